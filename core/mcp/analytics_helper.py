@@ -27,6 +27,12 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+# Shared mtime-aware config cache; skills may import this helper without the repo on sys.path
+try:
+    from core.utils.vault_config import user_profile as _user_profile
+except ImportError:
+    _user_profile = None
+
 
 # Configuration
 DEFAULT_PENDO_ENDPOINT = "https://app.pendo.io/data/track"
@@ -195,13 +201,16 @@ def is_analytics_enabled() -> bool:
 
 
 def load_user_profile() -> dict:
-    """Load user profile from yaml."""
+    """Load user profile from yaml (cached until the file changes when run from the Dex repo)."""
+    profile_path = get_vault_path() / 'System' / 'user-profile.yaml'
+    if _user_profile is not None:
+        return _user_profile(profile_path)
+    
     try:
         import yaml
     except ImportError:
         return {}
     
-    profile_path = get_vault_path() / 'System' / 'user-profile.yaml'
     if profile_path.exists():
         with open(profile_path, 'r') as f:
             return yaml.safe_load(f) or {}
@@ -14,6 +14,7 @@ Security:
 - No codes stored in plain text
 """
 
+import copy
 import hashlib
 import json
 import logging
@@ -42,6 +43,8 @@ try:
 except ImportError:
     _HAS_HEALTH = False
 
+from core.utils.vault_config import config_cache
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -210,13 +213,12 @@ def load_beta_features() -> Optional[Dict]:
 
 
 def load_user_profile() -> Optional[Dict]:
-    """Load user profile"""
+    """Load user profile (a private copy, safe to edit and save)"""
     if not USER_PROFILE_FILE.exists():
         return None
 
     try:
-        with open(USER_PROFILE_FILE, 'r') as f:
-            return yaml.safe_load(f) if yaml else None
+        return copy.deepcopy(config_cache.load(USER_PROFILE_FILE))
     except Exception as e:
         logger.error(f"Error loading user profile: {e}")
         return None
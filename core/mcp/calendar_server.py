@@ -45,6 +45,7 @@ if _repo_root not in sys.path:
     sys.path.append(_repo_root)
 from core.paths import PEOPLE_DIR
 from core.paths import VAULT_ROOT as VAULT_PATH
+from core.utils.vault_config import user_profile
 
 # Health system — error queue and health reporting
 try:
@@ -89,11 +90,8 @@ def get_default_work_calendar() -> str:
     only the relevant calendar instead of all calendars.
     """
     try:
-        import yaml
-        if USER_PROFILE_PATH.exists():
-            with open(USER_PROFILE_PATH, 'r') as f:
-                profile = yaml.safe_load(f)
-            
+        profile = user_profile(USER_PROFILE_PATH)
+        if profile:
             # Try calendar.work_calendar first
             if profile.get('calendar', {}).get('work_calendar'):
                 return profile['calendar']['work_calendar']
@@ -113,9 +111,8 @@ def get_default_work_calendar() -> str:
     return "Work"  # Fallback default
 
 
-# Cache the default calendar (read once at startup)
-DEFAULT_WORK_CALENDAR = get_default_work_calendar()
-logger.info(f"Default work calendar: {DEFAULT_WORK_CALENDAR}")
+# Profile reads are cached until user-profile.yaml changes, so edits apply without a restart
+logger.info(f"Default work calendar: {get_default_work_calendar()}")
 
 
 # Custom JSON encoder for handling date/datetime objects
@@ -643,7 +640,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "calendar_get_events":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         start_date = arguments.get("start_date", _tz_now().strftime("%Y-%m-%d"))
         
         # Parse start date
@@ -702,7 +699,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "calendar_get_today":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         today = _tz_now().strftime("%Y-%m-%d")
         
         # Reuse get_events logic
@@ -710,7 +707,7 @@ async def _handle_call_tool_inner(
         return await handle_call_tool("calendar_get_events", arguments)
     
     elif name == "calendar_create_event":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         title = arguments["title"]
         start_str = arguments["start_datetime"]
         duration = arguments.get("duration_minutes", 30)
@@ -754,7 +751,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "calendar_search_events":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         query = arguments["query"]
         days_back = arguments.get("days_back", 30)
         days_forward = arguments.get("days_forward", 30)
@@ -787,7 +784,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "calendar_delete_event":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         title = arguments["title"]
         event_date = arguments["event_date"]
         
@@ -821,7 +818,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "calendar_get_next_event":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         
         # Use fast EventKit
         success, output = run_shell_script("calendar_eventkit.py", "next", calendar_name)
@@ -850,7 +847,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
     
     elif name == "calendar_get_events_with_attendees":
-        calendar_name = arguments.get("calendar_name", DEFAULT_WORK_CALENDAR)
+        calendar_name = arguments.get("calendar_name") or get_default_work_calendar()
         start_date = arguments.get("start_date", _tz_now().strftime("%Y-%m-%d"))
         
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
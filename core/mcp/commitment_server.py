@@ -64,6 +64,7 @@ from core.paths import (
     USER_PROFILE_FILE as USER_PROFILE,
 )
 from core.utils.file_ops import atomic_write_json, file_lock
+from core.utils.vault_config import user_profile
 
 VAULT_PATH = str(VAULT_ROOT)
 
@@ -74,10 +75,8 @@ VAULT_PATH = str(VAULT_ROOT)
 def is_beta_activated() -> bool:
     """Check if the screenpipe beta feature is activated."""
     try:
-        import yaml
-        if USER_PROFILE.exists():
-            with open(USER_PROFILE, 'r') as f:
-                config = yaml.safe_load(f)
+        config = user_profile(USER_PROFILE)
+        if config:
             beta = config.get('beta', {})
             activated = beta.get('activated', {})
             return 'screenpipe' in activated
@@ -92,10 +91,8 @@ def is_screenpipe_enabled() -> bool:
         return False
     
     try:
-        import yaml
-        if USER_PROFILE.exists():
-            with open(USER_PROFILE, 'r') as f:
-                config = yaml.safe_load(f)
+        config = user_profile(USER_PROFILE)
+        if config:
             screenpipe_config = config.get('screenpipe', {})
             return screenpipe_config.get('enabled', False)
     except Exception as e:
@@ -105,10 +102,8 @@ def is_screenpipe_enabled() -> bool:
 def is_commitment_detection_enabled() -> bool:
     """Check if commitment detection feature is enabled."""
     try:
-        import yaml
-        if USER_PROFILE.exists():
-            with open(USER_PROFILE, 'r') as f:
-                config = yaml.safe_load(f)
+        config = user_profile(USER_PROFILE)
+        if config:
             screenpipe_config = config.get('screenpipe', {})
             if not screenpipe_config.get('enabled', False):
                 return False
@@ -0,0 +1,80 @@
+"""Commitment extraction tests for the Work MCP server."""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add MCP folder to import path for direct module imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import work_server  # noqa: E402
+
+from core.utils.extraction_cache import ExtractionCache  # noqa: E402
+
+FRAGMENTS = [
+    "i'll send the deck by friday", "we will share notes", "i owe you a reply", "need to follow up with sam",
+    "action items: draft plan", "follow-up: call legal", "followup: x", "follower", "swill", "i'll review it",
+    "will deliver by monday", " by ", "\n", "Action Item: Ship", "owe them", "need to send", "i'll",
+]
+
+
+def _per_pattern(text):
+    """The original extraction: every pattern run over the text separately."""
+    found = []
+    for pattern in work_server.COMMITMENT_PATTERNS:
+        for match in re.finditer(pattern, text.lower()):
+            commitment = match.group(1).strip() if match.lastindex >= 1 else match.group(0)
+            found.append((commitment, match.group(2) if match.lastindex >= 2 else None))
+    return found
+
+
+def test_single_scan_matches_per_pattern_scans():
+    rng = random.Random(11)
+    for _ in range(500):
+        text = " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12)))
+        assert work_server._find_commitment_matches(text.lower()) == _per_pattern(text), text
+
+
+@pytest.fixture
+def commitments_vault(tmp_path, monkeypatch):
+    meetings = tmp_path / "Meetings"
+    people = tmp_path / "People"
+    meetings.mkdir()
+    (people / "External").mkdir(parents=True)
+    today = work_server._tz_today().isoformat()
+    note = meetings / f"{today} - Acme.md"
+    note.write_text("Notes\ni'll send the deck by friday\naction items: draft plan\n", encoding="utf-8")
+    person = people / "External" / "Jane_Doe.md"
+    person.write_text("# Jane\n## Open Items\n- [ ] Intro to legal\n- [x] Done\n", encoding="utf-8")
+    for path in (note, person):
+        os.utime(path, ns=(1, 1))
+
+    monkeypatch.setattr(work_server, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(work_server, "get_meetings_dir", lambda: meetings)
+    monkeypatch.setattr(work_server, "get_people_dir", lambda: people)
+    monkeypatch.setattr(work_server, "_commitment_cache", ExtractionCache(tmp_path / "cache.json", version="t"))
+    return note
+
+
+def test_cached_scans_return_the_same_commitments(commitments_vault):
+    first = work_server.get_commitments_due_data()
+    assert first["sources_cache"] == {"hits": 0, "misses": 2, "incremental": False}
+    assert {"draft plan", "Intro to legal"} <= {c["commitment"] for c in first["commitments_no_date"]}
+    assert len(first["sources_scanned"]) == 1
+
+    second = work_server.get_commitments_due_data(incremental=True)
+    assert second["sources_cache"] == {"hits": 2, "misses": 0, "incremental": True}
+    assert {k: v for k, v in second.items() if k != "sources_cache"} == \
+        {k: v for k, v in first.items() if k != "sources_cache"}
+
+    commitments_vault.write_text("follow-up: pricing\n", encoding="utf-8")
+    os.utime(commitments_vault, ns=(2, 2))
+    third = work_server.get_commitments_due_data(incremental=True)
+    assert third["sources_cache"]["misses"] == 1
+    assert [c["commitment"] for c in third["commitments_no_date"]] == ["pricing", "Intro to legal"]
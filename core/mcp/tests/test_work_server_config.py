@@ -0,0 +1,38 @@
+"""Hot reload of pillars.yaml in the Work MCP server."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+# Add MCP folder to import path for direct module imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import work_server  # noqa: E402
+
+
+def _write_pillars(path, keyword, p0_limit, stamp):
+    path.write_text(
+        "pillars:\n"
+        f"  - id: sales\n    name: Sales\n    keywords: [{keyword}]\n"
+        "  - id: ops\n    name: Ops\n    keywords: [runbook]\n"
+        f"priority_limits:\n  P0: {p0_limit}\n",
+        encoding="utf-8",
+    )
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_pillar_edits_apply_without_restart(tmp_path, monkeypatch):
+    pillars_file = tmp_path / "pillars.yaml"
+    _write_pillars(pillars_file, "pipeline", 2, 1)
+    monkeypatch.setattr(work_server, "get_pillars_file", lambda: pillars_file)
+
+    assert list(work_server.PILLARS) == ["sales", "ops"]
+    assert work_server.PRIORITY_LIMITS["P0"] == 2
+    assert work_server.guess_pillar("Check the pipeline") == "sales"
+
+    # The memoized guess is dropped along with the old pillars
+    _write_pillars(pillars_file, "forecast", 4, 2)
+    assert work_server.guess_pillar("Check the pipeline") is None
+    assert work_server.PRIORITY_LIMITS["P0"] == 4
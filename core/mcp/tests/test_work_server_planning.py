@@ -0,0 +1,119 @@
+"""Goal / priority / task rollup tests for the Work MCP server."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+# Add MCP folder to import path for direct module imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import work_server  # noqa: E402
+
+from core.utils.completion_log import CompletionLog, week_key  # noqa: E402
+
+GOALS = """---
+quarter: Q1 2026
+---
+### 1. Launch Product v2.0 — **Growth** ^Q1-2026-goal-1
+**Progress:** 40%
+
+### 2. Hire a designer — **Team** ^Q1-2026-goal-2
+**Progress:** 0%
+
+### 10. Renew Acme — **Growth** ^Q1-2026-goal-10
+**Progress:** 10%
+"""
+
+PRIORITIES = """# Week Priorities
+1. Ship beta build — **Growth** ^week-2026-W05-p1
+   - Quarterly goal: [Q1-2026-goal-1]
+- [x] **Close Acme renewal** — [Q1-2026-goal-10] ^week-2026-W05-p2
+"""
+
+TASKS = """# Tasks
+## Now
+- [x] **Fix login bug** ^task-20260101-001 | week-2026-W05-p1
+- [ ] **Write release notes** ^task-20260101-002 | week-2026-W05-p1
+- [ ] **Send renewal contract** ^task-20260101-003 | week-2026-W05-p10
+"""
+
+
+@pytest.fixture
+def planning_vault(tmp_path, monkeypatch):
+    """Point the work server at throwaway goals, priorities and tasks files."""
+    files = {}
+    for name, content in (("goals", GOALS), ("priorities", PRIORITIES), ("tasks", TASKS)):
+        path = tmp_path / f"{name}.md"
+        path.write_text(content, encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+        files[name] = path
+
+    monkeypatch.setattr(work_server, "get_quarter_goals_file", lambda: files["goals"])
+    monkeypatch.setattr(work_server, "get_week_priorities_file", lambda: files["priorities"])
+    monkeypatch.setattr(work_server, "get_tasks_file", lambda: files["tasks"])
+    monkeypatch.setattr(work_server, "_completion_log", CompletionLog(tmp_path / "events.jsonl", tmp_path / "stats.json"))
+    return files
+
+
+def test_links_match_whole_ids_only(planning_vault):
+    assert [p["priority_id"] for p in work_server.find_linked_priorities("Q1-2026-goal-10")] == ["week-2026-W05-p2"]
+    assert work_server.find_linked_priorities("Q1-2026-goal-2") == []
+
+    tasks = work_server.find_linked_tasks("week-2026-W05-p1")
+    assert [t["task_id"] for t in tasks] == ["task-20260101-001", "task-20260101-002"]
+    assert [t["completed"] for t in tasks] == [True, False]
+
+    progress = work_server.calculate_goal_progress("Q1-2026-goal-10")
+    assert (progress["progress"], progress["calculation_method"]) == (100, "automatic")
+
+
+def test_graph_is_reused_until_a_planning_file_changes(planning_vault):
+    first = work_server.get_planning_graph()
+    assert work_server.get_planning_graph() is first
+
+    tasks_file = planning_vault["tasks"]
+    tasks_file.write_text(TASKS.replace("- [ ] **Write release notes**", "- [x] **Write release notes**"), encoding="utf-8")
+    os.utime(tasks_file, ns=(2, 2))
+
+    data = work_server.get_week_progress_data()
+    beta = next(p for p in data["priorities"] if p["priority_id"] == "week-2026-W05-p1")
+    assert (beta["tasks_done"], beta["tasks_total"], beta["status"]) == (2, 2, "complete")
+    assert work_server.get_planning_graph() is not first
+
+
+def test_returned_goals_are_copies(planning_vault):
+    goal = work_server.get_goal_by_id("Q1-2026-goal-1")
+    goal["milestones"].append({"title": "mutated", "completed": False})
+    assert work_server.get_goal_by_id("Q1-2026-goal-1")["milestones"] == []
+
+
+def test_repeat_priority_completion_is_counted_once(planning_vault):
+    for _ in range(2):
+        [reply] = work_server._handle_call_tool_inner("complete_weekly_priority", {"priority_id": "week-2026-W05-p1"})
+        assert json.loads(reply.text)["success"] is True
+
+    counts = work_server._completion_log.week_counts(week_key(work_server._tz_today()))
+    assert counts["priority"] == {"completed": 1, "reopened": 0}
+
+
+def test_scheduling_skips_time_already_past_today(monkeypatch):
+    tuesday = date(2026, 2, 3)
+    monkeypatch.setattr(work_server, "_tz_today", lambda: tuesday)
+    monkeypatch.setattr(work_server, "_tz_now", lambda: datetime(2026, 2, 3, 15, 0))
+    capacity = work_server.analyze_calendar_events([], days_ahead=1, work_start="09:00", work_end="17:00")
+
+    assert capacity["days"][0]["free_blocks"] == [{"start": "15:00", "end": "17:00", "minutes": 120}]
+
+    result = work_server.generate_scheduling_suggestions(
+        [{"title": "Write launch strategy"}, {"title": "Draft hiring plan"}], capacity
+    )
+    [placed] = result["suggestions"]
+    assert (placed["suggested_slot"]["date"], placed["suggested_slot"]["start"]) == ("2026-02-03", "15:00")
+    # The task that doesn't fit is reported once
+    assert result["warnings"] == ["Deep work task 'Draft hiring plan' has no suitable slot this week"]
@@ -0,0 +1,220 @@
+"""Task creation and lookup tests for the Work MCP server."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add MCP folder to import path for direct module imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import work_server  # noqa: E402
+
+from core.utils.completion_log import CompletionLog, week_key  # noqa: E402
+from core.utils.task_ids import allocate_task_ids  # noqa: E402
+from core.utils.task_index import get_task_index  # noqa: E402
+
+
+@pytest.fixture
+def task_vault(tmp_path, monkeypatch):
+    """Point the work server at a throwaway vault with one existing task."""
+    tasks_file = tmp_path / "03-Tasks" / "Tasks.md"
+    tasks_file.parent.mkdir(parents=True)
+    tasks_file.write_text(
+        "# Tasks\n\n## Next Week\n- [ ] **Draft the quarterly board update** ^task-20260101-004\n",
+        encoding="utf-8",
+    )
+    people_dir = tmp_path / "People"
+    people_dir.mkdir()
+    (people_dir / "Jane_Doe.md").write_text("# Jane Doe\n\n## Notes\n", encoding="utf-8")
+    (tmp_path / "System" / ".dex").mkdir(parents=True)
+
+    monkeypatch.setattr(work_server, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(work_server, "HAS_QMD", False)
+    monkeypatch.setattr(work_server, "get_tasks_file", lambda: tasks_file)
+    monkeypatch.setattr(work_server, "get_week_priorities_file", lambda: tmp_path / "missing.md")
+    pillar_id = next(iter(work_server.PILLARS))
+    return tasks_file, pillar_id
+
+
+@pytest.fixture
+def task_index(task_vault, monkeypatch):
+    """Keep the task-location index for the throwaway vault inside it."""
+    index_file = task_vault[0].parent.parent / "System" / ".dex" / "task-index.json"
+    monkeypatch.setattr(work_server, "get_task_index", lambda root=None: get_task_index(root, index_file))
+    return index_file
+
+
+@pytest.fixture
+def task_ids(task_vault, monkeypatch):
+    """Allocate task IDs from the throwaway vault's own high-water mark."""
+    tasks_file = task_vault[0]
+    state_file = tasks_file.parent.parent / "System" / ".dex" / "task-id-allocator.json"
+    monkeypatch.setattr(
+        work_server,
+        "allocate_task_ids",
+        lambda count, when=None: allocate_task_ids(count, when=when, state_file=state_file, scan_dirs=[tasks_file.parent]),
+    )
+    return state_file
+
+
+@pytest.fixture
+def completion_log(task_vault, monkeypatch):
+    """Record completion events in the throwaway vault."""
+    state_dir = task_vault[0].parent.parent / "System" / ".dex"
+    log = CompletionLog(state_dir / "events.jsonl", state_dir / "stats.json")
+    monkeypatch.setattr(work_server, "_completion_log", log)
+    return log
+
+
+@pytest.fixture
+def task_table(task_vault, monkeypatch):
+    """Build the vault-wide task table for the throwaway vault."""
+    db_file = task_vault[0].parent.parent / "System" / ".dex" / "task-table.db"
+    monkeypatch.setattr(work_server, "TASK_TABLE_DB_FILE", db_file)
+    monkeypatch.setattr(work_server, "_task_tables", {})
+    monkeypatch.setattr(work_server, "is_demo_mode", lambda: False)
+    return db_file
+
+
+def test_create_tasks_batch_dedupes_and_writes_once(task_vault, task_index, task_ids):
+    tasks_file, pillar = task_vault
+    items = [
+        {"title": "Send pricing proposal to Acme procurement", "pillar": pillar, "people": ["People/Jane_Doe"]},
+        {"title": "Send pricing proposal to Acme procurement team", "pillar": pillar},
+        {"title": "Draft the quarterly board update", "pillar": pillar},
+        {"title": "Book venue for the customer advisory summit", "pillar": pillar, "people": ["People/Jane_Doe"]},
+        {"title": "Fix it", "pillar": pillar},
+    ]
+
+    result = work_server.create_tasks_batch(items)
+
+    assert result["created"] == 2 and result["failed"] == 3
+    first, dup_in_batch, dup_existing, second, vague = result["results"]
+    assert first["success"] and second["success"]
+    assert [first["task"]["task_id"][-3:], second["task"]["task_id"][-3:]] == ["005", "006"]
+    assert first["synced_pages"] == ["People/Jane_Doe"]
+    assert dup_in_batch["error"] == "Potential duplicate detected"
+    assert dup_existing["error"] == "Potential duplicate detected"
+    assert vague["error"] == "Task is too vague"
+
+    content = tasks_file.read_text(encoding="utf-8")
+    assert content.index("Send pricing proposal") < content.index("Book venue") < content.index("Draft the quarterly")
+    assert "Related Tasks" in (tasks_file.parent.parent / "People" / "Jane_Doe.md").read_text(encoding="utf-8")
+
+
+def test_create_tasks_batch_enforces_priority_limits_across_items(task_vault, task_index, task_ids):
+    _, pillar = task_vault
+    limit = work_server.PRIORITY_LIMITS["P0"]
+    titles = [
+        "Escalate the payments outage to the on-call lead",
+        "Renew the expiring TLS certificate for checkout",
+        "Restore nightly database backups in staging",
+        "Rotate leaked API credentials for partner portal",
+        "Patch the login rate limiter before launch",
+        "Unblock legal review of vendor contract",
+    ]
+    items = [{"title": title, "pillar": pillar, "priority": "P0"} for title in titles[: limit + 1]]
+
+    result = work_server.create_tasks_batch(items)
+
+    assert result["created"] == limit
+    assert result["results"][-1]["error"] == "Priority limit exceeded for P0"
+
+
+def test_find_tasks_for_page_matches_refs_and_mentions(task_vault):
+    tasks_file, _ = task_vault
+    tasks_file.write_text(
+        "# Tasks\n\n## Now\n"
+        "- [ ] **Send contract** | People/Jane_Doe.md ^task-20260101-010\n"
+        "\t- Pillar: Pillar 1 | Priority: P1\n"
+        "- [x] **Catch up with jane_doe about hiring** ^task-20260101-011\n"
+        "- [ ] **Unrelated work item** ^task-20260101-012\n",
+        encoding="utf-8",
+    )
+
+    tasks = work_server.find_tasks_for_page("People/Jane_Doe")
+
+    assert [(t["title"][:13], t["priority"], t["completed"]) for t in tasks] == [
+        ("Send contract", "P1", False),
+        ("Catch up with", "P2", True),
+    ]
+    # The cached parse is shared read-only; memoized hits are dropped when Tasks.md changes
+    with pytest.raises(TypeError):
+        work_server._parse_cache.get(tasks_file, work_server._build_page_task_index)["by_page"] = {}
+    tasks_file.write_text("# Tasks\n- [ ] **Intro for Jane_Doe** | People/Jane_Doe.md\n", encoding="utf-8")
+    assert [t["title"] for t in work_server.find_tasks_for_page("People/Jane_Doe")] == ["Intro for Jane_Doe"]
+
+
+def test_sync_task_refs_batch_rewrites_each_page_once(task_vault, task_index, monkeypatch):
+    tasks_file, _ = task_vault
+    tasks_file.write_text("# Tasks\n- [ ] **Send contract** | People/Jane_Doe.md ^task-20260101-010\n", encoding="utf-8")
+    writes = []
+    original = work_server.update_related_tasks_section
+
+    def counting(page_path, tasks):
+        writes.append(page_path)
+        return original(page_path, tasks)
+
+    monkeypatch.setattr(work_server, "update_related_tasks_section", counting)
+    result = work_server.sync_task_refs_for_pages(["People/Jane_Doe", "People/Jane_Doe", "People/Missing"])
+
+    assert writes == ["People/Jane_Doe", "People/Missing"]
+    assert result["pages_synced"] == 1 and result["success"] is False
+    assert "Send contract" in (tasks_file.parent.parent / "People" / "Jane_Doe.md").read_text(encoding="utf-8")
+
+
+def test_status_changes_feed_weekly_completion_counts(task_vault, task_index, completion_log):
+    tasks_file, _ = task_vault
+    instances = [{"file": str(tasks_file), "line_number": 4, "title": "Draft the quarterly board update", "completed": False}]
+
+    result = work_server.update_task_status_everywhere("task-20260101-004", True, instances=instances)
+    assert result["success"] and "- [x]" in tasks_file.read_text(encoding="utf-8")
+    assert work_server.get_week_progress_data()["tasks_completed_this_week"] == 1
+
+    instances[0]["completed"] = True
+    work_server.update_task_status_everywhere("task-20260101-004", False, instances=instances)
+    counts = completion_log.week_counts(week_key(work_server._tz_today()))
+    assert counts["task"] == {"completed": 1, "reopened": 1}
+    assert work_server.get_week_progress_data()["tasks_completed_this_week"] == 0
+
+
+def test_task_ticked_outside_the_work_mcp_is_logged_once(task_vault, task_index, completion_log):
+    tasks_file, _ = task_vault
+    person_page = tasks_file.parent.parent / "People" / "Jane_Doe.md"
+    person_page.write_text(
+        "# Jane Doe\n\n## Related Tasks\n- [ ] **Draft the quarterly board update** ^task-20260101-004\n",
+        encoding="utf-8",
+    )
+    work_server.find_task_by_id("task-20260101-004")
+
+    # Ticked in Obsidian: only Tasks.md changes, so the copies now disagree
+    tasks_file.write_text(tasks_file.read_text(encoding="utf-8").replace("- [ ]", "- [x]"), encoding="utf-8")
+    instances = work_server.find_tasks_by_ids(["task-20260101-004"])["task-20260101-004"]
+    work_server.update_task_status_everywhere("task-20260101-004", True, instances=instances)
+
+    assert "- [x]" in person_page.read_text(encoding="utf-8")
+    counts = completion_log.week_counts(week_key(work_server._tz_today()))
+    assert counts["task"] == {"completed": 1, "reopened": 0}
+
+
+def test_vault_scope_sees_tasks_outside_tasks_md(task_vault, task_table):
+    tasks_file, pillar = task_vault
+    root = tasks_file.parent.parent
+    (root / "People" / "Jane_Doe.md").write_text(
+        "# Jane Doe\n\n## Actions\n- [ ] Waiting on Acme legal sign-off\n- [ ] Urgent: send Acme the SOW\n",
+        encoding="utf-8",
+    )
+
+    page = work_server.query_tasks_data(completed=False, mentions="acme", sort="priority")
+    assert [(t["title"], t["priority"], t["source"]) for t in page["tasks"]] == [
+        ("Urgent: send Acme the SOW", "P0", "vault"),
+        ("Waiting on Acme legal sign-off", "P2", "vault"),
+    ]
+    assert page["next_cursor"] is None
+
+    listed = work_server.get_vault_tasks(completed=False)
+    assert [t["source"] for t in listed] == ["tasks", "vault", "vault"]
+    assert work_server.query_tasks_data(sort="title")["success"] is False
@@ -12,16 +12,23 @@ Provides deterministic operations through structured tools with:
 - Progress tracking and rollup across planning levels
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
 from collections import Counter
+from collections.abc import Mapping
 from datetime import date, datetime, timedelta
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     import yaml
@@ -39,6 +46,7 @@ try:
     HAS_QMD = True
 except ImportError:
     HAS_QMD = False
+    def is_qmd_available(): return False
 
 # Analytics helper (optional - gracefully degrade if not available)
 try:
@@ -74,11 +82,12 @@ except ImportError:
 
 # Import QMD search index refresh (optional - silently skips if QMD not installed)
 try:
-    from core.utils.qmd_indexer import refresh_search_index
+    from core.utils.qmd_indexer import get_index_stats, refresh_search_index
     HAS_QMD = True
 except ImportError:
     HAS_QMD = False
     def refresh_search_index(): pass
+    def get_index_stats(): return None
 
 # Health system — error queue and health reporting
 try:
@@ -90,6 +99,7 @@ except ImportError:
 
 # Timezone-aware date/time (respects user-profile.yaml timezone)
 try:
+    from core.utils.timezone import get_user_timezone as _tz_user
     from core.utils.timezone import now as _tz_now
     from core.utils.timezone import today as _tz_today
 except ImportError:
@@ -97,6 +107,8 @@ except ImportError:
         return datetime.now()
     def _tz_today():
         return date.today()
+    def _tz_user():
+        return None
 
 # Custom JSON encoder for handling date/datetime objects
 class DateTimeEncoder(json.JSONEncoder):
@@ -110,17 +122,23 @@ _repo_root = str(Path(__file__).parent.parent.parent)
 if _repo_root not in sys.path:
     sys.path.append(_repo_root)
 from core.paths import (
+    COMMITMENT_CACHE_FILE,
     COMPANIES_DIR,
+    COMPANY_MENTIONS_FILE,
     DEMO_DIR,
     GOALS_FILE,
     INBOX_DIR,
+    MEETING_CACHE_DB_FILE,
     MEETING_CACHE_FILE,
     MEETINGS_DIR,
     PEOPLE_DIR,
     PEOPLE_INDEX_FILE,
     PILLARS_FILE,
+    PROJECTS_DIR,
     QUARTER_GOALS_FILE,
     SKILL_RATINGS_FILE,
+    SKILL_RATINGS_STATS_FILE,
+    TASK_TABLE_DB_FILE,
     TASKS_FILE,
     USER_PROFILE_FILE,
     WEEK_PRIORITIES_FILE,
@@ -128,20 +146,28 @@ from core.paths import (
 from core.paths import (
     VAULT_ROOT as BASE_DIR,
 )
+from core.utils.completion_log import CompletionLog, week_key
+from core.utils.extraction_cache import ExtractionCache
+from core.utils.file_ops import atomic_write_text
+from core.utils.free_busy import DEFAULT_WORK_END, DEFAULT_WORK_START, FreeBusy, pack_tasks, parse_clock
+from core.utils.meeting_parser import PARALLEL_MIN_FILES, parse_meeting_files
+from core.utils.meeting_store import MeetingCacheStore
+from core.utils.mention_index import MentionIndex
+from core.utils.parse_cache import FileParseCache
+from core.utils.people_index import PeopleIndex
+from core.utils.resolution_index import ResolutionIndex
+from core.utils.similarity_index import TitleSimilarityIndex
+from core.utils.skill_ratings import SkillRatings
+from core.utils.task_ids import allocate_task_ids
+from core.utils.task_index import get_task_index
+from core.utils.task_table import TaskTable
+from core.utils.tool_executor import ToolExecutor
+from core.utils.vault_config import config_cache, user_profile
 
 
 def is_demo_mode() -> bool:
     """Check if demo mode is enabled in user-profile.yaml"""
-    if not USER_PROFILE_FILE.exists() or yaml is None:
-        return False
-    
-    try:
-        content = USER_PROFILE_FILE.read_text()
-        data = yaml.safe_load(content)
-        return bool(data.get('demo_mode', False))
-    except Exception as e:
-        logger.error(f"Error checking demo mode: {e}")
-        return False
+    return bool(user_profile(USER_PROFILE_FILE).get('demo_mode', False))
 
 def get_tasks_file() -> Path:
     """Get the appropriate 03-Tasks/Tasks.md file based on demo mode"""
@@ -157,6 +183,12 @@ def get_pillars_file() -> Path:
             return demo_pillars
     return PILLARS_FILE
 
+def get_quarter_goals_file() -> Path:
+    """Get the appropriate Quarter Goals file based on demo mode"""
+    if is_demo_mode():
+        return DEMO_DIR / QUARTER_GOALS_FILE.parent.name / QUARTER_GOALS_FILE.name
+    return QUARTER_GOALS_FILE
+
 def get_week_priorities_file() -> Path:
     """Get the appropriate Week Priorities file based on demo mode"""
     if is_demo_mode():
@@ -213,8 +245,7 @@ def load_pillars_from_yaml() -> Dict[str, Dict]:
         return DEFAULT_PILLARS
     
     try:
-        content = get_pillars_file().read_text()
-        data = yaml.safe_load(content)
+        data = config_cache.load(get_pillars_file())
         
         if not data or 'pillars' not in data:
             logger.warning("No pillars found in YAML, using defaults")
@@ -246,8 +277,7 @@ def load_priority_limits_from_yaml() -> Dict[str, int]:
         return DEFAULT_PRIORITY_LIMITS
     
     try:
-        content = get_pillars_file().read_text()
-        data = yaml.safe_load(content)
+        data = config_cache.load(get_pillars_file())
         
         if data and 'priority_limits' in data:
             return {
@@ -260,9 +290,35 @@ def load_priority_limits_from_yaml() -> Dict[str, int]:
     
     return DEFAULT_PRIORITY_LIMITS
 
-# Load configuration at startup
-PILLARS = load_pillars_from_yaml()
-PRIORITY_LIMITS = load_priority_limits_from_yaml()
+def get_pillars() -> Dict[str, Dict]:
+    """Current pillars, re-read only when pillars.yaml (or demo mode) changes"""
+    return config_cache.derive(get_pillars_file(), load_pillars_from_yaml)
+
+def get_priority_limits() -> Dict[str, int]:
+    """Current priority limits, re-read only when pillars.yaml (or demo mode) changes"""
+    return config_cache.derive(get_pillars_file(), load_priority_limits_from_yaml)
+
+class _LiveConfig(Mapping):
+    """Read-only mapping that always reflects the current config file"""
+    
+    def __init__(self, load: Callable[[], Dict]):
+        self._load = load
+    
+    def __getitem__(self, key):
+        return self._load()[key]
+    
+    def __iter__(self):
+        return iter(self._load())
+    
+    def __len__(self):
+        return len(self._load())
+    
+    def __repr__(self):
+        return repr(self._load())
+
+# Hot-reloaded: edits to pillars.yaml apply without restarting the server
+PILLARS = _LiveConfig(get_pillars)
+PRIORITY_LIMITS = _LiveConfig(get_priority_limits)
 
 # Priority configuration
 PRIORITIES = ['P0', 'P1', 'P2', 'P3']
@@ -300,14 +356,19 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
 
 def guess_pillar(item: str) -> Optional[str]:
-    """Guess which pillar a task belongs to based on keywords"""
+    """Guess which pillar a task belongs to based on keywords (memoized per text)"""
+    get_pillars()  # a changed pillars.yaml clears the memo before we consult it
+    return _guess_pillar(item)
+
+@lru_cache(maxsize=4096)
+def _guess_pillar(item: str) -> Optional[str]:
     item_lower = item.lower()
     item_keywords = extract_keywords(item)
     
     best_match = None
     best_score = 0
     
-    for pillar_id, pillar_info in PILLARS.items():
+    for pillar_id, pillar_info in get_pillars().items():
         score = 0
         for keyword in pillar_info['keywords']:
             if keyword in item_lower:
@@ -321,8 +382,9 @@ def guess_pillar(item: str) -> Optional[str]:
     
     return best_match if best_score > 0 else None
 
+@lru_cache(maxsize=4096)
 def guess_priority(item: str) -> str:
-    """Guess priority based on task text"""
+    """Guess priority based on task text (memoized per text)"""
     item_lower = item.lower()
     
     # P0 indicators
@@ -346,71 +408,108 @@ def generate_task_id() -> str:
     The XXX counter is globally unique across all dates to avoid
     duplicate short references (last 3 digits used for quick user input).
 
-    Only scans user content folders (not documentation or system examples)
-    to avoid counting example IDs from docs as real tasks.
+    The high-water mark is persisted under System/.dex/ so allocation is
+    O(1) and safe across processes; it is rebuilt from a scan of the user
+    content folders only when the allocator state is missing or corrupt.
     """
-    date_str = _tz_now().strftime('%Y%m%d')
-
-    # Only scan folders that contain real task references (not docs/examples)
-    task_folders = [
-        '00-Inbox', '01-Quarter_Goals', '02-Week_Priorities',
-        '03-Tasks', '04-Projects', '05-Areas',
-    ]
-
-    existing_ids = []
-    for folder_name in task_folders:
-        folder = BASE_DIR / folder_name
-        if not folder.exists():
-            continue
-        for md_file in folder.rglob('*.md'):
-            try:
-                content = md_file.read_text()
-                pattern = r'\^task-\d{8}-(\d{3})'
-                matches = re.findall(pattern, content)
-                existing_ids.extend([int(m) for m in matches])
-            except Exception:
-                continue
-
-    # Get next available number (globally unique)
-    next_num = max(existing_ids, default=0) + 1
-    return f"task-{date_str}-{next_num:03d}"
+    return allocate_task_ids(1, when=_tz_now())[0]
 
 def extract_task_id(line: str) -> Optional[str]:
     """Extract task ID from a line"""
     match = re.search(r'\^(task-\d{8}-\d{3})', line)
     return match.group(1) if match else None
 
-def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
-    """Find all instances of a task ID across all markdown files"""
+def _instances_from_locations(locations) -> List[Dict[str, Any]]:
+    """Read task instances for index locations, opening each file once"""
     instances = []
-    
-    for md_file in BASE_DIR.rglob('*.md'):
-        try:
-            content = md_file.read_text()
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines):
-                if f'^{task_id}' in line and ('- [ ]' in line or '- [x]' in line):
-                    # Extract task title
-                    title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?\s*\^', line.strip())
-                    title = title_match.group(1).strip() if title_match else line.strip()
-                    
-                    instances.append({
-                        'file': str(md_file),
-                        'line_number': i + 1,
-                        'line_content': line,
-                        'title': title,
-                        'completed': '- [x]' in line
-                    })
-        except Exception as e:
-            logger.error(f"Error reading {md_file}: {e}")
+    lines_by_file: Dict[str, List[str]] = {}
+
+    for location in locations:
+        if location.file not in lines_by_file:
+            try:
+                lines_by_file[location.file] = Path(location.file).read_text().split('\n')
+            except Exception as e:
+                logger.error(f"Error reading {location.file}: {e}")
+                lines_by_file[location.file] = []
+        lines = lines_by_file[location.file]
+        if location.line_number > len(lines):
             continue
-    
+        line = lines[location.line_number - 1]
+
+        # Extract task title
+        title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?\s*\^', line.strip())
+        title = title_match.group(1).strip() if title_match else line.strip()
+
+        instances.append({
+            'file': location.file,
+            'line_number': location.line_number,
+            'line_content': line,
+            'title': title,
+            'completed': '- [x]' in line
+        })
+
     return instances
 
-def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, Any]:
-    """Update task status for all instances of a task ID across all files"""
-    instances = find_task_by_id(task_id)
+def find_task_by_id(task_id: str) -> List[Dict[str, Any]]:
+    """Find all instances of a task ID across all markdown files (via the task index)"""
+    index = get_task_index(BASE_DIR)
+    locations = index.lookup(task_id)
+    record_vault_status_changes(index)
+    return _instances_from_locations(locations)
+
+def find_tasks_by_ids(task_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Find instances for many task IDs with a single index freshness check"""
+    index = get_task_index(BASE_DIR)
+    locations = index.lookup_many(task_ids)
+    record_vault_status_changes(index)
+    return {task_id: _instances_from_locations(locs) for task_id, locs in locations.items()}
+
+# Status changes feed weekly stats and velocity without re-scanning the vault
+_completion_log = CompletionLog()
+
+def record_status_event(
+    kind: str, item_id: Optional[str], old_status: str, new_status: str,
+    pillar: Optional[str] = None, only_on_change: bool = False, **extra: Any
+) -> None:
+    """Append a task/priority/goal status change to the completion log (never fails the caller)
+
+    With only_on_change, the event is skipped if the log already shows the
+    item as done/not done like new_status.
+    """
+    try:
+        _completion_log.record(
+            kind, item_id, old_status, new_status,
+            pillar=pillar, when=_tz_now(), only_on_change=only_on_change, **extra
+        )
+    except Exception as e:
+        logger.error(f"Could not record {kind} status event for {item_id}: {e}")
+
+def record_vault_status_changes(index) -> None:
+    """Log checkbox flips the task index saw, e.g. a task ticked directly in Obsidian"""
+    for task_id, location in index.take_status_changes():
+        instances = _instances_from_locations([location])
+        title = instances[0]['title'] if instances else ''
+        record_status_event(
+            'task', task_id,
+            'not_started' if location.completed else 'done',
+            'done' if location.completed else 'not_started',
+            pillar=guess_pillar(title) if title else None,
+            only_on_change=True, source='vault'
+        )
+
+# Skill ratings are appended to ratings.jsonl and folded into per-skill aggregates
+_skill_ratings = SkillRatings()
+
+def update_task_status_everywhere(
+    task_id: str, completed: bool, instances: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """Update task status for all instances of a task ID across all files
+
+    Callers that already looked the task up (e.g. via find_tasks_by_ids)
+    can pass the instances to skip a second index lookup.
+    """
+    if instances is None:
+        instances = find_task_by_id(task_id)
     
     if not instances:
         return {
@@ -450,7 +549,8 @@ def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, An
             
             if new_line != old_line:
                 lines[line_idx] = new_line
-                filepath.write_text('\n'.join(lines))
+                atomic_write_text(filepath, '\n'.join(lines))
+                get_task_index(BASE_DIR).note_file_written(filepath)
                 updated_files.append({
                     'file': str(filepath),
                     'line': instance['line_number']
@@ -459,6 +559,17 @@ def update_task_status_everywhere(task_id: str, completed: bool) -> Dict[str, An
             logger.error(f"Error updating {instance['file']}: {e}")
             continue
     
+    if updated_files:
+        was_done = all(i['completed'] for i in instances) if completed else any(i['completed'] for i in instances)
+        # The task index may already have logged this change from the edited file
+        record_status_event(
+            'task', task_id,
+            'done' if was_done else 'not_started',
+            'done' if completed else 'not_started',
+            pillar=guess_pillar(instances[0]['title']),
+            only_on_change=True
+        )
+    
     return {
         'success': True,
         'task_id': task_id,
@@ -550,19 +661,20 @@ def extract_file_refs_from_task(task_line: str) -> List[str]:
     
     return list(set(refs))
 
-def find_tasks_for_page(page_path: str) -> List[Dict[str, Any]]:
-    """Find all tasks in 03-Tasks/Tasks.md that reference a given page"""
-    if not get_tasks_file().exists():
-        return []
-    
-    content = get_tasks_file().read_text()
-    lines = content.split('\n')
-    
-    # Normalize page path for matching
-    page_name = Path(page_path).stem.lower()
-    page_path_lower = page_path.lower()
+# page name -> matching task positions, for the page task index it was computed from.
+# Kept out of the cached record, which is shared read-only across tool threads.
+_page_task_hits: Dict[str, Tuple[int, ...]] = {}
+_page_task_hits_index: Optional[Mapping[str, Any]] = None
+_page_task_hits_lock = threading.Lock()
+
+def _build_page_task_index(tasks_file: Path) -> Mapping[str, Any]:
+    """Parse every task line in 03-Tasks/Tasks.md once for Related Tasks lookups"""
+    if not tasks_file.exists():
+        return MappingProxyType({'tasks': (), 'lowered': ()})
     
-    matching_tasks = []
+    lines = tasks_file.read_text().split('\n')
+    tasks = []
+    lowered = []
     current_section = None
     
     i = 0
@@ -579,48 +691,67 @@ def find_tasks_for_page(page_path: str) -> List[Dict[str, Any]]:
         if line.strip().startswith('- [ ]') or line.strip().startswith('- [x]'):
             completed = line.strip().startswith('- [x]')
             
-            # Check if this task references the page
-            file_refs = extract_file_refs_from_task(line)
-            task_mentions_page = any(
-                page_name in ref.lower() or page_path_lower in ref.lower()
-                for ref in file_refs
-            )
+            # Extract title
+            title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?(?:\s*\|.*)?$', line.strip())
+            title = title_match.group(1).strip() if title_match else line.strip()[6:]
             
-            # Also check if page name appears in task text
-            if not task_mentions_page:
-                task_mentions_page = page_name in line.lower()
+            # Clean title of file references for display
+            clean_title = re.sub(r'\s*\|\s*(?:People|Active)/[^\s]+', '', title)
+            clean_title = re.sub(r'\s+\.md\b', '', clean_title)
+            clean_title = re.sub(r'\s*\|.*$', '', clean_title)  # Remove trailing | refs
             
-            if task_mentions_page:
-                # Extract title
-                title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?(?:\s*\|.*)?$', line.strip())
-                title = title_match.group(1).strip() if title_match else line.strip()[6:]
-                
-                # Clean title of file references for display
-                clean_title = re.sub(r'\s*\|\s*(?:People|Active)/[^\s]+', '', title)
-                clean_title = re.sub(r'\s+\.md\b', '', clean_title)
-                clean_title = re.sub(r'\s*\|.*$', '', clean_title)  # Remove trailing | refs
-                
-                # Look for context/priority in following lines
-                priority = 'P2'
-                j = i + 1
-                while j < len(lines) and lines[j].strip().startswith('\t-'):
-                    if 'Priority:' in lines[j]:
-                        priority_match = re.search(r'Priority:\s*(P[0-3])', lines[j])
-                        if priority_match:
-                            priority = priority_match.group(1)
-                    j += 1
-                
-                matching_tasks.append({
-                    'title': clean_title,
-                    'completed': completed,
-                    'priority': priority,
-                    'section': current_section,
-                    'line_number': i + 1
-                })
+            # Look for context/priority in indented sub-bullets
+            priority = 'P2'
+            j = i + 1
+            while j < len(lines) and re.match(r'\s+-', lines[j]):
+                if 'Priority:' in lines[j]:
+                    priority_match = re.search(r'Priority:\s*(P[0-3])', lines[j])
+                    if priority_match:
+                        priority = priority_match.group(1)
+                j += 1
+            
+            tasks.append(MappingProxyType({
+                'title': clean_title,
+                'completed': completed,
+                'priority': priority,
+                'section': current_section,
+                'line_number': i + 1
+            }))
+            lowered.append(line.lower())
         
         i += 1
     
-    return matching_tasks
+    return MappingProxyType({'tasks': tuple(tasks), 'lowered': tuple(lowered)})
+
+def find_tasks_for_page(page_path: str) -> List[Dict[str, Any]]:
+    """Find all tasks in 03-Tasks/Tasks.md that reference a given page
+    
+    A task references a page when its file refs or its text mention the
+    page name. Every file ref is a substring of the task line and the page
+    name is a substring of the page path, so this reduces to "page name
+    appears in the task line". Matches are served from a page → task
+    reverse index that is cleared whenever Tasks.md changes.
+    """
+    tasks_file = get_tasks_file()
+    if not tasks_file.exists():
+        return []
+    
+    index = _parse_cache.get(tasks_file, _build_page_task_index)
+    page_name = Path(page_path).stem.lower()
+    
+    global _page_task_hits_index
+    with _page_task_hits_lock:
+        if _page_task_hits_index is not index:
+            _page_task_hits.clear()
+            _page_task_hits_index = index
+        hits = _page_task_hits.get(page_name)
+    if hits is None:
+        hits = tuple(i for i, line in enumerate(index['lowered']) if page_name in line)
+        with _page_task_hits_lock:
+            if _page_task_hits_index is index:
+                _page_task_hits[page_name] = hits
+    
+    return [dict(index['tasks'][i]) for i in hits]
 
 def update_related_tasks_section(page_path: str, tasks: List[Dict[str, Any]]) -> bool:
     """Update the Related Tasks section in a page"""
@@ -667,7 +798,7 @@ def update_related_tasks_section(page_path: str, tasks: List[Dict[str, Any]]) ->
         lines.insert(insert_idx, '\n' + section_content)
         new_content = '\n'.join(lines)
     
-    filepath.write_text(new_content)
+    atomic_write_text(filepath, new_content)
     return True
 
 def sync_task_refs_for_page(page_path: str) -> Dict[str, Any]:
@@ -682,28 +813,39 @@ def sync_task_refs_for_page(page_path: str) -> Dict[str, Any]:
         "tasks": tasks
     }
 
+def sync_task_refs_for_pages(page_paths: List[str]) -> Dict[str, Any]:
+    """Sync Related Tasks sections for many pages, rewriting each page once"""
+    results = []
+    seen = set()
+    for page_path in page_paths:
+        if page_path in seen:
+            continue
+        seen.add(page_path)
+        results.append(sync_task_refs_for_page(page_path))
+    
+    return {
+        "success": all(r['success'] for r in results),
+        "pages_synced": sum(1 for r in results if r['success']),
+        "results": results
+    }
+
 def propagate_task_status_to_refs(task_title: str, completed: bool) -> List[str]:
     """Update task status in all referenced pages' Related Tasks sections"""
-    updated_pages = []
-    
     # Find all pages that might reference this task
-    # Look for WikiLinks in the task line
-    if not get_tasks_file().exists():
-        return updated_pages
-    
-    content = get_tasks_file().read_text()
+    # Look for file refs in the task line
+    tasks_file = get_tasks_file()
+    if not tasks_file.exists():
+        return []
     
-    # Find the task line
-    for line in content.split('\n'):
-        if task_title.lower() in line.lower() and ('- [ ]' in line or '- [x]' in line):
-            file_refs = extract_file_refs_from_task(line)
-            for ref in file_refs:
-                result = sync_task_refs_for_page(ref)
-                if result['success']:
-                    updated_pages.append(ref)
+    title_lower = task_title.lower()
+    refs = []
+    for line in tasks_file.read_text().split('\n'):
+        if title_lower in line.lower() and ('- [ ]' in line or '- [x]' in line):
+            refs = extract_file_refs_from_task(line)
             break
     
-    return updated_pages
+    result = sync_task_refs_for_pages(refs)
+    return [r['page'] for r in result['results'] if r['success']]
 
 # ============================================================================
 # COMPANY AGGREGATION FUNCTIONS
@@ -714,7 +856,10 @@ def parse_person_page(filepath: Path) -> Dict[str, Any]:
     if not filepath.exists():
         return {}
     
-    content = filepath.read_text()
+    return _parse_person_content(filepath, filepath.read_text())
+
+def _parse_person_content(filepath: Path, content: str) -> Dict[str, Any]:
+    """Extract key fields from a person page's content"""
     person = {
         'name': filepath.stem.replace('_', ' '),
         'filepath': str(filepath),
@@ -754,15 +899,10 @@ def find_people_at_company(company_name: str) -> List[Dict[str, Any]]:
     company_name_lower = company_name.lower().replace('_', ' ')
     company_name_underscore = company_name.replace(' ', '_')
     
-    # Search through People directories
+    # Search through People directories (parsed pages come from the resolution index)
+    index = get_resolution_index()
     for subdir in ['External', 'Internal']:
-        people_subdir = get_people_dir() / subdir
-        if not people_subdir.exists():
-            continue
-        
-        for person_file in people_subdir.glob('*.md'):
-            person = parse_person_page(person_file)
-            
+        for person in index.people(subdir):
             # Match by company name or company page path
             matches = False
             if person.get('company'):
@@ -773,7 +913,7 @@ def find_people_at_company(company_name: str) -> List[Dict[str, Any]]:
                     matches = True
             
             if matches:
-                people.append(person)
+                people.append(dict(person))
     
     return people
 
@@ -782,7 +922,10 @@ def get_company_domains(company_filepath: Path) -> List[str]:
     if not company_filepath.exists():
         return []
     
-    content = company_filepath.read_text()
+    return _parse_company_domains(company_filepath.read_text())
+
+def _parse_company_domains(content: str) -> List[str]:
+    """Extract domains from a company page's content"""
     domains = []
     
     for line in content.split('\n'):
@@ -805,114 +948,52 @@ def _resolve_people_dir() -> Path:
     return get_people_dir()
 
 
-def build_people_index_data() -> Dict[str, Any]:
-    """Scan all person pages and build a lightweight JSON index."""
-    people_dir = _resolve_people_dir()
-    entries = []
-
-    for subdir_name in ['Internal', 'External', 'CPO_Network']:
-        subdir = people_dir / subdir_name
-        if not subdir.exists():
-            continue
+def _person_index_entry(person_file: Path, subdir_name: str) -> Dict[str, Any]:
+    """Build one People_Index entry, reading the person page once"""
+    content = person_file.read_text()
+    person = _parse_person_content(person_file, content)
 
-        for person_file in subdir.glob('*.md'):
-            if person_file.name == 'README.md':
-                continue
-            person = parse_person_page(person_file)
+    # Determine populated vs stub
+    has_content = bool(person.get('role') or person.get('email') or
+                    '## Meeting' in content or '## Notes' in content)
 
-            # Determine populated vs stub
-            content = person_file.read_text()
-            has_content = bool(person.get('role') or person.get('email') or
-                            '## Meeting' in content or '## Notes' in content)
+    # Extract tags from content
+    tags = []
+    for line in content.split('\n'):
+        if '**Tags**' in line and '|' in line:
+            parts = line.split('|')
+            if len(parts) >= 3:
+                tags = [t.strip() for t in parts[2].strip().split(',') if t.strip()]
+            break
 
-            # Extract tags from content
-            tags = []
-            for line in content.split('\n'):
-                if '**Tags**' in line and '|' in line:
-                    parts = line.split('|')
-                    if len(parts) >= 3:
-                        tags = [t.strip() for t in parts[2].strip().split(',') if t.strip()]
-                    break
+    return {
+        'name': person.get('name', person_file.stem.replace('_', ' ')),
+        'company': person.get('company'),
+        'role': person.get('role'),
+        'email': person.get('email'),
+        'type': subdir_name.lower(),
+        'path': str(person_file.relative_to(BASE_DIR)),
+        'last_interaction': person.get('last_interaction'),
+        'tags': tags,
+        'status': 'populated' if has_content else 'stub',
+    }
 
-            entries.append({
-                'name': person.get('name', person_file.stem.replace('_', ' ')),
-                'company': person.get('company'),
-                'role': person.get('role'),
-                'email': person.get('email'),
-                'type': subdir_name.lower(),
-                'path': str(person_file.relative_to(BASE_DIR)),
-                'last_interaction': person.get('last_interaction'),
-                'tags': tags,
-                'status': 'populated' if has_content else 'stub',
-            })
 
-    index = {
-        'version': 1,
-        'built_at': datetime.now().isoformat(),
-        'total': len(entries),
-        'by_type': {
-            'internal': sum(1 for e in entries if e['type'] == 'internal'),
-            'external': sum(1 for e in entries if e['type'] == 'external'),
-            'cpo_network': sum(1 for e in entries if e['type'] == 'cpo_network'),
-        },
-        'people': entries,
-    }
+# Person pages are re-parsed only when their mtime/size changes
+_people_index = PeopleIndex(PEOPLE_INDEX_FILE, _person_index_entry)
 
-    # Write to file
-    PEOPLE_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
-    PEOPLE_INDEX_FILE.write_text(json.dumps(index, indent=2, cls=DateTimeEncoder) + '\n')
 
-    return index
+def build_people_index_data() -> Dict[str, Any]:
+    """Bring People_Index.json up to date, re-parsing only changed person pages."""
+    index = _people_index.refresh(_resolve_people_dir(), BASE_DIR, force_write=True)
+    return {**index, 'pages_parsed': _people_index.parsed_last_refresh}
 
 
 def lookup_person_data(name: str, company: str = None) -> Dict[str, Any]:
     """Fast person lookup using the index with fuzzy matching."""
-
-    # Try reading the index file
-    index = None
-    if PEOPLE_INDEX_FILE.exists():
-        try:
-            index = json.loads(PEOPLE_INDEX_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
-            pass
-
-    # Auto-rebuild if index is missing or stale (>24 hours old)
-    if not index:
-        index = build_people_index_data()
-    else:
-        built_at = index.get('built_at', '')
-        try:
-            built_dt = datetime.fromisoformat(built_at)
-            if (datetime.now() - built_dt) > timedelta(hours=24):
-                logger.info("People index is stale (>24h), rebuilding...")
-                index = build_people_index_data()
-        except (ValueError, TypeError):
-            index = build_people_index_data()
-
-    people = index.get('people', [])
-    name_lower = name.lower()
-
-    matches = []
-    for person in people:
-        person_name = person.get('name', '').lower()
-        # Exact substring match
-        if name_lower in person_name or person_name in name_lower:
-            score = 1.0 if name_lower == person_name else 0.8
-        else:
-            # Fuzzy match using SequenceMatcher
-            score = SequenceMatcher(None, name_lower, person_name).ratio()
-
-        if score >= 0.5:
-            # Apply company filter if provided
-            if company:
-                person_company = (person.get('company') or '').lower()
-                if company.lower() not in person_company:
-                    continue
-
-            matches.append({**person, '_score': round(score, 2)})
-
-    # Sort by score descending
-    matches.sort(key=lambda m: m['_score'], reverse=True)
+    # Freshness comes from person-page changes: refresh only re-parses what changed
+    index = _people_index.refresh(_resolve_people_dir(), BASE_DIR)
+    matches = _people_index.search(name, company)
 
     return {
         'query': name,
@@ -927,14 +1008,15 @@ def lookup_person_data(name: str, company: str = None) -> Dict[str, Any]:
 # MEETING CONTEXT CACHE
 # ============================================================================
 
+# Indexed copy of meeting-cache.json; re-imported whenever the JSON changes
+_meeting_store = MeetingCacheStore(MEETING_CACHE_DB_FILE, MEETING_CACHE_FILE)
+
+
 def load_meeting_cache() -> Optional[Dict[str, Any]]:
-    """Load the meeting cache JSON file, return None if not available."""
-    if not MEETING_CACHE_FILE.exists():
-        return None
-    try:
-        return json.loads(MEETING_CACHE_FILE.read_text())
-    except (json.JSONDecodeError, OSError):
+    """Load the whole meeting cache, return None if not available."""
+    if not _meeting_store.ensure_current():
         return None
+    return _meeting_store.load_cache()
 
 
 def query_meeting_cache_data(
@@ -944,9 +1026,8 @@ def query_meeting_cache_data(
     date_to: str = None,
     keyword: str = None,
 ) -> Dict[str, Any]:
-    """Query the meeting cache with filters."""
-    cache = load_meeting_cache()
-    if not cache:
+    """Query the meeting cache with filters (served from the indexed store)."""
+    if not _meeting_store.ensure_current():
         return {
             'meetings': [],
             'total': 0,
@@ -954,61 +1035,45 @@ def query_meeting_cache_data(
             'guidance': 'No meeting cache found. Run the meeting cache builder: node .claude/hooks/meeting-cache-builder.cjs',
         }
 
-    meetings = cache.get('meetings', [])
-    filtered = []
-
-    for m in meetings:
-        # Attendee filter (fuzzy name match)
-        if attendee:
-            attendee_lower = attendee.lower()
-            attendee_names = [a.lower() for a in (m.get('attendees') or [])]
-            if not any(attendee_lower in a or a in attendee_lower for a in attendee_names):
-                continue
-
-        # Company filter
-        if company:
-            meeting_company = (m.get('company') or '').lower()
-            if company.lower() not in meeting_company:
-                continue
-
-        # Date range filter
-        meeting_date = m.get('date')
-        if date_from and meeting_date and meeting_date < date_from:
-            continue
-        if date_to and meeting_date and meeting_date > date_to:
-            continue
-
-        # Keyword filter (searches key_points, decisions, title)
-        if keyword:
-            keyword_lower = keyword.lower()
-            searchable = ' '.join([
-                m.get('title', ''),
-                ' '.join(m.get('key_points', [])),
-                ' '.join(m.get('decisions', [])),
-                ' '.join(m.get('action_items', [])),
-            ]).lower()
-            if keyword_lower not in searchable:
-                continue
-
-        filtered.append(m)
+    filtered = _meeting_store.query(
+        attendee=attendee,
+        company=company,
+        date_from=date_from,
+        date_to=date_to,
+        keyword=keyword,
+    )
+    info = _meeting_store.info()
 
     return {
         'meetings': filtered,
         'total': len(filtered),
         'cache_available': True,
-        'cache_last_updated': cache.get('last_updated'),
-        'cache_total_meetings': len(meetings),
+        'cache_last_updated': info['last_updated'],
+        'cache_total_meetings': info['total'],
     }
 
 
-def rebuild_meeting_cache_data() -> Dict[str, Any]:
-    """Rebuild the meeting cache by parsing meeting files in Python."""
+_MEETING_FILE_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+
+def rebuild_meeting_cache_data(parallel: Optional[bool] = None) -> Dict[str, Any]:
+    """Rebuild the meeting cache by parsing changed meeting files in Python.
+
+    ``parallel``: None parses large batches in a process pool, True always
+    uses the pool, False parses serially.
+    """
     meetings_dir = get_meetings_dir()
     if not meetings_dir.exists():
         return {'success': False, 'error': 'No meetings directory found'}
 
-    files = [f for f in meetings_dir.glob('*.md') if f.name != 'README.md']
-    if not files:
+    started = time.perf_counter()
+    with os.scandir(meetings_dir) as it:
+        entries = sorted(
+            (e for e in it
+             if e.name.endswith('.md') and e.name != 'README.md' and not e.name.startswith('.')),
+            key=lambda e: e.name,
+        )
+    if not entries:
         return {'success': False, 'error': 'No meeting files found'}
 
     # Load existing cache for mtime tracking
@@ -1026,40 +1091,54 @@ def rebuild_meeting_cache_data() -> Dict[str, Any]:
     for i, m in enumerate(cache['meetings']):
         existing_by_source[m.get('source_file', '')] = i
 
-    processed = 0
     skipped = 0
-
-    for filepath in files:
+    to_parse = []
+    mtimes = {}
+    for entry in entries:
+        filepath = Path(entry.path)
         rel_path = str(filepath.relative_to(BASE_DIR))
-        mtime_ms = filepath.stat().st_mtime_ns / 1_000_000
 
         # Skip files older than prune threshold based on filename date
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', filepath.name)
+        date_match = _MEETING_FILE_DATE.search(entry.name)
         if date_match and date_match.group(1) < prune_cutoff:
             skipped += 1
             continue
 
+        try:
+            mtime_ms = entry.stat().st_mtime_ns / 1_000_000
+        except OSError:
+            skipped += 1
+            continue
+
         # Skip unchanged files
         cached_mtime = cache.get('_file_mtimes', {}).get(rel_path)
         if cached_mtime and abs(cached_mtime - mtime_ms) < 1000:
             skipped += 1
             continue
 
-        try:
-            content = filepath.read_text()
-            entry = _parse_meeting_file_python(content, filepath.name, rel_path)
+        to_parse.append((filepath, rel_path))
+        mtimes[rel_path] = mtime_ms
+    stat_seconds = time.perf_counter() - started
 
-            idx = existing_by_source.get(rel_path)
-            if idx is not None:
-                cache['meetings'][idx] = entry
-            else:
-                cache['meetings'].append(entry)
-                existing_by_source[rel_path] = len(cache['meetings']) - 1
+    if parallel is False:
+        results, parse_timings = parse_meeting_files(to_parse, workers=1)
+    else:
+        results, parse_timings = parse_meeting_files(to_parse, min_parallel=2 if parallel else PARALLEL_MIN_FILES)
 
-            cache.setdefault('_file_mtimes', {})[rel_path] = mtime_ms
-            processed += 1
-        except Exception:
+    # Merge in file-name order so the cache doesn't depend on worker scheduling
+    processed = 0
+    for rel_path, parsed in results:
+        if parsed is None:
             skipped += 1
+            continue
+        idx = existing_by_source.get(rel_path)
+        if idx is not None:
+            cache['meetings'][idx] = parsed
+        else:
+            cache['meetings'].append(parsed)
+            existing_by_source[rel_path] = len(cache['meetings']) - 1
+        cache.setdefault('_file_mtimes', {})[rel_path] = mtimes[rel_path]
+        processed += 1
 
     # Prune old entries
     cache['meetings'] = [m for m in cache['meetings']
@@ -1068,132 +1147,64 @@ def rebuild_meeting_cache_data() -> Dict[str, Any]:
     # Sort by date descending
     cache['meetings'].sort(key=lambda m: m.get('date', ''), reverse=True)
 
-    # Save
+    # Save to the indexed store and export the JSON for Node consumers
+    write_started = time.perf_counter()
     cache['last_updated'] = datetime.now().isoformat()
-    MEETING_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    MEETING_CACHE_FILE.write_text(json.dumps(cache, indent=2) + '\n')
+    _meeting_store.replace(cache)
+    write_seconds = time.perf_counter() - write_started
 
     return {
         'success': True,
         'processed': processed,
         'skipped': skipped,
         'total_cached': len(cache['meetings']),
+        'workers': parse_timings['workers'],
+        # read/parse are summed across workers; parse_wall is the elapsed time of that phase
+        'timings': {
+            'stat': round(stat_seconds, 3),
+            'read': round(parse_timings['read'], 3),
+            'parse': round(parse_timings['parse'], 3),
+            'parse_wall': round(parse_timings['wall'], 3),
+            'write': round(write_seconds, 3),
+            'total': round(time.perf_counter() - started, 3),
+        },
     }
 
 
-def _parse_meeting_file_python(content: str, filename: str, rel_path: str) -> Dict[str, Any]:
-    """Parse a single meeting file into a cache entry (Python implementation)."""
-
-    # Frontmatter
-    fm = {}
-    fm_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if fm_match:
-        for line in fm_match.group(1).split('\n'):
-            kv = re.match(r'^(\w+):\s*(.+)', line)
-            if kv:
-                val = kv.group(2).strip().strip('"')
-                if val.startswith('[') and val.endswith(']'):
-                    val = [s.strip() for s in val[1:-1].split(',') if s.strip()]
-                fm[kv.group(1)] = val
-
-    # Date
-    date_val = fm.get('date') or fm.get('created')
-    if not date_val:
-        dm = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
-        date_val = dm.group(1) if dm else None
-    if date_val and not isinstance(date_val, str):
-        date_val = str(date_val)
-
-    # Title
-    title_match = re.search(r'^# (.+)$', content, re.MULTILINE)
-    title = title_match.group(1).strip() if title_match else (
-        re.sub(r'\.md$', '', re.sub(r'^\d{4}-\d{2}-\d{2}\s*-?\s*', '', filename)).strip()
-    )
+# Company names/domains -> meeting notes that mention them, updated per changed note
+_company_mentions = MentionIndex(COMPANY_MENTIONS_FILE)
 
-    # Attendees
-    attendees = fm.get('participants') or fm.get('attendees') or []
-    if isinstance(attendees, str):
-        attendees = [s.strip() for s in attendees.split(',')]
 
-    # Sections
-    def extract_section(heading):
-        pattern = rf'^## {re.escape(heading)}\b.*$'
-        match = re.search(pattern, content, re.MULTILINE | re.IGNORECASE)
-        if not match:
-            return []
-        start = match.end()
-        end_match = re.search(r'^## ', content[start:], re.MULTILINE)
-        block = content[start:start + end_match.start()] if end_match else content[start:]
-        items = []
-        for line in block.split('\n'):
-            stripped = line.strip()
-            if stripped.startswith('- '):
-                item = stripped[2:].strip()
-                item = re.sub(r'^\[[ x]\]\s*', '', item)
-                item = re.sub(r'\s*\^task-\d{8}-\d{3}\s*$', '', item)
-                item = re.sub(r'\[\[[^\]|]*\|([^\]]*)\]\]', r'\1', item)
-                item = re.sub(r'\[\[([^\]]*)\]\]', r'\1', item)
-                item = re.sub(r'\*\*([^*]+)\*\*', r'\1', item)
-                if item:
-                    items.append(item)
-        return items
-
-    decisions = extract_section('Decisions') or extract_section('Key Decisions')
-    action_items = extract_section('Action Items')
-    key_points = extract_section('Key Points') or extract_section('Summary')
+def _company_mention_patterns(company_name: str, domains: List[str]) -> List[str]:
+    return [company_name.lower()] + [d.lower() for d in domains]
 
-    return {
-        'date': date_val,
-        'title': title,
-        'source_file': rel_path,
-        'attendees': attendees,
-        'company': fm.get('company'),
-        'decisions': decisions,
-        'action_items': action_items,
-        'key_points': key_points,
-        'sentiment': 'neutral',
-        'cached_at': datetime.now().isoformat(),
-    }
 
+def find_meetings_for_company(
+    company_file: Path, company_name: str, domains: List[str], refresh: bool = True
+) -> List[Dict[str, Any]]:
+    """Find meetings that mention a company's name or one of its domains"""
+    meetings_dir = get_meetings_dir()
+    if not meetings_dir.exists():
+        return []
+
+    patterns = _company_mention_patterns(company_name, domains)
+    if refresh:
+        _company_mentions.refresh(meetings_dir, {company_file: patterns})
 
-def find_meetings_for_company(company_name: str, domains: List[str]) -> List[Dict[str, Any]]:
-    """Find meetings that involve people from a company"""
     meetings = []
-    
-    if not get_meetings_dir().exists():
-        return meetings
-    
-    company_name_lower = company_name.lower()
-    
-    for meeting_file in get_meetings_dir().glob('*.md'):
-        content = meeting_file.read_text()
-        content_lower = content.lower()
-        
-        # Check if company name or any domain appears in meeting
-        matches = company_name_lower in content_lower
-        if not matches:
-            for domain in domains:
-                if domain.lower() in content_lower:
-                    matches = True
-                    break
-        
-        if matches:
-            # Extract meeting info
-            lines = content.split('\n')
-            title = lines[0].lstrip('#').strip() if lines else meeting_file.stem
-            date = meeting_file.stem[:10] if len(meeting_file.stem) >= 10 else ''
-            
-            meetings.append({
-                'date': date,
-                'title': title,
-                'filepath': str(meeting_file)
-            })
-    
+    for name, note in _company_mentions.notes_mentioning(patterns):
+        stem = Path(name).stem
+        meetings.append({
+            'date': stem[:10] if len(stem) >= 10 else '',
+            'title': note['title'],
+            'filepath': str(meetings_dir / name)
+        })
+
     # Sort by date descending
     meetings.sort(key=lambda x: x['date'], reverse=True)
     return meetings[:10]  # Return last 10 meetings
 
-def refresh_company_page(company_path: str) -> Dict[str, Any]:
+def refresh_company_page(company_path: str, refresh_mentions: bool = True) -> Dict[str, Any]:
     """Refresh all aggregated sections on a company page"""
     
     # Normalize path
@@ -1221,7 +1232,7 @@ def refresh_company_page(company_path: str) -> Dict[str, Any]:
     people = find_people_at_company(company_name)
     
     # Find related meetings
-    meetings = find_meetings_for_company(company_name, domains)
+    meetings = find_meetings_for_company(filepath, company_name, domains, refresh=refresh_mentions)
     
     # Find related tasks
     tasks = find_tasks_for_page(company_path)
@@ -1287,7 +1298,7 @@ def refresh_company_page(company_path: str) -> Dict[str, Any]:
     # Update the Updated timestamp at the bottom
     content = re.sub(r'\*Updated: .*?\*', f'*Updated: {timestamp}*', content)
     
-    filepath.write_text(content)
+    atomic_write_text(filepath, content)
     
     return {
         'success': True,
@@ -1298,6 +1309,38 @@ def refresh_company_page(company_path: str) -> Dict[str, Any]:
         'filepath': str(filepath)
     }
 
+def refresh_all_companies_data() -> Dict[str, Any]:
+    """Refresh every company page, indexing meeting mentions for all companies in one pass"""
+    if not COMPANIES_DIR.exists():
+        return {'success': False, 'error': 'No companies directory found'}
+
+    company_files = sorted(COMPANIES_DIR.glob('*.md'))
+    pages = {
+        company_file: _company_mention_patterns(company_file.stem.replace('_', ' '), get_company_domains(company_file))
+        for company_file in company_files
+    }
+    _company_mentions.refresh(get_meetings_dir(), pages)
+
+    results = []
+    failed = []
+    for company_file in company_files:
+        try:
+            result = refresh_company_page(str(company_file.relative_to(BASE_DIR)), refresh_mentions=False)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        if result.get('success'):
+            results.append({k: result[k] for k in ('company', 'contacts_found', 'meetings_found', 'tasks_found')})
+        else:
+            failed.append({'filepath': str(company_file), 'error': result.get('error')})
+
+    return {
+        'success': not failed,
+        'companies_refreshed': len(results),
+        'meeting_notes_scanned': _company_mentions.scanned_last_refresh,
+        'companies': results,
+        'failed': failed,
+    }
+
 def list_companies() -> List[Dict[str, Any]]:
     """List all company pages"""
     companies = []
@@ -1427,7 +1470,7 @@ def create_company_page(name: str, website: str = '', industry: str = '',
 *Updated: {timestamp}*
 """
     
-    filepath.write_text(content)
+    atomic_write_text(filepath, content)
     
     return {
         'success': True,
@@ -1448,14 +1491,9 @@ def get_quarter_info(quarter_date: Optional[date] = None) -> Dict[str, Any]:
     
     # Read q1_start_month from user profile
     q1_start_month = 1  # Default to January
-    if USER_PROFILE_FILE.exists() and yaml:
-        try:
-            content = USER_PROFILE_FILE.read_text()
-            data = yaml.safe_load(content)
-            if data and 'quarterly_planning' in data:
-                q1_start_month = data['quarterly_planning'].get('q1_start_month', 1)
-        except Exception as e:
-            logger.error(f"Error reading q1_start_month: {e}")
+    data = user_profile(USER_PROFILE_FILE)
+    if data.get('quarterly_planning'):
+        q1_start_month = data['quarterly_planning'].get('q1_start_month', 1)
     
     # Calculate which quarter we're in based on q1_start_month
     month = quarter_date.month
@@ -1613,54 +1651,20 @@ def parse_quarterly_goals(filepath: Path) -> List[Dict[str, Any]]:
 
 def get_goal_by_id(goal_id: str) -> Optional[Dict[str, Any]]:
     """Get a specific goal by its ID"""
-    goals_file = QUARTER_GOALS_FILE
-    if is_demo_mode():
-        goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
-    
-    goals = parse_quarterly_goals(goals_file)
-    for goal in goals:
-        if goal.get('goal_id') == goal_id:
-            return goal
-    return None
+    goal = get_planning_graph()['goals_by_id'].get(goal_id)
+    return copy.deepcopy(goal) if goal is not None else None
 
 def find_linked_priorities(goal_id: str) -> List[Dict[str, Any]]:
     """Find all weekly priorities linked to a goal"""
-    priorities_file = get_week_priorities_file()
-    if not priorities_file.exists():
+    if not goal_id:
         return []
-    
-    content = priorities_file.read_text()
-    lines = content.split('\n')
-    
-    linked_priorities = []
-    for i, line in enumerate(lines):
-        # Look for lines that mention the goal_id
-        if goal_id in line:
-            # Check if this is a priority line
-            if '**' in line and ('- [ ]' in line or '- [x]' in line or line.strip().startswith('1.') or line.strip().startswith('2.') or line.strip().startswith('3.')):
-                completed = '- [x]' in line
-                
-                # Extract priority ID
-                priority_id = extract_priority_id(line)
-                
-                # Extract title
-                title_match = re.search(r'(?:\d+\.\s+)?(.+?)\s+—', line)
-                if not title_match:
-                    title_match = re.search(r'\*\*(.+?)\*\*', line)
-                title = title_match.group(1).strip() if title_match else line.strip()
-                
-                linked_priorities.append({
-                    'priority_id': priority_id,
-                    'title': title,
-                    'completed': completed,
-                    'line_number': i + 1
-                })
-    
-    return linked_priorities
+    graph = get_planning_graph()
+    return [dict(p) for p in graph['priorities_by_goal'].get(goal_id, ())]
 
-def calculate_goal_progress(goal_id: str) -> Dict[str, Any]:
+def calculate_goal_progress(goal_id: str, priorities: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """Calculate goal progress based on linked weekly priorities"""
-    priorities = find_linked_priorities(goal_id)
+    if priorities is None:
+        priorities = find_linked_priorities(goal_id)
     
     if not priorities:
         return {
@@ -1683,9 +1687,7 @@ def calculate_goal_progress(goal_id: str) -> Dict[str, Any]:
 
 def update_goal_in_file(goal_id: str, updates: Dict[str, Any]) -> bool:
     """Update a goal's fields in 01-Quarter_Goals/Quarter_Goals.md"""
-    goals_file = QUARTER_GOALS_FILE
-    if is_demo_mode():
-        goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+    goals_file = get_quarter_goals_file()
     
     if not goals_file.exists():
         return False
@@ -1715,14 +1717,12 @@ def update_goal_in_file(goal_id: str, updates: Dict[str, Any]) -> bool:
                 break
     
     # Write back
-    goals_file.write_text('\n'.join(lines))
+    atomic_write_text(goals_file, '\n'.join(lines))
     return True
 
 def create_quarterly_goal_in_file(goal_data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new quarterly goal in 01-Quarter_Goals/Quarter_Goals.md"""
-    goals_file = QUARTER_GOALS_FILE
-    if is_demo_mode():
-        goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+    goals_file = get_quarter_goals_file()
     
     # Ensure file exists
     if not goals_file.exists():
@@ -1745,7 +1745,7 @@ created: {_tz_now().strftime('%Y-%m-%d')}
 ## 🎯 Quarter Objectives
 
 """
-        goals_file.write_text(content)
+        atomic_write_text(goals_file, content)
     
     # Read existing goals to generate ID
     existing_goals = parse_quarterly_goals(goals_file)
@@ -1793,7 +1793,7 @@ created: {_tz_now().strftime('%Y-%m-%d')}
     else:
         content += goal_section
     
-    goals_file.write_text(content)
+    atomic_write_text(goals_file, content)
     
     return {
         'success': True,
@@ -1829,10 +1829,10 @@ def generate_priority_id(week_date: date, existing_priorities: List[Dict]) -> st
     
     return f"{prefix}{max_num + 1}"
 
-def parse_weekly_priorities(filepath: Path) -> List[Dict[str, Any]]:
-    """Parse weekly priorities from Week Priorities.md"""
+def _parse_weekly_priority_records(filepath: Path) -> Tuple[MappingProxyType, ...]:
+    """Parse weekly priorities from Week Priorities.md into immutable records"""
     if not filepath.exists():
-        return []
+        return ()
     
     content = filepath.read_text()
     priorities = []
@@ -1871,36 +1871,97 @@ def parse_weekly_priorities(filepath: Path) -> List[Dict[str, Any]]:
                 'line_number': i + 1
             })
     
-    return priorities
+    return tuple(MappingProxyType(p) for p in priorities)
+
+def parse_weekly_priorities(filepath: Path) -> List[Dict[str, Any]]:
+    """Parse weekly priorities from Week Priorities.md (cached until the file changes)"""
+    return [dict(record) for record in _parse_cache.get(filepath, _parse_weekly_priority_records)]
 
 def find_linked_tasks(priority_id: str) -> List[Dict[str, Any]]:
     """Find all tasks linked to a weekly priority"""
-    tasks_file = get_tasks_file()
-    if not tasks_file.exists():
+    if not priority_id:
         return []
+    graph = get_planning_graph()
+    return [dict(t) for t in graph['tasks_by_priority'].get(priority_id, ())]
+
+# ============================================================================
+# PLANNING GRAPH (goals → priorities → tasks)
+# ============================================================================
+
+_GOAL_ID_PATTERN = re.compile(r'Q\d+-\d{4}-goal-\d+')
+_PRIORITY_ID_PATTERN = re.compile(r'week-\d{4}-W\d{2}-p\d+')
+
+def _is_priority_link_line(line: str) -> bool:
+    """True for Week Priorities lines that can carry a goal link"""
+    stripped = line.strip()
+    return '**' in line and (
+        '- [ ]' in line or '- [x]' in line
+        or stripped.startswith('1.') or stripped.startswith('2.') or stripped.startswith('3.')
+    )
+
+def _build_planning_graph(paths: Tuple[Path, ...]) -> Dict[str, Any]:
+    """Link goals, weekly priorities and tasks in one pass over the three files
     
-    content = tasks_file.read_text()
-    lines = content.split('\n')
+    Priority lines link to every goal ID they mention and task lines to every
+    priority ID they mention. IDs are matched as whole tokens, so goal-1 no
+    longer picks up lines for goal-10.
+    """
+    goals_file, priorities_file, tasks_file = paths
     
-    linked_tasks = []
-    for i, line in enumerate(lines):
-        # Look for tasks that mention the priority_id
-        if priority_id in line and ('- [ ]' in line or '- [x]' in line):
-            completed = '- [x]' in line
-            task_id = extract_task_id(line)
-            
-            # Extract title
+    goals = parse_quarterly_goals(goals_file)
+    goals_by_id = {g['goal_id']: g for g in goals if g.get('goal_id')}
+    
+    priorities_by_goal: Dict[str, List[MappingProxyType]] = {}
+    if priorities_file.exists():
+        for i, line in enumerate(priorities_file.read_text().split('\n')):
+            goal_ids = set(_GOAL_ID_PATTERN.findall(line))
+            if not goal_ids or not _is_priority_link_line(line):
+                continue
+            title_match = re.search(r'(?:\d+\.\s+)?(.+?)\s+—', line)
+            if not title_match:
+                title_match = re.search(r'\*\*(.+?)\*\*', line)
+            link = MappingProxyType({
+                'priority_id': extract_priority_id(line),
+                'title': title_match.group(1).strip() if title_match else line.strip(),
+                'completed': '- [x]' in line,
+                'line_number': i + 1
+            })
+            for goal_id in goal_ids:
+                priorities_by_goal.setdefault(goal_id, []).append(link)
+    
+    tasks_by_priority: Dict[str, List[MappingProxyType]] = {}
+    if tasks_file.exists():
+        for i, line in enumerate(tasks_file.read_text().split('\n')):
+            if '- [ ]' not in line and '- [x]' not in line:
+                continue
+            priority_ids = set(_PRIORITY_ID_PATTERN.findall(line))
+            if not priority_ids:
+                continue
             title_match = re.match(r'-\s*\[[x ]\]\s*\*?\*?(.+?)\*?\*?(?:\s*\^task-|\s*\|)', line.strip())
-            title = title_match.group(1).strip() if title_match else line.strip()
-            
-            linked_tasks.append({
-                'task_id': task_id,
-                'title': title,
-                'completed': completed,
+            link = MappingProxyType({
+                'task_id': extract_task_id(line),
+                'title': title_match.group(1).strip() if title_match else line.strip(),
+                'completed': '- [x]' in line,
                 'line_number': i + 1
             })
+            for priority_id in priority_ids:
+                tasks_by_priority.setdefault(priority_id, []).append(link)
     
-    return linked_tasks
+    return {
+        'goals': tuple(goals),
+        'goals_by_id': goals_by_id,
+        'priorities': _parse_cache.get(priorities_file, _parse_weekly_priority_records),
+        'priorities_by_goal': {k: tuple(v) for k, v in priorities_by_goal.items()},
+        'tasks_by_priority': {k: tuple(v) for k, v in tasks_by_priority.items()},
+    }
+
+def get_planning_graph() -> Dict[str, Any]:
+    """Return the goals → priorities → tasks graph, rebuilt only when one of its files changes
+    
+    The result is shared between calls; copy records before mutating them.
+    """
+    paths = (get_quarter_goals_file(), get_week_priorities_file(), get_tasks_file())
+    return _parse_cache.get_group(paths, _build_planning_graph)
 
 # ============================================================================
 # GOAL INFERENCE FOR WEEKLY PRIORITIES
@@ -2024,11 +2085,22 @@ def infer_goal_link(priority_title: str, priority_pillar: str,
 # TASK PARSING AND MANAGEMENT
 # ============================================================================
 
-def parse_tasks_file(filepath: Path) -> List[Dict[str, Any]]:
-    """Parse tasks from a markdown file"""
+# Parsed task/priority records, re-parsed only when (mtime_ns, size) changes
+_parse_cache = FileParseCache()
+
+def _on_config_reload(path: Path) -> None:
+    """Drop results derived from pillars/profile config (guessed pillars live in parsed task records)"""
+    _guess_pillar.cache_clear()
+    guess_priority.cache_clear()
+    _parse_cache.clear()
+
+config_cache.add_listener(_on_config_reload)
+
+def _parse_task_records(filepath: Path) -> Tuple[MappingProxyType, ...]:
+    """Parse tasks from a markdown file into immutable records"""
     tasks = []
     if not filepath.exists():
-        return tasks
+        return ()
     
     content = filepath.read_text()
     lines = content.split('\n')
@@ -2076,7 +2148,11 @@ def parse_tasks_file(filepath: Path) -> List[Dict[str, Any]]:
                 'priority': guess_priority(clean_title),
             })
     
-    return tasks
+    return tuple(MappingProxyType(t) for t in tasks)
+
+def parse_tasks_file(filepath: Path) -> List[Dict[str, Any]]:
+    """Parse tasks from a markdown file (cached until the file changes)"""
+    return [dict(record) for record in _parse_cache.get(filepath, _parse_task_records)]
 
 def get_all_tasks() -> List[Dict[str, Any]]:
     """Get all tasks from 03-Tasks/Tasks.md and Week Priorities"""
@@ -2098,6 +2174,102 @@ def get_all_tasks() -> List[Dict[str, Any]]:
     
     return all_tasks
 
+# Vault-wide task table (every checkbox in every note), one per vault root
+_task_tables: Dict[str, TaskTable] = {}
+_task_tables_lock = threading.Lock()
+
+def _classify_vault_task(title: str, declared: Dict[str, str]) -> Tuple[Optional[str], str]:
+    """Pillar and priority for a table row: declared metadata first, then the title guesses"""
+    priority = declared.get('priority')
+    if priority not in PRIORITIES:
+        priority = guess_priority(title)
+    pillar = None
+    name = (declared.get('pillar') or '').strip().lower()
+    if name:
+        pillar = next((pid for pid, info in get_pillars().items()
+                       if name in (pid.lower(), str(info.get('name', '')).lower())), None)
+    return pillar or guess_pillar(title), priority
+
+def _task_classifier_version() -> str:
+    """Changes whenever pillar guessing would give different answers"""
+    return hashlib.sha1(json.dumps(get_pillars(), sort_keys=True).encode('utf-8')).hexdigest()
+
+def get_task_table() -> TaskTable:
+    """The task table for the active vault (the demo vault in demo mode)"""
+    root = DEMO_DIR if is_demo_mode() else BASE_DIR
+    with _task_tables_lock:
+        table = _task_tables.get(str(root))
+        if table is None:
+            primary = []
+            for path in (get_tasks_file(), get_week_priorities_file()):
+                try:
+                    primary.append(path.relative_to(root).as_posix())
+                except ValueError:
+                    pass
+            skip = []
+            if root == BASE_DIR:
+                try:
+                    skip.append(DEMO_DIR.relative_to(BASE_DIR).as_posix())
+                except ValueError:
+                    pass
+            db_path = TASK_TABLE_DB_FILE if root == BASE_DIR else TASK_TABLE_DB_FILE.with_name('task-table-demo.db')
+            table = TaskTable(root, db_path, _classify_vault_task, _task_classifier_version,
+                              primary_files=primary, skip_dirs=skip)
+            _task_tables[str(root)] = table
+        return table
+
+def invalidate_task_tables() -> None:
+    """Make the next vault task query re-check the files a write tool may have changed"""
+    with _task_tables_lock:
+        tables = list(_task_tables.values())
+    for table in tables:
+        table.invalidate()
+
+def _vault_task_source(task: Dict[str, Any]) -> str:
+    path = Path(task['source_file'])
+    if path == get_tasks_file():
+        return 'tasks'
+    if path == get_week_priorities_file():
+        return 'week_priorities'
+    return 'vault'
+
+def query_tasks_data(**filters: Any) -> Dict[str, Any]:
+    """One page of vault-wide tasks (see TaskTable.query for filters, sort and cursor)"""
+    try:
+        page = get_task_table().query(**filters)
+    except ValueError as e:
+        return {'success': False, 'error': str(e)}
+    for task in page['tasks']:
+        task['source'] = _vault_task_source(task)
+    return {'success': True, 'tasks': page['tasks'], 'count': len(page['tasks']),
+            'total': page['total'], 'next_cursor': page['next_cursor']}
+
+def get_vault_tasks(**filters: Any) -> List[Dict[str, Any]]:
+    """All vault-wide tasks matching the filters (one row per task ID), in vault order"""
+    tasks: List[Dict[str, Any]] = []
+    cursor = None
+    while True:
+        page = query_tasks_data(limit=500, cursor=cursor, **filters)
+        tasks.extend(page['tasks'])
+        cursor = page['next_cursor']
+        if not cursor:
+            return tasks
+
+# Similarity index over open task titles, reused while the title list is unchanged
+# (or only grows, as when create_tasks dedupes a batch against itself)
+_similarity_index: Optional[TitleSimilarityIndex] = None
+_similarity_index_lock = threading.Lock()
+
+def _get_similarity_index(titles: List[str]) -> TitleSimilarityIndex:
+    """Return a similarity index for the given titles, extending the cached one when possible"""
+    global _similarity_index
+    index = _similarity_index
+    if index is None or len(index) > len(titles) or index.titles != titles[:len(index)]:
+        index = TitleSimilarityIndex(extract_keywords)
+    index.extend(titles[len(index):])
+    _similarity_index = index
+    return index
+
 def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Find tasks similar to the given item.
     
@@ -2128,53 +2300,242 @@ def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]]) -> List[
         except Exception:
             pass  # Fall through to keyword matching
     
-    # --- Standard keyword + sequence matching ---
-    item_keywords = extract_keywords(item)
+    # --- Standard keyword + sequence matching (index narrows candidates) ---
+    open_tasks = [t for t in existing_tasks if not (t.get('completed') or t.get('status') == 'd')]
+    titles = [task.get('title', '') for task in open_tasks]
     
-    for task in existing_tasks:
-        if task.get('completed') or task.get('status') == 'd':
-            continue
-        
-        title = task.get('title', '')
-        title_similarity = calculate_similarity(item, title)
-        
-        task_keywords = extract_keywords(title)
-        if item_keywords and task_keywords:
-            keyword_overlap = len(item_keywords & task_keywords) / len(item_keywords | task_keywords)
-        else:
-            keyword_overlap = 0
-        
-        # Boost score if QMD also flagged this task as semantically similar
-        qmd_boost = 0.0
-        if qmd_matches:
+    # Boost score if QMD also flagged this task as semantically similar
+    boosts = {}
+    if qmd_matches:
+        for idx, title in enumerate(titles):
             for qmd_snippet in qmd_matches:
                 if title.lower() in qmd_snippet.lower() or qmd_snippet.lower() in title.lower():
-                    qmd_boost = 0.15
+                    boosts[idx] = 0.15
                     break
-        
+    
+    with _similarity_index_lock:
+        matches = _get_similarity_index(titles).search(
+            item, DEDUP_CONFIG['similarity_threshold'], 0.6, 0.25, boosts
+        )
+    
+    for idx, title_similarity, keyword_overlap in matches:
+        task = open_tasks[idx]
+        qmd_boost = boosts.get(idx, 0.0)
         similarity_score = (title_similarity * 0.6) + (keyword_overlap * 0.25) + qmd_boost
-        
-        if similarity_score >= DEDUP_CONFIG['similarity_threshold']:
-            similar.append({
-                'title': title,
-                'section': task.get('section', ''),
-                'source': task.get('source', ''),
-                'similarity_score': round(similarity_score, 2),
-                'semantic_match': qmd_boost > 0
-            })
+        similar.append({
+            'title': titles[idx],
+            'section': task.get('section', ''),
+            'source': task.get('source', ''),
+            'similarity_score': round(similarity_score, 2),
+            'semantic_match': qmd_boost > 0
+        })
     
     similar.sort(key=lambda x: x['similarity_score'], reverse=True)
     return similar[:3]
 
+def validate_new_task(title: str, pillar: str, priority: str) -> Optional[Dict[str, Any]]:
+    """Check pillar, priority and ambiguity for a new task. Returns an error result or None"""
+    if pillar not in PILLARS:
+        return {
+            "success": False,
+            "error": f"Invalid pillar '{pillar}'. Must be one of: {list(PILLARS.keys())}"
+        }
+    
+    if priority not in PRIORITIES:
+        return {
+            "success": False,
+            "error": f"Invalid priority '{priority}'. Must be one of: {PRIORITIES}"
+        }
+    
+    if is_ambiguous(title):
+        return {
+            "success": False,
+            "error": "Task is too vague",
+            "title": title,
+            "clarification_needed": generate_clarification_questions(title),
+            "suggestion": "Please provide more specific details before creating this task"
+        }
+    
+    return None
+
+def priority_limit_error(priority: str, priority_counts: Counter) -> Optional[Dict[str, Any]]:
+    """Return an error result if adding a task at this priority would exceed its limit"""
+    if priority in PRIORITY_LIMITS and priority_counts.get(priority, 0) >= PRIORITY_LIMITS[priority]:
+        return {
+            "success": False,
+            "error": f"Priority limit exceeded for {priority}",
+            "current_count": priority_counts.get(priority, 0),
+            "limit": PRIORITY_LIMITS[priority],
+            "suggestion": f"You have too many {priority} tasks. Complete or deprioritize some before adding more."
+        }
+    return None
+
+def build_task_entry(title: str, task_id: str, pillar: str, priority: str, context: str = '',
+                     weekly_priority_id: str = '', account: str = '', people: Optional[List[str]] = None) -> str:
+    """Build the markdown entry for a new task (task line plus metadata sub-bullets)"""
+    # Build file references for account/people
+    file_refs = []
+    if account:
+        # Use plain file path reference
+        file_refs.append(account if account.endswith('.md') else f"{account}.md")
+    for person in people or []:
+        file_refs.append(person if person.endswith('.md') else f"{person}.md")
+    
+    # Create the task entry with plain file references and task ID
+    task_line = f"- [ ] **{title}**"
+    if file_refs:
+        task_line += " | " + " ".join(file_refs)
+    task_line += f" ^{task_id}"
+    
+    task_entry = task_line
+    if context:
+        task_entry += f"\n\t- {context}"
+    task_entry += f"\n\t- Pillar: {PILLARS[pillar]['name']} | Priority: {priority}"
+    if weekly_priority_id:
+        task_entry += f" | Weekly priority: [{weekly_priority_id}]"
+    return task_entry
+
+def insert_task_entries(content: str, section: str, task_entries: List[str]) -> str:
+    """Insert task entries (in order) at the top of a section, creating the section if needed"""
+    block = "\n".join(task_entries)
+    section_header = f"## {section}"
+    if section_header in content:
+        # Add after section header
+        parts = content.split(section_header)
+        return parts[0] + section_header + "\n" + block + "\n" + section_header.join(parts[1:])
+    
+    # Create new section at the top
+    lines = content.split('\n')
+    insert_idx = 1  # After the first header
+    for i, line in enumerate(lines):
+        if line.startswith('# '):
+            insert_idx = i + 1
+            break
+    lines.insert(insert_idx, f"\n{section_header}\n{block}\n")
+    return '\n'.join(lines)
+
+def create_tasks_batch(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create many tasks with one dedup pass, one ID block, one write and one sync per page
+    
+    Each item takes the same fields as create_task. Items are checked in
+    order against existing tasks and against earlier items in the batch;
+    per-item results use the create_task result shape.
+    """
+    existing_tasks = get_all_tasks()
+    priority_counts = Counter(t.get('priority', 'P2') for t in existing_tasks if not t.get('completed'))
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    accepted = []  # (index, normalized item)
+    batch_tasks: List[Dict[str, Any]] = []
+    
+    for idx, item in enumerate(items):
+        title = (item.get('title') or '').strip()
+        pillar = item.get('pillar', '')
+        priority = item.get('priority', 'P2')
+        if not title:
+            results[idx] = {"success": False, "error": "Task title is required"}
+            continue
+        
+        error = validate_new_task(title, pillar, priority)
+        if error:
+            results[idx] = error
+            continue
+        
+        similar = find_similar_tasks(title, existing_tasks + batch_tasks)
+        if similar:
+            results[idx] = {
+                "success": False,
+                "error": "Potential duplicate detected",
+                "title": title,
+                "similar_tasks": similar,
+                "suggestion": "Review these similar tasks. If still unique, rephrase the title to be more distinct."
+            }
+            continue
+        
+        error = priority_limit_error(priority, priority_counts)
+        if error:
+            results[idx] = error
+            continue
+        
+        priority_counts[priority] += 1
+        normalized = {
+            'title': title,
+            'pillar': pillar,
+            'priority': priority,
+            'context': item.get('context', ''),
+            'section': item.get('section', 'Next Week'),
+            'weekly_priority_id': item.get('weekly_priority_id', ''),
+            'account': item.get('account', ''),
+            'people': item.get('people', []) or [],
+        }
+        accepted.append((idx, normalized))
+        batch_tasks.append({'title': title, 'section': normalized['section'], 'source': 'batch'})
+    
+    if accepted:
+        task_ids = allocate_task_ids(len(accepted), when=_tz_now())
+        
+        # Group entries by section, preserving request order within each section
+        entries_by_section: Dict[str, List[str]] = {}
+        for (idx, task), task_id in zip(accepted, task_ids):
+            task['task_id'] = task_id
+            entries_by_section.setdefault(task['section'], []).append(build_task_entry(
+                task['title'], task_id, task['pillar'], task['priority'], task['context'],
+                task['weekly_priority_id'], task['account'], task['people'],
+            ))
+        
+        tasks_file = get_tasks_file()
+        content = tasks_file.read_text() if tasks_file.exists() else "# Tasks\n\n"
+        for section, entries in entries_by_section.items():
+            content = insert_task_entries(content, section, entries)
+        atomic_write_text(tasks_file, content)
+        
+        # Sync each referenced page once, after the single write
+        pages = []
+        for _, task in accepted:
+            for page in ([task['account']] if task['account'] else []) + task['people']:
+                if page not in pages:
+                    pages.append(page)
+        synced = {page for page in pages if sync_task_refs_for_page(page)['success']}
+        
+        for idx, task in accepted:
+            task_pages = ([task['account']] if task['account'] else []) + task['people']
+            results[idx] = {
+                "success": True,
+                "task": {
+                    "title": task['title'],
+                    "task_id": task['task_id'],
+                    "pillar": PILLARS[task['pillar']]['name'],
+                    "priority": task['priority'],
+                    "section": task['section'],
+                    "weekly_priority_id": task['weekly_priority_id'] or None,
+                    "account": task['account'] or None,
+                    "people": task['people'] or None
+                },
+                "synced_pages": [page for page in task_pages if page in synced],
+                "message": f"Task '{task['title']}' created successfully under {task['section']} with ID: {task['task_id']}"
+            }
+            try:
+                _fire_analytics_event('task_created', {
+                    'pillar': task['pillar'],
+                    'priority': task['priority'],
+                })
+            except Exception:
+                pass
+    
+    return {
+        "success": bool(accepted),
+        "created": len(accepted),
+        "failed": len(items) - len(accepted),
+        "results": results,
+    }
+
 # ============================================================================
 # MIGRATION HELPERS
 # ============================================================================
 
 def migrate_quarterly_goals() -> Dict[str, Any]:
     """Add IDs to existing quarterly goals that don't have them"""
-    goals_file = QUARTER_GOALS_FILE
-    if is_demo_mode():
-        goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+    goals_file = get_quarter_goals_file()
     
     if not goals_file.exists():
         return {
@@ -2209,7 +2570,7 @@ def migrate_quarterly_goals() -> Dict[str, Any]:
             goals_updated += 1
     
     if goals_updated > 0:
-        goals_file.write_text('\n'.join(lines))
+        atomic_write_text(goals_file, '\n'.join(lines))
     
     return {
         'success': True,
@@ -2258,7 +2619,7 @@ def migrate_weekly_priorities() -> Dict[str, Any]:
             priorities_updated += 1
     
     if priorities_updated > 0:
-        priorities_file.write_text('\n'.join(lines))
+        atomic_write_text(priorities_file, '\n'.join(lines))
     
     return {
         'success': True,
@@ -2333,6 +2694,33 @@ def classify_all_tasks_effort(tasks: List[Dict]) -> List[Dict]:
 # WEEK PROGRESS TRACKING
 # ============================================================================
 
+def get_task_velocity(quarter_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Weekly task completions and burn-down for the quarter so far, from the completion log"""
+    today = _tz_today()
+    last_day = min(today, quarter_info['end_date'])
+    day = quarter_info['start_date'] - timedelta(days=quarter_info['start_date'].weekday())
+    weeks = []
+    while day <= last_day:
+        weeks.append(week_key(day))
+        day += timedelta(days=7)
+    
+    series = _completion_log.weekly_series(weeks)
+    cumulative = 0
+    for week in series:
+        cumulative += week['net']
+        week['cumulative'] = cumulative
+    avg_per_week = cumulative / len(series) if series else 0
+    
+    open_tasks = sum(1 for t in get_all_tasks() if not t.get('completed'))
+    return {
+        'weeks_elapsed': len(series),
+        'tasks_completed': cumulative,
+        'avg_per_week': round(avg_per_week, 1),
+        'open_tasks': open_tasks,
+        'weeks_to_clear_open_tasks': round(open_tasks / avg_per_week, 1) if avg_per_week > 0 else None,
+        'weekly': series
+    }
+
 def get_week_progress_data() -> Dict[str, Any]:
     """Get comprehensive progress data for the current week"""
     today = _tz_today()
@@ -2342,9 +2730,9 @@ def get_week_progress_data() -> Dict[str, Any]:
     days_remaining = (week_end - today).days
     days_elapsed = today.weekday()  # 0=Monday
     
-    # Get weekly priorities
-    priorities_file = get_week_priorities_file()
-    priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
+    # Weekly priorities and their linked tasks come from the shared planning graph
+    graph = get_planning_graph()
+    priorities = graph['priorities']
     
     # Enrich priorities with task data
     priorities_detail = []
@@ -2361,7 +2749,7 @@ def get_week_progress_data() -> Dict[str, Any]:
         
         # Find linked tasks
         if priority.get('priority_id'):
-            linked_tasks = find_linked_tasks(priority['priority_id'])
+            linked_tasks = graph['tasks_by_priority'].get(priority['priority_id'], ())
             priority_data['tasks_total'] = len(linked_tasks)
             priority_data['tasks_done'] = sum(1 for t in linked_tasks if t.get('completed'))
             
@@ -2382,14 +2770,9 @@ def get_week_progress_data() -> Dict[str, Any]:
     in_progress_priorities = sum(1 for p in priorities_detail if p['status'] == 'in_progress')
     not_started_priorities = sum(1 for p in priorities_detail if p['status'] == 'not_started')
     
-    # Get tasks completed this week
-    all_tasks = get_all_tasks()
-    tasks_completed_this_week = 0
-    for task in all_tasks:
-        if task.get('completed'):
-            # Check if completed this week by looking at the task line for timestamp
-            # This is a simplified check - would need completion timestamps
-            tasks_completed_this_week += 1  # Placeholder
+    # Tasks completed this week, from the completion event log's weekly counters
+    week_counts = _completion_log.week_counts(week_key(today))
+    tasks_completed_this_week = max(0, week_counts['task']['completed'] - week_counts['task']['reopened'])
     
     return {
         'date': today.isoformat(),
@@ -2406,6 +2789,7 @@ def get_week_progress_data() -> Dict[str, Any]:
             'not_started': not_started_priorities
         },
         'tasks_completed_this_week': tasks_completed_this_week,
+        'tasks_completed_by_pillar': {k: v for k, v in week_counts['pillars'].items() if v > 0},
         'warnings': [p['warning'] for p in priorities_detail if p.get('warning')]
     }
 
@@ -2414,58 +2798,83 @@ def get_week_progress_data() -> Dict[str, Any]:
 # MEETING INTELLIGENCE
 # ============================================================================
 
+# Company, person and project pages held in memory and re-read only when they change
+_resolution_index = ResolutionIndex(_parse_person_content, _parse_company_domains)
+
+_PROJECT_STATUS = re.compile(r'status:\s*(.+?)(?:\n|$)')
+
+
+def get_resolution_index() -> ResolutionIndex:
+    """Return the resolution index, brought up to date with the vault"""
+    people_dir = get_people_dir()
+    _resolution_index.refresh(
+        COMPANIES_DIR,
+        {'External': people_dir / 'External', 'Internal': people_dir / 'Internal'},
+        PROJECTS_DIR,
+    )
+    return _resolution_index
+
 def find_project_for_meeting(attendees: List[str], meeting_title: str) -> Optional[Dict[str, Any]]:
     """Find a related project based on meeting attendees or title"""
-    projects_dir = BASE_DIR / '04-Projects'
-    if not projects_dir.exists():
+    if not PROJECTS_DIR.exists():
         return None
     
+    # Records and positions come from one refresh, so a concurrent refresh can't mix them
+    projects, positions_by_person = get_resolution_index().project_snapshot()
+    
     # Normalize attendees and title for matching
     search_terms = [a.lower().replace(' ', '_') for a in attendees]
     search_terms.append(meeting_title.lower())
     
-    best_match = None
-    best_score = 0
-    
-    for project_file in projects_dir.glob('**/*.md'):
-        if project_file.name.startswith('.'):
-            continue
-            
-        try:
-            content = project_file.read_text()
-            content_lower = content.lower()
-            
-            score = 0
-            for term in search_terms:
-                if term in content_lower or term in project_file.stem.lower():
-                    score += 1
-            
-            if score > best_score:
-                best_score = score
-                
-                # Extract project status
-                status = 'Unknown'
-                if 'status:' in content_lower:
-                    status_match = re.search(r'status:\s*(.+?)(?:\n|$)', content_lower)
-                    if status_match:
-                        status = status_match.group(1).strip()
-                
-                best_match = {
-                    'path': str(project_file.relative_to(BASE_DIR)),
-                    'name': project_file.stem.replace('_', ' '),
-                    'status': status,
-                    'match_score': score
-                }
-        except Exception:
+    scores = [0] * len(projects)
+    for term in search_terms:
+        if term in positions_by_person:
+            # Person page names are pre-matched against every project
+            for i in positions_by_person[term]:
+                scores[i] += 1
             continue
+        for i, project in enumerate(projects):
+            if term in project['content_lower'] or term in project['stem_lower']:
+                scores[i] += 1
     
-    return best_match if best_score > 0 else None
+    best_score = max(scores, default=0)
+    if best_score <= 0:
+        return None
+    
+    project = projects[scores.index(best_score)]
+    status_match = _PROJECT_STATUS.search(project['content_lower'])
+    return {
+        'path': str(project['path'].relative_to(BASE_DIR)),
+        'name': project['path'].stem.replace('_', ' '),
+        'status': status_match.group(1).strip() if status_match else 'Unknown',
+        'match_score': best_score
+    }
+
+def _email_domain(value: str) -> Optional[str]:
+    if '@' not in value:
+        return None
+    return value.rsplit('@', 1)[1].strip().strip('<>').lower() or None
 
 def find_company_for_attendees(attendees: List[str], domains: List[str] = None) -> Optional[Dict[str, Any]]:
     """Find a company page based on attendees or email domains"""
     if not COMPANIES_DIR.exists():
         return None
     
+    index = get_resolution_index()
+    
+    def as_result(company: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'path': str(company['path'].relative_to(BASE_DIR)),
+            'name': company['path'].stem.replace('_', ' '),
+            'domains': list(company['domains'])
+        }
+    
+    # An exact email domain listed on a company page wins
+    for domain in [_email_domain(a) for a in attendees] + list(domains or []):
+        company = index.company_for_domain(domain) if domain else None
+        if company:
+            return as_result(company)
+    
     search_terms = []
     for attendee in attendees:
         search_terms.append(attendee.lower())
@@ -2477,24 +2886,10 @@ def find_company_for_attendees(attendees: List[str], domains: List[str] = None)
     if domains:
         search_terms.extend([d.lower() for d in domains])
     
-    for company_file in COMPANIES_DIR.glob('*.md'):
-        try:
-            content = company_file.read_text()
-            content_lower = content.lower()
-            company_name = company_file.stem.lower().replace('_', ' ')
-            
-            for term in search_terms:
-                if term in company_name or term in content_lower:
-                    # Extract company domains
-                    company_domains = get_company_domains(company_file)
-                    
-                    return {
-                        'path': str(company_file.relative_to(BASE_DIR)),
-                        'name': company_file.stem.replace('_', ' '),
-                        'domains': company_domains
-                    }
-        except Exception:
-            continue
+    for company in index.companies():
+        for term in search_terms:
+            if term in company['name_lower'] or term in company['content_lower']:
+                return as_result(company)
     
     return None
 
@@ -2514,23 +2909,19 @@ def get_meeting_context_data(meeting_title: str = None, attendees: List[str] = N
     if not attendees:
         return result
 
-    # --- Cache-first: pull recent meetings from meeting cache ---
-    cache = load_meeting_cache()
-    if cache:
+    # --- Cache-first: pull recent meetings from the indexed meeting cache ---
+    if _meeting_store.ensure_current():
         for attendee in attendees:
-            attendee_lower = attendee.lower()
-            for m in cache.get('meetings', []):
-                cached_attendees = [a.lower() for a in (m.get('attendees') or [])]
-                if any(attendee_lower in a or a in attendee_lower for a in cached_attendees):
-                    result['recent_meetings'].append({
-                        'date': m.get('date'),
-                        'title': m.get('title'),
-                        'source_file': m.get('source_file'),
-                        'decisions': m.get('decisions', []),
-                        'action_items': m.get('action_items', []),
-                        'key_points': m.get('key_points', []),
-                        'sentiment': m.get('sentiment'),
-                    })
+            for m in _meeting_store.query(attendee=attendee):
+                result['recent_meetings'].append({
+                    'date': m.get('date'),
+                    'title': m.get('title'),
+                    'source_file': m.get('source_file'),
+                    'decisions': m.get('decisions', []),
+                    'action_items': m.get('action_items', []),
+                    'key_points': m.get('key_points', []),
+                    'sentiment': m.get('sentiment'),
+                })
         # Deduplicate by source_file
         seen = set()
         deduped = []
@@ -2548,21 +2939,25 @@ def get_meeting_context_data(meeting_title: str = None, attendees: List[str] = N
     # Find related company
     result['related_company'] = find_company_for_attendees(attendees)
     
-    # Get attendee details from People directory
+    # Get attendee details from the People pages (resolution index)
+    index = get_resolution_index()
     for attendee in attendees:
+        if _email_domain(attendee):
+            by_email = index.people_by_email(attendee.strip().strip('<>'))
+            if by_email:
+                result['attendee_details'].append(dict(by_email[0]))
+                continue
+        
         attendee_normalized = attendee.lower().replace(' ', '_')
         
         # Check both Internal and External directories
         for subdir in ['External', 'Internal']:
-            people_subdir = get_people_dir() / subdir
-            if not people_subdir.exists():
-                continue
-            
-            for person_file in people_subdir.glob('*.md'):
-                if attendee_normalized in person_file.stem.lower():
-                    person_data = parse_person_page(person_file)
-                    result['attendee_details'].append(person_data)
-                    break
+            matches = index.people_by_key(subdir, attendee_normalized)
+            if not matches:
+                matches = [person for key, person in zip(index.person_keys(subdir), index.people(subdir))
+                           if attendee_normalized in key]
+            if matches:
+                result['attendee_details'].append(dict(matches[0]))
     
     # Find outstanding tasks related to attendees
     tasks_file = get_tasks_file()
@@ -2636,28 +3031,68 @@ COMMITMENT_PATTERNS = [
     r"follow.?up:\s*(.+)",
 ]
 
+_COMMITMENT_REGEXES = [re.compile(p) for p in COMMITMENT_PATTERNS]
+
+# One scan finds every position where a pattern can start: each alternative is
+# the literal its COMMITMENT_PATTERNS entry begins with (same order)
+_COMMITMENT_STARTS = re.compile(
+    r"(?=(?P<p0>i['']ll)|(?P<p1>will)|(?P<p2>owe)|(?P<p3>need to)|(?P<p4>action)|(?P<p5>follow))"
+)
+
+# Extracted commitments per meeting note / person page, keyed by content hash
+_commitment_cache = ExtractionCache(
+    COMMITMENT_CACHE_FILE,
+    version=hashlib.sha1('\n'.join(COMMITMENT_PATTERNS).encode('utf-8')).hexdigest(),
+)
+
+def _find_commitment_matches(text_lower: str) -> List[Tuple[str, Optional[str]]]:
+    """(commitment, due_date) pairs, as if each pattern had been run with finditer in turn"""
+    found: List[List[Tuple[str, Optional[str]]]] = [[] for _ in _COMMITMENT_REGEXES]
+    resume_at = [0] * len(_COMMITMENT_REGEXES)
+    for start in _COMMITMENT_STARTS.finditer(text_lower):
+        k = int(start.lastgroup[1:])
+        pos = start.start()
+        if pos < resume_at[k]:
+            continue  # inside this pattern's previous match; finditer doesn't overlap
+        match = _COMMITMENT_REGEXES[k].match(text_lower, pos)
+        if not match:
+            continue
+        resume_at[k] = match.end()
+        commitment_text = match.group(1).strip() if match.lastindex >= 1 else match.group(0)
+        due_date = match.group(2) if match.lastindex >= 2 else None
+        found[k].append((commitment_text, due_date))
+    return [pair for pattern_matches in found for pair in pattern_matches]
+
 def extract_commitments_from_text(text: str, source: str = '', date_context: str = '') -> List[Dict[str, Any]]:
     """Extract commitment patterns from text"""
-    commitments = []
-    text_lower = text.lower()
-    
-    for pattern in COMMITMENT_PATTERNS:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            commitment_text = match.group(1).strip() if match.lastindex >= 1 else match.group(0)
-            due_date = match.group(2) if match.lastindex >= 2 else None
-            
-            commitments.append({
-                'commitment': commitment_text,
-                'due_date': due_date,
-                'source': source,
-                'date_context': date_context
-            })
-    
-    return commitments
+    return [
+        {
+            'commitment': commitment_text,
+            'due_date': due_date,
+            'source': source,
+            'date_context': date_context
+        }
+        for commitment_text, due_date in _find_commitment_matches(text.lower())
+    ]
 
-def get_commitments_due_data(date_range: str = 'today') -> Dict[str, Any]:
-    """Scan meeting notes and person pages for commitments due"""
+def _extract_open_items(content: str) -> List[str]:
+    """Unchecked items from a person page's Open Items / Action Items / Follow-ups section"""
+    items = []
+    open_items_match = re.search(r'(?:## Open Items|## Action Items|## Follow-?ups?)\n(.*?)(?:\n##|\Z)', content, re.DOTALL)
+    if open_items_match:
+        section_content = open_items_match.group(1)
+        # Extract uncompleted items
+        for line in section_content.split('\n'):
+            if '- [ ]' in line:
+                items.append(re.sub(r'-\s*\[\s*\]\s*', '', line).strip())
+    return items
+
+def get_commitments_due_data(date_range: str = 'today', incremental: bool = False) -> Dict[str, Any]:
+    """Scan meeting notes and person pages for commitments due.
+
+    Extraction results are cached per file by content hash; with
+    ``incremental`` files whose mtime/size are unchanged aren't even read.
+    """
     today = _tz_today()
     
     result = {
@@ -2667,75 +3102,73 @@ def get_commitments_due_data(date_range: str = 'today') -> Dict[str, Any]:
         'sources_scanned': []
     }
     
-    # Scan recent meeting notes
-    meetings_dir = get_meetings_dir()
-    if meetings_dir.exists():
-        # Look at meetings from last 14 days
-        for meeting_file in meetings_dir.glob('*.md'):
-            try:
-                # Extract date from filename (assuming YYYY-MM-DD prefix)
-                filename = meeting_file.stem
-                date_match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-                if date_match:
-                    meeting_date_str = date_match.group(1)
-                    meeting_date = datetime.strptime(meeting_date_str, '%Y-%m-%d').date()
+    with _commitment_cache.scan() as scan:
+        # Scan recent meeting notes
+        meetings_dir = get_meetings_dir()
+        if meetings_dir.exists():
+            # Look at meetings from last 14 days
+            for meeting_file in meetings_dir.glob('*.md'):
+                try:
+                    # Extract date from filename (assuming YYYY-MM-DD prefix)
+                    filename = meeting_file.stem
+                    date_match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
+                    if date_match:
+                        meeting_date_str = date_match.group(1)
+                        meeting_date = datetime.strptime(meeting_date_str, '%Y-%m-%d').date()
+                        
+                        # Only look at recent meetings
+                        if (today - meeting_date).days > 14:
+                            continue
                     
-                    # Only look at recent meetings
-                    if (today - meeting_date).days > 14:
-                        continue
-                
-                content = meeting_file.read_text()
-                commitments = extract_commitments_from_text(
-                    content, 
-                    source=str(meeting_file.relative_to(BASE_DIR)),
-                    date_context=meeting_date_str if date_match else ''
-                )
-                
-                for c in commitments:
-                    if c['due_date']:
-                        due_lower = c['due_date'].lower()
-                        if due_lower in ['today', today.strftime('%A').lower()]:
-                            result['commitments_due_today'].append(c)
-                        elif due_lower in ['tomorrow', 'this week', 'friday', 'thursday', 'wednesday', 'tuesday', 'monday']:
-                            result['commitments_due_this_week'].append(c)
+                    source = str(meeting_file.relative_to(BASE_DIR))
+                    matches = scan.lookup(meeting_file, source,
+                                          lambda text: _find_commitment_matches(text.lower()), incremental)
+                    
+                    for commitment_text, due_date in matches:
+                        c = {
+                            'commitment': commitment_text,
+                            'due_date': due_date,
+                            'source': source,
+                            'date_context': meeting_date_str if date_match else ''
+                        }
+                        if c['due_date']:
+                            due_lower = c['due_date'].lower()
+                            if due_lower in ['today', today.strftime('%A').lower()]:
+                                result['commitments_due_today'].append(c)
+                            elif due_lower in ['tomorrow', 'this week', 'friday', 'thursday', 'wednesday', 'tuesday', 'monday']:
+                                result['commitments_due_this_week'].append(c)
+                            else:
+                                result['commitments_no_date'].append(c)
                         else:
                             result['commitments_no_date'].append(c)
-                    else:
-                        result['commitments_no_date'].append(c)
-                
-                result['sources_scanned'].append(str(meeting_file.name))
-                
-            except Exception as e:
-                logger.error(f"Error scanning {meeting_file}: {e}")
-                continue
-    
-    # Scan person pages for "owe" or "follow up" mentions
-    for subdir in ['External', 'Internal']:
-        people_subdir = get_people_dir() / subdir
-        if not people_subdir.exists():
-            continue
+                    
+                    result['sources_scanned'].append(str(meeting_file.name))
+                    
+                except Exception as e:
+                    logger.error(f"Error scanning {meeting_file}: {e}")
+                    continue
         
-        for person_file in people_subdir.glob('*.md'):
-            try:
-                content = person_file.read_text()
-                
-                # Look for "Open Items" or "Action Items" sections
-                open_items_match = re.search(r'(?:## Open Items|## Action Items|## Follow-?ups?)\n(.*?)(?:\n##|\Z)', content, re.DOTALL)
-                if open_items_match:
-                    section_content = open_items_match.group(1)
-                    # Extract uncompleted items
-                    for line in section_content.split('\n'):
-                        if '- [ ]' in line:
-                            item_text = re.sub(r'-\s*\[\s*\]\s*', '', line).strip()
-                            result['commitments_no_date'].append({
-                                'commitment': item_text,
-                                'due_date': None,
-                                'source': f"Person: {person_file.stem.replace('_', ' ')}",
-                                'to_person': person_file.stem.replace('_', ' ')
-                            })
-            except Exception:
+        # Scan person pages for "owe" or "follow up" mentions
+        for subdir in ['External', 'Internal']:
+            people_subdir = get_people_dir() / subdir
+            if not people_subdir.exists():
                 continue
+            
+            for person_file in people_subdir.glob('*.md'):
+                try:
+                    items = scan.lookup(person_file, str(person_file), _extract_open_items, incremental)
+                    for item_text in items:
+                        result['commitments_no_date'].append({
+                            'commitment': item_text,
+                            'due_date': None,
+                            'source': f"Person: {person_file.stem.replace('_', ' ')}",
+                            'to_person': person_file.stem.replace('_', ' ')
+                        })
+                except Exception:
+                    continue
     
+    # Files whose commitments came from the cache vs. were re-extracted
+    result['sources_cache'] = {'hits': scan.hits, 'misses': scan.misses, 'incremental': incremental}
     return result
 
 
@@ -2743,20 +3176,22 @@ def get_commitments_due_data(date_range: str = 'today') -> Dict[str, Any]:
 # CALENDAR CAPACITY ANALYSIS
 # ============================================================================
 
-def analyze_day_capacity(events: List[Dict], target_date: date) -> Dict[str, Any]:
-    """Analyze a single day's calendar capacity"""
-    day_name = target_date.strftime('%A')
-    
-    # Calculate total meeting time
-    total_meeting_minutes = 0
-    meeting_count = len(events)
-    
-    for event in events:
-        # Estimate duration from event data
-        duration = event.get('duration_minutes', 60)  # Default 1 hour
-        total_meeting_minutes += duration
-    
-    meeting_hours = round(total_meeting_minutes / 60, 1)
+def get_working_hours(work_start: Optional[str] = None, work_end: Optional[str] = None) -> Tuple[int, int]:
+    """Working hours as minutes since midnight: arguments, then user-profile.yaml working_hours, then 8am-6pm"""
+    configured = user_profile(USER_PROFILE_FILE).get('working_hours') or {}
+    start = parse_clock(work_start or str(configured.get('start', '')))
+    end = parse_clock(work_end or str(configured.get('end', '')))
+    start = DEFAULT_WORK_START if start is None else start
+    end = DEFAULT_WORK_END if end is None else end
+    if start >= end:
+        raise ValueError(f"Working hours end ({end // 60:02d}:{end % 60:02d}) must be after start ({start // 60:02d}:{start % 60:02d})")
+    return start, end
+
+def _day_capacity(calendar: FreeBusy, target_date: date) -> Dict[str, Any]:
+    """Capacity of one day from the merged free/busy intervals"""
+    day = calendar.day(target_date)
+    meeting_count = day['event_count']
+    meeting_hours = round(day['busy_minutes'] / 60, 1)
     
     # Classify day type
     if meeting_count >= 6 or meeting_hours >= 5:
@@ -2766,20 +3201,6 @@ def analyze_day_capacity(events: List[Dict], target_date: date) -> Dict[str, Any
     else:
         day_type = 'open'
     
-    # Calculate free blocks (simplified - assumes 8am-6pm workday)
-    work_start = 8  # 8am
-    work_end = 18   # 6pm
-    total_work_minutes = (work_end - work_start) * 60
-    free_minutes = total_work_minutes - total_meeting_minutes
-    
-    # Estimate largest block (simplified)
-    if day_type == 'stacked':
-        largest_block = 30
-    elif day_type == 'moderate':
-        largest_block = 90
-    else:
-        largest_block = 180
-    
     # Recommendations
     if day_type == 'stacked':
         recommendation = "Quick tasks only - too fragmented for deep work"
@@ -2790,15 +3211,69 @@ def analyze_day_capacity(events: List[Dict], target_date: date) -> Dict[str, Any
     
     return {
         'date': target_date.isoformat(),
-        'day_name': day_name,
+        'day_name': target_date.strftime('%A'),
         'meeting_count': meeting_count,
         'meeting_hours': meeting_hours,
         'day_type': day_type,
-        'free_minutes': max(0, free_minutes),
-        'largest_block_estimate': largest_block,
+        'free_minutes': day['free_minutes'],
+        'largest_block_estimate': day['largest_block_minutes'],
+        'free_blocks': [
+            {
+                'start': start.strftime('%H:%M'),
+                'end': end.strftime('%H:%M'),
+                'minutes': int((end - start).total_seconds() // 60),
+            }
+            for start, end in day['free_blocks']
+        ],
         'recommendation': recommendation
     }
 
+def analyze_day_capacity(events: List[Dict], target_date: date) -> Dict[str, Any]:
+    """Analyze a single day's calendar capacity"""
+    work_start, work_end = get_working_hours()
+    calendar = FreeBusy(events, work_start, work_end, default_date=target_date, tz=_tz_user(), not_before=_tz_now())
+    return _day_capacity(calendar, target_date)
+
+def analyze_calendar_events(
+    events: List[Dict],
+    days_ahead: int = 5,
+    work_start: Optional[str] = None,
+    work_end: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Merge events from all calendars and report free/busy capacity for upcoming weekdays"""
+    today = _tz_today()
+    start_minutes, end_minutes = get_working_hours(work_start, work_end)
+    # Time already gone today is not free
+    calendar = FreeBusy(
+        events, start_minutes, end_minutes, default_date=today, tz=_tz_user(), not_before=_tz_now()
+    )
+    
+    days_data = []
+    for i in range(days_ahead):
+        target_date = today + timedelta(days=i)
+        if target_date.weekday() >= 5:  # Skip weekends
+            continue
+        days_data.append(_day_capacity(calendar, target_date))
+    
+    deep_work_minutes = EFFORT_KEYWORDS['deep_work']['duration_range'][0]
+    return {
+        'analysis_date': today.isoformat(),
+        'working_hours': {
+            'start': f"{start_minutes // 60:02d}:{start_minutes % 60:02d}",
+            'end': f"{end_minutes // 60:02d}:{end_minutes % 60:02d}",
+        },
+        'days': days_data,
+        'week_summary': {
+            'stacked_days': sum(1 for d in days_data if d['day_type'] == 'stacked'),
+            'moderate_days': sum(1 for d in days_data if d['day_type'] == 'moderate'),
+            'open_days': sum(1 for d in days_data if d['day_type'] == 'open'),
+            'deep_work_opportunities': [
+                {'day': d['day_name'], 'date': d['date'], 'available_hours': round(d['largest_block_estimate'] / 60, 1)}
+                for d in days_data if d['largest_block_estimate'] >= deep_work_minutes
+            ]
+        }
+    }
+
 def get_calendar_capacity_data(days_ahead: int = 5) -> Dict[str, Any]:
     """Analyze calendar capacity for upcoming days
     
@@ -2842,6 +3317,88 @@ def get_calendar_capacity_data(days_ahead: int = 5) -> Dict[str, Any]:
 # SMART SCHEDULING SUGGESTIONS
 # ============================================================================
 
+_EFFORT_ORDER = {'deep_work': 0, 'medium': 1, 'quick': 2}
+# Estimate shown per effort level, and the minutes booked for it (the estimate's lower end)
+_EFFORT_ESTIMATES = {'deep_work': ('2-3 hours', 120), 'medium': ('1-2 hours', 60), 'quick': ('10-30 min', 10)}
+
+def _pack_tasks_into_free_blocks(
+    deep_work_tasks: List[Dict], medium_tasks: List[Dict], quick_tasks: List[Dict], days: List[Dict]
+) -> Dict[str, Any]:
+    """Bin-pack effort-classified tasks into the days' free blocks (most urgent, then largest, first)"""
+    blocks = []
+    day_names = {}
+    for day in days:
+        day_date = date.fromisoformat(day['date'])
+        day_names[day_date] = day['day_name']
+        for block in day.get('free_blocks', []):
+            start = datetime.combine(day_date, datetime.strptime(block['start'], '%H:%M').time())
+            blocks.append((start, start + timedelta(minutes=block['minutes'])))
+    blocks.sort()
+    
+    tasks = deep_work_tasks + medium_tasks[:5] + quick_tasks
+    order = sorted(
+        range(len(tasks)),
+        key=lambda i: (tasks[i].get('priority') or 'P2', _EFFORT_ORDER[tasks[i]['effort']['effort_type']], i),
+    )
+    placements, _ = pack_tasks(
+        blocks, [(i, _EFFORT_ESTIMATES[tasks[i]['effort']['effort_type']][1]) for i in order]
+    )
+    
+    suggestions = []
+    warnings = []
+    quick_scheduled = 0
+    for i, task in enumerate(tasks):
+        effort_type = task['effort']['effort_type']
+        slot = placements.get(i)
+        if effort_type == 'quick':
+            quick_scheduled += slot is not None
+            continue
+        if slot is None:
+            if effort_type == 'deep_work':
+                warnings.append(f"Deep work task '{task.get('title')}' has no suitable slot this week")
+                continue
+            suggested_slot = {'reason': 'No free block long enough - fit into gaps between meetings'}
+            action_prompt = None
+        else:
+            day_name = day_names[slot[0].date()]
+            suggested_slot = {
+                'day': day_name,
+                'date': slot[0].date().isoformat(),
+                'start': slot[0].strftime('%H:%M'),
+                'end': slot[1].strftime('%H:%M'),
+                'reason': f"Free on {day_name} from {slot[0].strftime('%H:%M')}"
+            }
+            action_prompt = f"Block {slot[0].strftime('%H:%M')}-{slot[1].strftime('%H:%M')} on {day_name} for this?"
+        suggestions.append({
+            'task': task.get('title'),
+            'task_id': task.get('task_id'),
+            'effort': effort_type,
+            'estimated_duration': _EFFORT_ESTIMATES[effort_type][0],
+            'suggested_slot': suggested_slot,
+            'action_prompt': action_prompt
+        })
+    
+    if quick_tasks:
+        suggestions.append({
+            'summary': f"{len(quick_tasks)} quick tasks",
+            'effort': 'quick',
+            'estimated_duration': '10-30 min each',
+            'suggested_slot': {
+                'reason': f"{quick_scheduled} fit into free gaps this week; batch the rest between meetings or at end of day"
+            },
+            'action_prompt': None
+        })
+    
+    deep_work_minutes = _EFFORT_ESTIMATES['deep_work'][1]
+    deep_work_slots = sum(1 for start, end in blocks if (end - start) >= timedelta(minutes=deep_work_minutes))
+    
+    return {
+        'suggestions': suggestions,
+        'warnings': warnings,
+        'deep_work_slots': deep_work_slots,
+        'free_minutes': sum(int((end - start).total_seconds() // 60) for start, end in blocks),
+    }
+
 def generate_scheduling_suggestions(
     tasks: List[Dict],
     calendar_capacity: Dict[str, Any]
@@ -2872,6 +3429,25 @@ def generate_scheduling_suggestions(
     
     # Find available slots from calendar capacity
     days = calendar_capacity.get('days', [])
+    
+    if any('free_blocks' in day for day in days):
+        packed = _pack_tasks_into_free_blocks(deep_work_tasks, medium_tasks, quick_tasks, days)
+        return {
+            'suggestions': packed['suggestions'],
+            'warnings': packed['warnings'],
+            'task_summary': {
+                'deep_work': len(deep_work_tasks),
+                'medium': len(medium_tasks),
+                'quick': len(quick_tasks)
+            },
+            'capacity_summary': {
+                'deep_work_slots': packed['deep_work_slots'],
+                'moderate_days': sum(1 for d in days if d.get('day_type') == 'moderate'),
+                'free_minutes': packed['free_minutes']
+            }
+        }
+    
+    # Without calendar data, fall back to whole-day slots by day type
     deep_work_slots = []
     medium_slots = []
     
@@ -2975,8 +3551,34 @@ async def handle_list_tools() -> list[types.Tool]:
                     "pillar": {"type": "string", "description": f"Filter by pillar ({pillar_description})"},
                     "priority": {"type": "string", "description": "Filter by priority (P0, P1, P2, P3)"},
                     "status": {"type": "string", "description": "Filter by status (n, s, b, d)"},
-                    "source": {"type": "string", "description": "Filter by source (tasks, week_priorities)"},
-                    "include_done": {"type": "boolean", "description": "Include completed tasks", "default": False}
+                    "source": {"type": "string", "description": "Filter by source (tasks, week_priorities, vault)"},
+                    "include_done": {"type": "boolean", "description": "Include completed tasks", "default": False},
+                    "scope": {"type": "string", "enum": ["tasks", "vault"], "description": "tasks: Tasks.md and Week Priorities (default); vault: every task in every note", "default": "tasks"}
+                }
+            }
+        ),
+        types.Tool(
+            name="query_tasks",
+            description="Query every task in the vault (Tasks.md, meeting notes, person pages, projects) from an index. Filter, sort and page with a cursor, e.g. all open P1 tasks mentioning Acme.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "include_done": {"type": "boolean", "description": "Include completed tasks", "default": False},
+                    "status": {"type": "string", "description": "Filter by status (n, d)"},
+                    "priority": {"type": "string", "description": "Filter by priority (P0, P1, P2, P3)"},
+                    "pillar": {"type": "string", "description": f"Filter by pillar ({pillar_description})"},
+                    "section": {"type": "string", "description": "Filter by section heading the task sits under"},
+                    "file_prefix": {"type": "string", "description": "Only files under this vault-relative path (e.g. '05-Areas/People/')"},
+                    "mentions": {"type": "string", "description": "Case-insensitive text in the title or a referenced page name"},
+                    "ref": {"type": "string", "description": "Exact referenced page name (e.g. 'Jane_Doe')"},
+                    "task_id": {"type": "string", "description": "Filter by task ID"},
+                    "completed_after": {"type": "string", "description": "Completed at or after (YYYY-MM-DD or YYYY-MM-DD HH:MM)"},
+                    "completed_before": {"type": "string", "description": "Completed at or before (YYYY-MM-DD HH:MM)"},
+                    "all_copies": {"type": "boolean", "description": "Return every copy of a synced task instead of one per task ID", "default": False},
+                    "sort": {"type": "string", "enum": ["location", "priority", "completed_at", "task_id"], "default": "location"},
+                    "descending": {"type": "boolean", "default": False},
+                    "limit": {"type": "integer", "description": "Page size", "default": 50},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page"}
                 }
             }
         ),
@@ -2998,6 +3600,34 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["title", "pillar"]
             }
         ),
+        types.Tool(
+            name="create_tasks",
+            description="Create many tasks at once (e.g. after meeting triage). Validates and dedupes all items against existing tasks and each other, then writes them in one pass. Returns one create_task-style result per item.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "description": "Tasks to create, each with the same fields as create_task",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string", "description": "Task title (be specific, not vague)"},
+                                "pillar": {"type": "string", "enum": pillar_ids, "description": f"Which strategic pillar this supports ({pillar_description})"},
+                                "priority": {"type": "string", "enum": ["P0", "P1", "P2", "P3"], "default": "P2"},
+                                "context": {"type": "string", "description": "Additional context or sub-tasks"},
+                                "section": {"type": "string", "description": "Which section in 03-Tasks/Tasks.md to add to", "default": "Next Week"},
+                                "weekly_priority_id": {"type": "string", "description": "Link to weekly priority (e.g., 'week-2026-W05-p1')"},
+                                "account": {"type": "string", "description": "Path to account page to link"},
+                                "people": {"type": "array", "items": {"type": "string"}, "description": "List of paths to people pages to link"}
+                            },
+                            "required": ["title", "pillar"]
+                        }
+                    }
+                },
+                "required": ["tasks"]
+            }
+        ),
         types.Tool(
             name="update_task_status",
             description="Update task status everywhere it appears (03-Tasks/Tasks.md, meeting notes, person pages). Provide task_id for guaranteed sync across all locations, or task_title for search-based update.",
@@ -3044,7 +3674,12 @@ async def handle_list_tools() -> list[types.Tool]:
         types.Tool(
             name="get_blocked_tasks",
             description="List all tasks that are currently blocked",
-            inputSchema={"type": "object", "properties": {}}
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "scope": {"type": "string", "enum": ["tasks", "vault"], "description": "tasks: Tasks.md and Week Priorities (default); vault: every task in every note", "default": "tasks"}
+                }
+            }
         ),
         types.Tool(
             name="suggest_focus",
@@ -3052,7 +3687,8 @@ async def handle_list_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "max_tasks": {"type": "integer", "description": "Maximum tasks to suggest", "default": 3}
+                    "max_tasks": {"type": "integer", "description": "Maximum tasks to suggest", "default": 3},
+                    "scope": {"type": "string", "enum": ["tasks", "vault"], "description": "tasks: Tasks.md and Week Priorities (default); vault: every task in every note", "default": "tasks"}
                 }
             }
         ),
@@ -3063,13 +3699,13 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="sync_task_refs",
-            description="Refresh the Related Tasks section on an account or people page by reading from 03-Tasks/Tasks.md",
+            description="Refresh the Related Tasks section on account or people pages by reading from 03-Tasks/Tasks.md. Pass page_path for one page or pages for a batch (each page is rewritten once).",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "page_path": {"type": "string", "description": "Path to the page to sync"}
-                },
-                "required": ["page_path"]
+                    "page_path": {"type": "string", "description": "Path to the page to sync"},
+                    "pages": {"type": "array", "items": {"type": "string"}, "description": "Paths of several pages to sync in one call"}
+                }
             }
         ),
         types.Tool(
@@ -3083,6 +3719,11 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["company_path"]
             }
         ),
+        types.Tool(
+            name="refresh_all_companies",
+            description="Refresh every company page (contacts, meetings, tasks). Meeting mentions for all companies are indexed in one pass over changed meeting notes.",
+            inputSchema={"type": "object", "properties": {}}
+        ),
         types.Tool(
             name="list_companies",
             description="List all company pages with basic info and contact counts",
@@ -3268,7 +3909,8 @@ async def handle_list_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "date_range": {"type": "string", "enum": ["today", "this_week", "all"], "default": "today", "description": "Which commitments to return"}
+                    "date_range": {"type": "string", "enum": ["today", "this_week", "all"], "default": "today", "description": "Which commitments to return"},
+                    "incremental": {"type": "boolean", "default": False, "description": "Only re-read files whose modification time or size changed since the last scan"}
                 }
             }
         ),
@@ -3286,7 +3928,7 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="analyze_calendar_capacity",
-            description="Analyze calendar capacity for upcoming days. Identifies day types (stacked/moderate/open), estimates free blocks, and finds deep work opportunities. Pass calendar events for accurate analysis.",
+            description="Analyze calendar capacity for upcoming days. Merges events from all calendars (overlaps counted once), computes free blocks within working hours, classifies day types (stacked/moderate/open) and finds deep work opportunities. Pass calendar events for accurate analysis.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -3298,19 +3940,25 @@ async def handle_list_tools() -> list[types.Tool]:
                             "properties": {
                                 "date": {"type": "string", "description": "Event date (YYYY-MM-DD)"},
                                 "title": {"type": "string"},
-                                "start_time": {"type": "string"},
+                                "start_time": {"type": "string", "description": "Start time (e.g. 09:30 or 9:30 AM)"},
                                 "end_time": {"type": "string"},
-                                "duration_minutes": {"type": "integer"}
+                                "start": {"type": "string", "description": "Start as ISO datetime (alternative to date + start_time)"},
+                                "end": {"type": "string", "description": "End as ISO datetime"},
+                                "duration_minutes": {"type": "integer"},
+                                "all_day": {"type": "boolean"},
+                                "calendar": {"type": "string", "description": "Source calendar name"}
                             }
                         },
-                        "description": "List of calendar events (from calendar MCP)"
-                    }
+                        "description": "List of calendar events (from calendar MCP, any number of calendars)"
+                    },
+                    "work_start": {"type": "string", "description": "Start of working hours (default: user-profile working_hours.start or 08:00)"},
+                    "work_end": {"type": "string", "description": "End of working hours (default: user-profile working_hours.end or 18:00)"}
                 }
             }
         ),
         types.Tool(
             name="suggest_task_scheduling",
-            description="Match tasks to available time slots based on effort classification. Returns scheduling suggestions for deep work, medium, and quick tasks.",
+            description="Match tasks to available time slots based on effort classification. With calendar events, packs deep work, medium and quick tasks into actual free blocks; returns scheduling suggestions.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -3318,19 +3966,22 @@ async def handle_list_tools() -> list[types.Tool]:
                     "calendar_events": {
                         "type": "array",
                         "items": {"type": "object"},
-                        "description": "Calendar events for capacity analysis (from calendar MCP)"
-                    }
+                        "description": "Calendar events for capacity analysis (from calendar MCP; same fields as analyze_calendar_capacity)"
+                    },
+                    "days_ahead": {"type": "integer", "default": 5, "description": "Number of days to schedule into"},
+                    "work_start": {"type": "string", "description": "Start of working hours (e.g. 09:00)"},
+                    "work_end": {"type": "string", "description": "End of working hours (e.g. 17:30)"}
                 }
             }
         ),
         types.Tool(
             name="build_people_index",
-            description="Scan all person pages and build a lightweight JSON index at System/People_Index.json. Run periodically or when person pages change.",
+            description="Build or update the lightweight JSON index at System/People_Index.json. Only person pages changed since the last build are re-parsed.",
             inputSchema={"type": "object", "properties": {}}
         ),
         types.Tool(
             name="lookup_person",
-            description="Fast person lookup using the People Directory index. Fuzzy name matching with optional company filter. Falls back to file scan if index doesn't exist.",
+            description="Fast person lookup using the People Directory index. Fuzzy name matching with optional company filter. The index is refreshed automatically when person pages change.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -3356,8 +4007,13 @@ async def handle_list_tools() -> list[types.Tool]:
         ),
         types.Tool(
             name="rebuild_meeting_cache",
-            description="Rebuild the meeting context cache from meeting notes. Parses all recent meetings and writes System/Memory/meeting-cache.json.",
-            inputSchema={"type": "object", "properties": {}}
+            description="Rebuild the meeting context cache from meeting notes. Parses changed recent meetings (in parallel for large batches), writes System/Memory/meeting-cache.json and reports per-phase timings.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "parallel": {"type": "boolean", "description": "Force (true) or disable (false) parallel parsing. Default: parallel only for large batches"}
+                }
+            }
         ),
         types.Tool(
             name="capture_skill_rating",
@@ -3386,23 +4042,72 @@ async def handle_list_tools() -> list[types.Tool]:
 
 # Tools that write to vault files and should trigger search index refresh
 WRITE_TOOLS = {
-    "create_task", "update_task_status", "create_company", "refresh_company",
-    "sync_task_refs", "create_quarterly_goal", "update_goal_progress",
+    "create_task", "create_tasks", "update_task_status", "create_company", "refresh_company",
+    "refresh_all_companies", "sync_task_refs", "create_quarterly_goal", "update_goal_progress",
     "create_weekly_priority", "complete_weekly_priority",
     "process_inbox_with_dedup", "migrate_quarterly_goals", "migrate_weekly_priorities",
     "build_people_index", "rebuild_meeting_cache", "capture_skill_rating",
 }
 
+# Lock key shared by tools that rewrite "Related Tasks" sections on arbitrary pages
+RELATED_PAGES_LOCK = 'related-task-pages'
+
+# Files each write tool modifies; writes to the same file are serialized
+_WRITE_TOOL_TARGETS = {
+    "create_task": lambda args: [get_tasks_file(), RELATED_PAGES_LOCK],
+    "create_tasks": lambda args: [get_tasks_file(), RELATED_PAGES_LOCK],
+    "update_task_status": lambda args: [get_tasks_file(), RELATED_PAGES_LOCK],
+    "process_inbox_with_dedup": lambda args: [get_tasks_file()],
+    "sync_task_refs": lambda args: [RELATED_PAGES_LOCK],
+    "create_company": lambda args: [COMPANIES_DIR],
+    "refresh_company": lambda args: [COMPANIES_DIR, COMPANY_MENTIONS_FILE],
+    "refresh_all_companies": lambda args: [COMPANIES_DIR, COMPANY_MENTIONS_FILE],
+    "create_quarterly_goal": lambda args: [QUARTER_GOALS_FILE],
+    "update_goal_progress": lambda args: [QUARTER_GOALS_FILE],
+    "migrate_quarterly_goals": lambda args: [QUARTER_GOALS_FILE],
+    "create_weekly_priority": lambda args: [get_week_priorities_file()],
+    "complete_weekly_priority": lambda args: [get_week_priorities_file()],
+    "migrate_weekly_priorities": lambda args: [get_week_priorities_file()],
+    "build_people_index": lambda args: [PEOPLE_INDEX_FILE],
+    "lookup_person": lambda args: [PEOPLE_INDEX_FILE],  # refreshes the index when person pages changed
+    "rebuild_meeting_cache": lambda args: [MEETING_CACHE_FILE, MEETING_CACHE_DB_FILE],
+    "capture_skill_rating": lambda args: [SKILL_RATINGS_FILE, SKILL_RATINGS_STATS_FILE],
+}
+
+def get_tool_write_targets(name: str, arguments: dict | None) -> Optional[List[str]]:
+    """Return the lock keys a write tool needs, or None for read-only tools"""
+    targets = _WRITE_TOOL_TARGETS.get(name)
+    if targets is None:
+        return None
+    return [str(target) for target in targets(arguments or {})]
+
+# Per-tool timeouts (seconds) for tools that legitimately scan the whole vault
+TOOL_TIMEOUTS = {
+    "rebuild_meeting_cache": 300,
+    "build_people_index": 300,
+    "refresh_all_companies": 300,
+    "migrate_quarterly_goals": 300,
+    "migrate_weekly_priorities": 300,
+}
+
+# Handlers are synchronous; run them in a worker pool so one slow tool
+# doesn't block the stdio server (see core/utils/tool_executor.py)
+_tool_executor = ToolExecutor(timeouts=TOOL_TIMEOUTS)
+
 @app.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool calls"""
     try:
-        result = await _handle_call_tool_inner(name, arguments)
+        result = await _tool_executor.run(
+            name, _handle_call_tool_inner, name, arguments,
+            write_keys=get_tool_write_targets(name, arguments),
+        )
 
         # Refresh QMD search index after any write operation (non-blocking)
         if name in WRITE_TOOLS:
+            invalidate_task_tables()
             refresh_search_index()
 
         return result
@@ -3410,7 +4115,9 @@ async def handle_call_tool(
         if _HAS_HEALTH:
             _tool_human_messages = {
                 "list_tasks": "Task listing failed",
+                "query_tasks": "Vault task query failed",
                 "create_task": "Task creation failed",
+                "create_tasks": "Batch task creation failed",
                 "update_task_status": "Task status update failed",
                 "get_system_status": "System status check failed",
                 "check_priority_limits": "Priority limits check failed",
@@ -3420,6 +4127,7 @@ async def handle_call_tool(
                 "get_pillar_summary": "Pillar summary failed",
                 "sync_task_refs": "Task reference sync failed",
                 "refresh_company": "Company page refresh failed",
+                "refresh_all_companies": "Bulk company page refresh failed",
                 "list_companies": "Company listing failed",
                 "create_company": "Company creation failed",
                 "create_quarterly_goal": "Quarterly goal creation failed",
@@ -3450,13 +4158,16 @@ async def handle_call_tool(
             )
         raise
 
-async def _handle_call_tool_inner(
+def _handle_call_tool_inner(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """Inner tool handler — wrapped by handle_call_tool for post-write hooks."""
+    """Inner tool handler (runs in a worker thread) — wrapped by handle_call_tool for post-write hooks."""
     
     if name == "list_tasks":
-        tasks = get_all_tasks()
+        if arguments and arguments.get('scope') == 'vault':
+            tasks = get_vault_tasks()
+        else:
+            tasks = get_all_tasks()
         
         if arguments:
             if not arguments.get('include_done', False):
@@ -3483,6 +4194,17 @@ async def _handle_call_tool_inner(
         }
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
+    elif name == "query_tasks":
+        args = dict(arguments or {})
+        result = query_tasks_data(
+            completed=None if args.pop('include_done', False) else False,
+            unique=not args.pop('all_copies', False),
+            **{k: v for k, v in args.items() if k in (
+                'status', 'priority', 'pillar', 'section', 'file_prefix', 'mentions', 'ref', 'task_id',
+                'completed_after', 'completed_before', 'sort', 'descending', 'limit', 'cursor')},
+        )
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+    
     elif name == "create_task":
         title = arguments['title']
         pillar = arguments['pillar']
@@ -3493,30 +4215,10 @@ async def _handle_call_tool_inner(
         account = arguments.get('account', '')
         people = arguments.get('people', [])
         
-        # Validate pillar
-        if pillar not in PILLARS:
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": f"Invalid pillar '{pillar}'. Must be one of: {list(PILLARS.keys())}"
-            }, indent=2))]
-        
-        # Validate priority
-        if priority not in PRIORITIES:
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": f"Invalid priority '{priority}'. Must be one of: {PRIORITIES}"
-            }, indent=2))]
-        
-        # Check ambiguity
-        if is_ambiguous(title):
-            questions = generate_clarification_questions(title)
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": "Task is too vague",
-                "title": title,
-                "clarification_needed": questions,
-                "suggestion": "Please provide more specific details before creating this task"
-            }, indent=2))]
+        # Validate pillar, priority and ambiguity
+        error = validate_new_task(title, pillar, priority)
+        if error:
+            return [types.TextContent(type="text", text=json.dumps(error, indent=2))]
         
         # Check for duplicates
         existing_tasks = get_all_tasks()
@@ -3533,40 +4235,15 @@ async def _handle_call_tool_inner(
         # Check priority limits
         active_tasks = [t for t in existing_tasks if not t.get('completed')]
         priority_counts = Counter(t.get('priority', 'P2') for t in active_tasks)
-        
-        if priority in PRIORITY_LIMITS and priority_counts.get(priority, 0) >= PRIORITY_LIMITS[priority]:
-            return [types.TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": f"Priority limit exceeded for {priority}",
-                "current_count": priority_counts.get(priority, 0),
-                "limit": PRIORITY_LIMITS[priority],
-                "suggestion": f"You have too many {priority} tasks. Complete or deprioritize some before adding more."
-            }, indent=2))]
+        error = priority_limit_error(priority, priority_counts)
+        if error:
+            return [types.TextContent(type="text", text=json.dumps(error, indent=2))]
         
         # Generate unique task ID
         task_id = generate_task_id()
-        
-        # Build file references for account/people
-        file_refs = []
-        if account:
-            # Use plain file path reference
-            file_refs.append(account if account.endswith('.md') else f"{account}.md")
-        for person in people:
-            file_refs.append(person if person.endswith('.md') else f"{person}.md")
-        
-        # Create the task entry with plain file references and task ID
         pillar_name = PILLARS[pillar]['name']
-        task_line = f"- [ ] **{title}**"
-        if file_refs:
-            task_line += " | " + " ".join(file_refs)
-        task_line += f" ^{task_id}"
-        
-        task_entry = task_line
-        if context:
-            task_entry += f"\n\t- {context}"
-        task_entry += f"\n\t- Pillar: {pillar_name} | Priority: {priority}"
-        if weekly_priority_id:
-            task_entry += f" | Weekly priority: [{weekly_priority_id}]"
+        task_entry = build_task_entry(title, task_id, pillar, priority, context,
+                                      weekly_priority_id, account, people)
         
         # Add to 03-Tasks/Tasks.md under the appropriate section
         if get_tasks_file().exists():
@@ -3574,24 +4251,9 @@ async def _handle_call_tool_inner(
         else:
             content = "# Tasks\n\n"
         
-        # Find the section and add the task
-        section_header = f"## {section}"
-        if section_header in content:
-            # Add after section header
-            parts = content.split(section_header)
-            new_content = parts[0] + section_header + "\n" + task_entry + "\n" + parts[1]
-        else:
-            # Create new section at the top
-            lines = content.split('\n')
-            insert_idx = 1  # After the first header
-            for i, line in enumerate(lines):
-                if line.startswith('# '):
-                    insert_idx = i + 1
-                    break
-            lines.insert(insert_idx, f"\n{section_header}\n{task_entry}\n")
-            new_content = '\n'.join(lines)
+        new_content = insert_task_entries(content, section, [task_entry])
         
-        get_tasks_file().write_text(new_content)
+        atomic_write_text(get_tasks_file(), new_content)
         
         # Sync Related Tasks sections in referenced pages
         synced_pages = []
@@ -3630,6 +4292,10 @@ async def _handle_call_tool_inner(
         }
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
+    elif name == "create_tasks":
+        result = create_tasks_batch(arguments.get('tasks', []))
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+    
     elif name == "update_task_status":
         task_id = arguments.get('task_id')
         task_title = arguments.get('task_title')
@@ -3699,7 +4365,14 @@ async def _handle_call_tool_inner(
                     new_line = old_line.replace('- [x]', '- [ ]')
                 
                 lines[line_idx] = new_line
-                filepath.write_text('\n'.join(lines))
+                atomic_write_text(filepath, '\n'.join(lines))
+                if new_line != old_line:
+                    record_status_event(
+                        'task', None,
+                        'done' if task['completed'] else 'not_started',
+                        'done' if completed else 'not_started',
+                        pillar=task.get('pillar')
+                    )
                 
                 # Propagate status change to referenced pages
                 synced_pages = propagate_task_status_to_refs(task['title'], completed)
@@ -3738,7 +4411,7 @@ async def _handle_call_tool_inner(
         
         # Check priority limits
         alerts = []
-        for priority, limit in PRIORITY_LIMITS.items():
+        for priority, limit in get_priority_limits().items():
             count = priority_counts.get(priority, 0)
             if count > limit:
                 alerts.append(f"{priority} has {count} tasks (limit: {limit})")
@@ -3766,6 +4439,7 @@ async def _handle_call_tool_inner(
             "priority_alerts": alerts,
             "balanced": len(alerts) == 0,
             "time_insights": time_insights,
+            "search_index": get_index_stats(),
             "timestamp": now.isoformat()
         }
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
@@ -3775,7 +4449,7 @@ async def _handle_call_tool_inner(
         priority_counts = Counter(t.get('priority', 'P2') for t in tasks)
         
         alerts = []
-        for priority, limit in PRIORITY_LIMITS.items():
+        for priority, limit in get_priority_limits().items():
             count = priority_counts.get(priority, 0)
             if count > limit:
                 alerts.append({
@@ -3787,7 +4461,7 @@ async def _handle_call_tool_inner(
         
         result = {
             "priority_counts": dict(priority_counts),
-            "limits": PRIORITY_LIMITS,
+            "limits": get_priority_limits(),
             "alerts": alerts,
             "balanced": len(alerts) == 0
         }
@@ -3866,7 +4540,10 @@ async def _handle_call_tool_inner(
     elif name == "get_blocked_tasks":
         # In this system, blocked tasks would be marked somehow
         # For now, we look for keywords indicating blocked status
-        all_tasks = get_all_tasks()
+        if arguments and arguments.get('scope') == 'vault':
+            all_tasks = get_vault_tasks(completed=False)
+        else:
+            all_tasks = get_all_tasks()
         blocked = []
         
         for task in all_tasks:
@@ -3884,19 +4561,26 @@ async def _handle_call_tool_inner(
     
     elif name == "suggest_focus":
         max_tasks = arguments.get('max_tasks', 3) if arguments else 3
-        all_tasks = get_all_tasks()
-        active_tasks = [t for t in all_tasks if not t.get('completed')]
-        
-        # Score tasks: P0 > P1 > P2 > P3
-        priority_scores = {'P0': 100, 'P1': 75, 'P2': 50, 'P3': 25}
-        
-        for task in active_tasks:
-            task['score'] = priority_scores.get(task.get('priority', 'P2'), 50)
-        
-        # Sort by score
-        active_tasks.sort(key=lambda x: x['score'], reverse=True)
-        
-        suggestions = active_tasks[:max_tasks]
+        if arguments and arguments.get('scope') == 'vault':
+            # The index answers "top N open tasks by priority" without loading the rest
+            page = query_tasks_data(completed=False, sort='priority', limit=max_tasks)
+            suggestions = page['tasks']
+            total_active = page['total']
+        else:
+            all_tasks = get_all_tasks()
+            active_tasks = [t for t in all_tasks if not t.get('completed')]
+            
+            # Score tasks: P0 > P1 > P2 > P3
+            priority_scores = {'P0': 100, 'P1': 75, 'P2': 50, 'P3': 25}
+            
+            for task in active_tasks:
+                task['score'] = priority_scores.get(task.get('priority', 'P2'), 50)
+            
+            # Sort by score
+            active_tasks.sort(key=lambda x: x['score'], reverse=True)
+            
+            suggestions = active_tasks[:max_tasks]
+            total_active = len(active_tasks)
         
         result = {
             "suggested_focus": [
@@ -3908,7 +4592,7 @@ async def _handle_call_tool_inner(
                 }
                 for t in suggestions
             ],
-            "total_active_tasks": len(active_tasks)
+            "total_active_tasks": total_active
         }
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
@@ -3917,7 +4601,7 @@ async def _handle_call_tool_inner(
         active_tasks = [t for t in all_tasks if not t.get('completed')]
         
         pillar_summary = {}
-        for pillar_id, pillar_info in PILLARS.items():
+        for pillar_id, pillar_info in get_pillars().items():
             pillar_tasks = [t for t in active_tasks if t.get('pillar') == pillar_id]
             pillar_summary[pillar_id] = {
                 "name": pillar_info['name'],
@@ -3939,9 +4623,15 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "sync_task_refs":
-        page_path = arguments['page_path']
+        pages = arguments.get('pages')
+        page_path = arguments.get('page_path')
         
-        result = sync_task_refs_for_page(page_path)
+        if pages:
+            result = sync_task_refs_for_pages(pages + ([page_path] if page_path else []))
+        elif page_path:
+            result = sync_task_refs_for_page(page_path)
+        else:
+            result = {"success": False, "error": "Must provide page_path or pages"}
         
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
@@ -3952,6 +4642,10 @@ async def _handle_call_tool_inner(
         
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
+    elif name == "refresh_all_companies":
+        result = refresh_all_companies_data()
+        return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
+
     elif name == "list_companies":
         companies = list_companies()
         
@@ -4027,9 +4721,7 @@ async def _handle_call_tool_inner(
             quarter = quarter_info['quarter']
         
         # Read goals
-        goals_file = QUARTER_GOALS_FILE
-        if is_demo_mode():
-            goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+        goals_file = get_quarter_goals_file()
         
         goals = parse_quarterly_goals(goals_file)
         
@@ -4065,7 +4757,7 @@ async def _handle_call_tool_inner(
         linked_priorities = find_linked_priorities(goal_id)
         
         # Calculate progress
-        progress_info = calculate_goal_progress(goal_id)
+        progress_info = calculate_goal_progress(goal_id, linked_priorities)
         
         # Check for stalls (no activity in >2 weeks)
         # For now, simplified - would need to track last activity dates
@@ -4099,6 +4791,7 @@ async def _handle_call_tool_inner(
             }, indent=2))]
         
         # Update the goal
+        previous = get_goal_by_id(goal_id)
         success = update_goal_in_file(goal_id, {'progress': progress_pct})
         
         if not success:
@@ -4107,6 +4800,15 @@ async def _handle_call_tool_inner(
                 "error": f"Could not find goal: {goal_id}"
             }, indent=2))]
         
+        old_progress = previous.get('progress', 0) if previous else 0
+        record_status_event(
+            'goal', goal_id,
+            'done' if old_progress >= 100 else 'in_progress',
+            'done' if progress_pct >= 100 else 'in_progress',
+            pillar=previous.get('pillar') if previous else None,
+            progress=progress_pct, previous_progress=old_progress
+        )
+        
         result = {
             "success": True,
             "goal_id": goal_id,
@@ -4141,9 +4843,7 @@ async def _handle_call_tool_inner(
         # If no goal_id provided, try to infer from title + pillar
         goal_inference = None
         if not quarterly_goal_id:
-            goals_file = QUARTER_GOALS_FILE
-            if is_demo_mode():
-                goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+            goals_file = get_quarter_goals_file()
             goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
             
             if goals:
@@ -4224,7 +4924,7 @@ async def _handle_call_tool_inner(
             content += "\n" + priority_entry + "\n"
             new_content = content
         
-        priorities_file.write_text(new_content)
+        atomic_write_text(priorities_file, new_content)
         
         result = {
             "success": True,
@@ -4261,9 +4961,7 @@ async def _handle_call_tool_inner(
                 priority['completed_tasks'] = sum(1 for t in linked_tasks if t['completed'])
         
         # ---- ALIGNMENT SUMMARY ----
-        goals_file = QUARTER_GOALS_FILE
-        if is_demo_mode():
-            goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+        goals_file = get_quarter_goals_file()
         goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
         quarter_info = get_quarter_info()
 
@@ -4319,7 +5017,13 @@ async def _handle_call_tool_inner(
             }, indent=2))]
         
         # Mark as completed (for now, just return success)
-        # In full implementation, would update the file
+        # In full implementation, would update the file. Until then the log
+        # is the only record, so repeat calls must not count it again.
+        if not priority.get('completed'):
+            record_status_event(
+                'priority', priority_id, 'not_started', 'done',
+                pillar=priority.get('pillar'), only_on_change=True
+            )
         
         # If linked to a goal, recalculate goal progress
         goal_progress = None
@@ -4344,16 +5048,10 @@ async def _handle_call_tool_inner(
         quarter_info = get_quarter_info()
         quarter = quarter_info['quarter']
         
-        # Get quarterly goals
-        goals_file = QUARTER_GOALS_FILE
-        if is_demo_mode():
-            goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
-        
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
-        
-        # Get weekly priorities
-        priorities_file = get_week_priorities_file()
-        priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
+        # Goals and weekly priorities come from the shared planning graph
+        graph = get_planning_graph()
+        goals = copy.deepcopy(list(graph['goals']))
+        priorities = [dict(p) for p in graph['priorities']]
         
         # Get tasks
         all_tasks = get_all_tasks()
@@ -4365,8 +5063,7 @@ async def _handle_call_tool_inner(
         # Check for stalled goals
         for goal in goals:
             if goal.get('goal_id'):
-                linked_priorities = find_linked_priorities(goal['goal_id'])
-                if len(linked_priorities) == 0:
+                if not graph['priorities_by_goal'].get(goal['goal_id']):
                     warnings.append({
                         'type': 'stalled_goal',
                         'message': f"Goal '{goal['title']}' has no linked priorities",
@@ -4398,16 +5095,10 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "check_goal_alignment":
-        # Get all goals, priorities, and tasks
-        goals_file = QUARTER_GOALS_FILE
-        if is_demo_mode():
-            goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
-        
-        goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
-        priorities_file = get_week_priorities_file()
-        priorities = parse_weekly_priorities(priorities_file) if priorities_file.exists() else []
-        all_tasks = get_all_tasks()
-        active_tasks = [t for t in all_tasks if not t.get('completed')]
+        # Get all goals and priorities from the shared planning graph
+        graph = get_planning_graph()
+        goals = copy.deepcopy(list(graph['goals']))
+        priorities = [dict(p) for p in graph['priorities']]
         
         # Find orphaned work
         priorities_with_no_goal = [p for p in priorities if not p.get('linked_goal_id')]
@@ -4416,8 +5107,7 @@ async def _handle_call_tool_inner(
         
         for goal in goals:
             if goal.get('goal_id'):
-                linked_priorities = find_linked_priorities(goal['goal_id'])
-                if len(linked_priorities) == 0:
+                if not graph['priorities_by_goal'].get(goal['goal_id']):
                     goals_with_no_priorities.append(goal)
         
         result = {
@@ -4455,9 +5145,7 @@ async def _handle_call_tool_inner(
             quarter_info = get_quarter_info()  # Still get for weeks remaining
         
         # Get quarterly goals
-        goals_file = QUARTER_GOALS_FILE
-        if is_demo_mode():
-            goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+        goals_file = get_quarter_goals_file()
         
         goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
         
@@ -4467,9 +5155,9 @@ async def _handle_call_tool_inner(
         avg_progress = sum(g['progress'] for g in goals) / total_goals if total_goals > 0 else 0
         weeks_remaining = quarter_info['weeks_remaining']
         
-        # Calculate velocity (progress per week)
-        # Simplified - would need historical data for accuracy
-        weeks_elapsed = 13 - weeks_remaining  # Rough estimate (13 weeks per quarter)
+        # Calculate velocity (progress per week) over the weeks actually elapsed
+        task_velocity = get_task_velocity(quarter_info)
+        weeks_elapsed = task_velocity['weeks_elapsed']
         velocity = avg_progress / weeks_elapsed if weeks_elapsed > 0 else 0
         
         # Projected completion
@@ -4491,6 +5179,7 @@ async def _handle_call_tool_inner(
             "weeks_remaining": weeks_remaining,
             "velocity_per_week": round(velocity, 1),
             "projected_completion": round(projected_progress, 1),
+            "task_velocity": task_velocity,
             "assessment": assessment,
             "recommendations": []
         }
@@ -4514,9 +5203,7 @@ async def _handle_call_tool_inner(
 
     elif name == "get_weekly_planning_context":
         # Pre-planning intelligence: goal health + optional priority matching
-        goals_file = QUARTER_GOALS_FILE
-        if is_demo_mode():
-            goals_file = DEMO_DIR / '01-Quarter_Goals/Quarter_Goals.md'
+        goals_file = get_quarter_goals_file()
 
         goals = parse_quarterly_goals(goals_file) if goals_file.exists() else []
         quarter_info = get_quarter_info()
@@ -4624,7 +5311,9 @@ async def _handle_call_tool_inner(
     elif name == "get_commitments_due":
         date_range = arguments.get('date_range', 'today') if arguments else 'today'
         
-        result = get_commitments_due_data(date_range)
+        incremental = bool(arguments.get('incremental', False)) if arguments else False
+        
+        result = get_commitments_due_data(date_range, incremental=incremental)
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
     
     elif name == "classify_task_effort":
@@ -4640,49 +5329,13 @@ async def _handle_call_tool_inner(
         
         # If events provided, analyze them; otherwise return structure for manual use
         if events:
-            today = _tz_today()
-            days_data = []
-            
-            # Group events by date
-            events_by_date = {}
-            for event in events:
-                event_date = event.get('date', today.isoformat())
-                if event_date not in events_by_date:
-                    events_by_date[event_date] = []
-                events_by_date[event_date].append(event)
-            
-            # Analyze each day
-            for i in range(days_ahead):
-                target_date = today + timedelta(days=i)
-                if target_date.weekday() >= 5:  # Skip weekends
-                    continue
-                
-                date_str = target_date.isoformat()
-                day_events = events_by_date.get(date_str, [])
-                
-                day_analysis = analyze_day_capacity(day_events, target_date)
-                days_data.append(day_analysis)
-            
-            # Summarize
-            stacked_days = sum(1 for d in days_data if d['day_type'] == 'stacked')
-            moderate_days = sum(1 for d in days_data if d['day_type'] == 'moderate')
-            open_days = sum(1 for d in days_data if d['day_type'] == 'open')
-            
-            deep_work_opportunities = [
-                {'day': d['day_name'], 'date': d['date'], 'available_hours': round(d['largest_block_estimate'] / 60, 1)}
-                for d in days_data if d['day_type'] == 'open'
-            ]
-            
-            result = {
-                'analysis_date': today.isoformat(),
-                'days': days_data,
-                'week_summary': {
-                    'stacked_days': stacked_days,
-                    'moderate_days': moderate_days,
-                    'open_days': open_days,
-                    'deep_work_opportunities': deep_work_opportunities
-                }
-            }
+            try:
+                result = analyze_calendar_events(
+                    events, days_ahead,
+                    work_start=arguments.get('work_start'), work_end=arguments.get('work_end'),
+                )
+            except ValueError as e:
+                result = {'success': False, 'error': str(e)}
         else:
             result = get_calendar_capacity_data(days_ahead)
         
@@ -4691,6 +5344,7 @@ async def _handle_call_tool_inner(
     elif name == "suggest_task_scheduling":
         include_all = arguments.get('include_all_tasks', False) if arguments else False
         calendar_events = arguments.get('calendar_events', []) if arguments else []
+        days_ahead = arguments.get('days_ahead', 5) if arguments else 5
 
         # Get tasks
         all_tasks = get_all_tasks()
@@ -4702,29 +5356,16 @@ async def _handle_call_tool_inner(
 
         # Get calendar capacity (use events if provided, otherwise use basic structure)
         if calendar_events:
-            today = _tz_today()
-            days_data = []
-
-            events_by_date = {}
-            for event in calendar_events:
-                event_date = event.get('date', today.isoformat())
-                if event_date not in events_by_date:
-                    events_by_date[event_date] = []
-                events_by_date[event_date].append(event)
-
-            for i in range(5):
-                target_date = today + timedelta(days=i)
-                if target_date.weekday() >= 5:
-                    continue
-
-                date_str = target_date.isoformat()
-                day_events = events_by_date.get(date_str, [])
-                day_analysis = analyze_day_capacity(day_events, target_date)
-                days_data.append(day_analysis)
-
-            calendar_capacity = {'days': days_data}
+            try:
+                calendar_capacity = analyze_calendar_events(
+                    calendar_events, days_ahead,
+                    work_start=arguments.get('work_start'), work_end=arguments.get('work_end'),
+                )
+            except ValueError as e:
+                result = {'success': False, 'error': str(e)}
+                return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
         else:
-            calendar_capacity = get_calendar_capacity_data(5)
+            calendar_capacity = get_calendar_capacity_data(days_ahead)
 
         result = generate_scheduling_suggestions(active_tasks, calendar_capacity)
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
@@ -4737,6 +5378,7 @@ async def _handle_call_tool_inner(
             'by_type': result['by_type'],
             'index_path': str(PEOPLE_INDEX_FILE),
             'built_at': result['built_at'],
+            'pages_parsed': result['pages_parsed'],
         }, indent=2))]
 
     elif name == "lookup_person":
@@ -4756,7 +5398,7 @@ async def _handle_call_tool_inner(
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
 
     elif name == "rebuild_meeting_cache":
-        result = rebuild_meeting_cache_data()
+        result = rebuild_meeting_cache_data(parallel=arguments.get('parallel') if arguments else None)
         return [types.TextContent(type="text", text=json.dumps(result, indent=2, cls=DateTimeEncoder))]
 
     elif name == "capture_skill_rating":
@@ -4769,18 +5411,7 @@ async def _handle_call_tool_inner(
         if not (1 <= rating <= 5):
             return [types.TextContent(type="text", text=json.dumps({"success": False, "error": "rating must be 1-5"}))]
 
-        SKILL_RATINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        entry = {
-            "ts": datetime.now().isoformat(timespec='seconds'),
-            "skill": skill_name,
-            "rating": rating,
-        }
-        if note:
-            entry["note"] = note
-
-        with open(SKILL_RATINGS_FILE, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        entry = _skill_ratings.record(skill_name, rating, note)
 
         # Fire analytics event (anonymous, consent-checked)
         try:
@@ -4800,46 +5431,10 @@ async def _handle_call_tool_inner(
     elif name == "get_skill_ratings":
         skill_filter = arguments.get('skill_name', '') if arguments else ''
 
-        if not SKILL_RATINGS_FILE.exists():
+        if not _skill_ratings.log_file.exists():
             return [types.TextContent(type="text", text=json.dumps({"ratings": {}, "message": "No ratings captured yet"}))]
 
-        ratings_by_skill = {}
-        for line in SKILL_RATINGS_FILE.read_text().strip().split('\n'):
-            if not line.strip():
-                continue
-            try:
-                entry = json.loads(line)
-                skill = entry.get('skill', 'unknown')
-                if skill_filter and skill != skill_filter:
-                    continue
-                if skill not in ratings_by_skill:
-                    ratings_by_skill[skill] = []
-                ratings_by_skill[skill].append(entry)
-            except json.JSONDecodeError:
-                continue
-
-        result = {}
-        for skill, entries in ratings_by_skill.items():
-            ratings_list = [e['rating'] for e in entries]
-            recent_5 = entries[-5:]
-            recent_ratings = [e['rating'] for e in recent_5]
-
-            trend = "stable"
-            if len(ratings_list) >= 4:
-                mid = len(ratings_list) // 2
-                first_half = sum(ratings_list[:mid]) / mid
-                second_half = sum(ratings_list[mid:]) / (len(ratings_list) - mid)
-                if second_half - first_half > 0.3:
-                    trend = "improving"
-                elif first_half - second_half > 0.3:
-                    trend = "declining"
-
-            result[skill] = {
-                "average": round(sum(ratings_list) / len(ratings_list), 1),
-                "count": len(ratings_list),
-                "trend": trend,
-                "recent": [{"rating": e['rating'], "note": e.get('note', ''), "ts": e['ts']} for e in recent_5],
-            }
+        result = _skill_ratings.summary(skill_filter)
 
         return [types.TextContent(type="text", text=json.dumps({"ratings": result}, indent=2, cls=DateTimeEncoder))]
 
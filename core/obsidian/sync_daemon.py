@@ -78,15 +78,24 @@ class DexSyncHandler(FileSystemEventHandler):
         
         logger.info(f"Found {len(matches)} tasks in {file_path.name}")
         
-        # Call Work MCP to sync each task
+        # Look up every task in one pass over the task index, then only
+        # call Work MCP for tasks whose instances disagree with this file
+        try:
+            from core.mcp.work_server import find_tasks_by_ids, update_task_status_everywhere
+            instances_by_id = find_tasks_by_ids([task_id for _, task_id in matches])
+        except Exception as e:
+            logger.error(f"Failed to look up tasks in {file_path.name}: {e}")
+            return
+        
         for checkbox_state, task_id in matches:
             status = 'd' if checkbox_state.lower() == 'x' else 'n'
+            instances = instances_by_id.get(task_id, [])
+            if instances and all(i['completed'] == (status == 'd') for i in instances):
+                continue
             
-            # Call Work MCP update_task_status
             # This updates the task everywhere (Tasks.md, person pages, etc.)
             try:
-                from core.mcp.work_server import update_task_status_everywhere
-                result = update_task_status_everywhere(task_id, status == 'd')
+                result = update_task_status_everywhere(task_id, status == 'd', instances=instances)
                 logger.info(f"Synced {task_id} → {status}")
             except Exception as e:
                 logger.error(f"Failed to sync {task_id}: {e}")
@@ -85,6 +85,15 @@ MCP_CONFIG_TARGET = SYSTEM_DIR / '.mcp.json'
 COMMITMENT_QUEUE_FILE = SYSTEM_DIR / 'commitment_queue.json'
 OBSIDIAN_SYNC_LOG = SYSTEM_DIR / 'obsidian-sync.log'
 RITUAL_INTELLIGENCE_DB_FILE = DEX_RUNTIME_DIR / 'ritual-intelligence.db'
+TASK_ID_STATE_FILE = DEX_RUNTIME_DIR / 'task-id-allocator.json'
+TASK_INDEX_FILE = DEX_RUNTIME_DIR / 'task-index.json'
+COMPLETION_LOG_FILE = DEX_RUNTIME_DIR / 'completion-events.jsonl'
+COMPLETION_STATS_FILE = DEX_RUNTIME_DIR / 'completion-stats.json'
+MEETING_CACHE_DB_FILE = DEX_RUNTIME_DIR / 'meeting-cache.db'
+COMPANY_MENTIONS_FILE = DEX_RUNTIME_DIR / 'company-mentions.json'
+COMMITMENT_CACHE_FILE = DEX_RUNTIME_DIR / 'commitment-cache.json'
+SKILL_RATINGS_STATS_FILE = DEX_RUNTIME_DIR / 'skill-ratings-stats.json'
+TASK_TABLE_DB_FILE = DEX_RUNTIME_DIR / 'task-table.db'
 
 
 def export_json(output_path: str | Path | None = None) -> dict:
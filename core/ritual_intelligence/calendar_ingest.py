@@ -6,9 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
-import yaml
-
 from core.paths import LEGACY_MEETINGS_DIR, TRACKED_MEETINGS_DIR, USER_PROFILE_FILE
+from core.utils.vault_config import config_cache
 
 from .models import NormalizedAttendee, NormalizedCalendarEvent
 
@@ -18,10 +17,7 @@ class CalendarIngestError(RuntimeError):
 
 
 def _load_profile() -> dict:
-    if not USER_PROFILE_FILE.exists():
-        return {}
-    with USER_PROFILE_FILE.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    return config_cache.load(USER_PROFILE_FILE) or {}
 
 
 def get_configured_work_calendar() -> str:
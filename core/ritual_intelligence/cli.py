@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
 from .service import RitualIntelligenceService
+from .transcript_backfill import DEFAULT_CHUNK_SIZE
 
 
 def _parser() -> argparse.ArgumentParser:
@@ -46,6 +48,14 @@ def _parser() -> argparse.ArgumentParser:
     import_transcript.add_argument("--source-event-id")
 
     subparsers.add_parser("reconcile-transcripts")
+
+    backfill = subparsers.add_parser("backfill-transcripts", help="Bulk-match a historical transcript archive")
+    backfill.add_argument(
+        "--chunk-size",
+        type=int,
+        help=f"Transcripts committed per transaction (default {DEFAULT_CHUNK_SIZE}; 0 means a single transaction)",
+    )
+    backfill.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an interrupted run")
     subparsers.add_parser("review-transcripts")
 
     transcript_not_same = subparsers.add_parser("transcript-not-same")
@@ -135,6 +145,15 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(service.reconcile_unmatched_transcripts(), indent=2, sort_keys=True))
         return 0
 
+    if args.command == "backfill-transcripts":
+        result = service.backfill_transcripts(
+            chunk_size=args.chunk_size,
+            progress=lambda done, total: print(f"{done}/{total} transcripts", file=sys.stderr),
+            resume=not args.restart,
+        )
+        print(json.dumps(result, indent=2, sort_keys=True))
+        return 0
+
     if args.command == "review-transcripts":
         print(json.dumps(service.list_unmatched_transcripts(), indent=2, sort_keys=True))
         return 0
@@ -1,16 +1,32 @@
-"""SQLite bootstrap and safety checks for Ritual Intelligence."""
+"""SQLite bootstrap and safety checks for Ritual Intelligence.
+
+``transaction()`` runs on one pooled connection per thread, reopened when
+the DB file is replaced or ``close_connections()`` closed it. A nested
+``transaction()`` is a savepoint: an exception inside it undoes only its own
+work. The schema is versioned with ``PRAGMA
+user_version``: ``MIGRATIONS[n - 1]`` takes a DB from version n - 1 to n,
+and pending migrations run once per connection. ``PRAGMA quick_check`` reads every
+page, so it runs when a DB is first opened after an unclean shutdown (a
+non-empty WAL left behind) and then at most every
+``INTEGRITY_CHECK_INTERVAL_SECONDS`` per process, not on every open.
+"""
 
 from __future__ import annotations
 
+import atexit
 import os
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator, Union
 
 from core.paths import DEX_RUNTIME_DIR, RITUAL_INTELLIGENCE_DB_FILE, SYSTEM_DIR
 
+INTEGRITY_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
+
 
 class RitualIntelligenceError(RuntimeError):
     """Base runtime error for Ritual Intelligence."""
@@ -68,7 +84,41 @@ def _validate_database(conn: sqlite3.Connection) -> None:
         raise DatabaseCorruptError(f"Ritual Intelligence database failed integrity check: {get_db_path()}")
 
 
-def connect(*, create: bool = True) -> sqlite3.Connection:
+# (st_dev, st_ino) of each DB file opened by this process -> monotonic time of its last check
+_checked_at: dict[tuple[int, int], float] = {}
+_checked_lock = threading.Lock()
+
+
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _wal_has_frames(db_path: Path) -> bool:
+    try:
+        return db_path.with_name(db_path.name + "-wal").stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _mark_checked(identity: tuple[int, int] | None) -> None:
+    if identity is not None:
+        with _checked_lock:
+            _checked_at[identity] = time.monotonic()
+
+
+def _check_if_due(conn: sqlite3.Connection, identity: tuple[int, int] | None) -> None:
+    with _checked_lock:
+        checked_at = _checked_at.get(identity)
+    if checked_at is not None and time.monotonic() - checked_at >= INTEGRITY_CHECK_INTERVAL_SECONDS:
+        _validate_database(conn)
+        _mark_checked(identity)
+
+
+def connect(*, create: bool = True, check_same_thread: bool = True) -> sqlite3.Connection:
     """Open the vault-local runtime DB with explicit safety checks."""
     db_path = get_db_path()
     if create:
@@ -79,15 +129,30 @@ def connect(*, create: bool = True) -> sqlite3.Connection:
     if db_path.exists() and not os.access(db_path, os.W_OK):
         raise DatabaseReadOnlyError(f"Ritual Intelligence database is read-only: {db_path}")
 
+    identity = _file_identity(db_path)
+    with _checked_lock:
+        first_open = identity not in _checked_at
+    # Frames left in the WAL before this process opened the file: the last writer didn't close cleanly
+    after_crash = identity is not None and first_open and _wal_has_frames(db_path)
+
     try:
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
     except sqlite3.OperationalError as exc:
         raise DatabaseReadOnlyError(f"Unable to open Ritual Intelligence database: {db_path}") from exc
 
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
-    _validate_database(conn)
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        if after_crash:
+            _validate_database(conn)
+        if first_open:
+            _mark_checked(_file_identity(db_path))
+        else:
+            _check_if_due(conn, identity)
+    except Exception:
+        conn.close()
+        raise
     return conn
 
 
@@ -261,27 +326,190 @@ SCHEMA = (
     """,
 )
 
+MigrationStep = Union[str, Callable[[sqlite3.Connection], None]]
+
+# Append-only: add a new entry for each schema change (indexes, ALTER TABLE ... ADD COLUMN,
+# or a callable for data backfills) and never edit one that has shipped.
+MIGRATIONS: tuple[tuple[MigrationStep, ...], ...] = (
+    # 1: base schema
+    SCHEMA,
+    # 2: indexes for the brief, contact suggestion, ritual and transcript lookups
+    (
+        "CREATE INDEX IF NOT EXISTS idx_occurrences_ritual_series ON occurrences(ritual_series_id, starts_at)",
+        "CREATE INDEX IF NOT EXISTS idx_source_events_occurrence ON source_events(occurrence_id)",
+        "CREATE INDEX IF NOT EXISTS idx_ritual_series_status ON ritual_series(status)",
+        "CREATE INDEX IF NOT EXISTS idx_transcripts_status ON transcripts(status, started_at)",
+        "CREATE INDEX IF NOT EXISTS idx_transcripts_occurrence ON transcripts(occurrence_id, status)",
+        "CREATE INDEX IF NOT EXISTS idx_transcript_negative_matches_occurrence "
+        "ON transcript_negative_matches(occurrence_id)",
+        "CREATE INDEX IF NOT EXISTS idx_occurrence_contacts_contact ON occurrence_contacts(contact_id)",
+        "CREATE INDEX IF NOT EXISTS idx_contact_suggestions_occurrence ON contact_suggestions(occurrence_id, status)",
+    ),
+    # 3: resumable checkpoints for bulk jobs (transcript backfill)
+    (
+        """
+        CREATE TABLE IF NOT EXISTS job_checkpoints (
+          name TEXT PRIMARY KEY,
+          position TEXT NOT NULL,
+          processed INTEGER NOT NULL DEFAULT 0,
+          updated_at TEXT NOT NULL
+        )
+        """,
+    ),
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations, each in its own transaction. Returns the schema version."""
+    if conn.in_transaction:
+        conn.commit()
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version > SCHEMA_VERSION:
+        raise RitualIntelligenceError(
+            f"Ritual Intelligence database schema v{version} is newer than this Dex supports (v{SCHEMA_VERSION})"
+        )
+    for number in range(version + 1, SCHEMA_VERSION + 1):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have applied it while we waited for the write lock
+            if conn.execute("PRAGMA user_version").fetchone()[0] < number:
+                for step in MIGRATIONS[number - 1]:
+                    if callable(step):
+                        step(conn)
+                    else:
+                        conn.execute(step)
+                conn.execute(f"PRAGMA user_version = {number}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return max(version, SCHEMA_VERSION)
+
 
 def bootstrap_database(conn: sqlite3.Connection | None = None) -> sqlite3.Connection:
     """Ensure the vault-local runtime DB exists and has the required schema."""
     owned = conn is None
     if owned:
         conn = connect(create=True)
-    for statement in SCHEMA:
-        conn.execute(statement)
+    migrate(conn)
     conn.commit()
     return conn
 
 
+class _PooledConnection:
+    __slots__ = ("conn", "path", "identity", "bootstrapped", "closed")
+
+    def __init__(self, conn: sqlite3.Connection, path: Path, identity: tuple[int, int] | None) -> None:
+        self.conn = conn
+        self.path = path
+        self.identity = identity
+        self.bootstrapped = False
+        self.closed = False
+
+
+_local = threading.local()
+# thread id -> that thread's pooled connection, so all of them can be closed at exit
+_pool: dict[int, _PooledConnection] = {}
+_pool_lock = threading.Lock()
+
+
+def _discard(entry: _PooledConnection) -> None:
+    with _pool_lock:
+        if _pool.get(threading.get_ident()) is entry:
+            del _pool[threading.get_ident()]
+    _local.entry = None
+    try:
+        entry.conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _pooled_connection(*, create: bool) -> _PooledConnection:
+    """This thread's connection, reopened if the DB file was deleted or replaced."""
+    db_path = get_db_path()
+    identity = _file_identity(db_path)
+    entry = getattr(_local, "entry", None)
+    if entry is not None and entry.closed:
+        # close_connections() ran, possibly on another thread
+        _local.entry = entry = None
+    if entry is not None:
+        if identity is not None and entry.path == db_path and entry.identity == identity:
+            try:
+                _check_if_due(entry.conn, identity)
+            except DatabaseCorruptError:
+                _discard(entry)
+                raise
+            return entry
+        _discard(entry)
+
+    conn = connect(create=create, check_same_thread=False)
+    entry = _PooledConnection(conn, db_path, _file_identity(db_path))
+    _local.entry = entry
+    with _pool_lock:
+        _pool[threading.get_ident()] = entry
+    return entry
+
+
+def close_connections() -> None:
+    """Close every pooled connection (at exit, or before moving the DB file)."""
+    with _pool_lock:
+        entries = list(_pool.values())
+        _pool.clear()
+    for entry in entries:
+        entry.closed = True
+        try:
+            entry.conn.close()
+        except sqlite3.Error:
+            pass
+    _local.entry = None
+
+
+atexit.register(close_connections)
+
+
 @contextmanager
 def transaction(*, create: bool = True) -> Iterator[sqlite3.Connection]:
-    """Context manager with commit/rollback semantics."""
-    conn = bootstrap_database() if create else connect(create=False)
+    """Context manager with commit/rollback semantics on the thread's pooled connection.
+
+    A transaction opened inside another on the same thread runs in a
+    savepoint of the outer one: an exception rolls back only the inner
+    work, and the outermost transaction commits or rolls back the rest.
+    """
+    depth = getattr(_local, "depth", 0)
+    if depth:
+        conn = _local.entry.conn
+        if not conn.in_transaction:
+            # Otherwise RELEASE would commit the outer transaction's work
+            conn.execute("BEGIN")
+        savepoint = f"nested_{depth}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+        _local.depth = depth + 1
+        try:
+            yield conn
+            conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+        except Exception:
+            conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            raise
+        finally:
+            _local.depth = depth
+        return
+
+    entry = _pooled_connection(create=create)
+    if create and not entry.bootstrapped:
+        bootstrap_database(entry.conn)
+        entry.bootstrapped = True
+    conn = entry.conn
+    _local.depth = 1
     try:
         yield conn
         conn.commit()
     except Exception:
-        conn.rollback()
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            _discard(entry)
         raise
     finally:
-        conn.close()
+        _local.depth = 0
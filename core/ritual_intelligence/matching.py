@@ -14,13 +14,31 @@ def _title_similarity(left: str, right: str) -> float:
     return SequenceMatcher(None, left.lower(), right.lower()).ratio()
 
 
-def _time_similarity(transcript: TranscriptArtifact, occurrence: dict) -> float:
-    if transcript.source_event_id and occurrence.get("source_event_id") == transcript.source_event_id:
-        return 1.0
-    if transcript.started_at is None:
-        return 0.0
-    occurrence_start = datetime.fromisoformat(occurrence["starts_at"])
-    delta_minutes = abs((occurrence_start - transcript.started_at).total_seconds()) / 60
+class TitleSimilarity:
+    """``_title_similarity`` memoized per title pair, for scoring many transcripts in one pass.
+
+    The occurrence side of each ``SequenceMatcher`` is indexed once per distinct title.
+    """
+
+    def __init__(self) -> None:
+        self._matchers: dict[str, SequenceMatcher] = {}
+        self._ratios: dict[tuple[str, str], float] = {}
+
+    def __call__(self, left: str, right: str) -> float:
+        if not left or not right:
+            return 0.0
+        key = (left.lower(), right.lower())
+        ratio = self._ratios.get(key)
+        if ratio is None:
+            matcher = self._matchers.get(key[1])
+            if matcher is None:
+                matcher = self._matchers[key[1]] = SequenceMatcher(None, "", key[1])
+            matcher.set_seq1(key[0])
+            ratio = self._ratios[key] = matcher.ratio()
+        return ratio
+
+
+def _time_score(delta_minutes: float) -> float:
     if delta_minutes <= 15:
         return 1.0
     if delta_minutes <= 60:
@@ -30,15 +48,33 @@ def _time_similarity(transcript: TranscriptArtifact, occurrence: dict) -> float:
     return 0.0
 
 
-def _attendee_overlap(transcript: TranscriptArtifact, occurrence_contacts: list[dict]) -> float:
-    transcript_emails = {attendee.email for attendee in transcript.attendees if attendee.email}
-    occurrence_emails = {row["attendee_email"] for row in occurrence_contacts if row["attendee_email"]}
+def _time_similarity(transcript: TranscriptArtifact, occurrence: dict) -> float:
+    if transcript.source_event_id and occurrence.get("source_event_id") == transcript.source_event_id:
+        return 1.0
+    if transcript.started_at is None:
+        return 0.0
+    occurrence_start = datetime.fromisoformat(occurrence["starts_at"])
+    return _time_score(abs((occurrence_start - transcript.started_at).total_seconds()) / 60)
+
+
+def _email_overlap(transcript_emails: set[str], occurrence_emails: set[str]) -> float:
     if not transcript_emails or not occurrence_emails:
         return 0.0
     overlap = transcript_emails & occurrence_emails
     return len(overlap) / max(len(transcript_emails), len(occurrence_emails))
 
 
+def _attendee_overlap(transcript: TranscriptArtifact, occurrence_contacts: list[dict]) -> float:
+    transcript_emails = {attendee.email for attendee in transcript.attendees if attendee.email}
+    occurrence_emails = {row["attendee_email"] for row in occurrence_contacts if row["attendee_email"]}
+    return _email_overlap(transcript_emails, occurrence_emails)
+
+
+def _weighted_confidence(time_score: float, attendee_score: float, title_score: float) -> float:
+    weighted = (time_score * 0.5) + (attendee_score * 0.3) + (title_score * 0.2)
+    return round(weighted, 2)
+
+
 def occurrence_match_confidence(
     transcript: TranscriptArtifact,
     occurrence: dict,
@@ -49,5 +85,4 @@ def occurrence_match_confidence(
     time_score = _time_similarity(transcript, occurrence)
     attendee_score = _attendee_overlap(transcript, occurrence_contacts)
     title_score = _title_similarity(transcript.title, occurrence["title"])
-    weighted = (time_score * 0.5) + (attendee_score * 0.3) + (title_score * 0.2)
-    return round(weighted, 2)
+    return _weighted_confidence(time_score, attendee_score, title_score)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import re
+import time
 import uuid
 from collections.abc import Iterable
 from datetime import datetime
@@ -93,6 +94,66 @@ def classify_capture_mode(event: NormalizedCalendarEvent, internal_domains: set[
     return "tracked meeting" if has_external_attendee(event, internal_domains) else "activity log"
 
 
+_STAGING_TABLES = (
+    """
+    CREATE TEMP TABLE staged_keys (
+      provider TEXT NOT NULL,
+      source_event_id TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TEMP TABLE staged_events (
+      seq INTEGER PRIMARY KEY,
+      occurrence_id TEXT NOT NULL,
+      title TEXT NOT NULL,
+      starts_at TEXT NOT NULL,
+      ends_at TEXT,
+      state TEXT NOT NULL,
+      capture_mode TEXT NOT NULL,
+      provider TEXT NOT NULL,
+      source_event_id TEXT NOT NULL,
+      source_series_id TEXT,
+      series_key TEXT,
+      calendar_id TEXT,
+      raw_payload TEXT,
+      is_current INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TEMP TABLE staged_attendees (
+      seq INTEGER PRIMARY KEY,
+      occurrence_id TEXT NOT NULL,
+      contact_id TEXT NOT NULL,
+      name TEXT,
+      email TEXT,
+      normalized_name TEXT,
+      domain TEXT,
+      attendee_type TEXT,
+      is_external INTEGER NOT NULL,
+      is_current INTEGER NOT NULL
+    )
+    """,
+)
+
+
+def _drop_staging_tables(conn) -> None:
+    for table in ("staged_keys", "staged_events", "staged_attendees"):
+        conn.execute(f"DROP TABLE IF EXISTS temp.{table}")
+
+
+def _prefetch_occurrence_ids(conn, keys: set[tuple[str, str]]) -> dict[tuple[str, str], str]:
+    """Existing (provider, source_event_id) -> occurrence_id mappings for the batch."""
+    conn.executemany("INSERT INTO temp.staged_keys (provider, source_event_id) VALUES (?, ?)", keys)
+    rows = conn.execute(
+        """
+        SELECT se.provider, se.source_event_id, se.occurrence_id
+        FROM temp.staged_keys k
+        JOIN source_events se ON se.provider = k.provider AND se.source_event_id = k.source_event_id
+        """
+    ).fetchall()
+    return {(row["provider"], row["source_event_id"]): row["occurrence_id"] for row in rows}
+
+
 def reconcile_events(
     conn,
     events: Iterable[NormalizedCalendarEvent],
@@ -100,40 +161,114 @@ def reconcile_events(
     internal_domains: set[str],
     window_start: datetime | None = None,
     window_end: datetime | None = None,
-) -> dict[str, int]:
-    """Reconcile a batch of normalized events onto canonical occurrences."""
+) -> dict:
+    """Reconcile a batch of normalized events onto canonical occurrences.
+
+    Existing source-event mappings are fetched for the whole batch up front.
+    Events and attendees are then staged in temp tables and merged with one
+    statement per target table, applied in batch order so a later copy of
+    an event wins exactly as if the events were written one at a time.
+    """
+    timings: dict[str, float] = {}
+    phase_start = time.perf_counter()
+
+    def _lap(phase: str) -> None:
+        nonlocal phase_start
+        now_ = time.perf_counter()
+        timings[phase] = round(now_ - phase_start, 4)
+        phase_start = now_
+
     now = utc_now()
     processed: list[NormalizedCalendarEvent] = [event for event in events if should_include_event(event, internal_domains)]
-    seen_ids = {event.source_event_id for event in processed}
 
     min_start = window_start.isoformat() if window_start else min((event.starts_at.isoformat() for event in processed), default=None)
     max_start = window_end.isoformat() if window_end else max((event.starts_at.isoformat() for event in processed), default=None)
 
-    created = 0
-    updated = 0
-
-    for event in processed:
-        occurrence_id = build_occurrence_id(event)
-        series_key = build_series_key(event)
-        capture_mode = classify_capture_mode(event, internal_domains)
-
-        existing = conn.execute(
-            "SELECT occurrence_id FROM source_events WHERE provider = ? AND source_event_id = ?",
-            (event.provider, event.source_event_id),
-        ).fetchone()
-
-        if existing:
-            occurrence_id = existing["occurrence_id"]
-            updated += 1
-        else:
-            created += 1
+    _drop_staging_tables(conn)
+    for statement in _STAGING_TABLES:
+        conn.execute(statement)
+    try:
+        occurrence_ids = _prefetch_occurrence_ids(
+            conn, {(event.provider, event.source_event_id) for event in processed}
+        )
+        _lap("prefetch")
+
+        # Resolve each event's occurrence in batch order: a repeat of an event
+        # earlier in the batch reuses that event's occurrence and counts as an update.
+        created = 0
+        updated = 0
+        resolved: list[str] = []
+        for event in processed:
+            key = (event.provider, event.source_event_id)
+            if key in occurrence_ids:
+                updated += 1
+            else:
+                created += 1
+                occurrence_ids[key] = build_occurrence_id(event)
+            resolved.append(occurrence_ids[key])
+        # Contacts are replaced per event, so only the last event for an occurrence keeps its attendees
+        last_seq = {occurrence_id: seq for seq, occurrence_id in enumerate(resolved)}
+
+        event_rows = []
+        attendee_rows = []
+        for seq, (event, occurrence_id) in enumerate(zip(processed, resolved)):
+            is_current = 1 if last_seq[occurrence_id] == seq else 0
+            event_rows.append(
+                (
+                    seq,
+                    occurrence_id,
+                    event.title,
+                    event.starts_at.isoformat(),
+                    event.ends_at.isoformat() if event.ends_at else None,
+                    event.state,
+                    classify_capture_mode(event, internal_domains),
+                    event.provider,
+                    event.source_event_id,
+                    event.source_series_id,
+                    build_series_key(event),
+                    event.calendar_id,
+                    json.dumps(event.as_dict(), sort_keys=True),
+                    is_current,
+                )
+            )
+            for attendee in event.attendees:
+                if _is_service_account(attendee):
+                    continue
+                attendee_rows.append(
+                    (
+                        len(attendee_rows),
+                        occurrence_id,
+                        _contact_id(attendee),
+                        attendee.name,
+                        attendee.email,
+                        (attendee.name or "").strip().lower() or None,
+                        attendee.domain,
+                        attendee.attendee_type,
+                        0 if attendee.domain in internal_domains else 1,
+                        is_current,
+                    )
+                )
+        conn.executemany(
+            "INSERT INTO temp.staged_events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            event_rows,
+        )
+        conn.executemany(
+            "INSERT INTO temp.staged_attendees VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            attendee_rows,
+        )
+        _lap("stage")
 
         conn.execute(
             """
             INSERT INTO occurrences (
               id, title, starts_at, ends_at, state, capture_mode, provider,
               source_series_id, series_key, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            )
+            SELECT occurrence_id, title, starts_at, ends_at, state, capture_mode, provider,
+                   source_series_id, series_key, :now, :now
+            FROM temp.staged_events
+            WHERE true
+            ORDER BY seq
             ON CONFLICT(id) DO UPDATE SET
               title = excluded.title,
               starts_at = excluded.starts_at,
@@ -144,25 +279,17 @@ def reconcile_events(
               series_key = excluded.series_key,
               updated_at = excluded.updated_at
             """,
-            (
-                occurrence_id,
-                event.title,
-                event.starts_at.isoformat(),
-                event.ends_at.isoformat() if event.ends_at else None,
-                event.state,
-                capture_mode,
-                event.provider,
-                event.source_series_id,
-                series_key,
-                now,
-                now,
-            ),
+            {"now": now},
         )
         conn.execute(
             """
             INSERT INTO source_events (
               provider, source_event_id, occurrence_id, source_series_id, calendar_id, last_seen_at, raw_payload
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            )
+            SELECT provider, source_event_id, occurrence_id, source_series_id, calendar_id, :now, raw_payload
+            FROM temp.staged_events
+            WHERE true
+            ORDER BY seq
             ON CONFLICT(provider, source_event_id) DO UPDATE SET
               occurrence_id = excluded.occurrence_id,
               source_series_id = excluded.source_series_id,
@@ -170,82 +297,68 @@ def reconcile_events(
               last_seen_at = excluded.last_seen_at,
               raw_payload = excluded.raw_payload
             """,
-            (
-                event.provider,
-                event.source_event_id,
-                occurrence_id,
-                event.source_series_id,
-                event.calendar_id,
-                now,
-                json.dumps(event.as_dict(), sort_keys=True),
-            ),
+            {"now": now},
         )
+        _lap("merge_occurrences")
 
-        conn.execute("DELETE FROM occurrence_contacts WHERE occurrence_id = ?", (occurrence_id,))
-        for attendee in event.attendees:
-            if _is_service_account(attendee):
-                continue
-            contact_id = _contact_id(attendee)
-            conn.execute(
-                """
-                INSERT INTO contacts (
-                  id, name, email, normalized_name, domain, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(email) DO UPDATE SET
-                  name = COALESCE(excluded.name, contacts.name),
-                  normalized_name = COALESCE(excluded.normalized_name, contacts.normalized_name),
-                  domain = COALESCE(excluded.domain, contacts.domain),
-                  updated_at = excluded.updated_at
-                """,
-                (
-                    contact_id,
-                    attendee.name,
-                    attendee.email,
-                    (attendee.name or "").strip().lower() or None,
-                    attendee.domain,
-                    now,
-                    now,
-                ),
+        # Contacts without an email can only collide on id (same name); keep the existing row
+        conn.execute(
+            """
+            INSERT INTO contacts (
+              id, name, email, normalized_name, domain, created_at, updated_at
             )
-            resolved_contact = conn.execute(
-                "SELECT id FROM contacts WHERE email = ? OR (email IS NULL AND id = ?)",
-                (attendee.email, contact_id),
-            ).fetchone()
-            final_contact_id = resolved_contact["id"] if resolved_contact else contact_id
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO occurrence_contacts (
-                  occurrence_id, contact_id, attendee_name, attendee_email, attendee_type, is_external
-                ) VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    occurrence_id,
-                    final_contact_id,
-                    attendee.name,
-                    attendee.email,
-                    attendee.attendee_type,
-                    0 if attendee.domain in internal_domains else 1,
-                ),
+            SELECT contact_id, name, email, normalized_name, domain, :now, :now
+            FROM temp.staged_attendees
+            WHERE true
+            ORDER BY seq
+            ON CONFLICT(email) DO UPDATE SET
+              name = COALESCE(excluded.name, contacts.name),
+              normalized_name = COALESCE(excluded.normalized_name, contacts.normalized_name),
+              domain = COALESCE(excluded.domain, contacts.domain),
+              updated_at = excluded.updated_at
+            ON CONFLICT DO NOTHING
+            """,
+            {"now": now},
+        )
+        conn.execute(
+            """
+            DELETE FROM occurrence_contacts
+            WHERE occurrence_id IN (SELECT occurrence_id FROM temp.staged_events)
+            """
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO occurrence_contacts (
+              occurrence_id, contact_id, attendee_name, attendee_email, attendee_type, is_external
             )
-
-    if min_start and max_start:
-        rows = conn.execute(
+            SELECT a.occurrence_id, COALESCE(c.id, a.contact_id), a.name, a.email, a.attendee_type, a.is_external
+            FROM temp.staged_attendees a
+            LEFT JOIN contacts c ON c.email = a.email
+            WHERE a.is_current = 1
+            ORDER BY a.seq
             """
-            SELECT se.provider, se.source_event_id, se.occurrence_id
-            FROM source_events se
-            JOIN occurrences o ON o.id = se.occurrence_id
-            WHERE se.provider = ?
-              AND o.starts_at BETWEEN ? AND ?
-              AND o.state != 'cancelled'
-            """,
-            ((processed[0].provider if processed else "eventkit"), min_start, max_start),
-        ).fetchall()
-        for row in rows:
-            if row["source_event_id"] in seen_ids:
-                continue
+        )
+        _lap("merge_contacts")
+
+        if min_start and max_start:
             conn.execute(
-                "UPDATE occurrences SET state = 'cancelled', updated_at = ? WHERE id = ?",
-                (now, row["occurrence_id"]),
+                """
+                UPDATE occurrences SET state = 'cancelled', updated_at = ?
+                WHERE id IN (
+                  SELECT se.occurrence_id
+                  FROM source_events se
+                  JOIN occurrences o ON o.id = se.occurrence_id
+                  WHERE se.provider = ?
+                    AND o.starts_at BETWEEN ? AND ?
+                    AND o.state != 'cancelled'
+                    AND se.source_event_id NOT IN (SELECT source_event_id FROM temp.staged_events)
+                )
+                """,
+                (now, (processed[0].provider if processed else "eventkit"), min_start, max_start),
             )
+        _lap("cancel")
+    finally:
+        _drop_staging_tables(conn)
 
-    return {"created": created, "updated": updated, "total": len(processed)}
+    timings["total"] = round(sum(timings.values()), 4)
+    return {"created": created, "updated": updated, "total": len(processed), "timings": timings}
@@ -58,8 +58,7 @@ class RitualIntelligenceService:
         return result
 
     def list_occurrences(self, *, limit: int = 50) -> list[dict]:
-        conn = bootstrap_database(connect(create=True))
-        try:
+        with transaction(create=True) as conn:
             rows = conn.execute(
                 """
                 SELECT id, title, starts_at, ends_at, state, capture_mode, provider,
@@ -70,9 +69,7 @@ class RitualIntelligenceService:
                 """,
                 (limit,),
             ).fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+        return [dict(row) for row in rows]
 
     def list_ritual_suggestions(self) -> list[dict]:
         try:
@@ -140,6 +137,15 @@ class RitualIntelligenceService:
 
         return reconcile_unmatched_transcripts()
 
+    def backfill_transcripts(self, *, chunk_size: int | None = None, progress=None, resume: bool = True) -> dict:
+        from .transcript_backfill import DEFAULT_CHUNK_SIZE, backfill_transcripts
+
+        return backfill_transcripts(
+            chunk_size=DEFAULT_CHUNK_SIZE if chunk_size is None else chunk_size,
+            progress=progress,
+            resume=resume,
+        )
+
     def mark_transcript_not_same_meeting(self, transcript_id: str, occurrence_id: str) -> dict:
         from .actions import mark_transcript_not_same_meeting
 
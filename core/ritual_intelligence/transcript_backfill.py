@@ -0,0 +1,242 @@
+"""Bulk matching for historical transcript archives.
+
+``reconcile_unmatched_transcripts`` queries a ±6h window per transcript,
+which suits the few transcripts ingested each day. A first import of an
+archive instead sorts the pending transcripts and every occurrence by start
+time and sweeps both with a moving ±6h window. Titles, attendee email sets
+and source event ids are prepared once, and title ratios are memoized per
+title pair. Scores and thresholds are those of
+``occurrence_match_confidence`` and ``reconcile_unmatched_transcripts``.
+
+Results are written per chunk. Each chunk's updates and the checkpoint
+(the sort position of its last transcript) commit in one transaction, so
+an interrupted backfill resumes after the last committed chunk. The
+checkpoint is removed when the sweep completes.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from .db import transaction, utc_now
+from .matching import TitleSimilarity, _email_overlap, _time_score, _weighted_confidence
+from .models import TranscriptArtifact
+from .transcript_reconcile import (
+    AMBIGUOUS_THRESHOLD,
+    MATCH_MARGIN,
+    MATCH_THRESHOLD,
+    MATCH_WINDOW,
+    PROMOTE_THRESHOLD,
+    RECENT_CANDIDATE_LIMIT,
+    _transcript_artifact,
+)
+
+CHECKPOINT_NAME = "transcript_backfill"
+DEFAULT_CHUNK_SIZE = 250
+
+ProgressCallback = Callable[[int, int], None]
+
+_OCCURRENCE_SELECT = """
+    SELECT o.id, o.title, o.starts_at, o.capture_mode, se.source_event_id
+    FROM occurrences o
+    LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
+"""
+
+
+@dataclass(slots=True)
+class _Candidate:
+    id: str
+    title: str
+    starts_at: datetime
+    capture_mode: str
+    source_event_id: str | None
+    emails: frozenset[str]
+
+
+def _sort_position(transcript: TranscriptArtifact) -> list:
+    # Timed transcripts in start order, then untimed ones; the id breaks ties
+    if transcript.started_at is None:
+        return [1, 0.0, transcript.transcript_id]
+    return [0, transcript.started_at.timestamp(), transcript.transcript_id]
+
+
+def _candidates(rows, emails: dict[str, set[str]]) -> list[_Candidate]:
+    return [
+        _Candidate(
+            id=row["id"],
+            title=row["title"],
+            starts_at=datetime.fromisoformat(row["starts_at"]),
+            capture_mode=row["capture_mode"],
+            source_event_id=row["source_event_id"],
+            emails=frozenset(emails.get(row["id"], ())),
+        )
+        for row in rows
+    ]
+
+
+def _load(conn):
+    transcripts = [
+        _transcript_artifact(row)
+        for row in conn.execute("SELECT * FROM transcripts WHERE status IN ('unmatched', 'ambiguous')")
+    ]
+    transcripts.sort(key=_sort_position)
+
+    emails: dict[str, set[str]] = {}
+    for row in conn.execute(
+        "SELECT occurrence_id, attendee_email FROM occurrence_contacts WHERE attendee_email IS NOT NULL AND attendee_email != ''"
+    ):
+        emails.setdefault(row["occurrence_id"], set()).add(row["attendee_email"])
+    occurrences = _candidates(conn.execute(f"{_OCCURRENCE_SELECT} ORDER BY o.starts_at ASC"), emails)
+    occurrences.sort(key=lambda candidate: candidate.starts_at)
+    recent = []
+    if any(transcript.started_at is None for transcript in transcripts):
+        recent = _candidates(
+            conn.execute(f"{_OCCURRENCE_SELECT} ORDER BY o.starts_at DESC LIMIT ?", (RECENT_CANDIDATE_LIMIT,)),
+            emails,
+        )
+
+    negative = {
+        (row["transcript_id"], row["occurrence_id"])
+        for row in conn.execute(
+            """
+            SELECT nm.transcript_id, nm.occurrence_id
+            FROM transcripts t
+            JOIN transcript_negative_matches nm ON nm.transcript_id = t.id
+            WHERE t.status IN ('unmatched', 'ambiguous')
+            """
+        )
+    }
+    checkpoint = conn.execute(
+        "SELECT position, processed FROM job_checkpoints WHERE name = ?", (CHECKPOINT_NAME,)
+    ).fetchone()
+    return transcripts, occurrences, recent, negative, checkpoint
+
+
+def _write_chunk(outcomes: list[tuple], promote: list[str], position: list | None, processed: int) -> None:
+    now = utc_now()
+    with transaction(create=True) as conn:
+        conn.executemany(
+            """
+            UPDATE transcripts
+            SET occurrence_id = COALESCE(?, occurrence_id), status = ?, occurrenceMatchConfidence = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            [(occurrence_id, status, confidence, now, transcript_id) for transcript_id, status, occurrence_id, confidence in outcomes],
+        )
+        conn.executemany(
+            "UPDATE occurrences SET capture_mode = 'tracked meeting', updated_at = ? WHERE id = ?",
+            [(now, occurrence_id) for occurrence_id in promote],
+        )
+        if position is None:
+            conn.execute("DELETE FROM job_checkpoints WHERE name = ?", (CHECKPOINT_NAME,))
+        else:
+            conn.execute(
+                """
+                INSERT INTO job_checkpoints (name, position, processed, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                  position = excluded.position,
+                  processed = excluded.processed,
+                  updated_at = excluded.updated_at
+                """,
+                (CHECKPOINT_NAME, json.dumps(position), processed, now),
+            )
+
+
+def backfill_transcripts(
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+    resume: bool = True,
+) -> dict:
+    """Match every unmatched/ambiguous transcript in one sweep over the occurrence timeline.
+
+    ``progress(done, total)`` is called after each committed chunk. With
+    ``resume`` an interrupted run continues after its checkpoint; otherwise
+    the sweep starts over. ``chunk_size=0`` writes everything in one transaction.
+    """
+    with transaction(create=True) as conn:
+        transcripts, occurrences, recent, negative, checkpoint = _load(conn)
+
+    start_position = json.loads(checkpoint["position"]) if resume and checkpoint else None
+    total = len(transcripts)
+    skipped = 0
+    if start_position is not None:
+        skipped = sum(1 for transcript in transcripts if _sort_position(transcript) <= start_position)
+    counts = {"matched": 0, "ambiguous": 0, "unmatched": 0}
+    titles = TitleSimilarity()
+    starts = [candidate.starts_at for candidate in occurrences]
+    low = high = 0
+    promoted: set[str] = set()
+    outcomes: list[tuple] = []
+    promote: list[str] = []
+    done = skipped
+
+    for transcript in transcripts[skipped:]:
+        if transcript.started_at is None:
+            window = recent
+        else:
+            # Both ends of the window only move forward as the transcripts' start times increase
+            earliest = transcript.started_at - MATCH_WINDOW
+            latest = transcript.started_at + MATCH_WINDOW
+            while low < len(starts) and starts[low] < earliest:
+                low += 1
+            high = max(high, low)
+            while high < len(starts) and starts[high] <= latest:
+                high += 1
+            window = occurrences[low:high]
+
+        transcript_emails = {attendee.email for attendee in transcript.attendees if attendee.email}
+        scored = []
+        for candidate in window:
+            if (transcript.transcript_id, candidate.id) in negative:
+                continue
+            if transcript.source_event_id and candidate.source_event_id == transcript.source_event_id:
+                confidence = 1.0
+            else:
+                time_score = 0.0
+                if transcript.started_at is not None:
+                    time_score = _time_score(abs((candidate.starts_at - transcript.started_at).total_seconds()) / 60)
+                confidence = _weighted_confidence(
+                    time_score,
+                    _email_overlap(transcript_emails, candidate.emails),
+                    titles(transcript.title, candidate.title),
+                )
+            scored.append((confidence, candidate))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        best_confidence = scored[0][0] if scored else 0.0
+        second_confidence = scored[1][0] if len(scored) > 1 else 0.0
+        if best_confidence >= MATCH_THRESHOLD and (best_confidence - second_confidence) >= MATCH_MARGIN:
+            best = scored[0][1]
+            outcomes.append((transcript.transcript_id, "matched", best.id, best_confidence))
+            if best_confidence >= PROMOTE_THRESHOLD and best.capture_mode == "activity log" and best.id not in promoted:
+                promoted.add(best.id)
+                promote.append(best.id)
+            counts["matched"] += 1
+        elif best_confidence >= AMBIGUOUS_THRESHOLD:
+            outcomes.append((transcript.transcript_id, "ambiguous", None, best_confidence))
+            counts["ambiguous"] += 1
+        else:
+            outcomes.append((transcript.transcript_id, "unmatched", None, best_confidence))
+            counts["unmatched"] += 1
+        done += 1
+
+        if chunk_size and len(outcomes) >= chunk_size and done < total:
+            _write_chunk(outcomes, promote, _sort_position(transcript), done)
+            outcomes, promote = [], []
+            if progress:
+                progress(done, total)
+
+    _write_chunk(outcomes, promote, None, done)
+    if progress:
+        progress(done, total)
+    return {
+        "total": total,
+        "processed": done - skipped,
+        "skipped": skipped,
+        "resumed": start_position is not None,
+        **counts,
+    }
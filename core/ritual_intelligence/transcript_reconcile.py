@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 from datetime import datetime, timedelta
 
@@ -9,45 +10,133 @@ from .db import transaction, utc_now
 from .matching import occurrence_match_confidence
 from .models import NormalizedAttendee, TranscriptArtifact
 
+MATCH_WINDOW = timedelta(hours=6)
+RECENT_CANDIDATE_LIMIT = 20
+# A match needs MATCH_THRESHOLD and a MATCH_MARGIN lead over the runner-up;
+# AMBIGUOUS_THRESHOLD holds it for review; PROMOTE_THRESHOLD turns an activity log into a tracked meeting
+MATCH_THRESHOLD = 0.75
+MATCH_MARGIN = 0.1
+AMBIGUOUS_THRESHOLD = 0.5
+PROMOTE_THRESHOLD = 0.9
+
+_CANDIDATE_SELECT = """
+    SELECT o.*, se.source_event_id
+    FROM occurrences o
+    LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
+"""
+
+
+def _transcript_artifact(transcript_row) -> TranscriptArtifact:
+    return TranscriptArtifact(
+        transcript_id=transcript_row["id"],
+        source=transcript_row["source"],
+        source_transcript_id=transcript_row["source_transcript_id"],
+        title=transcript_row["title"],
+        started_at=datetime.fromisoformat(transcript_row["started_at"]) if transcript_row["started_at"] else None,
+        ended_at=datetime.fromisoformat(transcript_row["ended_at"]) if transcript_row["ended_at"] else None,
+        source_event_id=transcript_row["source_event_id"],
+        attendees=[
+            NormalizedAttendee(
+                name=entry.get("name"),
+                email=entry.get("email"),
+                status=entry.get("status"),
+                attendee_type=entry.get("attendee_type"),
+            )
+            for entry in json.loads(transcript_row["attendees_json"] or "[]")
+        ],
+        raw_text=transcript_row["raw_text"],
+    )
 
-def _load_occurrence_contacts(conn, occurrence_id: str) -> list[dict]:
-    rows = conn.execute(
-        """
-        SELECT attendee_name, attendee_email, attendee_type
-        FROM occurrence_contacts
-        WHERE occurrence_id = ?
-        """,
-        (occurrence_id,),
-    ).fetchall()
-    return [dict(row) for row in rows]
-
-
-def _candidate_occurrences(conn, transcript_row: dict) -> list[dict]:
-    if transcript_row.get("started_at"):
-        started_at = datetime.fromisoformat(transcript_row["started_at"])
-        earliest = (started_at - timedelta(hours=6)).isoformat()
-        latest = (started_at + timedelta(hours=6)).isoformat()
-        rows = conn.execute(
-            """
-            SELECT o.*, se.source_event_id
-            FROM occurrences o
-            LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
-            WHERE o.starts_at BETWEEN ? AND ?
-            ORDER BY o.starts_at ASC
-            """,
-            (earliest, latest),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            """
-            SELECT o.*, se.source_event_id
-            FROM occurrences o
-            LEFT JOIN source_events se ON se.occurrence_id = o.id AND se.provider = o.provider
-            ORDER BY o.starts_at DESC
-            LIMIT 20
-            """
-        ).fetchall()
-    return [dict(row) for row in rows]
+
+def _match_window(transcript: TranscriptArtifact) -> tuple[str, str]:
+    # Bounds are compared as strings, exactly like the SQL BETWEEN they replace
+    return (
+        (transcript.started_at - MATCH_WINDOW).isoformat(),
+        (transcript.started_at + MATCH_WINDOW).isoformat(),
+    )
+
+
+def _merge_windows(windows: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    merged: list[tuple[str, str]] = []
+    for earliest, latest in sorted(windows):
+        if merged and earliest <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], latest))
+        else:
+            merged.append((earliest, latest))
+    return merged
+
+
+class _CandidatePool:
+    """Candidate occurrences, their contacts and the negative matches for a batch of transcripts."""
+
+    def __init__(self, conn, transcripts: list[TranscriptArtifact]) -> None:
+        windows = _merge_windows([_match_window(t) for t in transcripts if t.started_at is not None])
+        self.occurrences: list[dict] = []
+        self.contacts: dict[str, list[dict]] = {}
+        for earliest, latest in windows:
+            self.occurrences.extend(
+                dict(row)
+                for row in conn.execute(
+                    f"{_CANDIDATE_SELECT} WHERE o.starts_at BETWEEN ? AND ? ORDER BY o.starts_at ASC",
+                    (earliest, latest),
+                )
+            )
+            self._add_contacts(
+                conn.execute(
+                    """
+                    SELECT oc.occurrence_id, oc.attendee_name, oc.attendee_email, oc.attendee_type
+                    FROM occurrences o
+                    JOIN occurrence_contacts oc ON oc.occurrence_id = o.id
+                    WHERE o.starts_at BETWEEN ? AND ?
+                    """,
+                    (earliest, latest),
+                )
+            )
+        self.starts = [occurrence["starts_at"] for occurrence in self.occurrences]
+
+        self.recent: list[dict] = []
+        if any(t.started_at is None for t in transcripts):
+            self.recent = [
+                dict(row)
+                for row in conn.execute(
+                    f"{_CANDIDATE_SELECT} ORDER BY o.starts_at DESC LIMIT ?", (RECENT_CANDIDATE_LIMIT,)
+                )
+            ]
+            missing = list({occurrence["id"] for occurrence in self.recent} - self.contacts.keys())
+            if missing:
+                self._add_contacts(
+                    conn.execute(
+                        f"""
+                        SELECT occurrence_id, attendee_name, attendee_email, attendee_type
+                        FROM occurrence_contacts
+                        WHERE occurrence_id IN ({", ".join("?" for _ in missing)})
+                        """,
+                        missing,
+                    )
+                )
+
+        self.negative = {
+            (row["transcript_id"], row["occurrence_id"])
+            for row in conn.execute(
+                """
+                SELECT nm.transcript_id, nm.occurrence_id
+                FROM transcripts t
+                JOIN transcript_negative_matches nm ON nm.transcript_id = t.id
+                WHERE t.status IN ('unmatched', 'ambiguous')
+                """
+            )
+        }
+
+    def _add_contacts(self, rows) -> None:
+        for row in rows:
+            contact = dict(row)
+            self.contacts.setdefault(contact.pop("occurrence_id"), []).append(contact)
+
+    def candidates(self, transcript: TranscriptArtifact) -> list[dict]:
+        if transcript.started_at is None:
+            return self.recent
+        earliest, latest = _match_window(transcript)
+        return self.occurrences[bisect.bisect_left(self.starts, earliest):bisect.bisect_right(self.starts, latest)]
 
 
 def reconcile_unmatched_transcripts() -> list[dict]:
@@ -61,39 +150,16 @@ def reconcile_unmatched_transcripts() -> list[dict]:
             ORDER BY started_at DESC, created_at DESC
             """
         ).fetchall()
-        for transcript_row in transcript_rows:
-            transcript = TranscriptArtifact(
-                transcript_id=transcript_row["id"],
-                source=transcript_row["source"],
-                source_transcript_id=transcript_row["source_transcript_id"],
-                title=transcript_row["title"],
-                started_at=datetime.fromisoformat(transcript_row["started_at"]) if transcript_row["started_at"] else None,
-                ended_at=datetime.fromisoformat(transcript_row["ended_at"]) if transcript_row["ended_at"] else None,
-                source_event_id=transcript_row["source_event_id"],
-                attendees=[
-                    NormalizedAttendee(
-                        name=entry.get("name"),
-                        email=entry.get("email"),
-                        status=entry.get("status"),
-                        attendee_type=entry.get("attendee_type"),
-                    )
-                    for entry in json.loads(transcript_row["attendees_json"] or "[]")
-                ],
-                raw_text=transcript_row["raw_text"],
-            )
+        transcripts = [_transcript_artifact(row) for row in transcript_rows]
+        pool = _CandidatePool(conn, transcripts)
+        # Occurrences switched to tracked meetings in this run; the preloaded rows still say activity log
+        promoted: set[str] = set()
+        for transcript in transcripts:
             candidates = []
-            for occurrence in _candidate_occurrences(conn, dict(transcript_row)):
-                negative = conn.execute(
-                    """
-                    SELECT 1
-                    FROM transcript_negative_matches
-                    WHERE transcript_id = ? AND occurrence_id = ?
-                    """,
-                    (transcript.transcript_id, occurrence["id"]),
-                ).fetchone()
-                if negative:
+            for occurrence in pool.candidates(transcript):
+                if (transcript.transcript_id, occurrence["id"]) in pool.negative:
                     continue
-                contacts = _load_occurrence_contacts(conn, occurrence["id"])
+                contacts = pool.contacts.get(occurrence["id"], [])
                 confidence = occurrence_match_confidence(transcript, occurrence, contacts)
                 candidates.append((confidence, occurrence))
 
@@ -101,7 +167,7 @@ def reconcile_unmatched_transcripts() -> list[dict]:
             best_confidence = candidates[0][0] if candidates else 0.0
             second_confidence = candidates[1][0] if len(candidates) > 1 else 0.0
 
-            if best_confidence >= 0.75 and (best_confidence - second_confidence) >= 0.1:
+            if best_confidence >= MATCH_THRESHOLD and (best_confidence - second_confidence) >= MATCH_MARGIN:
                 best_occurrence = candidates[0][1]
                 conn.execute(
                     """
@@ -111,11 +177,16 @@ def reconcile_unmatched_transcripts() -> list[dict]:
                     """,
                     (best_occurrence["id"], best_confidence, utc_now(), transcript.transcript_id),
                 )
-                if best_confidence >= 0.9 and best_occurrence["capture_mode"] == "activity log":
+                if (
+                    best_confidence >= PROMOTE_THRESHOLD
+                    and best_occurrence["capture_mode"] == "activity log"
+                    and best_occurrence["id"] not in promoted
+                ):
                     conn.execute(
                         "UPDATE occurrences SET capture_mode = 'tracked meeting', updated_at = ? WHERE id = ?",
                         (utc_now(), best_occurrence["id"]),
                     )
+                    promoted.add(best_occurrence["id"])
                 results.append(
                     {
                         "transcript_id": transcript.transcript_id,
@@ -124,7 +195,7 @@ def reconcile_unmatched_transcripts() -> list[dict]:
                         "occurrenceMatchConfidence": best_confidence,
                     }
                 )
-            elif best_confidence >= 0.5:
+            elif best_confidence >= AMBIGUOUS_THRESHOLD:
                 conn.execute(
                     """
                     UPDATE transcripts
@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
@@ -20,3 +21,42 @@ for relative in (
 def fixture_vault() -> Path:
     """Return the path to the minimal PARA fixture vault."""
     return FIXTURE_VAULT
+
+
+@pytest.fixture
+def runtime_db(tmp_path, monkeypatch) -> Iterator[Path]:
+    """Point the Ritual Intelligence runtime at an empty DB under ``tmp_path``."""
+    from core.ritual_intelligence import db
+
+    path = tmp_path / "ritual-intelligence.db"
+    monkeypatch.setattr(db, "get_db_path", lambda: path)
+    yield path
+    db.close_connections()
+
+
+@pytest.fixture(autouse=True)
+def restore_fixture_vault():
+    """Undo what a test wrote to the fixture vault.
+
+    The Ritual Intelligence tests write the runtime DB, notes and transcripts
+    into the fixture vault. Files a test creates are removed afterwards, and
+    files it changes or deletes get their original contents back.
+    """
+    files = {path: path.read_bytes() for path in FIXTURE_VAULT.rglob("*") if path.is_file()}
+    directories = {path for path in FIXTURE_VAULT.rglob("*") if path.is_dir()}
+    yield
+
+    from core.ritual_intelligence.db import close_connections
+
+    close_connections()
+    # Deepest paths first, so created directories are empty by the time they are removed
+    for path in sorted(FIXTURE_VAULT.rglob("*"), reverse=True):
+        if path.is_dir():
+            if path not in directories:
+                path.rmdir()
+        elif path not in files:
+            path.unlink()
+    for path, content in files.items():
+        if not path.exists() or path.read_bytes() != content:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
@@ -0,0 +1,69 @@
+"""Tests for the append-only completion event log."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from core.utils.completion_log import CompletionLog, week_key
+
+MONDAY = datetime(2026, 2, 2, 9, 0, tzinfo=timezone.utc)
+NEXT_WEEK = datetime(2026, 2, 10, 9, 0, tzinfo=timezone.utc)
+
+
+def _log(tmp_path: Path) -> CompletionLog:
+    return CompletionLog(tmp_path / "completion-events.jsonl", tmp_path / "completion-stats.json")
+
+
+def test_weekly_and_pillar_counters(tmp_path: Path):
+    log = _log(tmp_path)
+    log.record("task", "task-20260202-001", "not_started", "done", pillar="growth", when=MONDAY)
+    log.record("task", "task-20260202-002", "not_started", "done", pillar="team", when=MONDAY)
+    log.record("task", "task-20260202-002", "done", "not_started", pillar="team", when=MONDAY)
+    log.record("goal", "Q1-2026-goal-1", "in_progress", "in_progress", when=MONDAY, progress=50)
+    log.record("priority", "week-2026-W07-p1", "not_started", "done", when=NEXT_WEEK)
+
+    week = log.week_counts(week_key(MONDAY.date()))
+    assert week["task"] == {"completed": 2, "reopened": 1}
+    assert week["pillars"] == {"growth": 1, "team": 0}
+    assert week["goal"] == {"completed": 0, "reopened": 0}
+
+    series = log.weekly_series([week_key(MONDAY.date()), week_key(NEXT_WEEK.date())], kind="priority")
+    assert [w["net"] for w in series] == [0, 1]
+    assert len(log.log_file.read_text().splitlines()) == 5
+
+
+def test_stale_stats_replay_only_the_log_tail(tmp_path: Path):
+    log = _log(tmp_path)
+    log.record("task", "task-20260202-001", "not_started", "done", when=MONDAY)
+
+    # Another writer appended without updating the stats, then crashed mid-line
+    event = {"ts": MONDAY.isoformat(), "kind": "task", "id": "task-20260202-002", "old": "not_started", "new": "done"}
+    with log.log_file.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(event) + "\n")
+        f.write('{"ts": "2026-02-02T1')
+
+    assert log.week_counts("2026-W06")["task"]["completed"] == 2
+    log.record("task", "task-20260202-003", "not_started", "done", when=MONDAY)
+    assert log.week_counts("2026-W06")["task"]["completed"] == 3
+
+    # Deleting the stats file rebuilds the same counters from the log
+    log.stats_file.unlink()
+    assert log.week_counts("2026-W06")["task"]["completed"] == 3
+
+
+def test_only_on_change_skips_repeated_status(tmp_path: Path):
+    log = _log(tmp_path)
+    assert log.record("priority", "week-2026-W06-p1", "not_started", "done", when=MONDAY, only_on_change=True)
+    assert log.record("priority", "week-2026-W06-p1", "not_started", "done", when=MONDAY, only_on_change=True) is None
+    # Items with no logged status are always recorded
+    assert log.record("task", "task-20260202-001", "done", "not_started", when=MONDAY, only_on_change=True)
+
+    assert log.week_counts("2026-W06")["priority"] == {"completed": 1, "reopened": 0}
+    assert log.week_counts("2026-W06")["task"] == {"completed": 0, "reopened": 1}
+
+
+def test_week_key_uses_iso_weeks():
+    assert week_key(date(2026, 1, 1)) == "2026-W01"
+    assert week_key(date(2027, 1, 1)) == "2026-W53"
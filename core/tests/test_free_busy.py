@@ -0,0 +1,125 @@
+"""Tests for the interval free/busy engine."""
+
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from core.utils.free_busy import FreeBusy, merge_intervals, pack_tasks, parse_clock
+
+DAY = date(2026, 2, 3)
+
+
+def _at(hour, minute=0, second=0):
+    return datetime(2026, 2, 3, hour, minute, second)
+
+
+def test_parse_clock_formats():
+    assert parse_clock("09:30") == 570
+    assert parse_clock("9:30 AM") == 570
+    assert parse_clock("12pm") == 720
+    assert parse_clock("12:15 a.m.") == 15
+    assert parse_clock("14:00:00") == 840
+    assert parse_clock("25:00") is None
+    assert parse_clock("13 pm") is None
+
+
+def test_overlaps_across_calendars_count_once():
+    events = [
+        {"start": "2026-02-03T09:00:00", "end": "2026-02-03T10:00:00", "calendar": "Work"},
+        {"date": "2026-02-03", "start_time": "9:30 AM", "end_time": "10:30 AM", "calendar": "Personal"},
+        {"date": "2026-02-03", "start_time": "10:30", "duration_minutes": 30},
+        {"date": "2026-02-03", "start_time": "15:00", "end_time": "16:00"},
+    ]
+    day = FreeBusy(events, work_start=9 * 60, work_end=17 * 60, default_date=DAY).day(DAY)
+
+    assert day["event_count"] == 4
+    assert day["busy_minutes"] == 180
+    assert day["free_blocks"] == [(_at(11), _at(15)), (_at(16), _at(17))]
+    assert day["free_minutes"] == 300
+    assert day["largest_block_minutes"] == 240
+
+
+def test_untimed_and_all_day_events():
+    events = [
+        {"title": "Offsite prep", "duration_minutes": 60},
+        {"title": "Holiday", "all_day": True, "date": "2026-02-04"},
+    ]
+    calendar = FreeBusy(events, work_start=9 * 60, work_end=12 * 60, default_date=DAY)
+
+    today = calendar.day(DAY)
+    assert today["free_blocks"] == [(_at(9), _at(12))]
+    assert (today["busy_minutes"], today["free_minutes"]) == (60, 120)
+    assert calendar.day(date(2026, 2, 4))["event_count"] == 1
+
+
+def test_short_gaps_are_not_free_blocks():
+    events = [
+        {"date": "2026-02-03", "start_time": "09:10", "end_time": "10:00"},
+        {"date": "2026-02-03", "start_time": "10:05", "end_time": "11:00"},
+    ]
+    calendar = FreeBusy(events, work_start=9 * 60, work_end=11 * 60 + 30, default_date=DAY)
+    assert calendar.free_blocks(DAY) == [(_at(11), _at(11, 30))]
+
+
+def test_time_before_not_before_is_not_free():
+    events = [{"date": "2026-02-03", "start_time": "15:30", "end_time": "16:00"}]
+    calendar = FreeBusy(events, work_start=9 * 60, work_end=17 * 60, default_date=DAY, not_before=_at(14, 59, 30))
+
+    assert calendar.free_blocks(DAY) == [(_at(15), _at(15, 30)), (_at(16), _at(17))]
+    assert calendar.free_blocks(DAY + timedelta(days=1))[0][0] == datetime(2026, 2, 4, 9)
+    late = FreeBusy([], work_start=9 * 60, work_end=17 * 60, default_date=DAY, not_before=_at(18))
+    assert late.day(DAY)["free_blocks"] == [] and late.day(DAY)["free_minutes"] == 0
+
+
+def test_invalid_working_hours():
+    with pytest.raises(ValueError):
+        FreeBusy([], work_start=17 * 60, work_end=9 * 60)
+
+
+def test_merge_matches_minute_coverage():
+    rng = random.Random(11)
+    for _ in range(200):
+        intervals = []
+        for _ in range(rng.randint(0, 12)):
+            start = rng.randint(0, 100)
+            intervals.append((start, start + rng.randint(0, 20)))
+        merged = merge_intervals(intervals)
+        covered = {m for s, e in intervals for m in range(s, e)}
+        assert {m for s, e in merged for m in range(s, e)} == covered
+        assert all(a[1] < b[0] for a, b in zip(merged, merged[1:]))
+
+
+def _first_fit(capacities, tasks):
+    capacities = list(capacities)
+    placed = {}
+    for key, minutes in tasks:
+        for idx, free in enumerate(capacities):
+            if free >= minutes:
+                placed[key] = idx
+                capacities[idx] -= minutes
+                break
+    return placed
+
+
+def test_pack_tasks_is_first_fit_in_time_order():
+    rng = random.Random(5)
+    for _ in range(200):
+        cursor = _at(8)
+        blocks = []
+        for _ in range(rng.randint(0, 8)):
+            start = cursor + timedelta(minutes=rng.randint(0, 60))
+            cursor = start + timedelta(minutes=rng.randint(15, 180))
+            blocks.append((start, cursor))
+        tasks = [(i, rng.choice([10, 15, 30, 45, 60, 120])) for i in range(rng.randint(0, 10))]
+
+        placements, unplaced = pack_tasks(blocks, tasks)
+
+        expected = _first_fit([int((e - s).total_seconds() // 60) for s, e in blocks], tasks)
+        assert {key: next(i for i, (s, e) in enumerate(blocks) if s <= start < e)
+                for key, (start, _) in placements.items()} == expected
+        assert unplaced == [key for key, _ in tasks if key not in expected]
+        booked = sorted(placements.values())
+        assert all(a[1] <= b[0] for a, b in zip(booked, booked[1:]))
@@ -0,0 +1,62 @@
+"""Tests for the meeting-cache note parser."""
+
+from __future__ import annotations
+
+from core.utils.meeting_parser import parse_meeting_content, parse_meeting_files
+
+NOTE = """---
+date: 2026-02-03
+participants: [Jane Doe, Sam Lee]
+company: "Acme"
+---
+# Acme renewal sync
+
+## Key Decisions
+- Move to **annual** billing
+
+## Action Items
+- [ ] Send the contract to [[Jane Doe|Jane]] ^task-20260203-001
+- [x] Update [[Pricing]]
+
+## Notes
+- not a section we cache
+"""
+
+
+def test_note_is_parsed_into_a_cache_entry():
+    entry = parse_meeting_content(NOTE, "2026-02-03 - Acme.md", "00-Inbox/Meetings/2026-02-03 - Acme.md", "t")
+    assert entry == {
+        "date": "2026-02-03",
+        "title": "Acme renewal sync",
+        "source_file": "00-Inbox/Meetings/2026-02-03 - Acme.md",
+        "attendees": ["Jane Doe", "Sam Lee"],
+        "company": "Acme",
+        "decisions": ["Move to annual billing"],
+        "action_items": ["Send the contract to Jane", "Update Pricing"],
+        "key_points": [],
+        "sentiment": "neutral",
+        "cached_at": "t",
+    }
+    untitled = parse_meeting_content("no heading", "2026-02-04 - Standup.md", "x.md")
+    assert (untitled["date"], untitled["title"]) == ("2026-02-04", "Standup")
+
+
+def test_pool_results_match_serial_parse_in_input_order(tmp_path):
+    files = []
+    for i in range(12):
+        path = tmp_path / f"2026-02-{i + 10:02d} - Sync {i}.md"
+        path.write_text(NOTE.replace("Acme renewal sync", f"Sync {i}"), encoding="utf-8")
+        files.append((path, path.name))
+    files.append((tmp_path / "missing.md", "missing.md"))
+
+    serial, serial_timings = parse_meeting_files(files, workers=1)
+    pooled, pooled_timings = parse_meeting_files(files, workers=2, min_parallel=1)
+
+    def strip(results):
+        return [(rel, entry and {k: v for k, v in entry.items() if k != "cached_at"}) for rel, entry in results]
+
+    assert strip(pooled) == strip(serial)
+    assert [rel for rel, _ in pooled] == [rel for _, rel in files]
+    assert pooled[-1][1] is None
+    assert serial_timings["workers"] == 1
+    assert set(pooled_timings) == {"read", "parse", "wall", "workers"}
@@ -0,0 +1,117 @@
+"""Tests for the indexed meeting-cache store."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+from pathlib import Path
+
+from core.utils.meeting_store import MeetingCacheStore
+
+PEOPLE = ["Jane Doe", "Sam Lee", "Priya Patel", "Al", "Jo", "Li Wei", "", "Bob O'Brien"]
+COMPANIES = ["Acme", "Acme Corp", "Globex", None, "Initech"]
+WORDS = ["pricing", "renewal", "roadmap", "hiring", "budget", "launch", "security", "SOC2", "q3"]
+
+
+def _linear(meetings, attendee=None, company=None, date_from=None, date_to=None, keyword=None):
+    """The original JSON scan from query_meeting_cache_data."""
+    filtered = []
+    for m in meetings:
+        if attendee:
+            names = [a.lower() for a in (m.get("attendees") or [])]
+            if not any(attendee.lower() in a or a in attendee.lower() for a in names):
+                continue
+        if company and company.lower() not in (m.get("company") or "").lower():
+            continue
+        meeting_date = m.get("date")
+        if date_from and meeting_date and meeting_date < date_from:
+            continue
+        if date_to and meeting_date and meeting_date > date_to:
+            continue
+        if keyword:
+            searchable = " ".join([
+                m.get("title", ""),
+                " ".join(m.get("key_points", [])),
+                " ".join(m.get("decisions", [])),
+                " ".join(m.get("action_items", [])),
+            ]).lower()
+            if keyword.lower() not in searchable:
+                continue
+        filtered.append(m)
+    return filtered
+
+
+def _meetings(rng):
+    meetings = []
+    for i in range(200):
+        meetings.append({
+            "date": rng.choice([None, f"2026-0{rng.randint(1, 9)}-{rng.randint(10, 28)}"]),
+            "title": " ".join(rng.sample(WORDS, 2)).title(),
+            "source_file": f"00-Inbox/Meetings/m{i}.md",
+            "attendees": rng.sample(PEOPLE, rng.randint(0, 3)),
+            "company": rng.choice(COMPANIES),
+            "decisions": [" ".join(rng.sample(WORDS, 3))],
+            "action_items": [],
+            "key_points": [rng.choice(WORDS)],
+        })
+    return meetings
+
+
+def test_indexed_queries_match_linear_scan(tmp_path: Path):
+    rng = random.Random(3)
+    meetings = _meetings(rng)
+    json_path = tmp_path / "meeting-cache.json"
+    json_path.write_text(json.dumps({"version": 1, "last_updated": "x", "meetings": meetings}))
+    store = MeetingCacheStore(tmp_path / "meeting-cache.db", json_path)
+    assert store.ensure_current()
+
+    queries = [
+        {"attendee": "jane"}, {"attendee": "Jane Doe Jr"}, {"attendee": "al"}, {"attendee": "o'brien"},
+        {"company": "acme"}, {"company": "corp", "date_from": "2026-05-01"},
+        {"keyword": "pricing renewal"}, {"keyword": "q3"}, {"keyword": 'soc2"'},
+        {"date_from": "2026-03-01", "date_to": "2026-06-30"},
+        {"attendee": "priya", "keyword": "budget", "company": "globex"},
+    ]
+    for query in queries:
+        assert store.query(**query) == _linear(meetings, **query), query
+    assert store.info()["total"] == 200
+
+
+def test_external_json_rebuild_is_reimported(tmp_path: Path):
+    json_path = tmp_path / "meeting-cache.json"
+    store = MeetingCacheStore(tmp_path / "meeting-cache.db", json_path)
+    assert not store.ensure_current()
+
+    store.replace({"version": 1, "last_updated": "a", "meetings": [{"title": "Pricing sync", "attendees": ["Jane"]}],
+                   "_file_mtimes": {"m.md": 1.0}})
+    assert json.loads(json_path.read_text())["_file_mtimes"] == {"m.md": 1.0}
+    assert [m["title"] for m in store.query(keyword="pricing")] == ["Pricing sync"]
+
+    # e.g. the Node meeting-cache builder rewrote the file
+    json_path.write_text(json.dumps({"meetings": [{"title": "Roadmap review", "attendees": ["Sam"]}]}))
+    os.utime(json_path, ns=(1, 1))
+    assert store.ensure_current()
+    assert store.query(keyword="pricing") == []
+    assert store.load_cache()["meetings"] == [{"title": "Roadmap review", "attendees": ["Sam"]}]
+
+
+def test_one_connection_is_reused_until_the_db_is_replaced(tmp_path: Path):
+    json_path = tmp_path / "meeting-cache.json"
+    json_path.write_text(json.dumps({"meetings": [{"title": "Pricing sync", "attendees": ["Jane"]}]}))
+    db_path = tmp_path / "meeting-cache.db"
+    store = MeetingCacheStore(db_path, json_path)
+    assert store.ensure_current()
+    conn = store._conn
+
+    assert [m["title"] for m in store.query(attendee="jane")] == ["Pricing sync"]
+    assert store.info()["total"] == 1
+    assert store._conn is conn
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+
+    # A deleted (or replaced) DB file is reopened and rebuilt from the JSON
+    db_path.unlink()
+    assert store.ensure_current()
+    assert store._conn is not conn
+    assert [m["title"] for m in store.query(keyword="pricing")] == ["Pricing sync"]
+    store.close()
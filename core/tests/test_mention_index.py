@@ -0,0 +1,79 @@
+"""Tests for the company-mention index over meeting notes."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+
+from core.utils.mention_index import AhoCorasick, MentionIndex
+
+
+def test_automaton_finds_exactly_the_substrings():
+    rng = random.Random(7)
+    patterns = ["acme", "acme corp", "cme", "me", "globex.com", "a", "corp", "initech", "ech"]
+    automaton = AhoCorasick(patterns)
+    for _ in range(300):
+        text = "".join(rng.choice("acmeorp .glbxitnh") for _ in range(rng.randint(0, 40)))
+        assert automaton.find(text) == {p for p in patterns if p in text}, text
+
+
+def _note(folder, name, text, stamp):
+    path = folder / name
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+    return path
+
+
+def _company(folder, name):
+    path = folder / "Companies" / f"{name}.md"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(f"# {name}\n", encoding="utf-8")
+    return path
+
+
+def test_only_changed_notes_and_new_patterns_are_scanned(tmp_path):
+    meetings = tmp_path / "Meetings"
+    meetings.mkdir()
+    _note(meetings, "2026-01-05 - Kickoff.md", "# Kickoff\nWith jane@acme.com", 1)
+    _note(meetings, "2026-01-06 - Sync.md", "# Sync\nGlobex renewal", 1)
+    acme, globex = _company(tmp_path, "Acme"), _company(tmp_path, "Globex")
+    index = MentionIndex(tmp_path / "mentions.json")
+
+    index.refresh(meetings, {acme: ["Acme", "acme.com"]})
+    assert index.scanned_last_refresh == 2
+    assert [name for name, _ in index.notes_mentioning(["acme"])] == ["2026-01-05 - Kickoff.md"]
+    assert index.notes_mentioning(["acme"])[0][1]["title"] == "Kickoff"
+
+    index.refresh(meetings, {acme: ["Acme", "acme.com"]})
+    assert index.scanned_last_refresh == 0
+
+    # A new company is matched against existing notes; persisted state is reused by a new instance
+    index = MentionIndex(tmp_path / "mentions.json")
+    index.refresh(meetings, {globex: ["Globex"]})
+    assert [name for name, _ in index.notes_mentioning(["globex"])] == ["2026-01-06 - Sync.md"]
+    assert [name for name, _ in index.notes_mentioning(["acme.com"])] == ["2026-01-05 - Kickoff.md"]
+
+    _note(meetings, "2026-01-06 - Sync.md", "# Sync\nAcme and Globex", 2)
+    (meetings / "2026-01-05 - Kickoff.md").unlink()
+    index.refresh(meetings, {acme: ["acme"]})
+    assert index.scanned_last_refresh == 1
+    assert [name for name, _ in index.notes_mentioning(["acme"])] == ["2026-01-06 - Sync.md"]
+
+
+def test_patterns_of_deleted_company_pages_are_dropped(tmp_path):
+    meetings = tmp_path / "Meetings"
+    meetings.mkdir()
+    _note(meetings, "2026-01-05 - Kickoff.md", "# Kickoff\nAcme and Globex", 1)
+    acme, globex = _company(tmp_path, "Acme"), _company(tmp_path, "Globex")
+    index = MentionIndex(tmp_path / "mentions.json")
+    index.refresh(meetings, {acme: ["acme"], globex: ["globex"]})
+    assert index.notes_mentioning(["globex"])
+
+    globex.unlink()
+    index.refresh(meetings, {acme: ["acme"]})
+
+    assert index.scanned_last_refresh == 0
+    assert index.notes_mentioning(["globex"]) == []
+    assert [name for name, _ in index.notes_mentioning(["acme"])] == ["2026-01-05 - Kickoff.md"]
+    assert json.loads((tmp_path / "mentions.json").read_text())["patterns"] == ["acme"]
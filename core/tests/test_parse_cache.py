@@ -0,0 +1,89 @@
+"""Tests for the mtime-keyed markdown parse cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from core.utils.parse_cache import FileParseCache
+
+
+def _settled(path: Path, ns: int) -> None:
+    os.utime(path, ns=(ns, ns))
+
+
+def test_parser_runs_once_per_file_change(tmp_path: Path):
+    target = tmp_path / "Tasks.md"
+    target.write_text("- [ ] one\n")
+    _settled(target, 1_000)
+    calls = []
+
+    def parser(path: Path):
+        calls.append(path)
+        return tuple(path.read_text().splitlines())
+
+    cache = FileParseCache()
+    assert cache.get(target, parser) == ("- [ ] one",)
+    assert cache.get(target, parser) == ("- [ ] one",)
+    assert len(calls) == 1
+
+    target.write_text("- [ ] one\n- [ ] two\n")
+    _settled(target, 2_000)
+    assert cache.get(target, parser) == ("- [ ] one", "- [ ] two")
+    assert len(calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_recently_modified_files_are_not_trusted(tmp_path: Path):
+    target = tmp_path / "Tasks.md"
+    target.write_text("- [ ] a\n")
+    calls = []
+
+    def parser(path: Path):
+        calls.append(path)
+        return path.read_text()
+
+    cache = FileParseCache()
+    cache.get(target, parser)
+    # Same-size rewrite within the same mtime tick must still be seen
+    target.write_text("- [x] a\n")
+    assert cache.get(target, parser) == "- [x] a\n"
+    assert len(calls) == 2
+
+
+def test_group_is_rebuilt_when_any_file_changes(tmp_path: Path):
+    goals, tasks = tmp_path / "Quarter_Goals.md", tmp_path / "Tasks.md"
+    goals.write_text("goal\n")
+    tasks.write_text("task\n")
+    _settled(goals, 1_000)
+    _settled(tasks, 1_000)
+    calls = []
+
+    def builder(paths):
+        calls.append(paths)
+        return tuple(p.read_text() for p in paths)
+
+    cache = FileParseCache()
+    assert cache.get_group((goals, tasks), builder) == ("goal\n", "task\n")
+    assert cache.get_group((goals, tasks), builder) == ("goal\n", "task\n")
+    assert len(calls) == 1
+
+    tasks.write_text("task two\n")
+    _settled(tasks, 2_000)
+    assert cache.get_group((goals, tasks), builder) == ("goal\n", "task two\n")
+    assert len(calls) == 2
+
+
+def test_work_server_task_records_are_copied(tmp_path: Path):
+    from core.mcp import work_server
+
+    tasks_file = tmp_path / "Tasks.md"
+    tasks_file.write_text("# Tasks\n## Now\n- [ ] **Draft the launch plan** ^task-20260101-001\n")
+    _settled(tasks_file, 1_000)
+
+    first = work_server.parse_tasks_file(tasks_file)
+    first[0]['title'] = 'mutated'
+    second = work_server.parse_tasks_file(tasks_file)
+
+    assert second[0]['title'] == 'Draft the launch plan'
+    assert second[0]['section'] == 'Now'
@@ -0,0 +1,73 @@
+"""Tests for the incremental People_Index and its name lookup."""
+
+from __future__ import annotations
+
+import os
+import random
+from pathlib import Path
+
+from core.utils.people_index import PeopleIndex, PersonNameIndex, score_name
+
+
+def _entry_fn(calls):
+    def entry(path: Path, subdir_name: str):
+        calls.append(path.name)
+        company = path.read_text().strip()
+        return {
+            "name": path.stem.replace("_", " "),
+            "company": company,
+            "type": subdir_name.lower(),
+            "path": str(path.relative_to(path.parents[2])),
+        }
+
+    return entry
+
+
+def _person(people_dir: Path, subdir: str, stem: str, company: str, ns: int = 1) -> Path:
+    path = people_dir / subdir / f"{stem}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(company)
+    os.utime(path, ns=(ns, ns))
+    return path
+
+
+def test_refresh_only_reparses_changed_pages(tmp_path: Path):
+    people_dir = tmp_path / "People"
+    _person(people_dir, "External", "Jane_Doe", "Acme")
+    _person(people_dir, "Internal", "Sam_Lee", "Dex")
+    calls = []
+    index = PeopleIndex(tmp_path / "People_Index.json", _entry_fn(calls))
+
+    first = index.refresh(people_dir, tmp_path)
+    assert first["total"] == 2 and first["by_type"] == {"internal": 1, "external": 1, "cpo_network": 0}
+    assert index.refresh(people_dir, tmp_path)["built_at"] == first["built_at"]
+    assert sorted(calls) == ["Jane_Doe.md", "Sam_Lee.md"]
+
+    _person(people_dir, "External", "Jane_Doe", "Globex Corp", ns=2)
+    (people_dir / "Internal" / "Sam_Lee.md").unlink()
+    # A fresh instance picks up the persisted signatures instead of re-parsing everything
+    calls.clear()
+    reloaded = PeopleIndex(tmp_path / "People_Index.json", _entry_fn(calls))
+    updated = reloaded.refresh(people_dir, tmp_path)
+    assert calls == ["Jane_Doe.md"]
+    assert [(p["name"], p["company"]) for p in updated["people"]] == [("Jane Doe", "Globex Corp")]
+    assert reloaded.search("jane doe", company="globex")[0]["_score"] == 1.0
+
+
+def test_name_index_matches_linear_scan():
+    rng = random.Random(11)
+    first = ["jane", "john", "jo", "sam", "samantha", "li", "priya", "alex", "alexandra", "mohammed"]
+    last = ["doe", "smith", "lee", "nguyen", "patel", "garcia", "o'brien", "kowalski"]
+    names = [f"{rng.choice(first)} {rng.choice(last)}" for _ in range(400)] + ["Al", "Jo Smith"]
+    index = PersonNameIndex(names)
+
+    for query in ["Jane Doe", "jon smth", "al", "Sam", "alexandra garcia", "Jo Smith Jr", "zz"]:
+        expected = []
+        for idx, name in enumerate(names):
+            score = score_name(query.lower(), name.lower())
+            if score >= 0.5:
+                expected.append((idx, score))
+        got = sorted(index.search(query))
+        # Every trigram-indexed hit is a real hit; exact/substring hits are never missed
+        assert set(got) <= set(expected)
+        assert {h for h in expected if h[1] >= 0.8} <= set(got)
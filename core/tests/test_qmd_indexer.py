@@ -0,0 +1,82 @@
+"""Tests for the single-flight QMD re-index worker."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+
+from core.utils import qmd_indexer
+from core.utils.qmd_indexer import ReindexWorker
+
+
+def test_burst_of_requests_is_coalesced_into_one_run():
+    runs = []
+    worker = ReindexWorker(lambda: runs.append(time.monotonic()), debounce_seconds=0.05, max_delay_seconds=1)
+
+    for _ in range(30):
+        worker.request()
+    assert worker.wait_idle(timeout=5)
+
+    stats = worker.stats()
+    assert len(runs) == 1
+    assert stats["requests"] == 30
+    assert stats["coalesced_requests"] == 29
+    assert stats["queued_requests"] == 0
+    assert stats["last_duration_seconds"] is not None
+
+
+def test_requests_during_a_run_schedule_one_trailing_run():
+    started = threading.Event()
+    release = threading.Event()
+    active = []
+    peak = []
+
+    def slow_run():
+        active.append(1)
+        peak.append(len(active))
+        started.set()
+        release.wait(timeout=5)
+        active.pop()
+
+    worker = ReindexWorker(slow_run, debounce_seconds=0.01, max_delay_seconds=1)
+    worker.request()
+    assert started.wait(timeout=5)
+
+    for _ in range(10):
+        worker.request()
+    assert worker.stats()["queued_requests"] == 10
+    assert worker.stats()["in_flight"] is True
+
+    release.set()
+    assert worker.wait_idle(timeout=5)
+    assert worker.stats()["runs"] == 2
+    assert max(peak) == 1
+
+
+def test_worker_survives_run_errors():
+    def failing():
+        raise RuntimeError("qmd exploded")
+
+    worker = ReindexWorker(failing, debounce_seconds=0.01)
+    worker.request()
+    assert worker.wait_idle(timeout=5)
+    assert worker.stats()["last_error"] == "qmd exploded"
+
+    worker.request()
+    assert worker.wait_idle(timeout=5)
+    assert worker.stats()["runs"] == 2
+
+
+def test_failed_qmd_run_is_reported_as_last_error(monkeypatch):
+    monkeypatch.setattr(qmd_indexer, "_qmd_path", "/usr/bin/qmd")
+    monkeypatch.setattr(
+        qmd_indexer.subprocess,
+        "run",
+        lambda args, **kwargs: subprocess.CompletedProcess(args, 1, stdout="", stderr="index locked"),
+    )
+
+    worker = ReindexWorker(qmd_indexer._run_reindex, debounce_seconds=0.01)
+    worker.request()
+    assert worker.wait_idle(timeout=5)
+    assert worker.stats()["last_error"] == "qmd update returned 1: index locked"
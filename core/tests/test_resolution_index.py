@@ -0,0 +1,75 @@
+"""Tests for the meeting-prep resolution indexes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from core.utils.resolution_index import ResolutionIndex
+
+
+def _page(path: Path, text: str, stamp: int = 1) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _domains(content):
+    for line in content.split("\n"):
+        if line.startswith("Domains:"):
+            return [d.strip() for d in line.split(":", 1)[1].split(",") if d.strip()]
+    return []
+
+
+def _vault(tmp_path):
+    _page(tmp_path / "Companies" / "Acme_Corp.md", "Domains: acme.com, Acme.io\n")
+    _page(tmp_path / "People" / "External" / "Jane_Doe.md", "email: jane@acme.com\n")
+    _page(tmp_path / "Projects" / "Launch.md", "Owner: [[Jane_Doe]]\n")
+    _page(tmp_path / "Projects" / "Ops" / "Hiring.md", "No people yet\n")
+    return tmp_path / "Companies", {"External": tmp_path / "People" / "External"}, tmp_path / "Projects"
+
+
+def test_lookups_and_incremental_rereads(tmp_path):
+    reads = []
+
+    def person_fn(path, content):
+        reads.append(path.name)
+        return {"name": path.stem.replace("_", " "), "email": content.split(":", 1)[1].strip()}
+
+    companies, people, projects = _vault(tmp_path)
+    index = ResolutionIndex(person_fn, _domains)
+    index.refresh(companies, people, projects)
+
+    assert index.company_for_domain("ACME.IO")["path"].name == "Acme_Corp.md"
+    assert index.people_by_key("External", "jane_doe")[0]["name"] == "Jane Doe"
+    assert index.people_by_email("Jane@Acme.com")[0]["name"] == "Jane Doe"
+    assert [p["path"].name for p in index.projects_for_person("jane_doe")] == ["Launch.md"]
+
+    index.refresh(companies, people, projects)
+    assert reads == ["Jane_Doe.md"]
+
+    # A new person is matched against unchanged projects; an edited project is re-scanned
+    _page(tmp_path / "People" / "External" / "Sam_Lee.md", "email: sam@acme.com\n")
+    _page(tmp_path / "Projects" / "Ops" / "Hiring.md", "Recruiter: sam_lee\n", stamp=2)
+    _page(tmp_path / "Projects" / "Launch.md", "Owner: [[Sam_Lee]]\n", stamp=2)
+    index.refresh(companies, people, projects)
+    assert reads == ["Jane_Doe.md", "Sam_Lee.md"]
+    assert [p["path"].name for p in index.projects_for_person("sam_lee")] == ["Launch.md", "Hiring.md"]
+    assert index.projects_for_person("jane_doe") == []
+
+
+def test_project_snapshot_stays_consistent_across_refreshes(tmp_path):
+    companies, people, projects = _vault(tmp_path)
+    index = ResolutionIndex(lambda path, content: {"name": path.stem}, _domains)
+    index.refresh(companies, people, projects)
+    records, positions = index.project_snapshot()
+
+    # Another thread refreshes after a project moved ahead of Launch.md and Launch.md changed
+    _page(tmp_path / "Projects" / "Audit.md", "Reviewer: jane_doe\n")
+    _page(tmp_path / "Projects" / "Launch.md", "Owner: nobody\n", stamp=2)
+    index.refresh(companies, people, projects)
+
+    assert [records[i]["path"].name for i in positions["jane_doe"]] == ["Launch.md"]
+    assert "jane_doe" in records[positions["jane_doe"][0]]["content_lower"]
+    records, positions = index.project_snapshot()
+    assert [records[i]["path"].name for i in positions["jane_doe"]] == ["Audit.md"]
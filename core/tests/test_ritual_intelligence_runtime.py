@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
 
 from core.paths import RITUAL_INTELLIGENCE_DB_FILE
-from core.ritual_intelligence.db import ensure_runtime_dir
+from core.ritual_intelligence import db
+from core.ritual_intelligence.db import ensure_runtime_dir, transaction
 from core.ritual_intelligence.models import NormalizedAttendee, NormalizedCalendarEvent
-from core.ritual_intelligence.service import RitualIntelligenceService
+from core.ritual_intelligence.service import RitualIntelligenceService, ensure_runtime_ready
 
 
 def _cleanup_db() -> None:
@@ -92,3 +94,138 @@ def test_empty_refresh_marks_missing_occurrence_cancelled():
 
     assert len(occurrences) == 1
     assert occurrences[0]["state"] == "cancelled"
+
+
+def test_batch_refresh_merges_repeats_and_resolves_contacts_once():
+    _cleanup_db()
+    service = RitualIntelligenceService()
+    starts_at = datetime.now(timezone.utc) + timedelta(days=1)
+    first = _event(source_event_id="evt-4", starts_at=starts_at)
+    repeat = _event(source_event_id="evt-4", starts_at=starts_at + timedelta(hours=1))
+    repeat.title = "Weekly Ritual (moved)"
+    repeat.attendees = [
+        NormalizedAttendee(name=None, email="client@acme.com", attendee_type="Person"),
+        NormalizedAttendee(name="Guest", email=None, attendee_type="Person"),
+        NormalizedAttendee(name="Room 4", email="room4@example.com", attendee_type="Room"),
+    ]
+    other = _event(source_event_id="evt-5", starts_at=starts_at + timedelta(days=1))
+
+    result = service.refresh_calendar(events=[first, repeat, other])
+    again = service.refresh_calendar(events=[repeat])
+
+    assert (result["created"], result["updated"], result["total"]) == (2, 1, 3)
+    assert set(result["timings"]) >= {"prefetch", "stage", "merge_occurrences", "merge_contacts", "cancel", "total"}
+    assert (again["created"], again["updated"]) == (0, 1)
+
+    occurrences = {row["title"]: row for row in service.list_occurrences()}
+    assert occurrences["Weekly Ritual (moved)"]["starts_at"] == repeat.starts_at.isoformat()
+
+    conn = ensure_runtime_ready()
+    try:
+        contacts = {row["email"]: row["name"] for row in conn.execute("SELECT name, email FROM contacts")}
+        linked = conn.execute(
+            """
+            SELECT oc.attendee_email, oc.is_external
+            FROM occurrence_contacts oc
+            JOIN source_events se ON se.occurrence_id = oc.occurrence_id
+            WHERE se.source_event_id = 'evt-4'
+            ORDER BY oc.attendee_email
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+    # A later attendee without a name keeps the name already on file; rooms are never contacts
+    assert contacts["client@acme.com"] == "Client"
+    assert None in contacts and "room4@example.com" not in contacts
+    assert [(row["attendee_email"], row["is_external"]) for row in linked] == [(None, 1), ("client@acme.com", 1)]
+
+
+def test_transactions_reuse_the_thread_connection_and_skip_integrity_checks(monkeypatch):
+    _cleanup_db()
+    with transaction() as conn:
+        first = conn
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+
+    statements: list[str] = []
+    first.set_trace_callback(statements.append)
+    with transaction() as conn:
+        conn.execute("SELECT COUNT(*) FROM occurrences").fetchone()
+    assert conn is first
+    assert not any("quick_check" in sql or "CREATE TABLE" in sql for sql in statements)
+
+    # Once the interval has passed, the next transaction re-checks the pooled connection
+    monkeypatch.setattr(db, "INTEGRITY_CHECK_INTERVAL_SECONDS", 0)
+    with transaction() as conn:
+        pass
+    assert any("quick_check" in sql for sql in statements)
+    first.set_trace_callback(None)
+
+
+def test_replaced_database_gets_a_fresh_connection():
+    _cleanup_db()
+    with transaction() as conn:
+        first = conn
+    _cleanup_db()
+    with transaction() as conn:
+        assert conn is not first
+        assert conn.execute("SELECT COUNT(*) FROM occurrences").fetchone()[0] == 0
+
+
+def _insert_correction(conn, correction_id: str) -> None:
+    conn.execute(
+        "INSERT INTO corrections (id, action_type, target_type, target_id, created_at) VALUES (?, 'a', 't', 'x', 'now')",
+        (correction_id,),
+    )
+
+
+def _correction_ids() -> list[str]:
+    with transaction() as conn:
+        return [row["id"] for row in conn.execute("SELECT id FROM corrections ORDER BY id")]
+
+
+def test_nested_transaction_rolls_back_with_the_outer_one():
+    _cleanup_db()
+    try:
+        with transaction() as outer:
+            _insert_correction(outer, "c1")
+            with transaction() as inner:
+                assert inner is outer
+                _insert_correction(inner, "c2")
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert _correction_ids() == []
+
+
+def test_failed_nested_transaction_rolls_back_only_its_own_work():
+    _cleanup_db()
+    with transaction() as outer:
+        try:
+            # Opened before the outer transaction has written anything
+            with transaction() as inner:
+                _insert_correction(inner, "c1")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        _insert_correction(outer, "c2")
+        try:
+            with transaction() as inner:
+                _insert_correction(inner, "c3")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        _insert_correction(outer, "c4")
+    assert _correction_ids() == ["c2", "c4"]
+
+
+def test_connections_closed_from_another_thread_are_reopened():
+    _cleanup_db()
+    with transaction() as conn:
+        first = conn
+    closer = threading.Thread(target=db.close_connections)
+    closer.start()
+    closer.join()
+    with transaction() as conn:
+        assert conn is not first
+        assert conn.execute("SELECT COUNT(*) FROM corrections").fetchone()[0] == 0
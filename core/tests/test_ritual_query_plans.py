@@ -0,0 +1,200 @@
+"""Query-plan regression coverage for the Ritual Intelligence runtime DB.
+
+Seeds a large synthetic DB, runs the brief, contact suggestion, ritual and
+transcript reconcile code paths against it, and checks that every statement
+they executed is answered from a persistent index rather than a full table
+scan or a per-statement automatic index.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from core.ritual_intelligence import db
+from core.ritual_intelligence.brief_generate import generate_brief_markdown
+from core.ritual_intelligence.contact_suggest import refresh_contact_suggestions_for_occurrence
+from core.ritual_intelligence.ritual_match import _upcoming_confirmed_occurrence_ids, refresh_ritual_suggestions
+from core.ritual_intelligence.transcript_reconcile import reconcile_unmatched_transcripts
+
+OCCURRENCES = 6000
+SERIES = 150
+CONTACTS = 1500
+TRANSCRIPTS = 3000
+NOW = "2026-01-01T00:00:00+00:00"
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    rng = random.Random(7)
+    base = datetime.now(timezone.utc) - timedelta(days=60)
+    conn.executemany(
+        """
+        INSERT INTO ritual_series (id, series_key, title, occurrence_count, status, created_at, updated_at)
+        VALUES (?, ?, ?, 0, ?, ?, ?)
+        """,
+        [
+            (f"ritual_{n}", f"eventkit:series-{n}", f"Series {n}", "confirmed" if n % 10 == 0 else "suggested", NOW, NOW)
+            for n in range(SERIES)
+        ],
+    )
+    occurrences = []
+    for n in range(OCCURRENCES):
+        series = n % SERIES
+        starts_at = base + timedelta(minutes=30 * n)
+        occurrences.append(
+            (
+                f"occ_{n}",
+                f"Series {series}",
+                starts_at.isoformat(),
+                (starts_at + timedelta(minutes=30)).isoformat(),
+                "cancelled" if n % 17 == 0 else "scheduled",
+                "tracked meeting" if n % 3 else "activity log",
+                f"eventkit:series-{series}",
+                f"ritual_{series}" if series % 2 == 0 else None,
+                NOW,
+                NOW,
+            )
+        )
+    conn.executemany(
+        """
+        INSERT INTO occurrences (
+          id, title, starts_at, ends_at, state, capture_mode, provider, series_key, ritual_series_id, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, 'eventkit', ?, ?, ?, ?)
+        """,
+        occurrences,
+    )
+    conn.executemany(
+        "INSERT INTO source_events (provider, source_event_id, occurrence_id, last_seen_at) VALUES ('eventkit', ?, ?, ?)",
+        [(f"evt_{n}", f"occ_{n}", NOW) for n in range(OCCURRENCES)],
+    )
+    conn.executemany(
+        """
+        INSERT INTO contacts (id, name, email, normalized_name, domain, created_at, updated_at)
+        VALUES (?, ?, ?, ?, 'acme.com', ?, ?)
+        """,
+        [(f"ctc_{n}", f"Person {n}", f"person{n}@acme.com", f"person {n}", NOW, NOW) for n in range(CONTACTS)],
+    )
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO occurrence_contacts (occurrence_id, contact_id, attendee_name, attendee_email, is_external)
+        VALUES (?, ?, ?, ?, 1)
+        """,
+        [
+            (f"occ_{n}", f"ctc_{c}", f"Person {c}", f"person{c}@acme.com")
+            for n in range(OCCURRENCES)
+            for c in rng.sample(range(CONTACTS), 4)
+        ],
+    )
+    transcripts = []
+    for n in range(TRANSCRIPTS):
+        matched = n % 20 != 0
+        started_at = base + timedelta(minutes=30 * rng.randrange(OCCURRENCES))
+        transcripts.append(
+            (
+                f"tr_{n}",
+                f"granola-{n}",
+                f"Series {n % SERIES}",
+                started_at.isoformat() if n % 40 else None,
+                json.dumps([{"name": "Person 1", "email": "person1@acme.com"}]),
+                f"occ_{rng.randrange(OCCURRENCES)}" if matched else None,
+                "matched" if matched else rng.choice(["unmatched", "ambiguous"]),
+                f"Summary {n}" if matched else None,
+                NOW,
+                NOW,
+            )
+        )
+    conn.executemany(
+        """
+        INSERT INTO transcripts (
+          id, source, source_transcript_id, title, started_at, attendees_json, occurrence_id, status,
+          summary_text, created_at, updated_at
+        ) VALUES (?, 'granola', ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        transcripts,
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO transcript_negative_matches (transcript_id, occurrence_id, created_at) VALUES (?, ?, ?)",
+        [(f"tr_{n}", f"occ_{rng.randrange(OCCURRENCES)}", NOW) for n in range(0, TRANSCRIPTS, 20)],
+    )
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO contact_suggestions (contact_id, occurrence_id, status, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [
+            (f"ctc_{rng.randrange(CONTACTS)}", f"occ_{n}", rng.choice(["suggested", "dismissed"]), NOW, NOW)
+            for n in range(0, OCCURRENCES, 3)
+        ],
+    )
+
+
+def _full_scans(conn: sqlite3.Connection, sql: str) -> list[str]:
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    # A full scan, or an automatic index SQLite builds for this one statement
+    return [
+        row["detail"]
+        for row in plan
+        if "AUTOMATIC" in row["detail"]
+        or (row["detail"].startswith("SCAN ") and "USING" not in row["detail"] and row["detail"] != "SCAN CONSTANT ROW")
+    ]
+
+
+def test_migrations_upgrade_an_existing_v1_database(runtime_db):
+    conn = sqlite3.connect(db.get_db_path())
+    for statement in db.SCHEMA:
+        conn.execute(statement)
+    conn.execute("INSERT INTO contacts (id, email, created_at, updated_at) VALUES ('ctc_1', 'a@acme.com', ?, ?)", (NOW, NOW))
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    with db.transaction() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        contacts = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    assert version == db.SCHEMA_VERSION
+    assert {"idx_transcripts_status", "idx_occurrence_contacts_contact", "idx_contact_suggestions_occurrence"} <= indexes
+    assert contacts == 1
+
+
+def test_runtime_queries_use_indexes_on_a_large_database(runtime_db):
+    with db.transaction() as conn:
+        _seed(conn)
+
+    executed: dict[str, list[str]] = {}
+    with db.transaction() as conn:
+        for module, run in (
+            ("brief_generate", lambda: [generate_brief_markdown(conn, f"occ_{n}") for n in (OCCURRENCES - 2, OCCURRENCES - 1)]),
+            ("contact_suggest", lambda: refresh_contact_suggestions_for_occurrence(conn, f"occ_{OCCURRENCES - 2}")),
+            ("ritual_match", lambda: _upcoming_confirmed_occurrence_ids(conn)),
+        ):
+            statements = executed.setdefault(module, [])
+            conn.set_trace_callback(statements.append)
+            run()
+        conn.set_trace_callback(None)
+
+    for module, run in (
+        ("ritual_match", refresh_ritual_suggestions),
+        ("transcript_reconcile", reconcile_unmatched_transcripts),
+    ):
+        with db.transaction() as conn:
+            statements = executed.setdefault(module, [])
+            conn.set_trace_callback(statements.append)
+        try:
+            run()
+        finally:
+            conn.set_trace_callback(None)
+
+    failures = []
+    with db.transaction() as conn:
+        for module, statements in executed.items():
+            queries = {sql.strip() for sql in statements if sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE"))}
+            assert queries, f"no queries traced for {module}"
+            for sql in sorted(queries):
+                scans = _full_scans(conn, sql)
+                if scans:
+                    failures.append(f"{module}: {scans} in {' '.join(sql.split())[:160]}")
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,59 @@
+"""Tests for the near-duplicate candidate index."""
+
+from __future__ import annotations
+
+import random
+import re
+from difflib import SequenceMatcher
+
+from core.utils.similarity_index import TitleSimilarityIndex
+
+WORDS = [
+    "review", "pricing", "proposal", "acme", "board", "update", "draft", "quarterly", "metrics",
+    "send", "follow", "customer", "renewal", "contract", "launch", "plan", "hire", "designer",
+    "book", "venue", "summit", "fix", "login", "bug", "the", "for", "with", "and",
+]
+
+
+def _keywords(text: str) -> set:
+    return {w for w in re.findall(r"\b\w+\b", text.lower()) if len(w) > 2 and w not in {"the", "for", "and", "with"}}
+
+
+def _brute_force(item, titles, threshold, boosts):
+    hits = []
+    item_keywords = _keywords(item)
+    for idx, title in enumerate(titles):
+        ratio = SequenceMatcher(None, item.lower(), title.lower()).ratio()
+        title_keywords = _keywords(title)
+        if item_keywords and title_keywords:
+            overlap = len(item_keywords & title_keywords) / len(item_keywords | title_keywords)
+        else:
+            overlap = 0
+        boost = boosts.get(idx, 0.0)
+        if (ratio * 0.6) + (overlap * 0.25) + boost >= threshold:
+            hits.append((idx, ratio, overlap))
+    return hits
+
+
+def test_search_matches_brute_force_scan():
+    rng = random.Random(7)
+    titles = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 7))) for _ in range(300)]
+    titles += ["Review Acme pricing proposal", "review acme pricing proposal", "Misc"]
+    index = TitleSimilarityIndex(_keywords)
+    index.extend(titles)
+
+    queries = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))) for _ in range(40)]
+    queries += ["Review Acme pricing proposal", "MISC", ""]
+    for query in queries:
+        boosts = {rng.randrange(len(titles)): 0.15}
+        for threshold in (0.6, 0.4):
+            assert index.search(query, threshold, 0.6, 0.25, boosts) == _brute_force(query, titles, threshold, boosts)
+
+
+def test_index_grows_incrementally():
+    index = TitleSimilarityIndex(_keywords)
+    index.extend(["Draft the quarterly board update"])
+    assert index.search("Draft quarterly board update", 0.6, 0.6, 0.25) != []
+
+    index.add("Send renewal contract to customer")
+    assert [idx for idx, _, _ in index.search("Send the renewal contract to customer", 0.6, 0.6, 0.25)] == [1]
@@ -0,0 +1,86 @@
+"""Tests for skill rating aggregates."""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime
+from pathlib import Path
+
+from core.utils.skill_ratings import SkillRatings
+
+WHEN = datetime(2026, 2, 3, 10, 0)
+
+
+def _ratings(tmp_path: Path) -> SkillRatings:
+    return SkillRatings(tmp_path / "ratings.jsonl", tmp_path / "skill-ratings-stats.json")
+
+
+def _full_scan(log_file: Path) -> dict:
+    """The summary computed from scratch over the whole log."""
+    by_skill: dict = {}
+    for line in log_file.read_text().splitlines():
+        entry = json.loads(line)
+        by_skill.setdefault(entry["skill"], []).append(entry)
+    result = {}
+    for skill, entries in by_skill.items():
+        ratings = [e["rating"] for e in entries]
+        trend = "stable"
+        if len(ratings) >= 4:
+            mid = len(ratings) // 2
+            first, second = sum(ratings[:mid]) / mid, sum(ratings[mid:]) / (len(ratings) - mid)
+            if second - first > 0.3:
+                trend = "improving"
+            elif first - second > 0.3:
+                trend = "declining"
+        result[skill] = {
+            "average": round(sum(ratings) / len(ratings), 1),
+            "count": len(ratings),
+            "trend": trend,
+            "recent": [{"rating": e["rating"], "note": e.get("note", ""), "ts": e["ts"]} for e in entries[-5:]],
+        }
+    return result
+
+
+def test_aggregates_match_a_full_scan(tmp_path: Path):
+    rng = random.Random(3)
+    ratings = _ratings(tmp_path)
+    for i in range(120):
+        ratings.record(rng.choice(["daily-plan", "meeting-prep", "review"]), rng.randint(1, 5),
+                       note=rng.choice(["", f"note {i}"]), when=WHEN)
+        if i % 17 == 0:
+            assert ratings.summary() == _full_scan(ratings.log_file)
+    assert ratings.summary() == _full_scan(ratings.log_file)
+    assert list(ratings.summary("review")) == ["review"]
+
+
+def test_trend_follows_the_half_split(tmp_path: Path):
+    ratings = _ratings(tmp_path)
+    for value in (1, 2, 4, 5, 5):
+        ratings.record("daily-plan", value, when=WHEN)
+    summary = ratings.summary()["daily-plan"]
+    assert (summary["count"], summary["average"], summary["trend"]) == (5, 3.4, "improving")
+
+
+def test_log_tail_replayed_and_shrunk_log_rebuilt(tmp_path: Path):
+    ratings = _ratings(tmp_path)
+    ratings.record("daily-plan", 4, when=WHEN)
+
+    # Lines appended by something else (or before a crash) are picked up
+    with ratings.log_file.open("a") as f:
+        f.write(json.dumps({"ts": "2026-02-03T11:00:00", "skill": "daily-plan", "rating": 2}) + "\n")
+        f.write('{"ts": "2026-02-03T12:00:00", "skill": "daily')  # torn append
+    assert ratings.summary()["daily-plan"]["count"] == 2
+    ratings.record("daily-plan", 3, when=WHEN)
+    assert ratings.summary()["daily-plan"]["count"] == 3
+    assert ratings.summary() == _full_scan_skipping_bad_lines(ratings.log_file)
+
+    ratings.log_file.write_text(json.dumps({"ts": "2026-02-04T09:00:00", "skill": "review", "rating": 5}) + "\n")
+    assert ratings.summary() == _full_scan(ratings.log_file)
+
+
+def _full_scan_skipping_bad_lines(log_file: Path) -> dict:
+    good = [line for line in log_file.read_text().splitlines() if line.endswith("}")]
+    clean = log_file.with_name("clean.jsonl")
+    clean.write_text("\n".join(good) + "\n")
+    return _full_scan(clean)
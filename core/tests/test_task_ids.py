@@ -0,0 +1,91 @@
+"""Tests for the persistent task ID allocator."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from core.utils import task_ids
+from core.utils.task_ids import allocate_task_ids, allocate_task_numbers, reconcile_task_ids
+
+
+def _vault_with_tasks(tmp_path: Path) -> Path:
+    tasks_dir = tmp_path / "03-Tasks"
+    tasks_dir.mkdir()
+    (tasks_dir / "Tasks.md").write_text(
+        "# Tasks\n- [ ] First ^task-20260101-007\n- [x] Second ^task-20260102-012\n"
+    )
+    return tasks_dir
+
+
+def test_rebuilds_from_vault_scan_when_state_missing(tmp_path: Path):
+    tasks_dir = _vault_with_tasks(tmp_path)
+    state = tmp_path / ".dex" / "task-id-allocator.json"
+
+    ids = allocate_task_ids(2, when=datetime(2026, 3, 1), state_file=state, scan_dirs=[tasks_dir])
+
+    assert ids == ["task-20260301-013", "task-20260301-014"]
+    assert json.loads(state.read_text())["high_water"] == 14
+
+
+def test_uses_stored_high_water_without_rescanning(tmp_path: Path, monkeypatch):
+    state = tmp_path / "task-id-allocator.json"
+    state.write_text(json.dumps({"version": 1, "high_water": 41, "reconciled_at": time.time()}))
+
+    def no_scan(scan_dirs):
+        raise AssertionError("allocation scanned the vault")
+
+    monkeypatch.setattr(task_ids, "scan_high_water", no_scan)
+    assert allocate_task_numbers(1, state_file=state, scan_dirs=[tmp_path]) == [42]
+    assert set(json.loads(state.read_text())) == {"version", "high_water", "reconciled_at", "updated_at"}
+
+
+def test_corrupt_state_is_rebuilt(tmp_path: Path):
+    tasks_dir = _vault_with_tasks(tmp_path)
+    state = tmp_path / "task-id-allocator.json"
+    state.write_text("{not json")
+
+    assert allocate_task_numbers(1, state_file=state, scan_dirs=[tasks_dir]) == [13]
+
+
+@pytest.mark.parametrize("catch_up", ["explicit", "periodic"])
+def test_ids_written_by_other_writers_are_skipped(tmp_path: Path, monkeypatch, catch_up: str):
+    tasks_dir = _vault_with_tasks(tmp_path)
+    state = tmp_path / "task-id-allocator.json"
+    assert allocate_task_numbers(1, state_file=state, scan_dirs=[tasks_dir]) == [13]
+
+    # Another writer (Pi extension, Granola sync, a manual edit) adds a higher ID
+    (tasks_dir / "Inbox.md").write_text("- [ ] Synced ^task-20260105-020\n")
+    # Not seen until the next reconcile
+    assert allocate_task_numbers(1, state_file=state, scan_dirs=[tasks_dir]) == [14]
+
+    if catch_up == "explicit":
+        assert reconcile_task_ids(state_file=state, scan_dirs=[tasks_dir]) == 20
+    else:
+        monkeypatch.setattr(task_ids, "RECONCILE_INTERVAL_SECONDS", 0)
+    assert allocate_task_numbers(1, state_file=state, scan_dirs=[tasks_dir]) == [21]
+
+
+def test_concurrent_allocations_are_unique(tmp_path: Path):
+    state = tmp_path / "task-id-allocator.json"
+    results: list[int] = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            numbers = allocate_task_numbers(1, state_file=state, scan_dirs=[])
+            with lock:
+                results.extend(numbers)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert sorted(results) == list(range(1, 41))
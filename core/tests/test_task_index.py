@@ -0,0 +1,86 @@
+"""Tests for the persistent task-ID location index."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from core.utils.task_index import TaskLocation, TaskLocationIndex
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def test_lookup_many_finds_all_instances(tmp_path: Path):
+    tasks = tmp_path / "03-Tasks" / "Tasks.md"
+    person = tmp_path / "05-Areas" / "People" / "Jane.md"
+    _write(tasks, "# Tasks\n- [ ] Ship it ^task-20260101-001\n- [x] Done ^task-20260101-002\n")
+    _write(person, "# Jane\n\n- [ ] Ship it ^task-20260101-001\n")
+    _write(tmp_path / "node_modules" / "pkg" / "README.md", "- [ ] Noise ^task-20260101-001\n")
+
+    index = TaskLocationIndex(tmp_path, tmp_path / ".dex" / "task-index.json")
+    found = index.lookup_many(["task-20260101-001", "task-20260101-002", "task-20260101-999"])
+
+    assert sorted(found["task-20260101-001"]) == sorted([
+        TaskLocation(str(tasks), 2, False),
+        TaskLocation(str(person), 3, False),
+    ])
+    assert found["task-20260101-002"] == [TaskLocation(str(tasks), 3, True)]
+    assert found["task-20260101-999"] == []
+
+
+def test_only_changed_files_are_reread(tmp_path: Path, monkeypatch):
+    tasks = tmp_path / "Tasks.md"
+    other = tmp_path / "Other.md"
+    _write(tasks, "- [ ] A ^task-20260101-001\n")
+    _write(other, "- [ ] B ^task-20260101-002\n")
+    for path in (tasks, other):
+        os.utime(path, ns=(1, 1))  # old enough to be trusted by the stat check
+    index_file = tmp_path / ".dex" / "task-index.json"
+    TaskLocationIndex(tmp_path, index_file).refresh()
+
+    # A new process loads the persisted index; only the edited file is re-read
+    _write(tasks, "- [x] A ^task-20260101-001 plus a longer line\n")
+    os.utime(tasks, ns=(2, 2))
+    reads = []
+    original = Path.read_text
+
+    def tracking_read(self, *args, **kwargs):
+        reads.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read)
+    index = TaskLocationIndex(tmp_path, index_file)
+    assert index.lookup("task-20260101-001") == [TaskLocation(str(tasks), 1, True)]
+    assert reads == ["task-index.json", "Tasks.md"]
+
+
+def test_deleted_files_drop_out_and_corrupt_index_rebuilds(tmp_path: Path):
+    tasks = tmp_path / "Tasks.md"
+    _write(tasks, "- [ ] A ^task-20260101-001\n")
+    index_file = tmp_path / ".dex" / "task-index.json"
+    _write(index_file, "{broken")
+
+    index = TaskLocationIndex(tmp_path, index_file)
+    assert len(index.lookup("task-20260101-001")) == 1
+    assert json.loads(index_file.read_text())["files"]
+
+    tasks.unlink()
+    assert index.lookup("task-20260101-001") == []
+
+
+def test_checkbox_flips_are_queued_once(tmp_path: Path):
+    tasks = tmp_path / "Tasks.md"
+    _write(tasks, "- [ ] A ^task-20260101-001\n- [ ] B ^task-20260101-002\n")
+    index = TaskLocationIndex(tmp_path, tmp_path / ".dex" / "task-index.json")
+    index.refresh()
+    assert index.take_status_changes() == []  # first sight of a file is not a change
+
+    _write(tasks, "- [x] A ^task-20260101-001\n- [ ] B ^task-20260101-002\n")
+    index.refresh()
+
+    assert index.take_status_changes() == [("task-20260101-001", TaskLocation(str(tasks), 1, True))]
+    assert index.take_status_changes() == []
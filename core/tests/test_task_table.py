@@ -0,0 +1,137 @@
+"""Tests for the vault-wide task table."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core.utils.task_table import TaskTable, parse_task_lines
+
+
+def _write(root: Path, rel: str, text: str, stamp: int = 1) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+    return path
+
+
+def _classify(title, declared):
+    priority = declared.get("priority") or ("P0" if "urgent" in title.lower() else "P2")
+    return declared.get("pillar", "").lower() or None, priority
+
+
+@pytest.fixture
+def vault(tmp_path):
+    _write(tmp_path, "03-Tasks/Tasks.md", (
+        "# Tasks\n\n## Now\n"
+        "- [ ] **Send Acme renewal quote** | People/External/Jane_Doe.md ^task-20260301-001\n"
+        "\t- Pillar: Sales | Priority: P1\n"
+        "- [x] Urgent board deck ✅ 2026-03-02 09:30 ^task-20260301-002\n"
+        "- [ ] Plan offsite\n"
+    ))
+    _write(tmp_path, "00-Inbox/Meetings/2026-03-01 - Acme sync.md", (
+        "# Acme sync\n\n### Action Items\n"
+        "- [ ] **Send Acme renewal quote** ^task-20260301-001\n"
+        "- [ ] Ask [[Globex|the Globex team]] for intro\n"
+    ))
+    _write(tmp_path, "System/Demo/03-Tasks/Tasks.md", "- [ ] Demo task\n")
+    _write(tmp_path, ".obsidian/notes.md", "- [ ] Hidden\n")
+    return tmp_path
+
+
+def _table(root: Path, version="v1") -> TaskTable:
+    state = {"version": version}
+    table = TaskTable(root, root / "tasks.db", _classify, lambda: state["version"],
+                      primary_files=["03-Tasks/Tasks.md"], skip_dirs=["System/Demo"])
+    table.state = state
+    return table
+
+
+def test_parse_task_lines_metadata():
+    tasks = parse_task_lines(
+        "## Now\n- [x] **Ship it** | People/Active/Al.md ✅ 2026-03-02 09:30 ^task-20260301-009\n"
+        "  - Priority: P0\n- [ ] Next\n"
+    )
+    assert [t["title"] for t in tasks] == ["Ship it", "Next"]
+    assert tasks[0]["completed_at"] == "2026-03-02 09:30"
+    assert tasks[0]["refs"] == ["al"]
+    assert tasks[0]["declared"] == {"priority": "P0"}
+    assert tasks[1]["declared"] == {} and tasks[1]["section"] == "Now"
+
+
+def test_filters_and_unique_copies(vault):
+    table = _table(vault)
+
+    open_p1 = table.query(completed=False, priority="P1", mentions="acme")["tasks"]
+    assert [(t["file"], t["pillar"]) for t in open_p1] == [("03-Tasks/Tasks.md", "sales")]
+    assert len(table.query(task_id="task-20260301-001", unique=False)["tasks"]) == 2
+
+    assert [t["title"] for t in table.query(ref="jane_doe")["tasks"]] == ["Send Acme renewal quote"]
+    assert [t["section"] for t in table.query(mentions="globex")["tasks"]] == ["Action Items"]
+    done = table.query(completed=True, completed_after="2026-03-01")["tasks"]
+    assert [(t["priority"], t["completed_at"]) for t in done] == [("P0", "2026-03-02 09:30")]
+    assert table.query()["total"] == 4  # demo and hidden folders are skipped
+
+
+def test_cursor_pages_cover_the_sorted_result(vault):
+    for i in range(30):
+        _write(vault, f"05-Areas/People/Person_{i:02d}.md", f"- [ ] Follow up {i}\n- [ ] Urgent item {i}\n")
+    table = _table(vault)
+    for sort, descending in (("location", False), ("priority", False), ("priority", True), ("task_id", True)):
+        everything = table.query(sort=sort, descending=descending, limit=1000)["tasks"]
+        paged, cursor = [], None
+        while True:
+            page = table.query(sort=sort, descending=descending, limit=7, cursor=cursor)
+            paged.extend(page["tasks"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert paged == everything
+        assert len(paged) == 64
+    with pytest.raises(ValueError):
+        table.query(sort="title")
+
+
+def test_refresh_reparses_only_changed_files(vault):
+    table = _table(vault)
+    table.refresh()
+    assert table.parsed_last_refresh == 2
+    table.refresh()
+    assert table.parsed_last_refresh == 0
+
+    _write(vault, "00-Inbox/Meetings/2026-03-01 - Acme sync.md", "- [x] **Send Acme renewal quote** ^task-20260301-001\n", 2)
+    (vault / "03-Tasks/Tasks.md").unlink()
+    table.refresh()
+    assert table.parsed_last_refresh == 1
+    # The remaining copy becomes the canonical row
+    assert [t["completed"] for t in table.query(task_id="task-20260301-001")["tasks"]] == [True]
+
+    table.state["version"] = "v2"
+    table.refresh()
+    assert table.parsed_last_refresh == 1
+
+
+def test_queries_reuse_a_recent_refresh_and_cursor_pages_never_refresh(vault, monkeypatch):
+    table = _table(vault)
+    walks = []
+    original = table._iter_markdown
+    monkeypatch.setattr(table, "_iter_markdown", lambda: walks.append(1) or original())
+
+    page = table.query(limit=2)
+    table.query(limit=2, cursor=page["next_cursor"])
+    table.query(completed=False)
+    assert len(walks) == 1
+
+    # An edit within the interval is picked up once the table is invalidated
+    _write(vault, "00-Inbox/Later.md", "- [ ] Late addition\n")
+    assert table.query(mentions="late")["total"] == 0
+    table.invalidate()
+    assert table.query(mentions="late")["total"] == 1
+    assert len(walks) == 2
+
+    table.refresh_interval = 0
+    table.query()
+    assert len(walks) == 3
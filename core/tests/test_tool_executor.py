@@ -0,0 +1,97 @@
+"""Tests for the worker-pool MCP tool executor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.utils.tool_executor import ToolExecutor
+
+
+def _tracker():
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def work(duration: float = 0.05):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(duration)
+        with lock:
+            state["active"] -= 1
+        return threading.current_thread().name
+
+    return state, work
+
+
+def test_read_tools_run_concurrently_off_the_event_loop():
+    executor = ToolExecutor(max_concurrency=4, default_timeout=5)
+    state, work = _tracker()
+
+    async def main():
+        return await asyncio.gather(*(executor.run("list_tasks", work) for _ in range(4)))
+
+    threads = asyncio.run(main())
+    assert state["peak"] == 4
+    assert all(name.startswith("mcp-tool") for name in threads)
+
+
+def test_writes_to_same_file_are_serialized_but_different_files_overlap():
+    executor = ToolExecutor(max_concurrency=4, default_timeout=5)
+    same_state, same_work = _tracker()
+    other_state, other_work = _tracker()
+
+    async def main():
+        await asyncio.gather(*(executor.run("create_task", same_work, write_keys=["Tasks.md"]) for _ in range(3)))
+        await asyncio.gather(
+            executor.run("create_task", other_work, write_keys=["Tasks.md"]),
+            executor.run("capture_skill_rating", other_work, write_keys=["ratings.jsonl"]),
+        )
+
+    asyncio.run(main())
+    assert same_state["peak"] == 1
+    assert other_state["peak"] == 2
+
+
+def test_reads_do_not_wait_for_writes():
+    executor = ToolExecutor(max_concurrency=4, default_timeout=5)
+    finished = []
+
+    def write():
+        time.sleep(0.3)
+        finished.append("write")
+
+    def read():
+        finished.append("read")
+
+    async def main():
+        writing = asyncio.ensure_future(executor.run("create_task", write, write_keys=["Tasks.md"]))
+        await asyncio.sleep(0.05)
+        await executor.run("list_tasks", read)
+        await writing
+
+    asyncio.run(main())
+    assert finished == ["read", "write"]
+
+
+def test_timeout_keeps_file_lock_until_handler_finishes():
+    executor = ToolExecutor(max_concurrency=2, default_timeout=5, timeouts={"slow": 0.05})
+    finished = []
+
+    def slow():
+        time.sleep(0.3)
+        finished.append("slow")
+
+    def fast():
+        finished.append("fast")
+
+    async def main():
+        with pytest.raises(TimeoutError):
+            await executor.run("slow", slow, write_keys=["Tasks.md"])
+        await executor.run("fast", fast, write_keys=["Tasks.md"])
+
+    asyncio.run(main())
+    assert finished == ["slow", "fast"]
@@ -0,0 +1,143 @@
+"""Coverage for the bulk transcript backfill."""
+
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.ritual_intelligence import db
+from core.ritual_intelligence.transcript_backfill import CHECKPOINT_NAME, backfill_transcripts
+from core.ritual_intelligence.transcript_reconcile import reconcile_unmatched_transcripts
+
+NOW = "2026-01-01T00:00:00+00:00"
+
+
+class _Interrupted(Exception):
+    pass
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    rng = random.Random(11)
+    base = datetime(2025, 6, 2, 9, 0, tzinfo=timezone.utc)
+    for n in range(120):
+        starts_at = base + timedelta(hours=3 * n)
+        conn.execute(
+            """
+            INSERT INTO occurrences (id, title, starts_at, state, capture_mode, provider, created_at, updated_at)
+            VALUES (?, ?, ?, 'scheduled', ?, 'eventkit', ?, ?)
+            """,
+            (f"occ_{n}", f"Sync {n % 7}", starts_at.isoformat(), "activity log" if n % 2 else "tracked meeting", NOW, NOW),
+        )
+        conn.execute(
+            "INSERT INTO source_events (provider, source_event_id, occurrence_id, last_seen_at) VALUES ('eventkit', ?, ?, ?)",
+            (f"evt_{n}", f"occ_{n}", NOW),
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO contacts (id, email, created_at, updated_at) VALUES (?, ?, ?, ?)",
+            (f"ctc_{n % 9}", f"person{n % 9}@acme.com", NOW, NOW),
+        )
+        conn.execute(
+            "INSERT INTO occurrence_contacts (occurrence_id, contact_id, attendee_email) VALUES (?, ?, ?)",
+            (f"occ_{n}", f"ctc_{n % 9}", f"person{n % 9}@acme.com"),
+        )
+    for n in range(90):
+        occurrence = rng.randrange(120)
+        started_at = base + timedelta(hours=3 * occurrence, minutes=rng.choice([0, 10, 45, 150]))
+        conn.execute(
+            """
+            INSERT INTO transcripts (
+              id, source, source_transcript_id, title, started_at, source_event_id, attendees_json, status,
+              created_at, updated_at
+            ) VALUES (?, 'granola', ?, ?, ?, ?, ?, 'unmatched', ?, ?)
+            """,
+            (
+                f"trn_{n}",
+                f"granola-{n}",
+                f"Sync {occurrence % 7}" if n % 3 else "Catch-up",
+                started_at.isoformat() if n % 10 else None,
+                f"evt_{occurrence}" if n % 10 == 0 and n % 20 else None,
+                json.dumps([{"email": f"person{occurrence % 9}@acme.com"}] if n % 2 else []),
+                NOW,
+                NOW,
+            ),
+        )
+    conn.execute(
+        "INSERT INTO transcript_negative_matches (transcript_id, occurrence_id, created_at) VALUES ('trn_1', 'occ_0', ?)",
+        (NOW,),
+    )
+
+
+def _state(path) -> tuple:
+    conn = sqlite3.connect(path)
+    try:
+        return (
+            sorted(conn.execute("SELECT id, status, occurrence_id, occurrenceMatchConfidence FROM transcripts")),
+            sorted(conn.execute("SELECT id, capture_mode FROM occurrences")),
+        )
+    finally:
+        conn.close()
+
+
+def _seeded_copy(runtime_db, monkeypatch, name: str):
+    copy = runtime_db.with_name(name)
+    shutil.copy(runtime_db, copy)
+    db.close_connections()
+    monkeypatch.setattr(db, "get_db_path", lambda: copy)
+    return copy
+
+
+def test_backfill_matches_like_incremental_reconcile(runtime_db, monkeypatch):
+    with db.transaction() as conn:
+        _seed(conn)
+    db.close_connections()
+
+    reconciled = _seeded_copy(runtime_db, monkeypatch, "reconciled.db")
+    reconcile_unmatched_transcripts()
+    expected = _state(reconciled)
+
+    backfilled = _seeded_copy(runtime_db, monkeypatch, "backfilled.db")
+    result = backfill_transcripts(chunk_size=0)
+
+    assert _state(backfilled) == expected
+    assert result["total"] == result["processed"] == 90
+    assert result["matched"] == sum(1 for row in expected[0] if row[1] == "matched")
+
+
+def test_interrupted_backfill_resumes_from_checkpoint(runtime_db, monkeypatch):
+    with db.transaction() as conn:
+        _seed(conn)
+    db.close_connections()
+
+    complete = _seeded_copy(runtime_db, monkeypatch, "complete.db")
+    backfill_transcripts(chunk_size=0)
+    expected = _state(complete)
+
+    _seeded_copy(runtime_db, monkeypatch, "resumed.db")
+    seen: list[tuple[int, int]] = []
+
+    def _stop_after_first_chunk(done: int, total: int) -> None:
+        seen.append((done, total))
+        raise _Interrupted
+
+    with pytest.raises(_Interrupted):
+        backfill_transcripts(chunk_size=25, progress=_stop_after_first_chunk)
+    with db.transaction() as conn:
+        checkpoint = conn.execute("SELECT processed FROM job_checkpoints WHERE name = ?", (CHECKPOINT_NAME,)).fetchone()
+    assert seen == [(25, 90)]
+    assert checkpoint["processed"] == 25
+
+    progress: list[tuple[int, int]] = []
+    result = backfill_transcripts(chunk_size=25, progress=lambda done, total: progress.append((done, total)))
+
+    assert result["resumed"] is True
+    assert result["skipped"] > 0
+    assert result["skipped"] + result["processed"] == result["total"]
+    assert progress[-1][0] == progress[-1][1]
+    assert _state(runtime_db.with_name("resumed.db")) == expected
+    with db.transaction() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM job_checkpoints").fetchone()[0] == 0
@@ -5,8 +5,12 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from core.paths import MEETING_INTEL_DIR, RITUAL_INTELLIGENCE_DB_FILE, TRACKED_MEETINGS_DIR
-from core.ritual_intelligence.actions import confirm_ritual, reassign_transcript_to_occurrence
+from core.paths import RITUAL_INTELLIGENCE_DB_FILE, TRACKED_MEETINGS_DIR
+from core.ritual_intelligence.actions import (
+    confirm_ritual,
+    mark_transcript_not_same_meeting,
+    reassign_transcript_to_occurrence,
+)
 from core.ritual_intelligence.models import NormalizedAttendee, NormalizedCalendarEvent, TranscriptArtifact
 from core.ritual_intelligence.ritual_match import list_ritual_suggestions
 from core.ritual_intelligence.service import RitualIntelligenceService
@@ -22,10 +26,9 @@ def _cleanup() -> None:
     ):
         if path.exists():
             path.unlink()
-    for directory in (TRACKED_MEETINGS_DIR, MEETING_INTEL_DIR / "raw", MEETING_INTEL_DIR / "summaries"):
-        if directory.exists():
-            for path in directory.glob("*.md"):
-                path.unlink()
+    if TRACKED_MEETINGS_DIR.exists():
+        for path in TRACKED_MEETINGS_DIR.glob("*.md"):
+            path.unlink()
 
 
 def _event(*, source_event_id: str, source_series_id: str, title: str, starts_at: datetime) -> NormalizedCalendarEvent:
@@ -181,3 +184,55 @@ def test_confirmed_ritual_brief_uses_previous_transcript_summary():
     rendered = upcoming_note.read_text(encoding="utf-8")
 
     assert "Transcript continuity: Decision: ship the update" in rendered
+
+
+def test_batch_reconcile_honours_negative_matches_and_source_event_ids():
+    _cleanup()
+    service = RitualIntelligenceService()
+    first_start = datetime(2026, 3, 12, 10, 0, tzinfo=timezone.utc)
+    service.refresh_calendar(
+        events=[
+            _event(source_event_id="evt-d1", source_series_id="series-d1", title="Design Review", starts_at=first_start),
+            _event(
+                source_event_id="evt-d2",
+                source_series_id="series-d2",
+                title="Design Review",
+                starts_at=first_start + timedelta(minutes=30),
+            ),
+        ]
+    )
+    first_id, second_id = [row["id"] for row in service.list_occurrences()]
+    attendees = [NormalizedAttendee(name="Client", email="client@acme.com"), NormalizedAttendee(email="test@example.com")]
+    ingest_artifacts(
+        [
+            TranscriptArtifact(
+                transcript_id="trn-granola-d",
+                source="granola",
+                source_transcript_id="granola-d",
+                title="Design Review",
+                started_at=first_start + timedelta(minutes=15),
+                ended_at=None,
+                attendees=attendees,
+                raw_text="Reviewed mocks.",
+            ),
+            TranscriptArtifact(
+                transcript_id="trn-manual-d",
+                source="manual",
+                source_transcript_id="manual-d",
+                title="Notes",
+                started_at=None,
+                ended_at=None,
+                source_event_id="evt-d2",
+                raw_text="Follow-ups.",
+            ),
+        ]
+    )
+    # Equally good candidates would be ambiguous; ruling one out leaves a clear match
+    mark_transcript_not_same_meeting("trn-granola-d", second_id)
+
+    results = {result["transcript_id"]: result for result in reconcile_unmatched_transcripts()}
+
+    assert results["trn-granola-d"]["status"] == "matched"
+    assert results["trn-granola-d"]["occurrence_id"] == first_id
+    assert results["trn-manual-d"]["occurrence_id"] == second_id
+    assert results["trn-manual-d"]["occurrenceMatchConfidence"] == 1.0
@@ -0,0 +1,86 @@
+"""Tests for the mtime-aware YAML config cache."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+import yaml
+
+from core.utils import vault_config
+from core.utils.vault_config import ConfigCache
+
+
+def _write(path, text, stamp):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    real = yaml.safe_load
+
+    def counting(text):
+        calls.append(text)
+        return real(text)
+
+    monkeypatch.setattr(vault_config.yaml, "safe_load", counting)
+    return calls
+
+
+def test_parsed_once_until_the_file_changes(tmp_path, parses):
+    profile = tmp_path / "user-profile.yaml"
+    _write(profile, "demo_mode: false\n", 1)
+    cache = ConfigCache()
+    reloads = []
+    cache.add_listener(reloads.append)
+
+    assert cache.load(profile) == {"demo_mode": False}
+    assert cache.load(profile) == {"demo_mode": False}
+    assert len(parses) == 1 and reloads == []
+
+    _write(profile, "demo_mode: true\n", 2)
+    assert cache.load(profile) == {"demo_mode": True}
+    assert len(parses) == 2 and reloads == [profile]
+
+    profile.unlink()
+    assert cache.load(profile) is None
+    assert reloads == [profile, profile]
+
+
+def test_derived_values_follow_their_file(tmp_path):
+    pillars = tmp_path / "pillars.yaml"
+    _write(pillars, "pillars: [{id: a}]\n", 1)
+    cache = ConfigCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return [p["id"] for p in cache.load(pillars)["pillars"]]
+
+    assert cache.derive(pillars, build) == ["a"]
+    assert cache.derive(pillars, build) == ["a"]
+    _write(pillars, "pillars: [{id: a}, {id: b}]\n", 2)
+    assert cache.derive(pillars, build) == ["a", "b"]
+    assert len(builds) == 2
+
+
+def test_parse_errors_are_cached_and_reraised(tmp_path, parses):
+    broken = tmp_path / "user-profile.yaml"
+    _write(broken, "name: [unclosed\n", 1)
+    cache = ConfigCache()
+    for _ in range(2):
+        with pytest.raises(yaml.YAMLError):
+            cache.load(broken)
+    assert len(parses) == 1
+    assert vault_config.user_profile(broken) == {}
+
+
+def test_recently_written_files_are_not_cached(tmp_path, parses):
+    profile = tmp_path / "user-profile.yaml"
+    profile.write_text("demo_mode: false\n", encoding="utf-8")
+    cache = ConfigCache()
+    cache.load(profile)
+    cache.load(profile)
+    assert len(parses) == 2
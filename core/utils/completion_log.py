@@ -0,0 +1,213 @@
+"""
+Append-only completion event log for Dex tasks, priorities and goals.
+
+Every status change made through the Work MCP appends one JSON line to
+``System/.dex/completion-events.jsonl``:
+
+    {"ts": "2026-02-03T10:15:00+00:00", "kind": "task", "id": "task-20260203-004",
+     "old": "not_started", "new": "done", "pillar": "growth"}
+
+Next to the log, ``completion-stats.json`` keeps per-ISO-week counters
+(completions and reopens per kind, net task completions per pillar) plus
+the byte offset of the log they cover, and the last logged status of each
+item. Weekly stats, velocity and
+burn-down read the counters, so they cost O(weeks) instead of a scan of
+the vault for ``✅`` timestamps. If the counters fall behind the log
+(crash between the two writes, or an older stats file), only the
+unread tail of the log is replayed.
+
+Status changes observed after the fact (a checkbox ticked in Obsidian and
+seen by the task index, a repeated ``complete_weekly_priority``) are
+recorded with ``only_on_change=True`` so the same change is counted once.
+
+Usage:
+    from core.utils.completion_log import CompletionLog, week_key
+
+    log = CompletionLog()
+    log.record('task', 'task-20260203-004', 'not_started', 'done', pillar='growth')
+    done = log.week_counts(week_key(date.today()))['task']['completed']
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.paths import COMPLETION_LOG_FILE, COMPLETION_STATS_FILE
+from core.utils.file_ops import atomic_write_json, file_lock
+
+logger = logging.getLogger(__name__)
+
+STATS_VERSION = 2
+DONE = 'done'
+
+
+def week_key(day: date) -> str:
+    """ISO week key like ``2026-W05``."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {'version': STATS_VERSION, 'log_offset': 0, 'weeks': {}, 'status': {}}
+
+
+def _apply_event(stats: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Fold one event into the weekly counters and the per-item status."""
+    if event.get('id'):
+        stats['status'].setdefault(event.get('kind', 'task'), {})[event['id']] = event.get('new')
+
+    was_done = event.get('old') == DONE
+    is_done = event.get('new') == DONE
+    if was_done == is_done:
+        return  # progress notes, reordering, etc. don't move the counters
+
+    try:
+        day = datetime.fromisoformat(event['ts']).date()
+    except (KeyError, TypeError, ValueError):
+        return
+    week = stats['weeks'].setdefault(week_key(day), {'pillars': {}})
+    counters = week.setdefault(event.get('kind', 'task'), {'completed': 0, 'reopened': 0})
+    counters['completed' if is_done else 'reopened'] += 1
+
+    if event.get('kind', 'task') == 'task':
+        pillar = event.get('pillar') or 'unassigned'
+        week['pillars'][pillar] = week['pillars'].get(pillar, 0) + (1 if is_done else -1)
+
+
+class CompletionLog:
+    """Completion events on disk plus pre-aggregated weekly counters."""
+
+    def __init__(self, log_file: Path = COMPLETION_LOG_FILE, stats_file: Path = COMPLETION_STATS_FILE):
+        self.log_file = Path(log_file)
+        self.stats_file = Path(stats_file)
+        self._lock_file = self.log_file.with_suffix(self.log_file.suffix + '.lock')
+
+    def _read_stats(self) -> Dict[str, Any]:
+        try:
+            stats = json.loads(self.stats_file.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return _empty_stats()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Completion stats unreadable ({e}); rebuilding from log")
+            return _empty_stats()
+        if not isinstance(stats, dict) or stats.get('version') != STATS_VERSION:
+            return _empty_stats()
+        return stats
+
+    def _catch_up(self, stats: Dict[str, Any]) -> bool:
+        """Replay log lines past ``log_offset``. Returns True if stats changed."""
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        offset = stats.get('log_offset', 0)
+        if offset == size:
+            return False
+        if offset > size:  # log was truncated or replaced
+            stats.clear()
+            stats.update(_empty_stats())
+            offset = 0
+        if size == 0:
+            return True
+
+        with self.log_file.open('rb') as f:
+            f.seek(offset)
+            tail = f.read()
+        # Ignore a trailing partial line from an interrupted append
+        complete = tail[:tail.rfind(b'\n') + 1]
+        for raw in complete.splitlines():
+            try:
+                _apply_event(stats, json.loads(raw))
+            except ValueError:
+                logger.warning("Skipping malformed completion event")
+        stats['log_offset'] = offset + len(complete)
+        return True
+
+    def record(
+        self,
+        kind: str,
+        item_id: Optional[str],
+        old_status: str,
+        new_status: str,
+        pillar: Optional[str] = None,
+        when: Optional[datetime] = None,
+        only_on_change: bool = False,
+        **extra: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Append one status-change event and update the weekly counters.
+
+        With ``only_on_change``, nothing is recorded (and None is returned)
+        when the item's last logged status is already done/not done like
+        ``new_status``.
+        """
+        event = {
+            'ts': (when or datetime.now(timezone.utc)).isoformat(),
+            'kind': kind,
+            'id': item_id,
+            'old': old_status,
+            'new': new_status,
+            'pillar': pillar,
+        }
+        event.update(extra)
+        line = (json.dumps(event, ensure_ascii=False) + '\n').encode('utf-8')
+
+        with file_lock(self._lock_file):
+            stats = self._read_stats()
+            self._catch_up(stats)
+            if only_on_change and item_id:
+                last = stats['status'].get(kind, {}).get(item_id)
+                if last is not None and (last == DONE) == (new_status == DONE):
+                    return None
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_file.open('ab') as f:
+                if f.tell() != stats['log_offset']:
+                    line = b'\n' + line  # terminate a torn line so ours parses
+                f.write(line)
+                stats['log_offset'] = f.tell()
+            _apply_event(stats, event)
+            atomic_write_json(self.stats_file, stats)
+        return event
+
+    def stats(self) -> Dict[str, Any]:
+        """Current counters, replaying any part of the log they don't cover yet."""
+        stats = self._read_stats()
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if stats.get('log_offset', 0) != size:
+            with file_lock(self._lock_file):
+                stats = self._read_stats()
+                if self._catch_up(stats):
+                    atomic_write_json(self.stats_file, stats)
+        return stats
+
+    def week_counts(self, week: str) -> Dict[str, Any]:
+        """Counters for one ISO week: ``{kind: {completed, reopened}, 'pillars': {...}}``."""
+        counts = self.stats()['weeks'].get(week, {})
+        result: Dict[str, Any] = {
+            kind: dict(counts.get(kind, {'completed': 0, 'reopened': 0}))
+            for kind in ('task', 'priority', 'goal')
+        }
+        result['pillars'] = dict(counts.get('pillars', {}))
+        return result
+
+    def weekly_series(self, weeks: List[str], kind: str = 'task') -> List[Dict[str, Any]]:
+        """Net completions per week (completions minus reopens) for the given week keys."""
+        all_weeks = self.stats()['weeks']
+        series = []
+        for week in weeks:
+            counters = all_weeks.get(week, {}).get(kind, {})
+            completed = counters.get('completed', 0)
+            reopened = counters.get('reopened', 0)
+            series.append({
+                'week': week,
+                'completed': completed,
+                'reopened': reopened,
+                'net': completed - reopened,
+            })
+        return series
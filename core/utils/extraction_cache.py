@@ -0,0 +1,124 @@
+"""
+Per-file cache of extraction results keyed by content hash.
+
+Scanners that run the same extraction over many notes on every call (e.g.
+commitments in recent meetings and person pages) can memoize the result
+per file. An entry stores the SHA-1 of the file bytes, the file's
+(mtime_ns, size) and the extracted JSON-able result:
+
+- default mode reads each file and re-extracts only if its hash changed;
+- incremental mode trusts an unchanged (mtime_ns, size) and skips the read
+  too, so only files changed since the last call are touched.
+
+``version`` identifies the extractor; changing it discards all entries.
+Entries for files not looked up during a scan are dropped on ``save()``.
+
+Usage:
+    from core.utils.extraction_cache import ExtractionCache
+
+    cache = ExtractionCache(COMMITMENT_CACHE_FILE, version='patterns-v2')
+    with cache.scan() as scan:
+        result = scan.lookup(path, rel_path, extract_fn, incremental=True)
+    hits, misses = scan.hits, scan.misses
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+from core.utils.file_ops import atomic_write_json
+from core.utils.parse_cache import signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+
+class CacheScan:
+    """One pass over a set of files; tracks hits, misses and the keys seen."""
+
+    def __init__(self, cache: 'ExtractionCache'):
+        self._cache = cache
+        self.hits = 0
+        self.misses = 0
+        self.seen: Set[str] = set()
+
+    def lookup(
+        self,
+        path: Path,
+        key: str,
+        extract: Callable[[str], Any],
+        incremental: bool = False,
+    ) -> Any:
+        """Extraction result for ``path``, computed only if the file changed."""
+        self.seen.add(key)
+        entries = self._cache._entries
+        entry = entries.get(key)
+        stat = path.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        if incremental and entry is not None and entry.get('signature') == signature:
+            self.hits += 1
+            return entry['result']
+
+        raw = path.read_bytes()
+        digest = hashlib.sha1(raw).hexdigest()
+        settled = signature if signature_is_settled(tuple(signature)) else None
+        if entry is not None and entry.get('hash') == digest:
+            self.hits += 1
+            if entry.get('signature') != settled:
+                entry['signature'] = settled
+                self._cache._dirty = True
+            return entry['result']
+
+        self.misses += 1
+        result = extract(raw.decode('utf-8'))
+        entries[key] = {'hash': digest, 'signature': settled, 'result': result}
+        self._cache._dirty = True
+        return result
+
+
+class ExtractionCache:
+    """Extraction results per file, persisted as JSON."""
+
+    def __init__(self, cache_file: Path, version: str):
+        self.cache_file = Path(cache_file)
+        self.version = version
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        if self._entries is not None:
+            return self._entries
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except FileNotFoundError:
+            data = None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Extraction cache unreadable ({e}); starting empty")
+            data = None
+        if not isinstance(data, dict) or data.get('version') != self.version:
+            data = {'entries': {}}
+        self._entries = data.get('entries') or {}
+        return self._entries
+
+    @contextmanager
+    def scan(self) -> Iterator[CacheScan]:
+        """Look up files under the cache lock, then drop unseen entries and persist changes."""
+        with self._lock:
+            self._load()
+            scan = CacheScan(self)
+            yield scan
+            stale = self._entries.keys() - scan.seen
+            for key in stale:
+                del self._entries[key]
+            if stale or self._dirty:
+                try:
+                    atomic_write_json(self.cache_file, {'version': self.version, 'entries': self._entries})
+                except OSError as e:
+                    logger.error(f"Could not write extraction cache: {e}")
+                self._dirty = False
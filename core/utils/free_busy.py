@@ -0,0 +1,271 @@
+"""
+Interval free/busy engine for calendar capacity and task scheduling.
+
+Events from any number of calendars become (start, end) intervals in the
+user's local time. A sweep over the start-sorted intervals merges
+overlaps, so double-booked time is counted once. Free blocks for a day
+are the gaps between merged intervals inside the working-hours window,
+found by bisecting into the merged list. With ``not_before`` (usually now),
+time before it is never free, so today's blocks start at the current time. A multi-week horizon with
+hundreds of events costs O(n log n) once, then O(log n + k) per day.
+
+``pack_tasks()`` bin-packs tasks into free blocks first-fit in time
+order. Callers pass tasks already sorted by urgency. A max segment tree
+over the blocks' remaining minutes finds the earliest block that fits in
+O(log m).
+
+Event fields understood: ``start``/``end`` (ISO datetimes) or ``date``
+plus ``start_time``/``end_time`` (``09:30``, ``9:30 AM``, ``14:00:00``),
+``duration_minutes`` when there is no end (60 if missing), ``all_day``.
+Events with no start time can't be placed. They still count as meetings
+and their duration is deducted from the day's free minutes.
+
+Usage:
+    from core.utils.free_busy import FreeBusy, pack_tasks
+
+    calendar = FreeBusy(events, work_start=9 * 60, work_end=17 * 60, not_before=datetime.now())
+    day = calendar.day(date(2026, 2, 3))
+    blocks = [block for d in days for block in calendar.free_blocks(d)]
+    placements, unplaced = pack_tasks(blocks, [('task-1', 120), ('task-2', 30)])
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_EVENT_MINUTES = 60
+DEFAULT_WORK_START = 8 * 60
+DEFAULT_WORK_END = 18 * 60
+MIN_FREE_BLOCK_MINUTES = 15
+
+Interval = Tuple[datetime, datetime]
+
+_CLOCK = re.compile(r'^\s*(\d{1,2})(?::(\d{2}))?(?::\d{2})?\s*([ap]\.?m\.?)?\s*$', re.IGNORECASE)
+
+
+def parse_clock(value: Any) -> Optional[int]:
+    """Minutes since midnight for '09:30', '9:30 AM', '9am', '14:00:00'; None if unparseable."""
+    if not isinstance(value, str):
+        return None
+    match = _CLOCK.match(value)
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2) or 0)
+    meridiem = (match.group(3) or '').lower().replace('.', '')
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem == 'pm' else 0)
+    if hour > 24 or minute > 59 or (hour == 24 and minute):
+        return None
+    return hour * 60 + minute
+
+
+def _parse_datetime(value: Any, tz: Optional[tzinfo]) -> Optional[datetime]:
+    if not isinstance(value, str) or 'T' not in value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(tz).replace(tzinfo=None) if tz else parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _minutes(value: Any, default: int) -> int:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def event_interval(
+    event: Dict[str, Any], default_date: date, tz: Optional[tzinfo] = None
+) -> Tuple[Optional[date], Optional[Interval]]:
+    """(event date, local interval); the interval is None for all-day or untimed events."""
+    start = _parse_datetime(event.get('start') or event.get('start_time'), tz)
+    day = start.date() if start else (_parse_date(event.get('date')) or default_date)
+    if event.get('all_day'):
+        return day, None
+    if start is None:
+        clock = parse_clock(event.get('start_time') or event.get('start'))
+        if clock is None:
+            return day, None
+        start = datetime.combine(day, time()) + timedelta(minutes=clock)
+
+    end = _parse_datetime(event.get('end') or event.get('end_time'), tz)
+    if end is None:
+        clock = parse_clock(event.get('end_time') or event.get('end'))
+        if clock is not None:
+            end = datetime.combine(start.date(), time()) + timedelta(minutes=clock)
+            if end <= start:
+                end += timedelta(days=1)  # runs past midnight
+    if end is None:
+        end = start + timedelta(minutes=_minutes(event.get('duration_minutes'), DEFAULT_EVENT_MINUTES))
+    return day, (start, max(start, end))
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sweep-line union of intervals: sorted, disjoint, touching intervals joined."""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class FreeBusy:
+    """Merged busy time across calendars, queried per day within working hours."""
+
+    def __init__(
+        self,
+        events: Iterable[Dict[str, Any]],
+        work_start: int = DEFAULT_WORK_START,
+        work_end: int = DEFAULT_WORK_END,
+        default_date: Optional[date] = None,
+        tz: Optional[tzinfo] = None,
+        min_block: int = MIN_FREE_BLOCK_MINUTES,
+        not_before: Optional[datetime] = None,
+    ):
+        if not 0 <= work_start < work_end <= 24 * 60:
+            raise ValueError('Working hours must satisfy 00:00 <= start < end <= 24:00')
+        self.work_start = work_start
+        self.work_end = work_end
+        self.min_block = min_block
+        if not_before is not None:
+            # Local wall-clock time, rounded up to the next whole minute
+            not_before = not_before.replace(tzinfo=None)
+            if not_before.second or not_before.microsecond:
+                not_before = not_before.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        self.not_before = not_before
+        default_date = default_date or date.today()
+
+        intervals = []
+        self._event_counts: Dict[date, int] = defaultdict(int)
+        self._unplaced_minutes: Dict[date, int] = defaultdict(int)
+        for event in events:
+            day, interval = event_interval(event, default_date, tz)
+            self._event_counts[day] += 1
+            if interval is None:
+                if not event.get('all_day'):
+                    self._unplaced_minutes[day] += _minutes(event.get('duration_minutes'), DEFAULT_EVENT_MINUTES)
+            else:
+                intervals.append(interval)
+        self.busy = merge_intervals(intervals)
+        self._busy_ends = [end for _, end in self.busy]
+
+    def _window(self, day: date) -> Interval:
+        midnight = datetime.combine(day, time())
+        return midnight + timedelta(minutes=self.work_start), midnight + timedelta(minutes=self.work_end)
+
+    def busy_within(self, start: datetime, end: datetime) -> List[Interval]:
+        """Merged busy intervals clipped to [start, end)."""
+        clipped = []
+        idx = bisect.bisect_right(self._busy_ends, start)
+        while idx < len(self.busy) and self.busy[idx][0] < end:
+            busy_start, busy_end = self.busy[idx]
+            clipped.append((max(busy_start, start), min(busy_end, end)))
+            idx += 1
+        return clipped
+
+    def free_blocks(self, day: date) -> List[Interval]:
+        """Gaps of at least ``min_block`` minutes inside the day's working hours, from ``not_before`` on."""
+        window_start, window_end = self._window(day)
+        if self.not_before is not None and self.not_before > window_start:
+            window_start = min(self.not_before, window_end)
+        blocks = []
+        cursor = window_start
+        for busy_start, busy_end in self.busy_within(window_start, window_end) + [(window_end, window_end)]:
+            if (busy_start - cursor) >= timedelta(minutes=self.min_block):
+                blocks.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+        return blocks
+
+    def day(self, day: date) -> Dict[str, Any]:
+        """Busy/free summary for one day."""
+        window_start, window_end = self._window(day)
+        busy_minutes = sum((e - s).total_seconds() for s, e in self.busy_within(window_start, window_end)) / 60
+        blocks = self.free_blocks(day)
+        free_minutes = sum((e - s).total_seconds() for s, e in blocks) / 60
+        unplaced = self._unplaced_minutes.get(day, 0)
+        return {
+            'date': day,
+            'event_count': self._event_counts.get(day, 0),
+            'busy_minutes': int(busy_minutes) + unplaced,
+            'free_minutes': max(0, int(free_minutes) - unplaced),
+            'free_blocks': blocks,
+            'largest_block_minutes': max((int((e - s).total_seconds() // 60) for s, e in blocks), default=0),
+        }
+
+
+class _MaxTree:
+    """Max segment tree over block capacities; finds the first index with capacity >= need."""
+
+    def __init__(self, values: Sequence[int]):
+        self.size = 1
+        while self.size < max(1, len(values)):
+            self.size *= 2
+        self.tree = [0] * (2 * self.size)
+        self.tree[self.size:self.size + len(values)] = values
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def first_at_least(self, need: int) -> Optional[int]:
+        if self.tree[1] < need:
+            return None
+        i = 1
+        while i < self.size:
+            i = 2 * i if self.tree[2 * i] >= need else 2 * i + 1
+        return i - self.size
+
+    def set(self, idx: int, value: int) -> None:
+        i = idx + self.size
+        self.tree[i] = value
+        i //= 2
+        while i:
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+
+
+def pack_tasks(
+    blocks: Sequence[Interval], tasks: Sequence[Tuple[Hashable, int]]
+) -> Tuple[Dict[Hashable, Interval], List[Hashable]]:
+    """First-fit tasks (key, minutes) into time-ordered free blocks, in the order given.
+
+    Returns ({key: (start, end)}, [keys that fit nowhere]). Each placement
+    takes the front of its block; the rest of the block stays available.
+    """
+    starts = [start for start, _ in blocks]
+    capacity = [int((end - start).total_seconds() // 60) for start, end in blocks]
+    tree = _MaxTree(capacity)
+    placements: Dict[Hashable, Interval] = {}
+    unplaced: List[Hashable] = []
+    for key, minutes in tasks:
+        minutes = max(1, minutes)
+        idx = tree.first_at_least(minutes)
+        if idx is None:
+            unplaced.append(key)
+            continue
+        start = starts[idx]
+        placements[key] = (start, start + timedelta(minutes=minutes))
+        starts[idx] = start + timedelta(minutes=minutes)
+        capacity[idx] -= minutes
+        tree.set(idx, capacity[idx])
+    return placements, unplaced
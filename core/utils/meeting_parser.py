@@ -0,0 +1,186 @@
+"""
+Meeting note parser for the meeting cache, with a parallel batch mode.
+
+``parse_meeting_content()`` turns one meeting note into a cache entry
+(date, title, attendees, company, decisions, action items, key points).
+All patterns are compiled once at import instead of per section per file.
+
+``parse_meeting_files()`` reads and parses a batch of files. Large batches
+(a cold rebuild after a vault restore or a prune-window change) are
+spread over a process pool; results come back in input order, so the
+merge into the cache is deterministic whatever the worker scheduling.
+If a pool can't be started the batch is parsed serially.
+
+Usage:
+    from core.utils.meeting_parser import parse_meeting_files
+
+    results, timings = parse_meeting_files([(path, rel_path), ...])
+    for rel_path, entry in results:   # entry is None if the file failed
+        ...
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Below this many files the pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+MAX_WORKERS = 8
+
+_FRONTMATTER = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_FRONTMATTER_KV = re.compile(r'^(\w+):\s*(.+)')
+_DATE_IN_NAME = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_TITLE = re.compile(r'^# (.+)$', re.MULTILINE)
+_DATE_PREFIX = re.compile(r'^\d{4}-\d{2}-\d{2}\s*-?\s*')
+_MD_SUFFIX = re.compile(r'\.md$')
+_NEXT_SECTION = re.compile(r'^## ', re.MULTILINE)
+_SECTIONS = {
+    heading: re.compile(rf'^## {re.escape(heading)}\b.*$', re.MULTILINE | re.IGNORECASE)
+    for heading in ('Decisions', 'Key Decisions', 'Action Items', 'Key Points', 'Summary')
+}
+_CHECKBOX = re.compile(r'^\[[ x]\]\s*')
+_TASK_ID = re.compile(r'\s*\^task-\d{8}-\d{3}\s*$')
+_ALIASED_LINK = re.compile(r'\[\[[^\]|]*\|([^\]]*)\]\]')
+_LINK = re.compile(r'\[\[([^\]]*)\]\]')
+_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+
+
+def _extract_section(content: str, heading: str) -> List[str]:
+    match = _SECTIONS[heading].search(content)
+    if not match:
+        return []
+    start = match.end()
+    end_match = _NEXT_SECTION.search(content, start)
+    block = content[start:end_match.start()] if end_match else content[start:]
+    items = []
+    for line in block.split('\n'):
+        stripped = line.strip()
+        if stripped.startswith('- '):
+            item = stripped[2:].strip()
+            item = _CHECKBOX.sub('', item)
+            item = _TASK_ID.sub('', item)
+            item = _ALIASED_LINK.sub(r'\1', item)
+            item = _LINK.sub(r'\1', item)
+            item = _BOLD.sub(r'\1', item)
+            if item:
+                items.append(item)
+    return items
+
+
+def parse_meeting_content(
+    content: str, filename: str, rel_path: str, cached_at: Optional[str] = None
+) -> Dict[str, Any]:
+    """Parse a single meeting note into a cache entry."""
+    fm: Dict[str, Any] = {}
+    fm_match = _FRONTMATTER.match(content)
+    if fm_match:
+        for line in fm_match.group(1).split('\n'):
+            kv = _FRONTMATTER_KV.match(line)
+            if kv:
+                val = kv.group(2).strip().strip('"')
+                if val.startswith('[') and val.endswith(']'):
+                    val = [s.strip() for s in val[1:-1].split(',') if s.strip()]
+                fm[kv.group(1)] = val
+
+    date_val = fm.get('date') or fm.get('created')
+    if not date_val:
+        dm = _DATE_IN_NAME.search(filename)
+        date_val = dm.group(1) if dm else None
+    if date_val and not isinstance(date_val, str):
+        date_val = str(date_val)
+
+    title_match = _TITLE.search(content)
+    title = title_match.group(1).strip() if title_match else (
+        _MD_SUFFIX.sub('', _DATE_PREFIX.sub('', filename)).strip()
+    )
+
+    attendees = fm.get('participants') or fm.get('attendees') or []
+    if isinstance(attendees, str):
+        attendees = [s.strip() for s in attendees.split(',')]
+
+    return {
+        'date': date_val,
+        'title': title,
+        'source_file': rel_path,
+        'attendees': attendees,
+        'company': fm.get('company'),
+        'decisions': _extract_section(content, 'Decisions') or _extract_section(content, 'Key Decisions'),
+        'action_items': _extract_section(content, 'Action Items'),
+        'key_points': _extract_section(content, 'Key Points') or _extract_section(content, 'Summary'),
+        'sentiment': 'neutral',
+        'cached_at': cached_at or datetime.now().isoformat(),
+    }
+
+
+def _parse_file(job: Tuple[str, str, str]) -> Tuple[Optional[Dict[str, Any]], float, float]:
+    """Worker: read and parse one file. Returns (entry or None, read_seconds, parse_seconds)."""
+    path, rel_path, cached_at = job
+    started = time.perf_counter()
+    try:
+        content = Path(path).read_text()
+    except (OSError, UnicodeDecodeError):
+        return None, time.perf_counter() - started, 0.0
+    read_done = time.perf_counter()
+    try:
+        entry = parse_meeting_content(content, os.path.basename(path), rel_path, cached_at)
+    except Exception:
+        entry = None
+    return entry, read_done - started, time.perf_counter() - read_done
+
+
+def _default_workers() -> int:
+    return max(1, min(MAX_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def parse_meeting_files(
+    files: Sequence[Tuple[Path, str]],
+    workers: Optional[int] = None,
+    min_parallel: int = PARALLEL_MIN_FILES,
+) -> Tuple[List[Tuple[str, Optional[Dict[str, Any]]]], Dict[str, Any]]:
+    """Read and parse ``(path, rel_path)`` pairs, in a process pool for large batches.
+
+    Returns ``(results, timings)``: results are ``(rel_path, entry)`` in the
+    order given (entry None for unreadable files); timings hold summed
+    per-file ``read`` and ``parse`` seconds, the batch wall time and the
+    number of workers used.
+    """
+    cached_at = datetime.now().isoformat()
+    jobs = [(str(path), rel_path, cached_at) for path, rel_path in files]
+    workers = _default_workers() if workers is None else max(1, workers)
+    if len(jobs) < min_parallel:
+        workers = 1
+
+    started = time.perf_counter()
+    outcomes = None
+    if workers > 1:
+        try:
+            # spawn: the MCP server is multi-threaded, so forking it isn't safe
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                outcomes = list(pool.map(_parse_file, jobs, chunksize=chunksize))
+        except Exception as e:  # no semaphores in a sandbox, broken pool, ...
+            logger.warning(f"Parallel meeting parse unavailable ({e}); parsing serially")
+            outcomes = None
+    if outcomes is None:
+        workers = 1
+        outcomes = [_parse_file(job) for job in jobs]
+
+    results = [(job[1], entry) for job, (entry, _, _) in zip(jobs, outcomes)]
+    timings = {
+        'read': sum(o[1] for o in outcomes),
+        'parse': sum(o[2] for o in outcomes),
+        'wall': time.perf_counter() - started,
+        'workers': workers,
+    }
+    return results, timings
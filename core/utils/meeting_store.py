@@ -0,0 +1,351 @@
+"""
+Indexed SQLite store for the meeting cache.
+
+``System/Memory/meeting-cache.json`` stays the interchange format (the
+Node ``meeting-cache-builder.cjs`` hook writes it and other consumers read
+it), but the Work MCP answers queries from ``System/.dex/meeting-cache.db``:
+
+- ``meetings``: one row per cached meeting (the full entry as JSON, plus
+  date and company columns), B-tree indexed by date;
+- ``meeting_attendees``: lowercased attendee names, indexed;
+- ``meeting_fts``: FTS5 (trigram tokenizer) over the keyword-searchable
+  text (title, key points, decisions, action items joined as before),
+  company and attendee names, so substring filters are index lookups
+  instead of scans.
+
+Index hits are re-checked in Python with the original substring rules,
+so filters return exactly what the old linear scan over the JSON did.
+The store re-imports the JSON whenever its (mtime_ns, size) changes, so
+an external rebuild is picked up on the next query.
+
+Each store keeps one connection, shared by all threads under the store's
+lock and reopened only if the DB file is replaced. The schema is applied
+once per DB file and tracked with ``PRAGMA user_version``.
+
+Usage:
+    from core.utils.meeting_store import MeetingCacheStore
+
+    store = MeetingCacheStore(MEETING_CACHE_DB_FILE, MEETING_CACHE_FILE)
+    if store.ensure_current():
+        meetings = store.query(attendee='Jane', date_from='2026-01-01')
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from core.utils.file_ops import atomic_write_text
+from core.utils.parse_cache import file_signature, signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    position INTEGER PRIMARY KEY,
+    source_file TEXT,
+    date TEXT,
+    company_lower TEXT NOT NULL DEFAULT '',
+    searchable TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(date);
+CREATE INDEX IF NOT EXISTS idx_meetings_source ON meetings(source_file);
+CREATE TABLE IF NOT EXISTS meeting_attendees (
+    position INTEGER NOT NULL,
+    name_lower TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meeting_attendees_name ON meeting_attendees(name_lower);
+CREATE TABLE IF NOT EXISTS file_mtimes (
+    source_file TEXT PRIMARY KEY,
+    mtime_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS meeting_fts USING fts5(
+    searchable, company, attendees,
+    tokenize='trigram'
+);
+"""
+
+# Trigram FTS can only answer substring queries of at least three characters
+_MIN_FTS_QUERY = 3
+
+
+def _searchable(meeting: Dict[str, Any]) -> str:
+    """Text the keyword filter searches, exactly as the JSON scan built it."""
+    return ' '.join([
+        meeting.get('title') or '',
+        ' '.join(meeting.get('key_points', [])),
+        ' '.join(meeting.get('decisions', [])),
+        ' '.join(meeting.get('action_items', [])),
+    ]).lower()
+
+
+def _attendee_names(meeting: Dict[str, Any]) -> List[str]:
+    return [a.lower() for a in (meeting.get('attendees') or [])]
+
+
+def _signature_key(signature) -> str:
+    # A JSON rewritten within the mtime granularity can't be told apart; re-import next time
+    return json.dumps(signature) if signature_is_settled(signature) else 'unsettled'
+
+
+def _file_identity(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+class MeetingCacheStore:
+    """SQLite-backed meeting cache with attendee/company/date/keyword indexes."""
+
+    def __init__(self, db_path: Path, json_path: Path):
+        self.db_path = Path(db_path)
+        self.json_path = Path(json_path)
+        self._lock = threading.Lock()
+        self._has_fts: Optional[bool] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._identity: Optional[Tuple[int, int]] = None
+
+    # ------------------------------------------------------------------ setup
+
+    def _apply_schema(self, conn: sqlite3.Connection) -> None:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            self._has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'meeting_fts'").fetchone() is not None
+            return
+        conn.executescript(_SCHEMA)
+        try:
+            conn.executescript(_FTS_SCHEMA)
+            self._has_fts = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 trigram index unavailable ({e}); substring filters will scan")
+            self._has_fts = False
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """The store's connection (caller holds the lock), reopened if the DB file was replaced."""
+        if self._conn is not None and _file_identity(self.db_path) == self._identity:
+            return self._conn
+        self._close()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            self._apply_schema(conn)
+        except Exception:
+            conn.close()
+            raise
+        self._conn, self._identity = conn, _file_identity(self.db_path)
+        return conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = self._identity = None
+
+    @contextmanager
+    def _session(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            yield self._connection()
+
+    def close(self) -> None:
+        """Close the store's connection; the next call reopens it."""
+        with self._lock:
+            self._close()
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, value))
+
+    # ---------------------------------------------------------------- loading
+
+    def _write_cache(self, conn: sqlite3.Connection, cache: Dict[str, Any]) -> None:
+        """Replace the store's contents with a cache dict (JSON schema)."""
+        conn.execute("DELETE FROM meetings")
+        conn.execute("DELETE FROM meeting_attendees")
+        conn.execute("DELETE FROM file_mtimes")
+        if self._has_fts:
+            conn.execute("DELETE FROM meeting_fts")
+
+        rows, attendee_rows, fts_rows = [], [], []
+        for position, m in enumerate(cache.get('meetings', [])):
+            rows.append((position, m.get('source_file'), m.get('date'), (m.get('company') or '').lower(),
+                         _searchable(m), json.dumps(m, ensure_ascii=False)))
+            names = _attendee_names(m)
+            attendee_rows.extend((position, name) for name in names)
+            fts_rows.append((position, rows[-1][4], rows[-1][3], '\n'.join(names)))
+
+        conn.executemany(
+            "INSERT INTO meetings(position, source_file, date, company_lower, searchable, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT INTO meeting_attendees(position, name_lower) VALUES (?, ?)", attendee_rows)
+        if self._has_fts:
+            conn.executemany(
+                "INSERT INTO meeting_fts(rowid, searchable, company, attendees) VALUES (?, ?, ?, ?)", fts_rows)
+        conn.executemany(
+            "INSERT OR REPLACE INTO file_mtimes(source_file, mtime_ms) VALUES (?, ?)",
+            list((cache.get('_file_mtimes') or {}).items()))
+        self._set_meta(conn, 'version', str(cache.get('version', 1)))
+        self._set_meta(conn, 'last_updated', cache.get('last_updated'))
+        self._set_meta(conn, 'schema_version', str(SCHEMA_VERSION))
+
+    def ensure_current(self) -> bool:
+        """Import the JSON cache if it changed since the last import. Returns True if a cache exists."""
+        signature = file_signature(self.json_path)
+        with self._session() as conn:
+            stored = self._meta(conn, 'json_signature')
+            current = _signature_key(signature)
+            if stored == current and self._meta(conn, 'schema_version') == str(SCHEMA_VERSION):
+                return signature is not None
+            if signature is None:
+                with conn:
+                    self._write_cache(conn, {})
+                    self._set_meta(conn, 'json_signature', current)
+                return False
+            try:
+                cache = json.loads(self.json_path.read_text())
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Meeting cache unreadable ({e})")
+                return False
+            with conn:
+                self._write_cache(conn, cache)
+                self._set_meta(conn, 'json_signature', current)
+            return True
+
+    def replace(self, cache: Dict[str, Any]) -> None:
+        """Store a freshly built cache and export it as compact JSON for Node consumers."""
+        with self._session() as conn:
+            with conn:
+                self._write_cache(conn, cache)
+            atomic_write_text(self.json_path, json.dumps(cache, ensure_ascii=False) + '\n')
+            with conn:
+                self._set_meta(conn, 'json_signature', _signature_key(file_signature(self.json_path)))
+
+    def load_cache(self) -> Dict[str, Any]:
+        """Return the stored cache in the JSON schema (meetings, _file_mtimes, ...)."""
+        with self._session() as conn:
+            meetings = [json.loads(r['payload']) for r in
+                        conn.execute("SELECT payload FROM meetings ORDER BY position")]
+            mtimes = {r['source_file']: r['mtime_ms'] for r in conn.execute("SELECT * FROM file_mtimes")}
+            version = self._meta(conn, 'version')
+            return {
+                'version': int(version) if version and version.isdigit() else 1,
+                'last_updated': self._meta(conn, 'last_updated'),
+                'meetings': meetings,
+                '_file_mtimes': mtimes,
+            }
+
+    def info(self) -> Dict[str, Any]:
+        with self._session() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+            return {'last_updated': self._meta(conn, 'last_updated'), 'total': total}
+
+    # --------------------------------------------------------------- querying
+
+    def _fts_positions(self, conn: sqlite3.Connection, column: str, text: str) -> Optional[Set[int]]:
+        """Meetings whose FTS column contains ``text``, or None if the index can't answer."""
+        if not self._has_fts or len(text) < _MIN_FTS_QUERY:
+            return None
+        rows = conn.execute(
+            "SELECT rowid FROM meeting_fts WHERE meeting_fts MATCH ?",
+            (f"{column} : {_fts_phrase(text)}",))
+        return {r[0] for r in rows}
+
+    def _attendee_positions(self, conn: sqlite3.Connection, attendee: str) -> Optional[Set[int]]:
+        """Meetings with an attendee that contains, or is contained in, the query."""
+        query = attendee.lower()
+        # Attendee names that are substrings of the query (including exact matches)
+        substrings = {query[i:j] for i in range(len(query)) for j in range(i + 1, len(query) + 1)}
+        substrings.add('')
+        positions: Set[int] = set()
+        substrings = list(substrings)
+        for start in range(0, len(substrings), 500):
+            chunk = substrings[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            positions.update(r[0] for r in conn.execute(
+                f"SELECT position FROM meeting_attendees WHERE name_lower IN ({placeholders})", chunk))
+        # Attendee names that contain the query
+        containing = self._fts_positions(conn, 'attendees', query)
+        if containing is None:
+            return None
+        return positions | containing
+
+    def query(
+        self,
+        attendee: Optional[str] = None,
+        company: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        keyword: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Filter cached meetings; same matching rules as the original JSON scan, cache order kept."""
+        with self._session() as conn:
+            candidates: Optional[Set[int]] = None
+
+            def narrow(found: Optional[Set[int]]) -> None:
+                nonlocal candidates
+                if found is not None:
+                    candidates = found if candidates is None else candidates & found
+
+            if attendee:
+                narrow(self._attendee_positions(conn, attendee))
+            if company:
+                narrow(self._fts_positions(conn, 'company', company.lower()))
+            if keyword:
+                narrow(self._fts_positions(conn, 'searchable', keyword.lower()))
+
+            sql = "SELECT company_lower, searchable, payload FROM meetings"
+            clauses, params = [], []
+            if date_from:
+                clauses.append("(date IS NULL OR date = '' OR date >= ?)")
+                params.append(date_from)
+            if date_to:
+                clauses.append("(date IS NULL OR date = '' OR date <= ?)")
+                params.append(date_to)
+            if candidates is not None:
+                if not candidates:
+                    return []
+                clauses.append("position IN (SELECT value FROM json_each(?))")
+                params.append(json.dumps(sorted(candidates)))
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            sql += " ORDER BY position"
+            rows = conn.execute(sql, params).fetchall()
+
+        results = []
+        attendee_lower = attendee.lower() if attendee else None
+        for row in rows:
+            meeting = json.loads(row['payload'])
+            # Re-check with the exact substring rules (FTS folding may differ from str.lower)
+            if attendee_lower is not None:
+                if not any(attendee_lower in a or a in attendee_lower for a in _attendee_names(meeting)):
+                    continue
+            if company and company.lower() not in row['company_lower']:
+                continue
+            if keyword and keyword.lower() not in row['searchable']:
+                continue
+            results.append(meeting)
+        return results
@@ -0,0 +1,212 @@
+"""
+Company-mention index over meeting notes.
+
+Company pages match meetings by substring: the company name or any of its
+email domains appearing anywhere in the (lowercased) note. Checking every
+company against every note costs one full pass over the meetings folder
+per company. ``MentionIndex`` instead runs a single Aho-Corasick pass per
+note over all names and domains at once and records which patterns each
+note mentions, keyed by the note's (mtime_ns, size):
+
+- a changed or new note is re-scanned with the full automaton;
+- a pattern seen for the first time (new company or domain) is matched
+  against the unchanged notes with an automaton of just the new patterns;
+- patterns are recorded per source page, and those of a page that was
+  deleted (or that dropped a domain) are removed from the index;
+- everything else is answered from ``System/.dex/company-mentions.json``.
+
+Usage:
+    from core.utils.mention_index import MentionIndex
+
+    mentions = MentionIndex(COMPANY_MENTIONS_FILE)
+    mentions.refresh(meetings_dir, {company_file: ['acme corp', 'acme.com']})
+    for name, note in mentions.notes_mentioning(['acme corp', 'acme.com']):
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from core.utils.file_ops import atomic_write_json
+from core.utils.parse_cache import file_signature, signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher: which patterns occur in a text, in one pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = [p for p in dict.fromkeys(patterns) if p]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            node = 0
+            for char in pattern:
+                nxt = self._goto[node].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][char] = nxt
+                node = nxt
+            self._out[node].append(idx)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """Patterns that occur in ``text``."""
+        if not self.patterns:
+            return set()
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return {self.patterns[i] for i in found}
+
+
+def _empty_index() -> Dict[str, Any]:
+    return {'version': INDEX_VERSION, 'pages': {}, 'patterns': [], 'notes': {}}
+
+
+class MentionIndex:
+    """Per-note pattern mentions for a meetings folder, kept current by file signature."""
+
+    def __init__(self, index_file: Path):
+        self.index_file = Path(index_file)
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._data_signature = None
+        self.scanned_last_refresh = 0
+
+    def _load(self) -> Dict[str, Any]:
+        signature = file_signature(self.index_file)
+        if self._data is not None and signature == self._data_signature:
+            return self._data
+        try:
+            data = json.loads(self.index_file.read_text())
+        except FileNotFoundError:
+            data = None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Company mention index unreadable ({e}); rebuilding")
+            data = None
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            data = _empty_index()
+        self._data, self._data_signature = data, signature
+        return data
+
+    @staticmethod
+    def _scan_folder(folder: Path) -> List[Tuple[str, Path, List[Optional[int]]]]:
+        found = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.name.endswith('.md') and not entry.name.startswith('.') and entry.is_file():
+                        stat = entry.stat()
+                        found.append((entry.name, Path(entry.path), [stat.st_mtime_ns, stat.st_size]))
+        except FileNotFoundError:
+            pass
+        found.sort()
+        return found
+
+    def refresh(self, folder: Path, pages: Mapping[Any, Iterable[str]]) -> None:
+        """Bring mentions up to date for ``folder``.
+
+        ``pages`` maps source pages (company page paths) to their patterns
+        (lowercased substrings). Pages not passed keep their patterns until
+        the page file is deleted.
+        """
+        with self._lock:
+            data = self._load()
+            if data.get('folder') != str(folder):
+                data = _empty_index()
+            sources = {page: patterns for page, patterns in data['pages'].items() if Path(page).exists()}
+            for page, patterns in pages.items():
+                sources[str(page)] = list(dict.fromkeys(p.lower() for p in patterns if p))
+            live = {p for patterns in sources.values() for p in patterns}
+            kept = [p for p in data['patterns'] if p in live]
+            removed = len(kept) != len(data['patterns'])
+            known = set(kept)
+            wanted = dict.fromkeys(p for patterns in sources.values() for p in patterns)
+            new_patterns = [p for p in wanted if p not in known]
+            all_patterns = kept + new_patterns
+            full = AhoCorasick(all_patterns)
+            added = AhoCorasick(new_patterns)
+
+            old_notes = data['notes']
+            notes: Dict[str, Any] = {}
+            scanned = 0
+            for name, path, signature in self._scan_folder(folder):
+                note = old_notes.get(name)
+                changed = note is None or note.get('signature') != signature
+                if not changed and not new_patterns:
+                    if removed:
+                        note = dict(note, mentions=[p for p in note['mentions'] if p in live])
+                    notes[name] = note
+                    continue
+                try:
+                    content = path.read_text()
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.warning(f"Skipping unreadable meeting note {path}: {e}")
+                    continue
+                scanned += 1
+                lowered = content.lower()
+                if changed:
+                    lines = content.split('\n')
+                    note = {
+                        'title': lines[0].lstrip('#').strip() if lines else path.stem,
+                        'mentions': sorted(full.find(lowered)),
+                    }
+                else:
+                    mentions = {p for p in note['mentions'] if p in live} | added.find(lowered)
+                    note = dict(note, mentions=sorted(mentions))
+                # Racy (just-written) notes are re-scanned next time
+                note['signature'] = signature if signature_is_settled(tuple(signature)) else None
+                notes[name] = note
+
+            self.scanned_last_refresh = scanned
+            if (not scanned and not new_patterns and not removed and sources == data['pages']
+                    and notes.keys() == old_notes.keys()):
+                return
+            data = {'version': INDEX_VERSION, 'folder': str(folder), 'pages': sources,
+                    'patterns': all_patterns, 'notes': notes}
+            self._data = data
+            try:
+                atomic_write_json(self.index_file, data)
+                self._data_signature = file_signature(self.index_file)
+            except OSError as e:
+                logger.error(f"Could not write company mention index: {e}")
+                self._data_signature = None
+
+    def notes_mentioning(self, patterns: Iterable[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """(file name, note) for notes mentioning any of ``patterns``, in file-name order."""
+        wanted = {p.lower() for p in patterns if p}
+        with self._lock:
+            notes = self._load()['notes']
+            return [(name, note) for name, note in sorted(notes.items())
+                    if wanted.intersection(note['mentions'])]
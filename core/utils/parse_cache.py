@@ -0,0 +1,106 @@
+"""
+In-process cache for parsed markdown files.
+
+MCP tool calls re-read and re-parse the same few files (Tasks.md,
+Week_Priorities.md, Quarter_Goals.md) over and over. ``FileParseCache``
+keeps the last parse result per (path, parser) and only re-runs the
+parser when the file's (mtime_ns, size) signature changes.
+
+Like git's index, a signature is only trusted once the file's mtime is
+older than the filesystem timestamp granularity: a file rewritten within
+the same clock tick with the same size would otherwise look unchanged.
+
+Results are stored as-is, so parsers should return immutable data
+(tuples, frozen records, ``MappingProxyType``) and callers copy before
+mutating.
+
+Usage:
+    from core.utils.parse_cache import FileParseCache
+
+    _cache = FileParseCache()
+    records = _cache.get(path, parse_fn)   # parse_fn(path) -> immutable result
+
+    # Results derived from several files are rebuilt when any of them changes
+    graph = _cache.get_group((goals, priorities, tasks), build_fn)  # build_fn(paths)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+# Coarsest common mtime granularity (FAT/HFS+ use 1-2s ticks)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def signature_is_settled(signature: Optional[Tuple[int, int]]) -> bool:
+    """True if a file signature is old enough that same-tick rewrites can't hide behind it."""
+    if signature is None:
+        return True
+    return time.time_ns() - signature[0] > RACY_WINDOW_NS
+
+
+class FileParseCache:
+    """Memoize ``parser(path)`` until the file's mtime/size signature changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (path(s), parser) -> (signature(s), result); recently modified files are never stored
+        self._entries: Dict[Tuple[Any, str], Tuple[Any, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, parser: Callable[[Path], Any]) -> Any:
+        """Return the cached parse of ``path``, re-parsing if it changed."""
+        key = (str(path), getattr(parser, '__qualname__', repr(parser)))
+        signature = file_signature(path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self.hits += 1
+                return cached[1]
+
+        result = parser(path)
+        with self._lock:
+            self.misses += 1
+            if signature_is_settled(signature):
+                self._entries[key] = (signature, result)
+            else:
+                self._entries.pop(key, None)
+        return result
+
+    def get_group(self, paths: Sequence[Path], builder: Callable[[Tuple[Path, ...]], Any]) -> Any:
+        """Return the cached ``builder(paths)``, rebuilding if any of the files changed."""
+        paths = tuple(Path(p) for p in paths)
+        key = (tuple(str(p) for p in paths), getattr(builder, '__qualname__', repr(builder)))
+        signature = tuple(file_signature(p) for p in paths)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self.hits += 1
+                return cached[1]
+
+        result = builder(paths)
+        with self._lock:
+            self.misses += 1
+            if all(signature_is_settled(sig) for sig in signature):
+                self._entries[key] = (signature, result)
+            else:
+                self._entries.pop(key, None)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached parses (e.g. after configuration changes)."""
+        with self._lock:
+            self._entries.clear()
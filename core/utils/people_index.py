@@ -0,0 +1,216 @@
+"""
+Incremental People_Index with an indexed fuzzy name lookup.
+
+``System/People_Index.json`` lists every person page (name, company,
+role, email, tags, ...). Instead of re-parsing all person pages on every
+build, ``PeopleIndex.refresh()`` stats the People folders and re-parses
+only pages whose (mtime_ns, size) changed; the signatures are stored in
+the JSON under ``files``. Freshness therefore follows file changes, not a
+wall-clock TTL.
+
+Name lookups go through ``PersonNameIndex``: padded character trigrams
+map to the people whose names contain them, so a query is only scored
+against names that share at least one trigram (plus names that are a
+substring of the query). Scoring is unchanged: 1.0 for an exact name,
+0.8 when one name contains the other, otherwise ``SequenceMatcher``
+ratio.
+
+Usage:
+    from core.utils.people_index import PeopleIndex
+
+    people = PeopleIndex(PEOPLE_INDEX_FILE, entry_fn)   # entry_fn(path, type_dir) -> entry dict
+    index = people.refresh(people_dir, base_dir)
+    matches = people.search('Jane Doe', company='Acme')
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.utils.file_ops import atomic_write_json
+from core.utils.parse_cache import file_signature, signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+PEOPLE_SUBDIRS = ('Internal', 'External', 'CPO_Network')
+MIN_SCORE = 0.5
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def score_name(query: str, name: str) -> float:
+    """Match score between a lowercased query and a lowercased person name."""
+    if query in name or name in query:
+        return 1.0 if query == name else 0.8
+    return SequenceMatcher(None, query, name).ratio()
+
+
+class PersonNameIndex:
+    """Trigram postings over lowercased person names."""
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = [n.lower() for n in names]
+        self._postings: Dict[str, List[int]] = {}
+        self._exact: Dict[str, List[int]] = {}
+        for idx, name in enumerate(self.names):
+            self._exact.setdefault(name, []).append(idx)
+            for gram in _trigrams(name):
+                self._postings.setdefault(gram, []).append(idx)
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        if len(query) < 3:
+            # Too short for trigrams to cover "query is a substring of the name"
+            return range(len(self.names))
+        candidates: Set[int] = set()
+        for gram in _trigrams(query):
+            candidates.update(self._postings.get(gram, ()))
+        # Names contained in the query (e.g. "Jo" for "Jo Smith") may share no trigram
+        for start in range(len(query)):
+            for end in range(start + 1, len(query) + 1):
+                candidates.update(self._exact.get(query[start:end], ()))
+        return candidates
+
+    def search(self, query: str, min_score: float = MIN_SCORE) -> List[Tuple[int, float]]:
+        """Return (position, score) for names scoring at least ``min_score``."""
+        query = query.lower()
+        hits = []
+        for idx in self._candidates(query):
+            name = self.names[idx]
+            if not (query in name or name in query):
+                # ratio <= 2 * min(len) / (len_a + len_b); skip names that can't reach min_score
+                total = len(query) + len(name)
+                if not total or 2 * min(len(query), len(name)) < min_score * total:
+                    continue
+                matcher = SequenceMatcher(None, query, name)
+                if matcher.quick_ratio() < min_score:
+                    continue
+                score = matcher.ratio()
+            else:
+                score = score_name(query, name)
+            if score >= min_score:
+                hits.append((idx, score))
+        return hits
+
+
+class PeopleIndex:
+    """People_Index.json kept current by re-parsing only changed person pages."""
+
+    def __init__(
+        self,
+        index_file: Path,
+        entry_fn: Callable[[Path, str], Dict[str, Any]],
+        subdirs: Iterable[str] = PEOPLE_SUBDIRS,
+    ):
+        self.index_file = Path(index_file)
+        self.entry_fn = entry_fn
+        self.subdirs = tuple(subdirs)
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_signature = None
+        self._names: Optional[PersonNameIndex] = None
+        self.parsed_last_refresh = 0
+
+    def _load(self) -> Dict[str, Any]:
+        signature = file_signature(self.index_file)
+        if self._index is not None and signature == self._index_signature:
+            return self._index
+        try:
+            data = json.loads(self.index_file.read_text())
+        except FileNotFoundError:
+            data = None
+        except (OSError, ValueError) as e:
+            logger.warning(f"People index unreadable ({e}); rebuilding")
+            data = None
+        if not isinstance(data, dict) or not isinstance(data.get('files'), dict):
+            data = {'people': [], 'files': {}}  # also upgrades pre-incremental indexes
+        self._index, self._index_signature, self._names = data, signature, None
+        return data
+
+    def _scan(self, people_dir: Path) -> List[Tuple[Path, str, os.stat_result]]:
+        found = []
+        for subdir_name in self.subdirs:
+            subdir = people_dir / subdir_name
+            try:
+                with os.scandir(subdir) as it:
+                    for entry in it:
+                        if entry.name.endswith('.md') and entry.name != 'README.md' and entry.is_file():
+                            found.append((Path(entry.path), subdir_name, entry.stat()))
+            except FileNotFoundError:
+                continue
+        found.sort(key=lambda item: (self.subdirs.index(item[1]), item[0].name))
+        return found
+
+    def refresh(self, people_dir: Path, base_dir: Path, force_write: bool = False) -> Dict[str, Any]:
+        """Bring the index up to date with the People folders and return it."""
+        with self._lock:
+            old = self._load()
+            old_entries = {e.get('path'): e for e in old.get('people', [])}
+            old_files = old.get('files', {})
+
+            entries, files = [], {}
+            parsed = 0
+            for path, subdir_name, stat in self._scan(people_dir):
+                rel = str(path.relative_to(base_dir))
+                signature = [stat.st_mtime_ns, stat.st_size]
+                entry = old_entries.get(rel)
+                if entry is None or old_files.get(rel) != signature:
+                    entry = self.entry_fn(path, subdir_name)
+                    parsed += 1
+                entries.append(entry)
+                # Racy (just-written) pages are re-parsed next time
+                files[rel] = signature if signature_is_settled(tuple(signature)) else None
+
+            self.parsed_last_refresh = parsed
+            changed = parsed > 0 or len(entries) != len(old_entries) or files != old_files
+            if not (changed or force_write) and 'built_at' in old:
+                return old
+
+            index = {
+                'version': INDEX_VERSION,
+                'built_at': datetime.now().isoformat(),
+                'total': len(entries),
+                'by_type': {
+                    'internal': sum(1 for e in entries if e['type'] == 'internal'),
+                    'external': sum(1 for e in entries if e['type'] == 'external'),
+                    'cpo_network': sum(1 for e in entries if e['type'] == 'cpo_network'),
+                },
+                'people': entries,
+                'files': files,
+            }
+            try:
+                atomic_write_json(self.index_file, index)
+                self._index_signature = file_signature(self.index_file)
+            except OSError as e:
+                logger.error(f"Could not write people index: {e}")
+                self._index_signature = None
+            self._index, self._names = index, None
+            return index
+
+    def search(self, name: str, company: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Scored matches for a name (best first), optionally filtered by company substring."""
+        with self._lock:
+            index = self._index if self._index is not None else self._load()
+            people = index.get('people', [])
+            if self._names is None:
+                self._names = PersonNameIndex(p.get('name', '') for p in people)
+            names = self._names
+
+        matches = []
+        for idx, score in sorted(names.search(name)):
+            person = people[idx]
+            if company and company.lower() not in (person.get('company') or '').lower():
+                continue
+            matches.append({**person, '_score': round(score, 2)})
+        matches.sort(key=lambda m: m['_score'], reverse=True)
+        return matches
@@ -4,6 +4,10 @@ QMD Search Index Refresh Utility
 Triggers incremental re-indexing of vault content after write operations.
 Only processes changed files — typically completes in under a second.
 
+Requests go to a single background worker that debounces and coalesces
+them: a burst of writes produces at most one in-flight run plus one
+trailing run, instead of one overlapping `qmd update`/`qmd embed` per call.
+
 Gracefully handles:
 - QMD not installed (silently skips)
 - QMD not configured (silently skips)
@@ -12,12 +16,18 @@ Gracefully handles:
 Usage:
     from core.utils.qmd_indexer import refresh_search_index
     refresh_search_index()  # Fire-and-forget, non-blocking
+
+    from core.utils.qmd_indexer import get_index_stats
+    get_index_stats()  # runs, coalesced requests, last duration, ...
 """
 
 import logging
 import shutil
 import subprocess
 import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -55,11 +65,15 @@ def _find_qmd() -> str | None:
     return None
 
 
-def _run_reindex():
-    """Run qmd update + embed in background. Called from a thread."""
+def _run_reindex() -> Optional[str]:
+    """Run qmd update + embed in background. Called from a thread.
+
+    Returns None on success (or when QMD is not installed), otherwise a
+    short description of what failed for the worker's ``last_error``.
+    """
     qmd = _find_qmd()
     if not qmd:
-        return
+        return None
 
     try:
         # Update FTS index (changed files only)
@@ -70,8 +84,9 @@ def _run_reindex():
             timeout=30,
         )
         if result.returncode != 0:
-            logger.debug(f"qmd update returned {result.returncode}: {result.stderr.strip()}")
-            return
+            error = f"qmd update returned {result.returncode}: {result.stderr.strip()}"
+            logger.debug(error)
+            return error
 
         # Update vector embeddings (changed chunks only)
         result = subprocess.run(
@@ -81,24 +96,136 @@ def _run_reindex():
             timeout=60,
         )
         if result.returncode != 0:
-            logger.debug(f"qmd embed returned {result.returncode}: {result.stderr.strip()}")
+            error = f"qmd embed returned {result.returncode}: {result.stderr.strip()}"
+            logger.debug(error)
+            return error
 
     except subprocess.TimeoutExpired:
         logger.warning("QMD re-index timed out")
+        return "QMD re-index timed out"
     except Exception as e:
-        logger.debug(f"QMD re-index error: {e}")
+        error = f"QMD re-index error: {e}"
+        logger.debug(error)
+        return error
+    return None
+
+
+class ReindexWorker:
+    """Single background thread that runs debounced, coalesced re-index jobs.
+
+    Requests arriving within ``debounce_seconds`` of each other are folded
+    into one run (but a run is never delayed more than ``max_delay_seconds``
+    after the first pending request). Requests that arrive while a run is
+    in flight schedule exactly one trailing run.
+
+    ``run_fn`` reports a failure by raising or by returning an error
+    message; either ends up in ``stats()['last_error']``.
+    """
+
+    def __init__(self, run_fn: Callable[[], Optional[str]], debounce_seconds: float = 2.0,
+                 max_delay_seconds: float = 10.0):
+        self._run_fn = run_fn
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._pending = 0            # requests not yet picked up by a run
+        self._first_pending_at = 0.0
+        self._last_request_at = 0.0
+        self._in_flight = False
+        self._stats = {
+            'requests': 0,
+            'runs': 0,
+            'coalesced_requests': 0,
+            'last_run_started_at': None,
+            'last_duration_seconds': None,
+            'last_error': None,
+        }
+
+    def request(self) -> None:
+        """Queue a re-index; returns immediately."""
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_pending_at = now
+            self._pending += 1
+            self._last_request_at = now
+            self._stats['requests'] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name='qmd-reindex', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _next_batch(self) -> int:
+        """Block until a debounced batch is due; return how many requests it covers."""
+        with self._cond:
+            while True:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                due = min(self._last_request_at + self.debounce_seconds,
+                          self._first_pending_at + self.max_delay_seconds)
+                if now >= due:
+                    batch, self._pending = self._pending, 0
+                    self._in_flight = True
+                    return batch
+                self._cond.wait(timeout=due - now)
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            started = time.monotonic()
+            started_at = datetime.now().isoformat(timespec='seconds')
+            error = None
+            try:
+                error = self._run_fn()
+            except Exception as e:  # keep the worker alive
+                error = str(e)
+                logger.debug(f"QMD re-index worker error: {e}")
+            with self._cond:
+                self._in_flight = False
+                self._stats['runs'] += 1
+                self._stats['coalesced_requests'] += batch - 1
+                self._stats['last_run_started_at'] = started_at
+                self._stats['last_duration_seconds'] = round(time.monotonic() - started, 3)
+                self._stats['last_error'] = error
+                self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of worker counters."""
+        with self._cond:
+            return {**self._stats, 'queued_requests': self._pending, 'in_flight': self._in_flight}
+
+    def wait_idle(self, timeout: float = 30.0) -> bool:
+        """Block until nothing is queued or running (mainly for tests and shutdown)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining)
+            return True
+
+
+_worker = ReindexWorker(lambda: _run_reindex())
 
 
 def refresh_search_index():
     """
     Trigger an incremental re-index of the QMD search index.
 
-    Non-blocking: spawns a background thread so the caller returns immediately.
-    Safe to call frequently — only processes changed files.
+    Non-blocking: hands the request to the background worker so the caller
+    returns immediately. Safe to call frequently — bursts are coalesced.
     Silently skips if QMD is not installed.
     """
     if _find_qmd() is None:
         return
 
-    thread = threading.Thread(target=_run_reindex, daemon=True)
-    thread.start()
+    _worker.request()
+
+
+def get_index_stats() -> Dict[str, Any]:
+    """Return re-index worker stats (runs, queued/coalesced requests, last duration)."""
+    return _worker.stats()
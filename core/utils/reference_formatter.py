@@ -7,25 +7,14 @@ import os
 from pathlib import Path
 from typing import Optional
 
-try:
-    import yaml
-except ImportError:
-    yaml = None
+from core.utils.vault_config import user_profile
 
 BASE_DIR = Path(os.environ.get('VAULT_PATH', Path.cwd()))
 USER_PROFILE = BASE_DIR / 'System' / 'user-profile.yaml'
 
 def get_obsidian_mode() -> bool:
     """Check if Obsidian mode is enabled"""
-    if not USER_PROFILE.exists() or yaml is None:
-        return False
-    
-    try:
-        content = USER_PROFILE.read_text()
-        data = yaml.safe_load(content)
-        return bool(data.get('obsidian_mode', False))
-    except Exception:
-        return False
+    return bool(user_profile(USER_PROFILE).get('obsidian_mode', False))
 
 def format_person_reference(name: str, full_path: Optional[str] = None) -> str:
     """Format person reference (e.g., John_Doe or [[John_Doe]])"""
@@ -0,0 +1,242 @@
+"""
+Resolution indexes for meeting prep: who and what a meeting is about.
+
+Meeting context used to read every company page, every project file under
+``04-Projects/**`` and glob the People folders once per attendee.
+``ResolutionIndex`` keeps the lowered text and parsed fields of those
+pages in memory, re-reading only files whose (mtime_ns, size) changed,
+and derives:
+
+- email domain -> company page (from each page's **Domains** row);
+- person page name / email -> person page, per People subfolder;
+- person -> projects that mention the person's page name (found with one
+  Aho-Corasick pass per changed project; unchanged projects are only
+  checked for people added since the last refresh).
+
+A refresh costs one ``stat`` per page; lookups are dictionary hits, with
+substring fallbacks answered from memory. A refresh replaces the derived
+maps instead of mutating them, and lookups read them under the lock, so a
+lookup never sees a half-applied refresh from another thread.
+
+Usage:
+    from core.utils.resolution_index import ResolutionIndex
+
+    index = ResolutionIndex(person_fn, domains_fn)
+    index.refresh(companies_dir, {'External': ext_dir, 'Internal': int_dir}, projects_dir)
+    company = index.company_for_domain('acme.com')
+    projects, positions_by_person = index.project_snapshot()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from core.utils.mention_index import AhoCorasick
+from core.utils.parse_cache import signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+
+def _list_markdown(folder: Path, recursive: bool = False) -> List[Tuple[Path, Tuple[int, int]]]:
+    found = []
+    roots = [root for root, _dirs, _files in os.walk(folder)] if recursive else [folder]
+    for root in roots:
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.name.endswith('.md') and not entry.name.startswith('.') and entry.is_file():
+                        stat = entry.stat()
+                        found.append((Path(entry.path), (stat.st_mtime_ns, stat.st_size)))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    found.sort()
+    return found
+
+
+class _PageTable:
+    """Pages of one folder, re-loaded only when their signature changes."""
+
+    def __init__(self, loader: Callable[[Path, str], Dict[str, Any]]):
+        self._loader = loader
+        self._pages: Dict[Path, Tuple[Optional[Tuple[int, int]], Dict[str, Any]]] = {}
+        self.records: List[Dict[str, Any]] = []
+        self.changed: Set[Path] = set()
+
+    def refresh(self, files: List[Tuple[Path, Tuple[int, int]]]) -> bool:
+        """Sync with ``files``; returns True if any page was added, changed or removed."""
+        pages = {}
+        self.changed = set()
+        for path, signature in files:
+            cached = self._pages.get(path)
+            if cached is not None and cached[0] == signature:
+                pages[path] = cached
+                continue
+            try:
+                content = path.read_text()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable page {path}: {e}")
+                continue
+            record = self._loader(path, content)
+            # Racy (just-written) pages are re-read next time
+            pages[path] = (signature if signature_is_settled(signature) else None, record)
+            self.changed.add(path)
+        removed = self._pages.keys() - pages.keys()
+        self._pages = pages
+        self.records = [record for _, record in pages.values()]
+        return bool(self.changed or removed)
+
+
+class ResolutionIndex:
+    """Companies by domain, people by name/email, and projects by person, kept current by mtime."""
+
+    def __init__(
+        self,
+        person_fn: Callable[[Path, str], Dict[str, Any]],
+        domains_fn: Callable[[str], List[str]],
+    ):
+        self._person_fn = person_fn
+        self._domains_fn = domains_fn
+        self._lock = threading.Lock()
+        self._dirs: Optional[Tuple[Any, ...]] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._companies = _PageTable(self._company_record)
+        self._people: Dict[str, _PageTable] = {}
+        self._projects = _PageTable(lambda path, content: {
+            'path': path,
+            'stem_lower': path.stem.lower(),
+            'content_lower': content.lower(),
+        })
+        self._by_domain: Dict[str, Dict[str, Any]] = {}
+        self._person_keys: Set[str] = set()
+        self._by_person_key: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self._by_email: Dict[str, List[Dict[str, Any]]] = {}
+        # Person keys each project mentions, and person key -> positions in self._projects.records
+        self._project_mentions: Dict[Path, Set[str]] = {}
+        self._project_positions: Dict[str, List[int]] = {}
+
+    def _company_record(self, path: Path, content: str) -> Dict[str, Any]:
+        return {
+            'path': path,
+            'name_lower': path.stem.lower().replace('_', ' '),
+            'content_lower': content.lower(),
+            'domains': self._domains_fn(content),
+        }
+
+    def _person_record(self, path: Path, content: str) -> Dict[str, Any]:
+        return {'key': path.stem.lower(), 'person': self._person_fn(path, content)}
+
+    def refresh(self, companies_dir: Path, people_dirs: Mapping[str, Path], projects_dir: Path) -> None:
+        """Stat the indexed folders and re-read pages that changed."""
+        with self._lock:
+            dirs = (Path(companies_dir), tuple((k, Path(v)) for k, v in people_dirs.items()), Path(projects_dir))
+            if dirs != self._dirs:
+                self._reset()
+                self._dirs = dirs
+
+            if self._companies.refresh(_list_markdown(Path(companies_dir))):
+                by_domain: Dict[str, Dict[str, Any]] = {}
+                for company in self._companies.records:
+                    for domain in company['domains']:
+                        by_domain.setdefault(domain.lower(), company)
+                self._by_domain = by_domain
+
+            people_changed = False
+            for subdir, folder in people_dirs.items():
+                table = self._people.setdefault(subdir, _PageTable(self._person_record))
+                people_changed |= table.refresh(_list_markdown(Path(folder)))
+            if people_changed:
+                by_key: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+                by_email: Dict[str, List[Dict[str, Any]]] = {}
+                for subdir, table in self._people.items():
+                    for record in table.records:
+                        by_key.setdefault(subdir, {}).setdefault(record['key'], []).append(record['person'])
+                        email = (record['person'].get('email') or '').lower()
+                        if email:
+                            by_email.setdefault(email, []).append(record['person'])
+                self._by_person_key, self._by_email = by_key, by_email
+
+            projects_changed = self._projects.refresh(_list_markdown(Path(projects_dir), recursive=True))
+            if people_changed or projects_changed:
+                self._index_project_mentions()
+
+    def _index_project_mentions(self) -> None:
+        keys = {r['key'] for table in self._people.values() for r in table.records}
+        new_keys = keys - self._person_keys
+        automaton = AhoCorasick(sorted(keys))
+        mentions: Dict[Path, Set[str]] = {}
+        positions: Dict[str, List[int]] = {key: [] for key in keys}
+        for i, project in enumerate(self._projects.records):
+            previous = self._project_mentions.get(project['path'])
+            if previous is None or project['path'] in self._projects.changed:
+                found = automaton.find(project['content_lower'])
+                found.update(k for k in keys if k in project['stem_lower'])
+            else:
+                found = previous & keys
+                found.update(k for k in new_keys if k in project['content_lower'] or k in project['stem_lower'])
+            mentions[project['path']] = found
+            for key in found:
+                positions[key].append(i)
+        self._project_mentions = mentions
+        self._project_positions = positions
+        self._person_keys = keys
+
+    # -- lookups ---------------------------------------------------------------
+
+    def companies(self) -> List[Dict[str, Any]]:
+        """Company records in file-name order."""
+        with self._lock:
+            return self._companies.records
+
+    def company_for_domain(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Company page whose **Domains** row lists ``domain`` (case-insensitive)."""
+        with self._lock:
+            return self._by_domain.get(domain.lower())
+
+    def people(self, subdir: str) -> List[Dict[str, Any]]:
+        """Parsed person pages of one People subfolder, in file-name order."""
+        with self._lock:
+            table = self._people.get(subdir)
+            return [r['person'] for r in table.records] if table else []
+
+    def person_keys(self, subdir: str) -> List[str]:
+        with self._lock:
+            table = self._people.get(subdir)
+            return [r['key'] for r in table.records] if table else []
+
+    def people_by_key(self, subdir: str, key: str) -> List[Dict[str, Any]]:
+        """Person pages in ``subdir`` whose lowercased file stem is exactly ``key``."""
+        with self._lock:
+            return self._by_person_key.get(subdir, {}).get(key, [])
+
+    def people_by_email(self, email: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self._by_email.get(email.lower(), [])
+
+    def is_person_key(self, key: str) -> bool:
+        with self._lock:
+            return key in self._person_keys
+
+    def projects(self) -> List[Dict[str, Any]]:
+        """Project records in path order."""
+        with self._lock:
+            return self._projects.records
+
+    def projects_for_person(self, key: str) -> List[Dict[str, Any]]:
+        """Projects whose text or file name contains a person's lowercased page stem."""
+        with self._lock:
+            records = self._projects.records
+            return [records[i] for i in self._project_positions.get(key, ())]
+
+    def project_snapshot(self) -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+        """Project records, plus person key -> positions in that list, from the same refresh.
+
+        Every person key is present (with an empty list if no project mentions it).
+        """
+        with self._lock:
+            return self._projects.records, self._project_positions
@@ -0,0 +1,149 @@
+"""
+Candidate index for near-duplicate task detection.
+
+Dedup scores a new item against every open task title with
+``difflib.SequenceMatcher`` plus keyword Jaccard overlap:
+
+    score = ratio_weight * ratio + keyword_weight * jaccard + boost
+
+``TitleSimilarityIndex`` returns exactly the titles whose score reaches a
+threshold, without running SequenceMatcher against all of them:
+
+- a keyword inverted index yields the only titles with non-zero Jaccard;
+- titles with no shared keyword and no boost need ``ratio >= threshold /
+  ratio_weight`` on their own (with the default weights that means an
+  exact case-insensitive match, answered by a dict lookup);
+- remaining candidates are pruned with SequenceMatcher's cheap upper
+  bounds (length, then character multiset) before the full ratio runs.
+
+Because every pruning step uses an upper bound, results are identical to
+the brute-force scan.
+
+Usage:
+    from core.utils.similarity_index import TitleSimilarityIndex
+
+    index = TitleSimilarityIndex(extract_keywords)
+    index.extend(titles)
+    for idx, ratio, overlap in index.search(item, 0.6, 0.6, 0.25):
+        ...
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Slack for float rounding when comparing upper bounds with the threshold
+_EPSILON = 1e-9
+
+
+class TitleSimilarityIndex:
+    """Incremental index over titles for thresholded similarity search."""
+
+    def __init__(self, keyword_fn: Callable[[str], Set[str]]):
+        self._keyword_fn = keyword_fn
+        self.titles: List[str] = []
+        self._lowered: List[str] = []
+        self._char_counts: List[Counter] = []
+        self._keywords: List[Set[str]] = []
+        self._by_keyword: Dict[str, List[int]] = {}
+        self._by_lowered: Dict[str, List[int]] = {}
+        self._lengths: List[Tuple[int, int]] = []  # sorted (length, idx)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def add(self, title: str) -> int:
+        """Index one title and return its position."""
+        idx = len(self.titles)
+        lowered = title.lower()
+        keywords = self._keyword_fn(title)
+        self.titles.append(title)
+        self._lowered.append(lowered)
+        self._char_counts.append(Counter(lowered))
+        self._keywords.append(keywords)
+        for keyword in keywords:
+            self._by_keyword.setdefault(keyword, []).append(idx)
+        self._by_lowered.setdefault(lowered, []).append(idx)
+        bisect.insort(self._lengths, (len(lowered), idx))
+        return idx
+
+    def extend(self, titles: Iterable[str]) -> None:
+        for title in titles:
+            self.add(title)
+
+    def _ratio_bounded(self, query: str, query_counts: Counter, idx: int, min_ratio: float) -> Optional[float]:
+        """Return the SequenceMatcher ratio if it can reach ``min_ratio``, else None."""
+        if min_ratio <= 0:
+            return SequenceMatcher(None, query, self._lowered[idx]).ratio()
+        total = len(query) + len(self._lowered[idx])
+        if total == 0:
+            return 1.0
+        # Length bound (real_quick_ratio)
+        if 2.0 * min(len(query), len(self._lowered[idx])) / total < min_ratio - _EPSILON:
+            return None
+        # Character multiset bound (quick_ratio)
+        matches = sum((query_counts & self._char_counts[idx]).values())
+        if 2.0 * matches / total < min_ratio - _EPSILON:
+            return None
+        return SequenceMatcher(None, query, self._lowered[idx]).ratio()
+
+    def search(
+        self,
+        text: str,
+        threshold: float,
+        ratio_weight: float,
+        keyword_weight: float,
+        boosts: Optional[Dict[int, float]] = None,
+    ) -> List[Tuple[int, float, float]]:
+        """Return (idx, ratio, keyword_overlap) for titles scoring >= threshold, in index order."""
+        boosts = boosts or {}
+        query = text.lower()
+        query_counts = Counter(query)
+        query_keywords = self._keyword_fn(text)
+
+        # Keyword overlap for titles sharing at least one keyword
+        shared: Dict[int, int] = {}
+        for keyword in query_keywords:
+            for idx in self._by_keyword.get(keyword, ()):
+                shared[idx] = shared.get(idx, 0) + 1
+        overlaps = {
+            idx: count / (len(query_keywords) + len(self._keywords[idx]) - count)
+            for idx, count in shared.items()
+        }
+
+        candidates = set(overlaps) | set(boosts)
+
+        # Titles with no keyword overlap and no boost must clear the bar on ratio alone
+        base_min_ratio = threshold / ratio_weight if ratio_weight else float('inf')
+        if base_min_ratio <= 1.0 + _EPSILON:
+            if base_min_ratio >= 1.0 - _EPSILON:
+                candidates.update(self._by_lowered.get(query, ()))
+            else:
+                # Only titles whose length allows ratio >= base_min_ratio
+                lo = len(query) * base_min_ratio / (2.0 - base_min_ratio) if base_min_ratio < 2 else 0
+                hi = len(query) * (2.0 - base_min_ratio) / base_min_ratio if base_min_ratio > 0 else float('inf')
+                start = bisect.bisect_left(self._lengths, (int(lo - 1), -1))
+                for length, idx in self._lengths[start:]:
+                    if length > hi + 1:
+                        break
+                    candidates.add(idx)
+
+        results = []
+        for idx in sorted(candidates):
+            overlap = overlaps.get(idx, 0)
+            boost = boosts.get(idx, 0.0)
+            if not ratio_weight:
+                min_ratio = 0.0
+            else:
+                min_ratio = (threshold - keyword_weight * overlap - boost) / ratio_weight
+            if min_ratio > 1.0 + _EPSILON:
+                continue
+            ratio = self._ratio_bounded(query, query_counts, idx, min_ratio)
+            if ratio is None:
+                continue
+            if (ratio * ratio_weight) + (overlap * keyword_weight) + boost >= threshold:
+                results.append((idx, ratio, overlap))
+        return results
@@ -0,0 +1,186 @@
+"""
+Skill quality ratings: the append-only log plus per-skill aggregates.
+
+``capture_skill_rating`` appends one JSON line per rating to
+``System/Skill_Ratings/ratings.jsonl``:
+
+    {"ts": "2026-02-03T10:15:00", "skill": "daily-plan", "rating": 4, "note": "..."}
+
+Next to it, ``System/.dex/skill-ratings-stats.json`` keeps, per skill, the
+count and sum of ratings, the last five entries, and the trend inputs
+(the sum of the first half of the ratings and the ratings of the second
+half not yet folded into it), along with the byte offset of the log they
+cover. ``summary()`` answers from the aggregates. The log is only read
+again when that offset doesn't match its size: the unread tail is
+replayed, or the whole log if it shrank.
+
+Usage:
+    from core.utils.skill_ratings import SkillRatings
+
+    ratings = SkillRatings()
+    ratings.record('daily-plan', 4, note='Good priorities')
+    summary = ratings.summary('daily-plan')   # {skill: {average, count, trend, recent}}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.paths import SKILL_RATINGS_FILE, SKILL_RATINGS_STATS_FILE
+from core.utils.file_ops import atomic_write_json, file_lock
+
+logger = logging.getLogger(__name__)
+
+STATS_VERSION = 1
+RECENT_COUNT = 5
+# Trend needs this many ratings, and a half-to-half change above the threshold
+TREND_MIN_RATINGS = 4
+TREND_THRESHOLD = 0.3
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {'version': STATS_VERSION, 'log_offset': 0, 'skills': {}}
+
+
+def _apply_entry(stats: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """Fold one rating into its skill's aggregate."""
+    rating = entry.get('rating')
+    if isinstance(rating, bool) or not isinstance(rating, (int, float)):
+        return
+    skill = stats['skills'].setdefault(entry.get('skill', 'unknown'), {
+        'count': 0, 'sum': 0, 'first_half_sum': 0, 'second_half': [], 'recent': [],
+    })
+    skill['count'] += 1
+    skill['sum'] += rating
+    # Ratings [0, count // 2) form the first half; move the boundary forward
+    skill['second_half'].append(rating)
+    while skill['count'] - len(skill['second_half']) < skill['count'] // 2:
+        skill['first_half_sum'] += skill['second_half'].pop(0)
+    skill['recent'] = (skill['recent'] + [{
+        'rating': rating, 'note': entry.get('note', ''), 'ts': entry.get('ts'),
+    }])[-RECENT_COUNT:]
+
+
+def _trend(skill: Dict[str, Any]) -> str:
+    count = skill['count']
+    if count < TREND_MIN_RATINGS:
+        return 'stable'
+    mid = count // 2
+    first_half = skill['first_half_sum'] / mid
+    second_half = sum(skill['second_half']) / (count - mid)
+    if second_half - first_half > TREND_THRESHOLD:
+        return 'improving'
+    if first_half - second_half > TREND_THRESHOLD:
+        return 'declining'
+    return 'stable'
+
+
+class SkillRatings:
+    """Skill ratings on disk plus pre-aggregated per-skill stats."""
+
+    def __init__(self, log_file: Path = SKILL_RATINGS_FILE, stats_file: Path = SKILL_RATINGS_STATS_FILE):
+        self.log_file = Path(log_file)
+        self.stats_file = Path(stats_file)
+        self._lock_file = self.stats_file.with_suffix(self.stats_file.suffix + '.lock')
+
+    def _read_stats(self) -> Dict[str, Any]:
+        try:
+            stats = json.loads(self.stats_file.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return _empty_stats()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skill rating stats unreadable ({e}); rebuilding from log")
+            return _empty_stats()
+        if not isinstance(stats, dict) or stats.get('version') != STATS_VERSION:
+            return _empty_stats()
+        return stats
+
+    def _catch_up(self, stats: Dict[str, Any]) -> bool:
+        """Replay log lines past ``log_offset``. Returns True if stats changed."""
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        offset = stats.get('log_offset', 0)
+        if offset == size:
+            return False
+        if offset > size:  # log was truncated or replaced
+            stats.clear()
+            stats.update(_empty_stats())
+            offset = 0
+        if size == 0:
+            return True
+
+        with self.log_file.open('rb') as f:
+            f.seek(offset)
+            tail = f.read()
+        # Ignore a trailing partial line from an interrupted append
+        complete = tail[:tail.rfind(b'\n') + 1]
+        for raw in complete.splitlines():
+            if not raw.strip():
+                continue
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                logger.warning("Skipping malformed skill rating")
+                continue
+            if isinstance(entry, dict):
+                _apply_entry(stats, entry)
+        stats['log_offset'] = offset + len(complete)
+        return True
+
+    def record(self, skill_name: str, rating: int, note: str = '', when: Optional[datetime] = None) -> Dict[str, Any]:
+        """Append one rating and update the skill's aggregate."""
+        entry: Dict[str, Any] = {
+            'ts': (when or datetime.now()).isoformat(timespec='seconds'),
+            'skill': skill_name,
+            'rating': rating,
+        }
+        if note:
+            entry['note'] = note
+        line = (json.dumps(entry) + '\n').encode('utf-8')
+
+        with file_lock(self._lock_file):
+            stats = self._read_stats()
+            self._catch_up(stats)
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_file.open('ab') as f:
+                if f.tell() != stats['log_offset']:
+                    line = b'\n' + line  # terminate a torn line so ours parses
+                f.write(line)
+                stats['log_offset'] = f.tell()
+            _apply_entry(stats, entry)
+            atomic_write_json(self.stats_file, stats)
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Current aggregates, replaying any part of the log they don't cover yet."""
+        stats = self._read_stats()
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if stats.get('log_offset', 0) != size:
+            with file_lock(self._lock_file):
+                stats = self._read_stats()
+                if self._catch_up(stats):
+                    atomic_write_json(self.stats_file, stats)
+        return stats
+
+    def summary(self, skill_filter: str = '') -> Dict[str, Dict[str, Any]]:
+        """Average, count, trend and last five ratings per skill (or just ``skill_filter``)."""
+        result = {}
+        for name, skill in self.stats()['skills'].items():
+            if skill_filter and name != skill_filter:
+                continue
+            result[name] = {
+                'average': round(skill['sum'] / skill['count'], 1),
+                'count': skill['count'],
+                'trend': _trend(skill),
+                'recent': skill['recent'],
+            }
+        return result
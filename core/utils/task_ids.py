@@ -0,0 +1,170 @@
+"""
+Persistent task ID allocation for Dex.
+
+Task IDs look like ``task-YYYYMMDD-NNN`` where the ``NNN`` counter is
+globally unique across all dates (users refer to tasks by those last
+three digits). Instead of scanning the vault for the highest counter on
+every allocation, the high-water mark is kept in a small JSON file under
+``System/.dex/`` and updated under an advisory file lock, so concurrent
+MCP servers never hand out the same number.
+
+Other writers (the Pi extension, the Granola sync script, manual edits,
+vault sync from another device) add IDs without touching the state file,
+so the vault's task folders are re-scanned off the hot path: when the
+state file is missing or unreadable, when the last scan is older than
+``RECONCILE_INTERVAL_SECONDS``, or on an explicit ``reconcile_task_ids()``.
+The stored high-water mark never drops below a counter seen there.
+
+Usage:
+    from core.utils.task_ids import allocate_task_ids, reconcile_task_ids
+
+    [task_id] = allocate_task_ids(1)
+    reconcile_task_ids()  # after a bulk import by another tool
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from core.paths import (
+    AREAS_DIR,
+    INBOX_DIR,
+    PROJECTS_DIR,
+    QUARTER_GOALS_DIR,
+    TASK_ID_STATE_FILE,
+    TASKS_DIR,
+    WEEK_PRIORITIES_DIR,
+)
+from core.utils.file_ops import atomic_write_json, file_lock
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+
+# Seconds between vault scans for IDs other writers added
+RECONCILE_INTERVAL_SECONDS = 15 * 60
+
+# Only folders that contain real task references (not docs/examples)
+TASK_ID_SCAN_DIRS = (
+    INBOX_DIR,
+    QUARTER_GOALS_DIR,
+    WEEK_PRIORITIES_DIR,
+    TASKS_DIR,
+    PROJECTS_DIR,
+    AREAS_DIR,
+)
+
+_TASK_NUMBER_RE = re.compile(r'\^task-\d{8}-(\d{3})')
+
+
+def scan_high_water(scan_dirs: Iterable[Path] = TASK_ID_SCAN_DIRS) -> int:
+    """Return the highest task counter referenced in the given folders."""
+    high_water = 0
+    for folder in scan_dirs:
+        if not folder.exists():
+            continue
+        for md_file in folder.rglob('*.md'):
+            try:
+                content = md_file.read_text()
+            except Exception:
+                continue
+            for match in _TASK_NUMBER_RE.findall(content):
+                high_water = max(high_water, int(match))
+    return high_water
+
+
+def _read_state(state_file: Path) -> Tuple[Optional[int], float]:
+    """Read the stored high-water mark (None if missing/corrupt) and last scan time."""
+    try:
+        data = json.loads(state_file.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None, 0.0
+    except (OSError, ValueError) as e:
+        logger.warning(f"Task ID state unreadable ({e}); rebuilding from vault")
+        return None, 0.0
+
+    high_water = data.get('high_water') if isinstance(data, dict) else None
+    if not isinstance(high_water, int) or isinstance(high_water, bool) or high_water < 0:
+        logger.warning("Task ID state malformed; rebuilding from vault")
+        return None, 0.0
+    reconciled_at = data.get('reconciled_at')
+    if not isinstance(reconciled_at, (int, float)) or isinstance(reconciled_at, bool):
+        reconciled_at = 0.0
+    return high_water, float(reconciled_at)
+
+
+def _write_state(state_file: Path, high_water: int, reconciled_at: float) -> None:
+    atomic_write_json(state_file, {
+        'version': STATE_VERSION,
+        'high_water': high_water,
+        'reconciled_at': reconciled_at,
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+    })
+
+
+def _reconciled(stored: Optional[int], scan_dirs: Iterable[Path]) -> int:
+    """Raise ``stored`` to the highest counter in the vault (call under the lock)."""
+    observed = scan_high_water(scan_dirs)
+    if stored is None:
+        logger.info(f"Rebuilt task ID high-water mark from vault: {observed}")
+    elif observed > stored:
+        logger.info(f"Task IDs up to {observed} were written elsewhere; skipping past them")
+    return max(stored or 0, observed)
+
+
+def reconcile_task_ids(
+    state_file: Path = TASK_ID_STATE_FILE,
+    scan_dirs: Iterable[Path] = TASK_ID_SCAN_DIRS,
+) -> int:
+    """Scan the vault now for IDs added by other writers; returns the high-water mark."""
+    lock_path = state_file.with_name(state_file.name + '.lock')
+    with file_lock(lock_path):
+        stored, _ = _read_state(state_file)
+        high_water = _reconciled(stored, scan_dirs)
+        _write_state(state_file, high_water, time.time())
+    return high_water
+
+
+def allocate_task_numbers(
+    count: int = 1,
+    state_file: Path = TASK_ID_STATE_FILE,
+    scan_dirs: Iterable[Path] = TASK_ID_SCAN_DIRS,
+) -> List[int]:
+    """Reserve ``count`` contiguous task counters and return them in order."""
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    lock_path = state_file.with_name(state_file.name + '.lock')
+    with file_lock(lock_path):
+        high_water, reconciled_at = _read_state(state_file)
+        now = time.time()
+        if high_water is None or not 0 <= now - reconciled_at < RECONCILE_INTERVAL_SECONDS:
+            high_water = _reconciled(high_water, scan_dirs)
+            reconciled_at = now
+
+        first = high_water + 1
+        _write_state(state_file, high_water + count, reconciled_at)
+    return list(range(first, first + count))
+
+
+def format_task_id(number: int, when: datetime) -> str:
+    """Format a task counter as ``task-YYYYMMDD-NNN``."""
+    return f"task-{when.strftime('%Y%m%d')}-{number:03d}"
+
+
+def allocate_task_ids(
+    count: int = 1,
+    when: Optional[datetime] = None,
+    state_file: Path = TASK_ID_STATE_FILE,
+    scan_dirs: Iterable[Path] = TASK_ID_SCAN_DIRS,
+) -> List[str]:
+    """Reserve ``count`` contiguous task IDs stamped with ``when`` (default: now)."""
+    when = when or datetime.now()
+    numbers = allocate_task_numbers(count, state_file=state_file, scan_dirs=scan_dirs)
+    return [format_task_id(n, when) for n in numbers]
@@ -0,0 +1,239 @@
+"""
+Persistent task-ID location index for Dex.
+
+Maps each ``^task-YYYYMMDD-NNN`` anchor to the (file, line, checkbox
+state) places where it appears, so status updates only read the files
+that actually contain the ID instead of every markdown file in the vault.
+
+The index lives in ``System/.dex/task-index.json``. Freshness is checked
+per file by (mtime_ns, size): a lookup stats the vault and re-reads only
+files that changed since they were last indexed. Files modified within
+the last couple of seconds are always re-read (see ``parse_cache``).
+Writers can call ``note_file_written()`` to refresh a file immediately.
+
+When a re-indexed file shows a task's checkbox flipped (for example a task
+ticked directly in Obsidian), the change is queued for
+``take_status_changes()`` so it can be logged as a completion event.
+
+Usage:
+    from core.utils.task_index import get_task_index
+
+    index = get_task_index()
+    locations = index.lookup('task-20260101-001')
+    by_id = index.lookup_many(['task-20260101-001', 'task-20260101-002'])
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.paths import TASK_INDEX_FILE, VAULT_ROOT
+from core.utils.file_ops import atomic_write_json
+from core.utils.parse_cache import signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Directories never worth indexing (tooling, dependencies, runtime state)
+_SKIP_DIR_NAMES = {'node_modules', '__pycache__'}
+
+_TASK_ANCHOR_RE = re.compile(r'\^(task-\d{8}-\d{3,})')
+
+
+class TaskLocation(NamedTuple):
+    """One checkbox line carrying a task anchor."""
+    file: str
+    line_number: int
+    completed: bool
+
+
+def scan_task_lines(content: str) -> List[tuple]:
+    """Return (task_id, line_number, completed) for every task checkbox line."""
+    entries = []
+    for i, line in enumerate(content.split('\n')):
+        if '^task-' not in line or ('- [ ]' not in line and '- [x]' not in line):
+            continue
+        for task_id in _TASK_ANCHOR_RE.findall(line):
+            entries.append((task_id, i + 1, '- [x]' in line))
+    return entries
+
+
+class TaskLocationIndex:
+    """Inverted index from task ID to checkbox locations, refreshed by file stat."""
+
+    def __init__(self, root: Path = VAULT_ROOT, index_file: Path = TASK_INDEX_FILE):
+        self.root = Path(root)
+        self.index_file = Path(index_file)
+        self._lock = threading.RLock()
+        # rel_path -> {'mtime_ns', 'size', 'tasks': [[task_id, line, completed], ...]}
+        self._files: Dict[str, Dict] = {}
+        self._by_id: Dict[str, List[TaskLocation]] = {}
+        self._status_changes: List[Tuple[str, TaskLocation]] = []
+        self._loaded = False
+        self._dirty = False
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Task index unreadable ({e}); rebuilding")
+            self._dirty = True
+            return
+
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            self._dirty = True
+            return
+        files = data.get('files')
+        if isinstance(files, dict):
+            self._files = files
+            self._rebuild_inverted()
+
+    def _save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            atomic_write_json(self.index_file, {'version': INDEX_VERSION, 'files': self._files})
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not persist task index: {e}")
+
+    # -- maintenance -------------------------------------------------------
+
+    def _rebuild_inverted(self) -> None:
+        by_id: Dict[str, List[TaskLocation]] = {}
+        for rel_path, entry in self._files.items():
+            file_str = str(self.root / rel_path)
+            for task_id, line_number, completed in entry.get('tasks', []):
+                by_id.setdefault(task_id, []).append(TaskLocation(file_str, line_number, completed))
+        self._by_id = by_id
+
+    def _iter_markdown(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in _SKIP_DIR_NAMES]
+            for name in filenames:
+                if name.endswith('.md'):
+                    yield Path(dirpath) / name
+
+    def _index_file(self, path: Path, stat: os.stat_result) -> bool:
+        """(Re)index one file. Returns True if its task entries changed."""
+        rel_path = path.relative_to(self.root).as_posix()
+        try:
+            content = path.read_text()
+        except Exception as e:
+            logger.error(f"Error reading {path}: {e}")
+            return self._files.pop(rel_path, None) is not None
+
+        tasks = [list(t) for t in scan_task_lines(content)]
+        previous = self._files.get(rel_path)
+        if previous is not None:
+            self._queue_status_changes(str(path), previous.get('tasks', []), tasks)
+        # A file modified within the mtime granularity window is re-read next time
+        mtime_ns = stat.st_mtime_ns if signature_is_settled((stat.st_mtime_ns, stat.st_size)) else None
+        self._files[rel_path] = {'mtime_ns': mtime_ns, 'size': stat.st_size, 'tasks': tasks}
+        self._dirty = True
+        return previous is None or previous.get('tasks') != tasks
+
+    def _queue_status_changes(self, file_str: str, previous: List[list], tasks: List[list]) -> None:
+        # A task counts as done in a file when every checkbox for it there is ticked
+        before: Dict[str, bool] = {}
+        for task_id, _, completed in previous:
+            before[task_id] = before.get(task_id, True) and completed
+        after: Dict[str, TaskLocation] = {}
+        for task_id, line_number, completed in tasks:
+            location = after.get(task_id)
+            if location is None or (location.completed and not completed):
+                after[task_id] = TaskLocation(file_str, line_number, completed)
+        for task_id, location in after.items():
+            if task_id in before and before[task_id] != location.completed:
+                self._status_changes.append((task_id, location))
+
+    def refresh(self) -> None:
+        """Re-index files whose mtime/size changed; drop files that disappeared."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            changed = False
+            seen = set()
+            for path in self._iter_markdown():
+                rel_path = path.relative_to(self.root).as_posix()
+                seen.add(rel_path)
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entry = self._files.get(rel_path)
+                if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                    continue
+                changed |= self._index_file(path, stat)
+
+            for rel_path in set(self._files) - seen:
+                del self._files[rel_path]
+                self._dirty = True
+                changed = True
+
+            if changed:
+                self._rebuild_inverted()
+            self._save()
+
+    def note_file_written(self, path: Path) -> None:
+        """Refresh a single file after it was written by this process."""
+        path = Path(path)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            try:
+                rel_path = path.relative_to(self.root).as_posix()
+            except ValueError:
+                return
+            if path.exists():
+                self._index_file(path, path.stat())
+            elif self._files.pop(rel_path, None) is not None:
+                self._dirty = True
+            self._rebuild_inverted()
+            self._save()
+
+    # -- queries -----------------------------------------------------------
+
+    def take_status_changes(self) -> List[Tuple[str, TaskLocation]]:
+        """Return and clear the checkbox flips seen since the last call."""
+        with self._lock:
+            changes, self._status_changes = self._status_changes, []
+            return changes
+
+    def lookup(self, task_id: str) -> List[TaskLocation]:
+        """Return all checkbox locations for a task ID."""
+        return self.lookup_many([task_id]).get(task_id, [])
+
+    def lookup_many(self, task_ids: Iterable[str]) -> Dict[str, List[TaskLocation]]:
+        """Return locations for several task IDs with a single freshness check."""
+        self.refresh()
+        with self._lock:
+            return {task_id: list(self._by_id.get(task_id, [])) for task_id in task_ids}
+
+
+_indexes: Dict[str, TaskLocationIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_task_index(root: Optional[Path] = None, index_file: Optional[Path] = None) -> TaskLocationIndex:
+    """Return the process-wide index for a vault root."""
+    root = Path(root) if root else VAULT_ROOT
+    index_file = Path(index_file) if index_file else TASK_INDEX_FILE
+    key = f"{root}::{index_file}"
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = TaskLocationIndex(root, index_file)
+        return _indexes[key]
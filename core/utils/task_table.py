@@ -0,0 +1,440 @@
+"""
+Vault-wide task table in SQLite.
+
+``get_all_tasks()`` only reads ``Tasks.md`` and ``Week_Priorities.md``, but
+task checkboxes also live in meeting notes, person pages and projects.
+``TaskTable`` indexes every checkbox line in every markdown file of the
+vault into ``System/.dex/task-table.db``:
+
+- ``tasks``: id, title, status, file, line, section (nearest heading),
+  pillar, priority, completion time (the ``✅ YYYY-MM-DD HH:MM`` stamp)
+  and referenced pages, indexed for the common filters;
+- ``task_refs``: lowercased stems of the pages a task links to
+  (``[[Jane_Doe]]``, ``| People/External/Jane_Doe.md``), indexed.
+
+A refresh stats the vault and re-parses only files whose (mtime_ns, size)
+changed, replacing just their rows. Pillar and priority come from a
+caller-supplied ``classify`` function; when its ``version`` changes (e.g.
+pillars.yaml was edited) every file is re-parsed once.
+
+A task ID synced to several pages has one row per copy. The copy in the
+first of ``primary_files`` that holds it (then the first by path) is
+marked canonical; ``query(unique=True)`` returns only canonical rows.
+
+Queries filter, sort and page with a keyset cursor, so a page of results
+costs one indexed SELECT however large the vault is. A query refreshes
+the table first only if the last refresh is older than
+``refresh_interval`` seconds (or ``invalidate()`` was called, as the Work
+MCP does after its own writes); follow-up pages (with a cursor) never
+refresh, so a multi-page read sees one consistent table.
+
+Usage:
+    from core.utils.task_table import TaskTable
+
+    table = TaskTable(vault_root, TASK_TABLE_DB_FILE, classify, version_fn,
+                      primary_files=['03-Tasks/Tasks.md'])
+    page = table.query(completed=False, priority='P1', mentions='acme', limit=50)
+    more = table.query(completed=False, priority='P1', mentions='acme', cursor=page['next_cursor'])
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.utils.parse_cache import signature_is_settled
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Queries reuse a refresh this recent instead of stat-ing the vault again
+REFRESH_INTERVAL_SECONDS = 2.0
+
+# Directories never worth indexing (tooling, dependencies, runtime state)
+_SKIP_DIR_NAMES = {'node_modules', '__pycache__'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    task_id TEXT,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    section TEXT,
+    pillar TEXT,
+    priority TEXT NOT NULL,
+    completed_at TEXT,
+    refs TEXT NOT NULL,
+    search TEXT NOT NULL,
+    canonical INTEGER NOT NULL DEFAULT 1
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_location ON tasks(file, line);
+CREATE INDEX IF NOT EXISTS idx_tasks_task_id ON tasks(task_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(completed, priority, file, line);
+CREATE INDEX IF NOT EXISTS idx_tasks_pillar ON tasks(completed, pillar, file, line);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_at ON tasks(completed_at);
+CREATE TABLE IF NOT EXISTS task_refs (
+    task INTEGER NOT NULL,
+    ref TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_task_refs_ref ON task_refs(ref, task);
+CREATE INDEX IF NOT EXISTS idx_task_refs_task ON task_refs(task);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_HEADING = re.compile(r'^#{1,6}\s+(.+?)\s*#*\s*$')
+_CHECKBOX = re.compile(r'^\s*- \[([ xX])\]')
+_TASK_ID = re.compile(r'\^(task-\d{8}-\d{3,})')
+_TITLE = re.compile(r'-\s*\[[xX ]\]\s*\*?\*?(.+?)\*?\*?(?:\s*\^task-\d{8}-\d{3,})?\s*$')
+_PATH_REFS = re.compile(r'\s*\|\s*(?:People|Active)/[^\s]+')
+_MD_SUFFIX = re.compile(r'\s+\.md\b')
+_ANCHOR = re.compile(r'\s*\^task-\d{8}-\d{3,}\s*')
+_DONE_STAMP = re.compile(r'\s*✅\s*(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+_WIKI_LINK = re.compile(r'\[\[([^\]|#]+)')
+_MD_FILE = re.compile(r'([\w./-]+)\.md\b')
+_DECLARED_PILLAR = re.compile(r'Pillar:\s*([^|]+?)\s*(?:\||$)')
+_DECLARED_PRIORITY = re.compile(r'Priority:\s*(P[0-3])\b')
+
+# Sort name -> (SQL key expression, key column in the result row)
+_SORTS = {
+    'location': ('', None),
+    'priority': ('priority', 'priority'),
+    'completed_at': ("COALESCE(completed_at, '')", 'completed_at'),
+    'task_id': ("COALESCE(task_id, '')", 'task_id'),
+}
+
+Classifier = Callable[[str, Dict[str, str]], Tuple[Optional[str], str]]
+
+
+def _page_stem(target: str) -> str:
+    return Path(target.strip()).name.lower()
+
+
+def parse_task_lines(content: str) -> List[Dict[str, Any]]:
+    """Checkbox lines of one markdown file, with the metadata the table stores.
+
+    ``declared`` holds ``Pillar:`` / ``Priority:`` values from the indented
+    sub-bullets ``create_task`` writes under a task, if present.
+    """
+    lines = content.split('\n')
+    tasks = []
+    section = None
+    for i, line in enumerate(lines):
+        heading = _HEADING.match(line)
+        if heading:
+            section = heading.group(1)
+            continue
+        checkbox = _CHECKBOX.match(line)
+        if not checkbox:
+            continue
+
+        stripped = line.strip()
+        stamp = _DONE_STAMP.search(stripped)
+        unstamped = _DONE_STAMP.sub('', stripped)
+        title_match = _TITLE.match(unstamped)
+        title = title_match.group(1).strip() if title_match else unstamped[6:]
+        clean_title = _ANCHOR.sub('', _MD_SUFFIX.sub('', _PATH_REFS.sub('', title))).strip().strip('*').strip()
+
+        refs = [_page_stem(t) for t in _WIKI_LINK.findall(stripped)]
+        refs += [_page_stem(t) for t in _MD_FILE.findall(stripped)]
+
+        indent = len(line) - len(line.lstrip())
+        declared: Dict[str, str] = {}
+        for follow in lines[i + 1:]:
+            if not follow.strip() or len(follow) - len(follow.lstrip()) <= indent:
+                break
+            if (m := _DECLARED_PILLAR.search(follow)) and 'pillar' not in declared:
+                declared['pillar'] = m.group(1)
+            if (m := _DECLARED_PRIORITY.search(follow)) and 'priority' not in declared:
+                declared['priority'] = m.group(1)
+
+        task_id = _TASK_ID.search(stripped)
+        completed = checkbox.group(1) != ' '
+        tasks.append({
+            'line': i + 1,
+            'task_id': task_id.group(1) if task_id else None,
+            'title': clean_title,
+            'completed': completed,
+            'status': 'd' if completed else 'n',
+            'section': section,
+            'completed_at': stamp.group(1) if stamp else None,
+            'refs': list(dict.fromkeys(refs)),
+            'declared': declared,
+        })
+    return tasks
+
+
+def _encode_cursor(key: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str) -> List[Any]:
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list) or len(key) != 3:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key
+
+
+class TaskTable:
+    """Every task checkbox in the vault, kept current by file signature."""
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Path,
+        classify: Classifier,
+        version: Callable[[], str],
+        primary_files: Sequence[str] = (),
+        skip_dirs: Sequence[str] = (),
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+    ):
+        self.root = Path(root)
+        self.db_path = Path(db_path)
+        self._classify = classify
+        self._version = version
+        self._primary = {path: rank for rank, path in enumerate(primary_files)}
+        self._skip = {d.strip('/') for d in skip_dirs}
+        self._lock = threading.Lock()
+        self.refresh_interval = refresh_interval
+        self._refreshed: Optional[Tuple[float, str]] = None  # (monotonic time, version)
+        self.parsed_last_refresh = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _iter_markdown(self) -> Iterator[Tuple[str, Path]]:
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            rel_dir = Path(dirpath).relative_to(self.root).as_posix()
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith('.') and d not in _SKIP_DIR_NAMES
+                and (f"{rel_dir}/{d}" if rel_dir != '.' else d) not in self._skip
+            ]
+            for name in filenames:
+                if name.endswith('.md'):
+                    path = Path(dirpath) / name
+                    yield path.relative_to(self.root).as_posix(), path
+
+    # ---------------------------------------------------------------- refresh
+
+    def _delete_file(self, conn: sqlite3.Connection, rel_path: str) -> None:
+        conn.execute("DELETE FROM task_refs WHERE task IN (SELECT id FROM tasks WHERE file = ?)", (rel_path,))
+        conn.execute("DELETE FROM tasks WHERE file = ?", (rel_path,))
+        conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+
+    def _index_file(self, conn: sqlite3.Connection, rel_path: str, path: Path, stat: os.stat_result) -> None:
+        self._delete_file(conn, rel_path)
+        try:
+            content = path.read_text()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Skipping unreadable file {path}: {e}")
+            return
+        for task in parse_task_lines(content):
+            pillar, priority = self._classify(task['title'], task['declared'])
+            search = ' '.join([task['title'].lower()] + task['refs'])
+            cursor = conn.execute(
+                "INSERT INTO tasks(file, line, task_id, title, status, completed, section, pillar, priority, "
+                "completed_at, refs, search) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (rel_path, task['line'], task['task_id'], task['title'], task['status'], int(task['completed']),
+                 task['section'], pillar, priority, task['completed_at'], json.dumps(task['refs']), search))
+            conn.executemany("INSERT INTO task_refs(task, ref) VALUES (?, ?)",
+                             [(cursor.lastrowid, ref) for ref in task['refs']])
+        # A file modified within the mtime granularity window is re-read next time
+        settled = signature_is_settled((stat.st_mtime_ns, stat.st_size))
+        conn.execute("INSERT INTO files(path, mtime_ns, size) VALUES (?, ?, ?)",
+                     (rel_path, stat.st_mtime_ns if settled else None, stat.st_size))
+
+    def _mark_canonical(self, conn: sqlite3.Connection) -> None:
+        """One canonical row per task ID: primary files first, then path order."""
+        rank = ' '.join(f"WHEN ? THEN {r}" for r in self._primary.values())
+        rank_sql = f"CASE file {rank} ELSE {len(self._primary)} END" if self._primary else "0"
+        conn.execute("UPDATE tasks SET canonical = 0 WHERE task_id IS NOT NULL")
+        conn.execute(
+            f"""UPDATE tasks SET canonical = 1 WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY task_id ORDER BY {rank_sql}, file, line) AS n
+                    FROM tasks WHERE task_id IS NOT NULL
+                ) WHERE n = 1)""",
+            list(self._primary))
+
+    def invalidate(self) -> None:
+        """Make the next query refresh, e.g. after writing a markdown file."""
+        with self._lock:
+            self._refreshed = None
+
+    def refresh(self, max_age: float = 0.0) -> None:
+        """Re-parse files whose mtime/size changed (all files if the classifier changed).
+
+        Does nothing if the table was refreshed less than ``max_age`` seconds
+        ago with the same classifier version.
+        """
+        version = f"{SCHEMA_VERSION}:{self._version()}"
+        with self._lock:
+            if (self._refreshed is not None and self._refreshed[1] == version
+                    and time.monotonic() - self._refreshed[0] < max_age):
+                return
+            self._refresh(version)
+            self._refreshed = (time.monotonic(), version)
+
+    def _refresh(self, version: str) -> None:
+        with closing(self._connect()) as conn:
+            stored = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            reparse_all = stored is None or stored[0] != version
+            known = {r['path']: (r['mtime_ns'], r['size']) for r in conn.execute("SELECT * FROM files")}
+
+            parsed = 0
+            seen = set()
+            with conn:
+                for rel_path, path in self._iter_markdown():
+                    seen.add(rel_path)
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    if not reparse_all and known.get(rel_path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    self._index_file(conn, rel_path, path, stat)
+                    parsed += 1
+                removed = known.keys() - seen
+                for rel_path in removed:
+                    self._delete_file(conn, rel_path)
+                if parsed or removed:
+                    self._mark_canonical(conn)
+                if reparse_all:
+                    conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES ('version', ?)", (version,))
+            self.parsed_last_refresh = parsed
+
+    # ---------------------------------------------------------------- queries
+
+    def query(
+        self,
+        completed: Optional[bool] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        pillar: Optional[str] = None,
+        section: Optional[str] = None,
+        file_prefix: Optional[str] = None,
+        ref: Optional[str] = None,
+        mentions: Optional[str] = None,
+        task_id: Optional[str] = None,
+        completed_after: Optional[str] = None,
+        completed_before: Optional[str] = None,
+        unique: bool = True,
+        sort: str = 'location',
+        descending: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Filter, sort and page the table. Returns {tasks, total, next_cursor}.
+
+        ``mentions`` is a case-insensitive substring of the title or of a
+        referenced page's name; ``ref`` is an exact page name. Pass the
+        previous page's ``next_cursor`` (with the same filters and sort) to
+        continue; it is None on the last page.
+        """
+        if sort not in _SORTS:
+            raise ValueError(f"Unknown sort '{sort}'. Use one of: {', '.join(_SORTS)}")
+        if cursor is None:
+            self.refresh(max_age=self.refresh_interval)
+
+        clauses, params = [], []
+        if completed is not None:
+            clauses.append("completed = ?")
+            params.append(int(completed))
+        for column, value in (('status', status), ('priority', priority), ('pillar', pillar),
+                              ('section', section), ('task_id', task_id)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if file_prefix:
+            clauses.append("substr(file, 1, ?) = ?")
+            params.extend([len(file_prefix), file_prefix])
+        if ref:
+            clauses.append("id IN (SELECT task FROM task_refs WHERE ref = ?)")
+            params.append(_page_stem(ref))
+        if mentions:
+            clauses.append("instr(search, ?) > 0")
+            params.append(mentions.lower())
+        if completed_after:
+            clauses.append("completed_at >= ?")
+            params.append(completed_after)
+        if completed_before:
+            clauses.append("completed_at <= ?")
+            params.append(completed_before)
+        if unique:
+            clauses.append("canonical = 1")
+        where = " AND ".join(clauses) or "1"
+
+        key_sql, key_column = _SORTS[sort]
+        order_terms = ([key_sql] if key_sql else []) + ['file', 'line']
+        direction = 'DESC' if descending else 'ASC'
+        page_clauses, page_params = [], []
+        if cursor:
+            key = _decode_cursor(cursor)
+            compare = '<' if descending else '>'
+            if key_sql:
+                page_clauses.append(f"({key_sql}, file, line) {compare} (?, ?, ?)")
+                page_params.extend(key)
+            else:
+                page_clauses.append(f"(file, line) {compare} (?, ?)")
+                page_params.extend(key[1:])
+        limit = max(1, int(limit))
+
+        with self._lock, closing(self._connect()) as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM tasks WHERE {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE {' AND '.join([where] + page_clauses)} "
+                f"ORDER BY {', '.join(f'{term} {direction}' for term in order_terms)} LIMIT ?",
+                params + page_params + [limit + 1]).fetchall()
+
+        tasks = [self._row_to_task(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = _encode_cursor([last[key_column] or '' if key_column else None, last['file'], last['line']])
+        return {'tasks': tasks, 'total': total, 'next_cursor': next_cursor}
+
+    def _row_to_task(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'id': row['task_id'] or f"{row['file']}:{row['line']}",
+            'task_id': row['task_id'],
+            'title': row['title'],
+            'section': row['section'],
+            'completed': bool(row['completed']),
+            'status': row['status'],
+            'line_number': row['line'],
+            'source_file': str(self.root / row['file']),
+            'file': row['file'],
+            'pillar': row['pillar'],
+            'priority': row['priority'],
+            'completed_at': row['completed_at'],
+            'refs': json.loads(row['refs']),
+        }
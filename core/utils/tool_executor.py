@@ -0,0 +1,138 @@
+"""
+Run blocking MCP tool handlers off the asyncio event loop.
+
+MCP servers are ``async`` but most tool handlers do synchronous file I/O
+and parsing. ``ToolExecutor`` runs each handler in a worker thread so one
+slow tool no longer stalls every other request on the stdio server:
+
+- read-only tools run concurrently;
+- write tools take an async lock per target file, so two writes to the
+  same file are serialized while writes to different files overlap;
+- reads never wait for writes: writers replace files atomically
+  (``atomic_write_text``), so a read sees either the old or the new file,
+  and the shared caches that reads refresh take their own locks;
+- a concurrency limit caps the number of worker threads, and each tool
+  has a timeout.
+
+A timed-out handler keeps its thread (Python cannot kill it), so its
+locks and concurrency slot are only released once it really finishes.
+
+Configuration (environment):
+    DEX_MCP_MAX_CONCURRENCY   worker threads / concurrent tools (default 4)
+    DEX_MCP_TOOL_TIMEOUT      default per-tool timeout in seconds (default 120)
+
+Usage:
+    from core.utils.tool_executor import ToolExecutor
+
+    executor = ToolExecutor(timeouts={"rebuild_meeting_cache": 300})
+    result = await executor.run("create_task", handler, name, args, write_keys=[str(tasks_file)])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TOOL_TIMEOUT = 120.0
+
+
+def _env_number(name: str, default: float, cast: Callable[[str], Any]) -> Any:
+    raw = os.environ.get(name, '').strip()
+    if not raw:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}")
+        return default
+    return value if value > 0 else default
+
+
+class ToolExecutor:
+    """Thread-pool runner for sync tool handlers with per-file write locks and timeouts."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        self.max_concurrency = max_concurrency or _env_number(
+            'DEX_MCP_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY, int)
+        self.default_timeout = default_timeout or _env_number(
+            'DEX_MCP_TOOL_TIMEOUT', DEFAULT_TOOL_TIMEOUT, float)
+        self.timeouts = dict(timeouts or {})
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='mcp-tool')
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._file_locks: Dict[str, asyncio.Lock] = {}
+
+    def _bind_loop(self) -> None:
+        # asyncio primitives belong to one loop; recreate them if the loop changed
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._file_locks = {}
+
+    def timeout_for(self, name: str) -> float:
+        return self.timeouts.get(name, self.default_timeout)
+
+    async def _acquire(self, write_keys: Optional[Iterable[str]]) -> List[asyncio.Lock]:
+        await self._semaphore.acquire()
+        locks = []
+        try:
+            # Sorted acquisition order prevents deadlocks between multi-file writers
+            for key in sorted(set(write_keys or ())):
+                lock = self._file_locks.setdefault(key, asyncio.Lock())
+                await lock.acquire()
+                locks.append(lock)
+        except BaseException:
+            self._release(locks)
+            raise
+        return locks
+
+    def _release(self, locks: List[asyncio.Lock]) -> None:
+        for lock in reversed(locks):
+            lock.release()
+        self._semaphore.release()
+
+    async def run(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        write_keys: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """Run ``fn(*args)`` in a worker thread.
+
+        Pass ``write_keys`` (target file paths, possibly empty) for tools that
+        write; leave it ``None`` for read-only tools.
+        """
+        self._bind_loop()
+        locks = await self._acquire(write_keys)
+
+        future = self._loop.run_in_executor(self._pool, functools.partial(fn, *args))
+        timeout = self.timeout_for(name)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done():
+                raise  # the handler itself raised (e.g. a file-lock TimeoutError)
+            held = locks
+            future.add_done_callback(lambda _: self._release(held))
+            locks = None
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            logger.error(f"Tool '{name}' timed out after {timeout}s; releasing its locks when it finishes")
+            raise TimeoutError(f"Tool '{name}' timed out after {timeout}s") from None
+        finally:
+            if locks is not None:
+                self._release(locks)
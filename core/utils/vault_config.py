@@ -0,0 +1,139 @@
+"""
+Shared, mtime-aware cache for the vault's YAML configuration.
+
+``System/user-profile.yaml`` and ``System/pillars.yaml`` are read on many
+hot paths (demo-mode checks before every file lookup, quarter maths,
+internal-domain checks, analytics). ``ConfigCache`` parses each file once
+and serves the parsed data until the file's (mtime_ns, size) signature
+changes, so edits are picked up on the next call without a restart.
+
+- ``load(path)`` returns the parsed YAML (None if the file is missing);
+  a parse error is cached with the signature and re-raised each call.
+- ``derive(path, build)`` memoizes a value computed from a config file
+  (e.g. the pillar table) until that file changes.
+- ``add_listener(fn)`` calls ``fn(path)`` when a file that was read before
+  has changed, so callers can drop caches built on top of it.
+
+Parsed data is shared between callers: treat it as read-only and copy
+before mutating. Like ``FileParseCache``, a signature is only trusted
+once it is older than the filesystem's timestamp granularity.
+
+Usage:
+    from core.utils.vault_config import config_cache, user_profile
+
+    profile = user_profile()                               # {} if missing or unreadable
+    data = config_cache.load(PILLARS_FILE)                 # parsed YAML or None
+    pillars = config_cache.derive(PILLARS_FILE, build_fn)  # build_fn() -> value
+    config_cache.add_listener(lambda path: other_cache.clear())
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.paths import USER_PROFILE_FILE
+from core.utils.parse_cache import file_signature, signature_is_settled
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigCache:
+    """Parsed YAML files and values derived from them, reloaded when the file changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # path -> (signature, data, error)
+        self._files: Dict[str, Tuple[Any, Any, Optional[Exception]]] = {}
+        # (path, builder) -> (signature, value)
+        self._derived: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        # Last signature seen per path, to tell a reload from a first read
+        self._seen: Dict[str, Any] = {}
+        self._listeners: List[Callable[[Path], None]] = []
+
+    def add_listener(self, listener: Callable[[Path], None]) -> None:
+        """Call ``listener(path)`` whenever a previously read config file changes."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def _observe(self, path: Path, signature: Any) -> None:
+        key = str(path)
+        with self._lock:
+            changed = key in self._seen and self._seen[key] != signature
+            self._seen[key] = signature
+            listeners = list(self._listeners) if changed else []
+        if changed:
+            logger.info(f"Config changed, reloading: {path}")
+        for listener in listeners:
+            try:
+                listener(path)
+            except Exception as e:
+                logger.error(f"Config reload listener failed for {path}: {e}")
+
+    def load(self, path: Path) -> Any:
+        """Parsed YAML of ``path`` (None if missing or PyYAML is unavailable)."""
+        path = Path(path)
+        signature = file_signature(path)
+        self._observe(path, signature)
+        with self._lock:
+            cached = self._files.get(str(path))
+        if cached is None or cached[0] != signature:
+            data, error = None, None
+            if signature is not None and yaml is not None:
+                try:
+                    data = yaml.safe_load(path.read_text(encoding='utf-8'))
+                except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                    error = e
+            cached = (signature, data, error)
+            with self._lock:
+                if signature_is_settled(signature):
+                    self._files[str(path)] = cached
+                else:
+                    self._files.pop(str(path), None)
+        if cached[2] is not None:
+            raise cached[2]
+        return cached[1]
+
+    def derive(self, path: Path, build: Callable[[], Any]) -> Any:
+        """``build()`` memoized until ``path`` changes (build reads the file via ``load``)."""
+        path = Path(path)
+        key = (str(path), getattr(build, '__qualname__', repr(build)))
+        signature = file_signature(path)
+        with self._lock:
+            cached = self._derived.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        value = build()
+        with self._lock:
+            if signature_is_settled(signature):
+                self._derived[key] = (signature, value)
+            else:
+                self._derived.pop(key, None)
+        return value
+
+    def clear(self) -> None:
+        """Forget all parsed files and derived values."""
+        with self._lock:
+            self._files.clear()
+            self._derived.clear()
+
+
+config_cache = ConfigCache()
+
+
+def user_profile(path: Path = USER_PROFILE_FILE) -> Dict[str, Any]:
+    """Parsed user-profile.yaml, or {} if it is missing, empty or unreadable."""
+    try:
+        data = config_cache.load(path)
+    except Exception as e:
+        logger.error(f"Error reading user profile {path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}